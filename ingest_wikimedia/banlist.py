@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import bisect
+import hashlib
 import json
 import logging
+import mmap
 import os
 import re
+import struct
 import tempfile
 import time
 from pathlib import Path
@@ -65,6 +69,32 @@ RUN_WAIT_POLL_SECONDS = 15
 # window across every invocation on the box.
 CACHE_PATH = Path(tempfile.gettempdir()) / "ingest_wikimedia_banlist_remote.txt"
 
+# The merged banlist (committed file ∪ remote cache) compiled into a sorted
+# array of 16-byte binary digests — a DPLA ID is an MD5, so ``bytes.fromhex``
+# of the ID *is* the digest and lookups are exact, not probabilistic. Every
+# ``get-ids-es --single-id`` process in the re-staging fan-out used to re-read
+# and re-parse both text files into a ``set[str]`` (~100 bytes of object
+# overhead per ID); with the index each process mmaps one shared, page-cached
+# file and answers ``is_banned`` with a binary search over it.
+#
+# Layout: ``INDEX_MAGIC`` (8 bytes), the source fingerprint (16 bytes), the
+# record count (little-endian u64), then the sorted records. The fingerprint
+# covers the path, size and mtime of every source file, so the index is
+# rebuilt exactly when the committed file or the remote cache changes — and a
+# version bump in ``INDEX_MAGIC`` invalidates every old index on the box.
+#
+# ``INDEX_PATH`` is a name template, not the file itself: each index is written
+# to ``<stem>.<fingerprint hex><suffix>`` (see :func:`_index_path`). Remote and
+# committed-only loads have different source lists and so different
+# fingerprints; with one shared file, a box mixing both modes (a launch with
+# the Quarry feed next to an ``INGEST_WIKIMEDIA_BANLIST_REMOTE=0`` run) would
+# overwrite the other mode's index on every load. After writing an index, the
+# ones no current source list can match any more are pruned.
+INDEX_PATH = Path(tempfile.gettempdir()) / "ingest_wikimedia_banlist.idx"
+INDEX_MAGIC = b"DPLABAN1"
+_INDEX_HEADER = struct.Struct("<8s16sQ")
+_RECORD_SIZE = 16
+
 
 def _remote_enabled() -> bool:
     """Whether to union the Quarry feed into the banlist.
@@ -232,6 +262,111 @@ def _fetch_remote_ids(wait_for_run: bool = False) -> set[str]:
         return stale if stale is not None else set()
 
 
+def _sources_fingerprint(paths: list[Path]) -> bytes:
+    """Digest of each source's path, size and mtime; a missing source hashes
+    as missing so the index still tracks its later appearance."""
+    h = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        try:
+            st = path.stat()
+            h.update(f"{path}:{st.st_size}:{st.st_mtime_ns}\n".encode())
+        except OSError:
+            h.update(f"{path}:missing\n".encode())
+    return h.digest()
+
+
+def _read_committed(path: Path) -> set[str]:
+    with open(path, "r") as file:
+        return {line.rstrip() for line in file if line.strip()}
+
+
+def _index_path(fingerprint: bytes) -> Path:
+    return INDEX_PATH.with_name(
+        f"{INDEX_PATH.stem}.{fingerprint.hex()}{INDEX_PATH.suffix}"
+    )
+
+
+def _prune_indexes(keep: set[bytes]) -> None:
+    """Delete compiled indexes whose fingerprint isn't in ``keep``. A process
+    still mapping a pruned file keeps its mapping; the next load rebuilds."""
+    keep_paths = {_index_path(fingerprint) for fingerprint in keep}
+    for path in INDEX_PATH.parent.glob(f"{INDEX_PATH.stem}.*{INDEX_PATH.suffix}"):
+        if path in keep_paths:
+            continue
+        try:
+            path.unlink(missing_ok=True)
+        except OSError as e:
+            logging.warning("Banlist: could not prune old index %s: %s", path, e)
+
+
+def _write_index(ids: set[str], fingerprint: bytes) -> None:
+    """Compile ``ids`` into the index for ``fingerprint`` (tmp + ``os.replace``,
+    like :func:`_write_cache`, since the fan-out reads the index concurrently)."""
+    records = []
+    for dpla_id in ids:
+        if _DPLA_ID_RE.match(dpla_id):
+            records.append(bytes.fromhex(dpla_id))
+        else:
+            logging.warning("Banlist: dropping malformed ID %r from index.", dpla_id)
+    records.sort()
+    index_path = _index_path(fingerprint)
+    tmp = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(_INDEX_HEADER.pack(INDEX_MAGIC, fingerprint, len(records)))
+            f.write(b"".join(records))
+        tmp.replace(index_path)
+    except OSError as e:
+        logging.warning("Banlist: could not write index %s: %s", index_path, e)
+        try:
+            tmp.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def _open_index(fingerprint: bytes) -> mmap.mmap | None:
+    """Map the index for ``fingerprint`` read-only if it was built from exactly
+    the current sources; ``None`` if it is absent, stale, truncated or
+    foreign."""
+    try:
+        with open(_index_path(fingerprint), "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _INDEX_HEADER.size:
+                return None
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    magic, built_from, count = _INDEX_HEADER.unpack_from(mapped)
+    if (
+        magic != INDEX_MAGIC
+        or built_from != fingerprint
+        or size != _INDEX_HEADER.size + count * _RECORD_SIZE
+    ):
+        mapped.close()
+        return None
+    return mapped
+
+
+class _Records:
+    """Sequence view of the index's sorted records, for :mod:`bisect`."""
+
+    def __init__(self, data: bytes | mmap.mmap, count: int) -> None:
+        self._data = data
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i: int) -> bytes:
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        start = _INDEX_HEADER.size + i * _RECORD_SIZE
+        return self._data[start : start + _RECORD_SIZE]
+
+    def __iter__(self):
+        return (self[i] for i in range(self._count))
+
+
 class Banlist:
     def __init__(
         self, fetch_remote: bool | None = None, wait_for_run: bool = False
@@ -248,18 +383,68 @@ class Banlist:
         single-ID re-staging fan-out), which then holds the last good list.
         """
         banlist_path = Path(__file__).parent.parent / BANLIST_FILE_NAME
-        with open(banlist_path, "r") as file:
-            ids = {line.rstrip() for line in file if line.strip()}
 
         if fetch_remote is None:
             fetch_remote = _remote_enabled()
-        if fetch_remote:
-            ids |= _fetch_remote_ids(wait_for_run=wait_for_run)
-
-        self.dpla_id_banlist = ids
+        sources = [banlist_path, CACHE_PATH] if fetch_remote else [banlist_path]
+
+        # Only go through the fetch layer when it could yield something the
+        # cache file doesn't already hold: a launch waiting on the current run,
+        # or a missing/stale cache. With a fresh cache the cache file IS the
+        # remote list, so a matching index covers it without reading it.
+        remote_ids: set[str] | None = None
+        if fetch_remote and (wait_for_run or not _cache_is_fresh()):
+            remote_ids = _fetch_remote_ids(wait_for_run=wait_for_run)
+
+        fingerprint = _sources_fingerprint(sources)
+        # A fetched list is always compiled fresh: if its cache write failed,
+        # the cache (and so the fingerprint) no longer reflects it, and a
+        # matching old index would silently drop the new IDs. The rebuilt
+        # index may then hold more than its sources — safe, since the
+        # banlist only ever grows.
+        mapped = None if remote_ids is not None else _open_index(fingerprint)
+        if mapped is None:
+            ids = _read_committed(banlist_path)
+            if remote_ids is not None:
+                ids |= remote_ids
+            elif fetch_remote:
+                ids |= _read_cache() or set()
+            _write_index(ids, fingerprint)
+            # Keep this index and the other mode's current one; anything
+            # else was built from sources that have since changed.
+            _prune_indexes(
+                {
+                    _sources_fingerprint([banlist_path]),
+                    _sources_fingerprint([banlist_path, CACHE_PATH]),
+                }
+            )
+            mapped = _open_index(fingerprint)
+            if mapped is None:
+                # Unwritable temp dir: serve from an in-memory copy of the
+                # same layout rather than fail the run.
+                records = sorted(bytes.fromhex(i) for i in ids if _DPLA_ID_RE.match(i))
+                mapped = _INDEX_HEADER.pack(
+                    INDEX_MAGIC, fingerprint, len(records)
+                ) + b"".join(records)
+
+        count = _INDEX_HEADER.unpack_from(mapped)[2]
+        self._records = _Records(mapped, count)
+
+    @property
+    def dpla_id_banlist(self) -> set[str]:
+        """The banned IDs as hex strings. Materialises the whole list; use
+        :meth:`is_banned` for lookups."""
+        return {record.hex() for record in self._records}
+
+    def __len__(self) -> int:
+        return len(self._records)
 
     def is_banned(self, dpla_id: str) -> bool:
         """
         Checks if the given DPLA ID is in the banlist.
         """
-        return dpla_id in self.dpla_id_banlist
+        if not _DPLA_ID_RE.match(dpla_id):
+            return False
+        key = bytes.fromhex(dpla_id)
+        i = bisect.bisect_left(self._records, key)
+        return i < len(self._records) and self._records[i] == key
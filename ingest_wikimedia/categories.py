@@ -1,4 +1,11 @@
+import json
 import logging
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable
 
 import pywikibot
 from pywikibot.site import BaseSite
@@ -13,6 +20,32 @@ WD_CONTAINS = "Q60474998"  # P4224 qualifier value on P7084
 
 COMMONS_CATEGORY_PREFIX = "Category:Media contributed by "
 
+# Where files land when they render before their institution's P8464 is
+# visible to Commons; see touch_institution_files().
+UNKNOWN_INSTITUTION_CATEGORY = (
+    "Category:Media contributed by the Digital Public Library of America"
+    " with unknown institution"
+)
+
+# What CategoryEnsurer learns about institutions outlives the process: the
+# uploader runs once per target, spawns one ensurer per worker, and each used
+# to re-ask Wikidata/Commons about every institution it met. Only POSITIVE
+# facts are cached — "this institution's category infrastructure exists" and
+# "this hub's category item is Qn" — since a negative answer leads straight to
+# creation and must be re-checked live. Infrastructure is never torn down in
+# normal operation, so a week's TTL only bounds how long an out-of-band
+# deletion goes unnoticed.
+CATEGORY_CACHE_PATH = Path(tempfile.gettempdir()) / "ingest_wikimedia_categories.json"
+CATEGORY_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# Entity ids per wbgetentities request (the API's limit for non-bot-flagged
+# callers).
+WBGETENTITIES_BATCH = 50
+
+# Titles per action=purge / prop=categories request (the API's multi-value
+# limit for non-``apihighlimits`` callers).
+PURGE_BATCH = 50
+
 
 class CategoryEnsurer:
     """
@@ -22,15 +55,23 @@ class CategoryEnsurer:
     Idempotent: each institution Q-ID is only acted on once per session (tracked in
     _ensured). Raises on failure so callers can skip the item and preserve the invariant
     that no file is uploaded without its institution category already existing.
+
+    With a ``cache_path``, institutions found (or made) ready and hub category
+    items are persisted with a TTL and seed later sessions; :meth:`prewarm`
+    fills the cache for a whole partner up front.
     """
 
     def __init__(
         self,
         commons_site: BaseSite,
         dry_run: bool = False,
+        cache_path: Path | None = None,
     ):
         self.commons_site = commons_site
         self.dry_run = dry_run
+        # Persistent positive-fact cache (see CATEGORY_CACHE_PATH); None keeps
+        # everything in-session, as tests and one-off tools want.
+        self.cache_path = cache_path
         self._ensured: set[str] = set()
         # Institutions for which this session actually created new P8464
         # infrastructure (i.e. took the slow path in ensure()).  Callers can read
@@ -39,6 +80,7 @@ class CategoryEnsurer:
         self._newly_created: set[str] = set()
         self._hub_category_qids: dict[str, str] = {}
         self._wikidata_repo: BaseSite | None = None
+        self._load_cache()
 
     @property
     def newly_created(self) -> set[str]:
@@ -63,6 +105,89 @@ class CategoryEnsurer:
             self._wikidata_repo = get_wikidata_site().data_repository()
         return self._wikidata_repo
 
+    def _read_cache_file(self) -> dict:
+        try:
+            with open(self.cache_path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _load_cache(self) -> None:
+        """Seed the session state from the still-fresh persistent entries."""
+        if self.cache_path is None:
+            return
+        cutoff = time.time() - CATEGORY_CACHE_TTL_SECONDS
+        data = self._read_cache_file()
+        for qid, stamp in (data.get("ready") or {}).items():
+            if isinstance(stamp, (int, float)) and stamp >= cutoff:
+                self._ensured.add(qid)
+        for qid, entry in (data.get("hub_category") or {}).items():
+            if isinstance(entry, list) and len(entry) == 2 and entry[1] >= cutoff:
+                self._hub_category_qids[qid] = entry[0]
+
+    def _remember(
+        self,
+        ready: Iterable[str] = (),
+        hub_category: dict[str, str] | None = None,
+    ) -> None:
+        """Persist new positive facts, merged over what's on disk so
+        concurrent uploaders don't drop each other's entries."""
+        if self.cache_path is None or self.dry_run:
+            return
+        now = time.time()
+        data = self._read_cache_file()
+        data.setdefault("ready", {}).update(dict.fromkeys(ready, now))
+        data.setdefault("hub_category", {}).update(
+            {hub: [cat, now] for hub, cat in (hub_category or {}).items()}
+        )
+        tmp = Path(f"{self.cache_path}.{os.getpid()}.tmp")
+        try:
+            tmp.write_text(json.dumps(data))
+            tmp.replace(self.cache_path)
+        except OSError as e:
+            logging.warning(f"Could not write category cache {self.cache_path}: {e}")
+            tmp.unlink(missing_ok=True)
+
+    def prewarm(self, institution_qids: Iterable[str]) -> int:
+        """Resolve many institutions' P8464 with batched ``wbgetentities``.
+
+        Every institution that already has a category item is marked ensured
+        (and persisted), so :meth:`ensure` answers for it without a per-item
+        Commons or Wikidata round-trip. Pass hub QIDs too: their category item
+        is cached for :meth:`_get_hub_category_qid`. Institutions without
+        P8464 are left for :meth:`ensure` to create. Best-effort — a failed
+        batch only means those institutions get checked live. Returns how many
+        institutions were newly marked ready.
+        """
+        qids = sorted({q for q in institution_qids if q and q not in self._ensured})
+        ready: dict[str, str] = {}
+        for start in range(0, len(qids), WBGETENTITIES_BATCH):
+            batch = qids[start : start + WBGETENTITIES_BATCH]
+            try:
+                response = self._repo.simple_request(
+                    action="wbgetentities", ids="|".join(batch), props="claims"
+                ).submit()
+            except Exception as e:
+                logging.warning(f"Category prewarm of {len(batch)} items failed: {e}")
+                continue
+            for qid, entity in (response.get("entities") or {}).items():
+                for claim in (entity.get("claims") or {}).get("P8464", []):
+                    value = ((claim.get("mainsnak") or {}).get("datavalue") or {}).get(
+                        "value"
+                    )
+                    if isinstance(value, dict) and value.get("id"):
+                        ready[qid] = value["id"]
+                        break
+        self._ensured.update(ready)
+        self._hub_category_qids.update(ready)
+        self._remember(ready=ready, hub_category=ready)
+        logging.info(
+            f"Category prewarm: {len(ready)}/{len(qids)} institutions already"
+            " have category infrastructure."
+        )
+        return len(ready)
+
     def ensure(
         self,
         institution_qid: str,
@@ -93,6 +218,7 @@ class CategoryEnsurer:
                 f"Category already set up for {institution_name} ({institution_qid})"
             )
             self._ensured.add(institution_qid)
+            self._remember(ready=[institution_qid])
             return
 
         # Commons category absent — check whether Wikidata already has P8464 set
@@ -102,6 +228,7 @@ class CategoryEnsurer:
                 f"Category already set up for {institution_name} ({institution_qid})"
             )
             self._ensured.add(institution_qid)
+            self._remember(ready=[institution_qid])
             return
 
         hub_category_qid = self._get_hub_category_qid(hub_institution_qid)
@@ -132,6 +259,7 @@ class CategoryEnsurer:
         logging.info(f"Added P8464 to {institution_qid} → {category_qid}")
 
         self._ensured.add(institution_qid)
+        self._remember(ready=[institution_qid])
         # Reaching this point means we actually wrote new infrastructure this
         # session.  Track separately so callers can force-rerender the
         # institution's files once Wikidata replication has settled.
@@ -162,6 +290,7 @@ class CategoryEnsurer:
             )
         hub_category_qid = target.getID()
         self._hub_category_qids[hub_institution_qid] = hub_category_qid
+        self._remember(hub_category={hub_institution_qid: hub_category_qid})
         return hub_category_qid
 
     def _institution_has_category(self, institution_qid: str) -> bool:
@@ -307,6 +436,7 @@ def touch_institution_files(
     commons_site: BaseSite,
     institution_qid: str,
     log_each: bool = False,
+    purge: bool = False,
 ) -> int:
     """Force-rerender all Commons file pages that reference this institution.
 
@@ -325,23 +455,154 @@ def touch_institution_files(
     by ``fix-unknown-categories --verbose``).  Per-page errors are always
     logged as warnings and counted as failures but don't abort the loop.
 
-    Returns the number of files successfully touched.
+    ``purge=True`` re-renders through :func:`rerender_pages` instead: batched
+    purges, with null edits only for the files still in the unknown-institution
+    category afterwards.
+
+    Returns the number of files successfully touched (or re-rendered).
     """
-    count = 0
-    for page in commons_site.search(
+    hits = commons_site.search(
         f'insource:"Institution" insource:"wikidata = {institution_qid}"',
         namespaces=[6],
-    ):
-        if log_each:
-            logging.info(f"  Touching: {page.title()}")
+    )
+    if purge:
+        return len(rerender_pages(commons_site, list(hits), log_each=log_each))
+    return len(touch_pages(commons_site, hits, log_each=log_each))
+
+
+def _touch_one(commons_site: BaseSite, page, log_each: bool) -> bool:
+    if log_each:
+        logging.info(f"  Touching: {page.title()}")
+    try:
+        with_csrf_recovery(commons_site, f"touch {page.title()}", page.touch)
+        return True
+    except CsrfRecoveryFailed:
+        # Session-level fatal — propagate past the per-page catch
+        # so the caller can abort the run rather than logging one
+        # warning per remaining file.
+        raise
+    except Exception as e:
+        logging.warning(f"Failed to touch '{page.title()}'", exc_info=e)
+        return False
+
+
+def touch_pages(
+    commons_site: BaseSite,
+    pages: Iterable,
+    log_each: bool = False,
+    workers: int = 1,
+) -> list:
+    """Null-edit each page in ``pages``; returns the pages that succeeded.
+
+    ``workers`` > 1 overlaps the edits' round-trips on a thread pool — the
+    edit rate itself stays bounded by pywikibot's shared put throttle, so this
+    only removes the idle time between edits, not the throttle. Per-page
+    errors are logged and skipped; :class:`CsrfRecoveryFailed` aborts.
+    """
+    if workers <= 1:
+        return [page for page in pages if _touch_one(commons_site, page, log_each)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            (p, pool.submit(_touch_one, commons_site, p, log_each)) for p in pages
+        ]
         try:
-            with_csrf_recovery(commons_site, f"touch {page.title()}", page.touch)
-            count += 1
+            return [p for p, f in futures if f.result()]
         except CsrfRecoveryFailed:
-            # Session-level fatal — propagate past the per-page catch
-            # so the caller can abort the run rather than logging one
-            # warning per remaining file.
+            for _, f in futures:
+                f.cancel()
             raise
+
+
+def _query_pages(response: dict) -> list[dict]:
+    # ``pages`` is a dict keyed by pageid under formatversion=1 and a list
+    # under formatversion=2.
+    pages = (response.get("query") or {}).get("pages") or {}
+    return list(pages.values() if isinstance(pages, dict) else pages)
+
+
+def purge_pages(commons_site: BaseSite, pages: list) -> list:
+    """``action=purge&forcelinkupdate=1`` over ``pages``, ``PURGE_BATCH``
+    titles per request. Returns the pages whose purge AND links update the
+    API confirmed; a failed request just leaves its batch out."""
+    by_title = {page.title(): page for page in pages}
+    titles = list(by_title)
+    purged = []
+    for start in range(0, len(titles), PURGE_BATCH):
+        batch = titles[start : start + PURGE_BATCH]
+        try:
+            response = commons_site.simple_request(
+                action="purge", titles=batch, forcelinkupdate=True
+            ).submit()
         except Exception as e:
-            logging.warning(f"Failed to touch '{page.title()}'", exc_info=e)
-    return count
+            logging.warning(f"Purge of {len(batch)} titles failed: {e}")
+            continue
+        for entry in response.get("purge") or []:
+            # fv1 flags are present-with-"" and fv2 omits false, so key
+            # presence means "true" under both.
+            if "purged" in entry and "linkupdate" in entry:
+                page = by_title.get(entry.get("title"))
+                if page is not None:
+                    purged.append(page)
+    return purged
+
+
+def pages_in_category(commons_site: BaseSite, pages: list, category: str) -> list:
+    """The subset of ``pages`` currently in ``category``, checked with one
+    ``prop=categories&clcategories=`` request per ``PURGE_BATCH`` titles. A
+    failed request counts its whole batch as still in the category."""
+    by_title = {page.title(): page for page in pages}
+    titles = list(by_title)
+    remaining = []
+    for start in range(0, len(titles), PURGE_BATCH):
+        batch = titles[start : start + PURGE_BATCH]
+        try:
+            response = commons_site.simple_request(
+                action="query",
+                prop="categories",
+                clcategories=category,
+                cllimit="max",
+                titles=batch,
+            ).submit()
+        except Exception as e:
+            logging.warning(f"Category check of {len(batch)} titles failed: {e}")
+            remaining += [by_title[t] for t in batch]
+            continue
+        for entry in _query_pages(response):
+            if entry.get("categories") and entry.get("title") in by_title:
+                remaining.append(by_title[entry["title"]])
+    return remaining
+
+
+def rerender_pages(
+    commons_site: BaseSite,
+    pages: list,
+    log_each: bool = False,
+    workers: int = 1,
+) -> list:
+    """Re-render ``pages`` with batched purges instead of one null edit each.
+
+    A purge with ``forcelinkupdate`` re-parses the page and rewrites its
+    category links — the same effect a null edit has on the
+    ``{{Institution|wikidata=…}}`` expansion — but 50 titles to a request and
+    outside the edit-rate budget. Only pages whose purge failed, or that are
+    still in :data:`UNKNOWN_INSTITUTION_CATEGORY` afterwards (e.g. still
+    rendering before the Wikidata change replicated), fall back to
+    :func:`touch_pages`. Returns the pages re-rendered either way.
+    """
+    purged = purge_pages(commons_site, pages)
+    purged_titles = {page.title() for page in purged}
+    unpurged = [page for page in pages if page.title() not in purged_titles]
+    stragglers = pages_in_category(commons_site, purged, UNKNOWN_INSTITUTION_CATEGORY)
+    straggler_titles = {page.title() for page in stragglers}
+    cleared = [page for page in purged if page.title() not in straggler_titles]
+    logging.info(
+        f"Purged {len(purged)}/{len(pages)} files; {len(cleared)} cleared,"
+        f" {len(stragglers) + len(unpurged)} falling back to null edits."
+    )
+    if log_each:
+        for page in cleared:
+            logging.info(f"  Purged: {page.title()}")
+    touched = touch_pages(
+        commons_site, unpurged + stragglers, log_each=log_each, workers=workers
+    )
+    return cleared + touched
@@ -1,4 +1,5 @@
 import csv
+from collections.abc import Mapping
 from typing import IO
 
 CHECKSUM = "sha1"
@@ -13,8 +14,10 @@ def load_ids(ids_file: IO) -> list[str]:
     return dpla_ids
 
 
-def null_safe[T](data: dict, field_name: str, identity_element: T) -> T:
-    if data is not None and type(data) is dict:
+def null_safe[T](data: Mapping, field_name: str, identity_element: T) -> T:
+    # Any Mapping, not just dict: the staged institutions/subjects configs
+    # are served as read-only partners.ConfigSnapshot mappings.
+    if isinstance(data, Mapping):
         value = data.get(field_name, identity_element)
         if type(value) is type(identity_element):
             return value
@@ -24,16 +27,16 @@ def null_safe[T](data: dict, field_name: str, identity_element: T) -> T:
         return identity_element
 
 
-def get_list(data: dict, field_name: str) -> list:
-    """Null safe shortcut for getting an array from a dict."""
+def get_list(data: Mapping, field_name: str) -> list:
+    """Null safe shortcut for getting an array from a mapping."""
     return null_safe(data, field_name, [])
 
 
-def get_str(data: dict, field_name: str) -> str:
-    """Null safe shortcut for getting a string from a dict."""
+def get_str(data: Mapping, field_name: str) -> str:
+    """Null safe shortcut for getting a string from a mapping."""
     return null_safe(data, field_name, "")
 
 
-def get_dict(data: dict, field_name: str) -> dict:
-    """Null safe shortcut for getting a dict from a dict."""
+def get_dict(data: Mapping, field_name: str) -> dict:
+    """Null safe shortcut for getting a dict from a mapping."""
     return null_safe(data, field_name, {})
@@ -1,5 +1,6 @@
 import json
 import logging
+from collections.abc import Mapping
 from urllib import parse
 from typing import TypeVar, Callable
 
@@ -238,6 +239,17 @@ class DPLA:
     ) -> bool:
         """
         Enforces a number of criteria for ensuring this is an item we should upload.
+
+        Pure and network-free: a decision over the staged metadata alone. The
+        reachability probe for a CONTENTdm manifest derived from
+        ``isShownAt`` used to run here — one ``HEAD`` per item on the
+        uploader's hot path — and now runs once, in parallel, when get-ids-es
+        stages the item (:func:`ingest_wikimedia.staging.probe_derived_manifest`),
+        which records the status in ``dpla-map.json``. A derived manifest
+        whose staging probe got an error status is not an asset; one never
+        probed (metadata staged before the probe existed, or a network error
+        at staging) is, and the downloader's manifest fetch remains the real
+        test.
         """
 
         def value_ok(value: T, test: Callable[[T], bool], error_msg: str):
@@ -289,12 +301,10 @@ class DPLA:
         iiif_manifest = get_str(item_metadata, IIIF_MANIFEST_FIELD_NAME)
 
         if not iiif_manifest and not media_master:
-            iiif_url = self.iiif.contentdm_iiif_url(is_shown_at)
-            if iiif_url is not None:
-                response = self.http_session.head(iiif_url, allow_redirects=True)
-                if response.status_code < 400:
-                    item_metadata[IIIF_MANIFEST_FIELD_NAME] = iiif_url
-                    iiif_manifest = iiif_url
+            iiif_manifest = self.iiif.contentdm_iiif_url(is_shown_at) or ""
+        probe_status = item_metadata.get(IIIF_MANIFEST_PROBE_FIELD_NAME)
+        if isinstance(probe_status, int) and probe_status >= 400:
+            iiif_manifest = ""
 
         asset_ok = value_ok(
             value=(media_master or bool(str(iiif_manifest))),
@@ -318,7 +328,7 @@ class DPLA:
 
     @staticmethod
     def get_provider_and_data_provider(
-        item_metadata: dict, providers_json: dict
+        item_metadata: dict, providers_json: Mapping
     ) -> tuple[dict, dict]:
         """
         Loads metadata about the provider and data provider from the providers json file.
@@ -335,7 +345,7 @@ class DPLA:
         )
         return provider, data_provider
 
-    def get_providers_data(self) -> dict:
+    def get_providers_data(self) -> Mapping:
         """Loads institutions_v2.json (hub → config) from ingestion3.
 
         Delegates to ``partners.load_institutions`` so it reads the launch-staged
@@ -393,6 +403,12 @@ INSTITUTIONS_FIELD_NAME = "institutions"
 SOURCE_RESOURCE_FIELD_NAME = "sourceResource"
 MEDIA_MASTER_FIELD_NAME = "mediaMaster"
 IIIF_MANIFEST_FIELD_NAME = "iiifManifest"
+# Staging-time markers get-ids-es adds to ``dpla-map.json`` for a manifest URL
+# it derived from ``isShownAt`` (rather than one DPLA supplied): the flag, and
+# the HTTP status of the one-off reachability probe. Underscored like
+# ``_staged_by_get_ids_es`` — ours, not DPLA's.
+IIIF_MANIFEST_DERIVED_FIELD_NAME = "_iiif_manifest_derived"
+IIIF_MANIFEST_PROBE_FIELD_NAME = "_iiif_manifest_probe_status"
 PROVIDER_FIELD_NAME = "provider"
 DATA_PROVIDER_FIELD_NAME = "dataProvider"
 EXACT_MATCH_FIELD_NAME = "exactMatch"
@@ -22,6 +22,8 @@ from typing import Any
 
 import requests
 
+from ingest_wikimedia.timings import timings
+
 ES_URL = "http://search-prod1.internal.dp.la:9200/dpla_alias/_search"
 ES_HARD_TIMEOUT = 120
 
@@ -54,7 +56,8 @@ def post_es(query: dict) -> requests.Response:
         )
     signal.alarm(ES_HARD_TIMEOUT)
     try:
-        return requests.post(ES_URL, json=query, timeout=30)
+        with timings.time("es.search"):
+            return requests.post(ES_URL, json=query, timeout=30)
     finally:
         signal.alarm(0)
 
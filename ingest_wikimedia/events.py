@@ -0,0 +1,204 @@
+"""Machine-readable JSONL event stream written alongside each phase log.
+
+The status poller, ``get-ids-retry`` and the Slack failure summary all
+recover pipeline state by scraping the human log — regexes over
+``DPLA ID:`` / ``Failed:`` / ``COUNTS:`` lines, awk over SSM — which is slow
+on multi-GB logs and silently breaks whenever a message is reworded.
+:func:`~ingest_wikimedia.logs.setup_logging` now also opens
+``{time}-{label}-{phase}.events.jsonl`` next to the ``.log`` and every call
+to :func:`emit` appends one JSON object per line::
+
+    {"ts": 1760000000.123, "event": "item_end", "dpla_id": "…", "seconds": 4.2}
+
+Events ride the standard ``logging`` machinery on a dedicated logger rather
+than a module-level file handle. That is what makes them work from
+``multiprocessing`` pool workers for free: the uploader / sdc-sync workers
+already forward every record through a ``QueueHandler`` to the parent's
+handlers, and the parent's :class:`JsonlEventHandler` is one of those
+handlers. The text handlers installed by ``setup_logging`` carry
+:func:`drop_events` so event records never show up in the human log.
+
+Event names in use: ``phase_start``, ``item_start``, ``item_end``,
+``ordinal``, ``tracker`` (periodic and final counter snapshot) and
+``timings``. Consumers should ignore unknown event names and fields.
+"""
+
+import json
+import logging
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+EVENTS_LOGGER_NAME = "ingest_wikimedia.events"
+EVENTS_SUFFIX = ".events.jsonl"
+# Seconds between the periodic ``tracker`` snapshots written by
+# :func:`maybe_emit_tracker`. Frequent enough that a stalled run is visible
+# within a couple of minutes; rare enough to be noise-free on multi-day runs.
+TRACKER_EVENT_INTERVAL_SECONDS = 60
+
+_events_logger = logging.getLogger(EVENTS_LOGGER_NAME)
+# Pinned to INFO so events are written even when a tool runs its text log at
+# WARNING, and independent of whatever level the root logger ends up at.
+_events_logger.setLevel(logging.INFO)
+
+_last_tracker_emit = 0.0
+
+
+def emit(event: str, **fields) -> None:
+    """Append one structured event. Cheap no-op-ish when nothing listens:
+    without :func:`~ingest_wikimedia.logs.setup_logging` the record reaches
+    no JSONL handler and is dropped below logging's WARNING last resort."""
+    _events_logger.info(event, extra={"event_fields": {"event": event, **fields}})
+
+
+@contextmanager
+def item(dpla_id: str, **fields) -> Iterator[None]:
+    """Bracket one DPLA item with ``item_start`` / ``item_end`` events.
+
+    ``item_end`` carries the wall-clock ``seconds`` and, when the body
+    raised, the exception class under ``error_class`` — the exception
+    itself propagates unchanged, so this is safe to wrap around the
+    per-item call in both the serial loops and the pool worker tasks.
+    """
+    emit("item_start", dpla_id=dpla_id, **fields)
+    start = time.monotonic()
+    error_class = None
+    try:
+        yield
+    except BaseException as ex:
+        error_class = type(ex).__name__
+        raise
+    finally:
+        end: dict = {"dpla_id": dpla_id, "seconds": round(time.monotonic() - start, 3)}
+        if error_class:
+            end["error_class"] = error_class
+        emit("item_end", **end)
+
+
+def cause_chain(ex: BaseException) -> list[str]:
+    """Class names of the exceptions behind ``ex``, nearest first.
+
+    Follows ``__cause__`` (``raise ... from``) and, failing that,
+    ``__context__`` (raised while handling), so a transient error wrapped
+    in a generic one — ``RuntimeError`` from a ``ReadTimeout`` after the
+    retry loop gives up — is still visible to consumers that classify by
+    class name. Cycles are cut at the first repeat.
+    """
+    names: list[str] = []
+    seen = {id(ex)}
+    current = ex.__cause__ or ex.__context__
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        names.append(type(current).__name__)
+        current = current.__cause__ or current.__context__
+    return names
+
+
+def drop_events(record: logging.LogRecord) -> bool:
+    """Handler filter that keeps event records out of the human log."""
+    return not hasattr(record, "event_fields")
+
+
+def events_path_for(log_path: str) -> str:
+    """Return the JSONL path that accompanies a ``.log`` path."""
+    root, ext = os.path.splitext(log_path)
+    return (root if ext == ".log" else log_path) + EVENTS_SUFFIX
+
+
+class JsonlEventHandler(logging.Handler):
+    """Writes event records (and only event records) as JSON lines.
+
+    Flushes per record: the file is tailed by the status tooling while the
+    phase is running, and a run that dies mid-item must not lose the events
+    leading up to the crash to a buffer.
+    """
+
+    def __init__(self, filename: str):
+        super().__init__(logging.INFO)
+        self._stream = open(filename, "a", encoding="utf-8")
+        self.addFilter(lambda record: hasattr(record, "event_fields"))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            payload = {"ts": round(record.created, 3), **record.event_fields}
+            self._stream.write(json.dumps(payload, default=str) + "\n")
+            self._stream.flush()
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            super().close()
+
+
+def counts_payload(tracker) -> dict[str, int]:
+    """Non-zero ``Result`` counters keyed by name — the JSON form of the
+    text ``COUNTS:`` block."""
+    return {key.name: value for key, value in tracker.data.items() if value}
+
+
+def emit_tracker(tracker, *, final: bool = False) -> None:
+    """Write a ``tracker`` event with the current non-zero counters."""
+    emit("tracker", counts=counts_payload(tracker), final=final)
+
+
+def maybe_emit_tracker(tracker, now: float | None = None) -> None:
+    """Emit a periodic ``tracker`` snapshot at most once per
+    :data:`TRACKER_EVENT_INTERVAL_SECONDS`. Called from the per-item loops;
+    the throttle keeps it to one ``time.time()`` comparison per item."""
+    global _last_tracker_emit
+    now = time.time() if now is None else now
+    if now - _last_tracker_emit < TRACKER_EVENT_INTERVAL_SECONDS:
+        return
+    _last_tracker_emit = now
+    emit_tracker(tracker)
+
+
+def emit_phase_end(tracker, timings) -> None:
+    """Write the final ``timings`` and ``tracker`` events — the structured
+    twin of the ``TIMINGS:`` / ``COUNTS:`` blocks logged at phase end."""
+    emit("timings", ops=timings.snapshot())
+    emit_tracker(tracker, final=True)
+
+
+def parse_event_line(line: str, event: str | None = None) -> dict | None:
+    """Parse one JSONL line into an event, optionally only ``event``.
+
+    Returns ``None`` for a torn line (the writer was killed mid-write), any
+    other unparseable or non-object line, and events of another name.
+    """
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(record, dict):
+        return None
+    if event is not None and record.get("event") != event:
+        return None
+    return record
+
+
+def iter_events(
+    path: str, event: str | None = None, tail_bytes: int | None = None
+) -> Iterator[dict]:
+    """Yield parsed events from a JSONL file, optionally only ``event``.
+
+    Unparseable lines are skipped rather than aborting the read (see
+    :func:`parse_event_line`). ``tail_bytes`` limits the read to the end of
+    the file — the partial line it starts inside is dropped — for callers
+    that only want the latest events of a multi-GB stream.
+    """
+    with open(path, "rb") as f:
+        if tail_bytes is not None:
+            size = os.fstat(f.fileno()).st_size
+            if size > tail_bytes:
+                f.seek(size - tail_bytes - 1)
+                if f.read(1) != b"\n":
+                    f.readline()
+        for raw in f:
+            record = parse_event_line(raw.decode("utf-8", errors="replace"), event)
+            if record is not None:
+                yield record
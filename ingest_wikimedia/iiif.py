@@ -1,7 +1,9 @@
 import json
 import logging
 import re
+import threading
 from operator import itemgetter
+from typing import NamedTuple
 from urllib.parse import urlparse
 
 import requests
@@ -9,13 +11,102 @@ import validators
 from requests import Session
 
 from ingest_wikimedia.common import get_list, get_dict, get_str
+from ingest_wikimedia.timings import timings
 from ingest_wikimedia.tracker import Tracker, Result
 
 
+class ManifestFetch(NamedTuple):
+    """Outcome of a (possibly conditional) manifest GET.
+
+    ``not_modified`` is True when the server answered ``304`` to the
+    validators we sent — ``manifest`` is then None and the caller's stored
+    copy is current. ``etag`` / ``last_modified`` are the response's
+    validators, for storing alongside the manifest so the next fetch can be
+    conditional. ``error`` says why a failed fetch has no manifest; the fetch
+    itself doesn't log it, so the caller can log it in its own scope.
+    """
+
+    manifest: dict | None
+    etag: str | None = None
+    last_modified: str | None = None
+    not_modified: bool = False
+    error: str | None = None
+
+    def validators(self) -> dict[str, str]:
+        """The response validators as S3 user metadata, omitting absent
+        ones and any value S3 can't store (user metadata must be ASCII)."""
+        pairs = (
+            (MANIFEST_ETAG_METADATA, self.etag),
+            (MANIFEST_LAST_MODIFIED_METADATA, self.last_modified),
+        )
+        return {k: v for k, v in pairs if v and v.isascii()}
+
+
+class ServerCapabilities:
+    """Per-image-server memory of whether the "append a full-res suffix"
+    fallback in :meth:`IIIF.maximize_iiif_url` works.
+
+    That fallback used to ``HEAD`` ``url + suffix`` for every canvas that
+    none of the URL-shape regexes recognise — once per page of every item
+    on the server, although a IIIF image server answers the same URL shape
+    the same way for every identifier it serves. Keyed by
+    ``scheme://host/service-path`` (the URL minus its identifier segment)
+    and the suffix, so a proven v3 suffix says nothing about the v2 one, and
+    one service on a host says nothing about another service behind it:
+
+    * the first successful probe marks the service as accepting the suffix,
+      and every later canvas from it is maximized with no network call;
+    * :data:`PROBE_FAILURES_BEFORE_NEGATIVE` definitive refusals with no
+      success mark it as not accepting it, and later canvases fail fast. A
+      refusal is an answer about the URL shape — a 4xx, or a 2xx that isn't
+      a JPEG. A 5xx, 408 or 429 is the server having a bad moment, and a
+      timeout never gets this far, so neither counts.
+
+    Process-lifetime only: a run is one partner's batch, and a server that
+    changes behaviour mid-run is not worth a TTL. Lock-guarded because
+    manifests may be resolved from prefetch threads.
+    """
+
+    def __init__(self):
+        self._accepts_suffix: set[str] = set()
+        self._failures: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def server_key(url: str, suffix: str) -> str:
+        parsed = urlparse(url)
+        service_path = parsed.path.rstrip("/").rpartition("/")[0]
+        return f"{parsed.scheme}://{parsed.netloc}{service_path} {suffix}"
+
+    def lookup(self, url: str, suffix: str) -> bool | None:
+        """True/False when the service's behaviour is known, else None."""
+        key = self.server_key(url, suffix)
+        with self._lock:
+            if key in self._accepts_suffix:
+                return True
+            if self._failures.get(key, 0) >= PROBE_FAILURES_BEFORE_NEGATIVE:
+                return False
+        return None
+
+    def record_probe(self, url: str, suffix: str, ok: bool | None) -> None:
+        """``ok`` is None for an inconclusive (transient) probe, which
+        leaves the service's record as it was."""
+        if ok is None:
+            return
+        key = self.server_key(url, suffix)
+        with self._lock:
+            if ok:
+                self._accepts_suffix.add(key)
+                self._failures.pop(key, None)
+            else:
+                self._failures[key] = self._failures.get(key, 0) + 1
+
+
 class IIIF:
     def __init__(self, tracker: Tracker, http_session: Session):
         self.tracker = tracker
         self.http_session = http_session
+        self.server_capabilities = ServerCapabilities()
 
     def iiif_v2_urls(self, iiif: dict) -> list[str]:
         """
@@ -159,14 +250,27 @@ class IIIF:
         else:
             # try just whacking a max-res suffix on:
             test_url = url + suffix
-            # test to make sure that has something at the end of it
-
-            head_response = self.http_session.head(test_url)
-            if (
-                head_response.ok
-                and head_response.headers[HEADER_CONTENT_TYPE] == CONTENT_TYPE_JPEG
-            ):
+            known = self.server_capabilities.lookup(url, suffix)
+            if known:
                 return test_url
+            if known is None:
+                # test to make sure that has something at the end of it
+                with timings.time("iiif.head_probe"):
+                    head_response = self.http_session.head(test_url)
+                ok = (
+                    head_response.ok
+                    and head_response.headers.get(HEADER_CONTENT_TYPE)
+                    == CONTENT_TYPE_JPEG
+                )
+                transient = not head_response.ok and (
+                    head_response.status_code >= 500
+                    or head_response.status_code in PROBE_TRANSIENT_STATUSES
+                )
+                self.server_capabilities.record_probe(
+                    url, suffix, None if transient else ok
+                )
+                if ok:
+                    return test_url
 
         logging.warning(f"Couldn't maximize IIIF URL: {url}")
         self.tracker.increment(Result.BAD_IMAGE_API)
@@ -191,20 +295,56 @@ class IIIF:
 
     def get_iiif_manifest(self, url: str) -> dict | None:
         """
-        Gets the IIIF manifest from the given url.
+        Gets the IIIF manifest from the given url, logging why when it can't.
+        """
+        fetched = self.fetch_iiif_manifest(url)
+        if fetched.error:
+            logging.warning(fetched.error)
+        return fetched.manifest
+
+    def fetch_iiif_manifest(
+        self,
+        url: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> ManifestFetch:
+        """
+        Gets the IIIF manifest from the given url, revalidating against the
+        ``etag`` / ``last_modified`` of a previously stored copy when given.
+
+        Sends ``If-None-Match`` / ``If-Modified-Since`` so a server that
+        supports them (CONTENTdm does) answers an unchanged manifest with a
+        body-less ``304`` instead of the full JSON. Servers that ignore the
+        headers just answer ``200`` as before. On any failure the result's
+        ``manifest`` is None, ``not_modified`` is False and ``error`` carries
+        the message. Nothing is logged here: the downloader calls this from
+        its prefetch threads, outside the item's log scope.
         """
         if not validators.url(url):
-            logging.warning(f"Invalid IIIF manifest url: {url}")
-            return None
+            return ManifestFetch(None, error=f"Invalid IIIF manifest url: {url}")
+
+        headers = {}
+        if etag:
+            headers[HEADER_IF_NONE_MATCH] = etag
+        if last_modified:
+            headers[HEADER_IF_MODIFIED_SINCE] = last_modified
 
         try:
-            request = self.http_session.get(url)
-            request.raise_for_status()
-            return request.json()
+            with timings.time("iiif.manifest"):
+                request = self.http_session.get(url, headers=headers)
+                if request.status_code == HTTP_NOT_MODIFIED and headers:
+                    return ManifestFetch(
+                        None, etag=etag, last_modified=last_modified, not_modified=True
+                    )
+                request.raise_for_status()
+                return ManifestFetch(
+                    request.json(),
+                    etag=request.headers.get(HEADER_ETAG),
+                    last_modified=request.headers.get(HEADER_LAST_MODIFIED),
+                )
 
         except (requests.RequestException, json.JSONDecodeError):
-            logging.warning(f"Unable to read IIIF manifest at {url}")
-            return None
+            return ManifestFetch(None, error=f"Unable to read IIIF manifest at {url}")
 
     @staticmethod
     def contentdm_iiif_url(is_shown_at: str) -> str | None:
@@ -375,5 +515,21 @@ CONTENT_DM_ISSHOWNAT_REGEX = r"^/cdm/ref/collection/(.*)/id/(.*)$"
 JSON_LD_AT_CONTEXT = "@context"
 JSON_LD_AT_ID = "@id"
 
+# Definitive suffix-probe refusals, with no success, before a service is
+# negatively cached by ServerCapabilities.
+PROBE_FAILURES_BEFORE_NEGATIVE = 3
+# Below 500 but about the server's state, not the URL shape: these never
+# count toward the negative cache (nor does any 5xx).
+PROBE_TRANSIENT_STATUSES = frozenset({408, 429})
+
 HEADER_CONTENT_TYPE = "Content-Type"
+HEADER_ETAG = "ETag"
+HEADER_LAST_MODIFIED = "Last-Modified"
+HEADER_IF_NONE_MATCH = "If-None-Match"
+HEADER_IF_MODIFIED_SINCE = "If-Modified-Since"
+HTTP_NOT_MODIFIED = 304
+# S3 user-metadata keys the manifest's validators are stored under on
+# ``iiif.json`` (lower-case: S3 folds user metadata keys).
+MANIFEST_ETAG_METADATA = "manifest-etag"
+MANIFEST_LAST_MODIFIED_METADATA = "manifest-last-modified"
 CONTENT_TYPE_JPEG = "image/jpeg"
@@ -35,7 +35,9 @@ from urllib.parse import urlencode, urlparse
 
 import mwparserfromhell
 
+from ingest_wikimedia import wikitext_parse
 from ingest_wikimedia.csrf import with_csrf_recovery
+from ingest_wikimedia.timings import timings
 from ingest_wikimedia.sdc import (
     CASEFOLD_COMPARE_KEYS,
     casefold_for_compare,
@@ -250,6 +252,14 @@ class RevisionSnapshot:
     revid: int
     user: str
     text: str
+    # Pre-parsed :func:`parse_artwork_params` result, set when the snapshot
+    # came from the revision-params cache instead of a content fetch (and
+    # ``text`` is then empty). Consumers go through :func:`_revision_params`.
+    params: dict[str, str] | None = field(default=None, compare=False)
+
+
+def _revision_params(rev: RevisionSnapshot) -> dict[str, str]:
+    return rev.params if rev.params is not None else parse_artwork_params(rev.text)
 
 
 @dataclass
@@ -310,7 +320,7 @@ def find_legacy_template(wikitext: str):
     both are present (rare but defensible: a page already migrated
     once that someone added an Information block to).
     """
-    wikicode = mwparserfromhell.parse(wikitext)
+    wikicode = wikitext_parse.parse(wikitext)
     for tpl in wikicode.filter_templates():
         if _template_name(tpl) in LEGACY_TEMPLATE_NAMES:
             return tpl
@@ -519,14 +529,14 @@ def trace_param_provenance(
     if not sorted_revs:
         return {}
 
-    final_params = parse_artwork_params(sorted_revs[-1].text)
+    final_params = _revision_params(sorted_revs[-1])
     if not final_params:
         return {}
 
     provenance: dict[str, str] = {}
     prior_seen: dict[str, str] = {}
     for rev in sorted_revs:
-        rev_params = parse_artwork_params(rev.text)
+        rev_params = _revision_params(rev)
         # Drop entries from prior_seen for params the current revision
         # no longer carries. Without this, a delete → re-add of the
         # same string at a later revision looks like "unchanged" (the
@@ -773,7 +783,7 @@ def _unwrap_infi_creator(value: str) -> str | None:
     a Commons editor actually contributed; the wrapper is bot
     scaffolding that drops out on migration.
     """
-    parsed = mwparserfromhell.parse(value)
+    parsed = wikitext_parse.parse(value)
     templates = parsed.filter_templates(recursive=False)
     if len(templates) != 1:
         return None
@@ -1029,7 +1039,7 @@ def _is_redundant_dpla_source(value: str) -> bool:
     if "dpla" not in value.casefold():
         return False  # cheap guard: a DPLA-managed name always contains "dpla"
     saw_dpla_template = False
-    for node in mwparserfromhell.parse(value).nodes:
+    for node in wikitext_parse.parse(value).nodes:
         if isinstance(node, mwparserfromhell.nodes.Template):
             if _template_name(node) not in _DPLA_MANAGED_TEMPLATE_NAMES:
                 return False
@@ -1071,7 +1081,7 @@ def _only_external_links(value: str) -> bool:
     uploader-generated source pointer (it becomes the file's SDC source), not
     community-authored context. Any prose alongside means it is NOT pure."""
     saw = False
-    for node in mwparserfromhell.parse(value).nodes:
+    for node in wikitext_parse.parse(value).nodes:
         if isinstance(node, mwparserfromhell.nodes.ExternalLink):
             saw = True
         elif isinstance(node, mwparserfromhell.nodes.Text):
@@ -1115,7 +1125,7 @@ def _is_dpla_generated_extra(key: str, value: str) -> bool:
             return False
         urls = [
             str(n.url)
-            for n in mwparserfromhell.parse(value).nodes
+            for n in wikitext_parse.parse(value).nodes
             if isinstance(n, mwparserfromhell.nodes.ExternalLink)
         ]
         return all(_is_rights_url(u) for u in urls)
@@ -1265,7 +1275,7 @@ def _unwrap_lang_template(value: str) -> tuple[str, str]:
     # title/description value across the batch).
     if "{{" not in value:
         return value, "en"
-    parsed = mwparserfromhell.parse(value.strip())
+    parsed = wikitext_parse.parse(value.strip())
     templates = parsed.filter_templates(recursive=False)
     if len(templates) == 1 and str(parsed).strip() == str(templates[0]).strip():
         tpl = templates[0]
@@ -1668,45 +1678,238 @@ def build_legacy_import_claims(plan: MigrationPlan) -> list[dict]:
 # ---------------------------------------------------------------------------
 
 
-def fetch_revision_snapshots(file_page) -> list[RevisionSnapshot]:
-    """Pull the full revision history of ``file_page`` into
+# Revisions per ``prop=revisions&revids=…`` content request — the API's
+# multi-revision cap for non-high-limit accounts.
+_REVISION_CONTENT_BATCH = 50
+# Bump when :func:`parse_artwork_params` changes what it extracts, so cached
+# param dicts parsed by the old code are ignored rather than trusted.
+REVISION_CACHE_VERSION = 1
+REVISION_CACHE_FILENAME = "legacy-revision-params.sqlite"
+
+
+class RevisionParamsCache:
+    """On-disk ``revid → parse_artwork_params(text)`` cache.
+
+    A revision's content never changes once saved, so its parsed legacy
+    params are valid forever (modulo :data:`REVISION_CACHE_VERSION`). Re-runs
+    of ``sdc-sync --migrate-legacy`` over a partner — after a crash, a
+    ``--limit`` trial, or a later pass for files that failed — then only
+    fetch content for revisions saved since the previous run. Rows also
+    carry the revision's ``sha1`` so a revert to a cached state reuses the
+    cached params without a content fetch.
+
+    SQLite rather than a JSON file: lookups are per-file batches out of a
+    partner-sized table, and writes land incrementally so a killed run
+    keeps everything it parsed.
+    """
+
+    def __init__(self, path: str):
+        import sqlite3
+
+        self.path = path
+        self._db = sqlite3.connect(path, timeout=30)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS revision_params ("
+            "revid INTEGER PRIMARY KEY, sha1 TEXT, version INTEGER, params TEXT)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS revision_params_sha1 ON revision_params(sha1)"
+        )
+        self._db.commit()
+
+    def lookup(
+        self, revids: list[int], sha1s: list[str]
+    ) -> tuple[dict[int, dict[str, str]], dict[str, dict[str, str]]]:
+        """Return ``(params_by_revid, params_by_sha1)`` for the cached rows
+        matching either key, ignoring rows from another cache version."""
+        by_revid: dict[int, dict[str, str]] = {}
+        by_sha1: dict[str, dict[str, str]] = {}
+        for column, keys in (("revid", revids), ("sha1", sha1s)):
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                rows = self._db.execute(
+                    f"SELECT revid, sha1, params FROM revision_params "
+                    f"WHERE version = ? AND {column} IN "
+                    f"({','.join('?' * len(chunk))})",
+                    [REVISION_CACHE_VERSION, *chunk],
+                )
+                for revid, sha1, params in rows:
+                    parsed = json.loads(params)
+                    by_revid[revid] = parsed
+                    if sha1:
+                        by_sha1[sha1] = parsed
+        return by_revid, by_sha1
+
+    def store(self, rows: list[tuple[int, str | None, dict[str, str]]]) -> None:
+        if not rows:
+            return
+        self._db.executemany(
+            "INSERT OR REPLACE INTO revision_params VALUES (?, ?, ?, ?)",
+            [
+                (revid, sha1, REVISION_CACHE_VERSION, json.dumps(params))
+                for revid, sha1, params in rows
+            ],
+        )
+        self._db.commit()
+
+    def close(self) -> None:
+        self._db.close()
+
+
+_revision_cache: RevisionParamsCache | None = None
+
+
+def enable_revision_cache(path: str = REVISION_CACHE_FILENAME) -> None:
+    """Route :func:`fetch_revision_snapshots` through an on-disk
+    :class:`RevisionParamsCache` at ``path`` for the rest of the process."""
+    global _revision_cache
+    if _revision_cache is not None:
+        _revision_cache.close()
+    _revision_cache = RevisionParamsCache(path)
+
+
+def _fetch_revision_texts(site, revids: list[int]) -> dict[int, str]:
+    """Fetch main-slot content for exactly ``revids``, batched
+    :data:`_REVISION_CONTENT_BATCH` per request. Revisions whose content
+    the API withholds (suppressed, deleted) are absent from the result."""
+    texts: dict[int, str] = {}
+    for start in range(0, len(revids), _REVISION_CONTENT_BATCH):
+        batch = revids[start : start + _REVISION_CONTENT_BATCH]
+        with timings.time("legacy.revision_content"):
+            response = site.simple_request(
+                action="query",
+                prop="revisions",
+                revids="|".join(str(r) for r in batch),
+                rvprop="ids|content",
+                rvslots="main",
+            ).submit()
+        pages = (response.get("query") or {}).get("pages") or {}
+        # formatversion 1 keys pages by pageid and content by ``*``;
+        # formatversion 2 uses a list and ``content`` — accept both, as
+        # _resolve_commons_creator_qid does.
+        for page in pages.values() if isinstance(pages, dict) else pages:
+            for rev in page.get("revisions") or []:
+                main = (rev.get("slots") or {}).get("main") or rev
+                text = main.get("*", main.get("content"))
+                if isinstance(text, str) and "revid" in rev:
+                    texts[int(rev["revid"])] = text
+    return texts
+
+
+def fetch_revision_snapshots(
+    file_page, cache: RevisionParamsCache | None = None
+) -> list[RevisionSnapshot]:
+    """Pull the revision history of ``file_page`` into
     :class:`RevisionSnapshot` records the planner consumes.
 
-    Requests revision text (``content=True``) so the planner can parse
-    each historical wikitext. On a long-tenure file with thousands of
-    revisions this is a non-trivial pywikibot call; callers running
-    against a partner batch should expect minutes of wall time per
-    high-traffic file. The cost is paid once at plan time — the result
-    of :func:`plan_migration` is a small dict the executor walks
-    cheaply.
+    Fetches revision *metadata* first (``revisions(content=False)`` —
+    ids, user, sha1) and then content only where it is actually needed:
+
+    * revisions already in the :class:`RevisionParamsCache` (``cache``, or
+      the process-wide one from :func:`enable_revision_cache`) reuse their
+      cached param dicts;
+    * revisions whose sha1 matches one already cached or already queued —
+      reverts and null edits, which dominate long vandalism-patrol
+      histories — share that revision's params;
+    * everything else, plus the latest revision (whose full text
+      :func:`plan_migration` needs), is fetched in
+      :data:`_REVISION_CONTENT_BATCH`-revid requests and parsed once.
+
+    Previously every call was a ``revisions(content=True)`` walk of the full
+    history — minutes of wall time per high-traffic file, repeated on every
+    re-run. Cached snapshots carry ``params`` and an empty ``text``; only
+    the latest snapshot is guaranteed to carry text.
 
     A SUPPRESSED (RevDel) revision hides its author and content together
     (``user is None``); it is tolerated — coerced to ``""`` so
     :func:`parse_artwork_params` finds no params and it contributes nothing
     to provenance. But a revision with a VISIBLE author and unloaded content
-    (``text is None`` while ``user`` is set) means the
-    ``revisions(content=True)`` fetch came back PARTIAL. That is raised, not
-    tolerated: silently coercing it to ``""`` would drop it from
-    :func:`trace_param_provenance`'s walk, mis-attributing an unchanged
-    DPLA-bot param to whichever later community editor's revision did load —
-    emitting a false "community" SDC import and a bogus "added by Wikimedia
-    users, not verified by the source institution" notice. The caller skips
-    and flags the file; a re-run with a complete fetch migrates it correctly.
+    (no content returned while ``user`` is set) means the fetch came back
+    PARTIAL. That is raised, not tolerated: silently coercing it to ``""``
+    would drop it from :func:`trace_param_provenance`'s walk, mis-attributing
+    an unchanged DPLA-bot param to whichever later community editor's
+    revision did load — emitting a false "community" SDC import and a bogus
+    "added by Wikimedia users, not verified by the source institution"
+    notice. The caller skips and flags the file; a re-run with a complete
+    fetch migrates it correctly.
     """
+    cache = cache if cache is not None else _revision_cache
+    with timings.time("legacy.revision_metadata"):
+        metas = [
+            (
+                getattr(rev, "revid", 0),
+                getattr(rev, "user", None),
+                getattr(rev, "text", None),
+                getattr(rev, "sha1", None) or None,
+            )
+            for rev in file_page.revisions(content=False)
+        ]
+    if not metas:
+        return []
+    latest_revid = max(revid for revid, _, _, _ in metas)
+
+    texts: dict[int, str] = {}
+    params: dict[int, dict[str, str]] = {}
+    cached_by_revid: dict[int, dict[str, str]] = {}
+    cached_by_sha1: dict[str, dict[str, str]] = {}
+    if cache is not None:
+        cached_by_revid, cached_by_sha1 = cache.lookup(
+            [revid for revid, _, _, _ in metas],
+            sorted({sha1 for _, _, _, sha1 in metas if sha1}),
+        )
+
+    # sha1 → the one revid whose content stands in for every revision
+    # with that sha1 in this history.
+    queued_by_sha1: dict[str, int] = {}
+    to_fetch: list[int] = []
+    aliases: dict[int, int] = {}
+    for revid, user, text, sha1 in metas:
+        if text is not None:
+            texts[revid] = text
+        elif user is None:
+            texts[revid] = ""
+        elif revid == latest_revid:
+            to_fetch.append(revid)
+        elif revid in cached_by_revid:
+            params[revid] = cached_by_revid[revid]
+        elif sha1 and sha1 in cached_by_sha1:
+            params[revid] = cached_by_sha1[sha1]
+        elif sha1 and sha1 in queued_by_sha1:
+            aliases[revid] = queued_by_sha1[sha1]
+        else:
+            to_fetch.append(revid)
+            if sha1:
+                queued_by_sha1[sha1] = revid
+
+    if to_fetch:
+        texts.update(_fetch_revision_texts(file_page.site, to_fetch))
+
+    new_rows: list[tuple[int, str | None, dict[str, str]]] = []
+    for revid, user, _, sha1 in metas:
+        if revid in texts and revid not in params:
+            params[revid] = parse_artwork_params(texts[revid])
+            if user is not None:
+                new_rows.append((revid, sha1, params[revid]))
+
     snapshots: list[RevisionSnapshot] = []
-    for rev in file_page.revisions(content=True):
-        revid = getattr(rev, "revid", 0)
-        user = getattr(rev, "user", None)
-        text = getattr(rev, "text", None)
-        if text is None and user is not None:
+    for revid, user, _, _ in metas:
+        source = aliases.get(revid, revid)
+        if source not in params:
             raise RuntimeError(
                 f"incomplete revision content for {file_page.title()!r} "
                 f"(revid {revid}, user {user!r}): refusing to compute legacy "
                 f"provenance from a partial revision history"
             )
         snapshots.append(
-            RevisionSnapshot(revid=revid, user=user or "", text=text or "")
+            RevisionSnapshot(
+                revid=revid,
+                user=user or "",
+                text=texts.get(revid, ""),
+                params=params[source],
+            )
         )
+    if cache is not None:
+        cache.store(new_rows)
     return snapshots
 
 
@@ -2477,7 +2680,7 @@ def _extract_dpla_metadata_template(block: str) -> str:
     ``{{DPLA metadata}}`` template is found in it — a defensive
     no-op for callers that already pass just the template.
     """
-    node = _find_dpla_metadata_node(mwparserfromhell.parse(block))
+    node = _find_dpla_metadata_node(wikitext_parse.parse(block))
     return str(node) if node is not None else block
 
 
@@ -2548,7 +2751,7 @@ def _carry_user_extension_params(old_template, new_block: str) -> str:
     to_carry = [p for p in old_template.params if _is_user_extension_param(p)]
     if not to_carry:
         return new_block
-    fresh = mwparserfromhell.parse(new_block)
+    fresh = wikitext_parse.parse_copy(new_block)
     target = _find_dpla_metadata_node(fresh)
     if target is None:
         return new_block
@@ -2581,7 +2784,7 @@ def _swap_wrapper_node(
     ``Other fields N``) are carried from the old node into the fresh block,
     which is built from canonical params only and would otherwise drop them.
     """
-    wikicode = mwparserfromhell.parse(original_text)
+    wikicode = wikitext_parse.parse_copy(original_text)
     for tpl in wikicode.filter_templates():
         if _template_name(tpl) in wrapper_names:
             replacement = _extract_dpla_metadata_template(new_template_block)
@@ -2641,7 +2844,7 @@ def _inject_preserved_extras(text: str, extras: dict[str, str]) -> str:
     """
     if not extras:
         return text
-    wikicode = mwparserfromhell.parse(text)
+    wikicode = wikitext_parse.parse_copy(text)
     target = None
     for tpl in wikicode.filter_templates():
         if _template_name(tpl) == "dpla metadata":
@@ -5,6 +5,13 @@ from datetime import datetime
 
 from tqdm import tqdm
 
+from ingest_wikimedia.events import (
+    JsonlEventHandler,
+    drop_events,
+    emit,
+    events_path_for,
+)
+
 
 def _install_logging_excepthook() -> None:
     """Replace ``sys.excepthook`` with a wrapper that logs the
@@ -67,6 +74,12 @@ class TqdmLoggingHandler(logging.Handler):
             self.handleError(record)
 
 
+def session_label(partner: str) -> str:
+    """The label a phase's log (and progress checkpoint) is filed under:
+    ``WIKIMEDIA_SESSION_LABEL`` when the launcher set one, else the partner."""
+    return os.environ.get("WIKIMEDIA_SESSION_LABEL") or partner
+
+
 def setup_logging(
     partner: str, event_type: str, level: int = logging.INFO, console: bool = True
 ) -> None:
@@ -81,15 +94,22 @@ def setup_logging(
     file. Required for tools whose STDOUT is a data channel — e.g. ``get-ids-es``
     redirects stdout to the ID CSV, and ``TqdmLoggingHandler`` writes to stdout,
     so a console handler there would interleave log lines into the CSV.
+
+    Also opens the structured ``.events.jsonl`` stream next to the log (see
+    :mod:`ingest_wikimedia.events`); the text handlers filter event records
+    out so the human log is unchanged.
     """
     os.makedirs(LOGS_DIR_BASE, exist_ok=True)
     time_str = datetime.now().strftime("%Y%m%d-%H%M%S")
-    session_label = os.environ.get("WIKIMEDIA_SESSION_LABEL") or partner
-    log_file_name = f"{time_str}-{session_label}-{event_type}.log"
+    label = session_label(partner)
+    log_file_name = f"{time_str}-{label}-{event_type}.log"
     filename = f"{LOGS_DIR_BASE}/{log_file_name}"
     handlers: list[logging.Handler] = [logging.FileHandler(filename=filename, mode="w")]
     if console:
         handlers.insert(0, TqdmLoggingHandler())
+    for handler in handlers:
+        handler.addFilter(drop_events)
+    handlers.append(JsonlEventHandler(events_path_for(filename)))
     logging.basicConfig(
         level=level,
         datefmt="%H:%M:%S",
@@ -97,6 +117,7 @@ def setup_logging(
         format="[%(levelname)s] %(asctime)s: %(message)s",
     )
     logging.info(f"Logging to {filename}.")
+    emit("phase_start", label=label, phase=event_type, pid=os.getpid())
     for d in logging.Logger.manager.loggerDict:
         if d.startswith("pywiki"):
             logging.getLogger(d).setLevel(level)
@@ -30,6 +30,12 @@ ladder — no per-institution URL parsing, validated against the live index
 The ES-querying resolver takes an injectable ``query_fn`` (defaults to
 :func:`ingest_wikimedia.es.post_es`) so the ladder logic is unit-tested without
 a live cluster. The pure helpers below carry no ES dependency at all.
+
+:func:`resolve_current_dpla_ids` walks the same ladder for a whole batch of
+files: one ``ids`` query for every embedded id, one aggregated ``terms`` query
+for every normalized ``isShownAt`` candidate, and per-file wildcard queries
+only for the residue — a handful of round-trips per batch instead of one or
+more per file.
 """
 
 from __future__ import annotations
@@ -141,6 +147,34 @@ def _scoped_wildcard_query(token: str, scope_filter: dict) -> dict:
     }
 
 
+def _batch_ids_query(dpla_ids: list[str]) -> dict:
+    """Which of these ids exist? Returns the live ones as hits (no source)."""
+    return {
+        "size": len(dpla_ids),
+        "query": {"ids": {"values": dpla_ids}},
+        "_source": False,
+    }
+
+
+def _batch_isshownat_query(urls: list[str]) -> dict:
+    """Exact ``terms`` on ``isShownAt`` for a whole batch's URL variants,
+    bucketed per matched URL. Each bucket carries its ``doc_count`` and up to
+    two record ids, which is all the per-file ">1 record" ambiguity check
+    needs — a plain hit list would let one over-shared URL crowd every other
+    file's hits out of the page.
+    """
+    return {
+        "size": 0,
+        "query": {"terms": {"isShownAt": urls}},
+        "aggs": {
+            "by_url": {
+                "terms": {"field": "isShownAt", "size": len(urls)},
+                "aggs": {"records": {"top_hits": {"size": 2, "_source": False}}},
+            }
+        },
+    }
+
+
 # --- resolver ----------------------------------------------------------------
 
 
@@ -170,6 +204,16 @@ def _hit_ids(resp_json: dict) -> list[str]:
     return [h.get("_id") for h in resp_json.get("hits", {}).get("hits", [])]
 
 
+@dataclass
+class ResolveRequest:
+    """One file's inputs to :func:`resolve_current_dpla_ids` — the keyword
+    arguments of :func:`resolve_current_dpla_id`, minus ``query_fn``."""
+
+    embedded_id: str | None
+    recorded_url: str | None
+    scope_filter: dict | Callable[[], dict | None] | None
+
+
 def resolve_current_dpla_id(
     *,
     embedded_id: str | None,
@@ -211,7 +255,17 @@ def resolve_current_dpla_id(
             # A variant matches more than one record — don't guess.
             return ResolveResult(None, "unresolved", ambiguous=True, tried=tried)
 
-    # Anchor 3: institution-scoped wildcard on the stable URL token.
+    return _resolve_wildcard(recorded_url, scope_filter, query_fn, tried)
+
+
+def _resolve_wildcard(
+    recorded_url: str | None,
+    scope_filter: dict | Callable[[], dict | None] | None,
+    query_fn: Callable[[dict], object],
+    tried: list[str],
+) -> ResolveResult:
+    """Anchor 3 (and the unresolved floor) for a file the first two rungs
+    didn't settle."""
     token = extract_stable_token(recorded_url or "")
     if token:
         # Resolve a lazy scope only now — deriving it (a P195 read on Commons)
@@ -227,3 +281,92 @@ def resolve_current_dpla_id(
                 return ResolveResult(None, "unresolved", ambiguous=True, tried=tried)
 
     return ResolveResult(None, "unresolved", tried=tried)
+
+
+def _live_ids(dpla_ids: list[str], query_fn: Callable[[dict], object]) -> set[str]:
+    if not dpla_ids:
+        return set()
+    data = query_fn(_batch_ids_query(dpla_ids)).json()
+    check_es_response(data)
+    return set(_hit_ids(data))
+
+
+def _isshownat_matches(
+    urls: list[str], query_fn: Callable[[dict], object]
+) -> dict[str, tuple[int, list[str]]]:
+    """``{matched url: (doc_count, up to two record ids)}``; unmatched URLs
+    are absent."""
+    if not urls:
+        return {}
+    data = query_fn(_batch_isshownat_query(urls)).json()
+    check_es_response(data)
+    buckets = (data.get("aggregations") or {}).get("by_url", {}).get("buckets", [])
+    return {
+        b["key"]: (
+            b.get("doc_count", 0),
+            _hit_ids(b.get("records", {})),
+        )
+        for b in buckets
+    }
+
+
+def resolve_current_dpla_ids(
+    files: list[ResolveRequest],
+    *,
+    query_fn: Callable[[dict], object] = post_es,
+) -> list[ResolveResult]:
+    """Batched :func:`resolve_current_dpla_id`: one result per request, in
+    order, each identical to what the single-file ladder would return.
+
+    Rungs 1 and 2 cost one ES query each for the whole batch; only files they
+    leave unsettled pay a per-file wildcard query (and their lazy scope). The
+    caller bounds the batch size — every embedded id and URL variant goes into
+    one request body.
+    """
+    results: list[ResolveResult | None] = [None] * len(files)
+    tried: list[list[str]] = [[] for _ in files]
+
+    # Anchor 1: every embedded id in one ids query.
+    embedded = {
+        i: r.embedded_id
+        for i, r in enumerate(files)
+        if r.embedded_id and is_dpla_id(r.embedded_id)
+    }
+    live = _live_ids(list(dict.fromkeys(embedded.values())), query_fn)
+    for i, dpla_id in embedded.items():
+        tried[i].append("embedded")
+        if dpla_id in live:
+            results[i] = ResolveResult(dpla_id, "embedded", tried=tried[i])
+
+    # Anchor 2: every remaining file's URL variants in one terms query.
+    candidates = {
+        i: normalize_url_candidates(r.recorded_url or "")
+        for i, r in enumerate(files)
+        if results[i] is None
+    }
+    all_urls = list(dict.fromkeys(u for urls in candidates.values() for u in urls))
+    matches = _isshownat_matches(all_urls, query_fn)
+    for i, urls in candidates.items():
+        if not urls:
+            continue
+        tried[i].append("isShownAt")
+        record_ids: list[str] = []
+        multi = False
+        for url in urls:
+            doc_count, ids = matches.get(url, (0, []))
+            multi = multi or doc_count > 1
+            record_ids += [d for d in ids if d not in record_ids]
+        if multi or len(record_ids) > 1:
+            results[i] = ResolveResult(
+                None, "unresolved", ambiguous=True, tried=tried[i]
+            )
+        elif record_ids:
+            results[i] = ResolveResult(record_ids[0], "isShownAt", tried=tried[i])
+
+    # Anchor 3: the residue, one file at a time.
+    for i, r in enumerate(files):
+        if results[i] is None:
+            results[i] = _resolve_wildcard(
+                r.recorded_url, r.scope_filter, query_fn, tried[i]
+            )
+    return results
@@ -4,17 +4,23 @@ Stdlib-only — no third-party imports — so this module is safe to use in Lamb
 GitHub Actions without installing the full ingest_wikimedia package dependencies.
 """
 
+import bisect
+import hashlib
 import json
+import logging
+import mmap
 import os
 import re
+import struct
 import time
 import urllib.error
 import urllib.parse
 import urllib.request
+from collections.abc import Iterator, Mapping
 from pathlib import Path
 
 # Per-URL cache so a warm/long-lived process fetches each config at most once.
-_staged_config_cache: dict[str, dict] = {}
+_staged_config_cache: dict[str, Mapping] = {}
 
 # Config files sourced from dpla/ingestion3 (main is the source of authority).
 INSTITUTIONS_URL = (
@@ -37,6 +43,25 @@ SUBJECTS_URL = (
 INSTITUTIONS_FILE_ENV = "WIKIMEDIA_INSTITUTIONS_FILE"
 SUBJECTS_FILE_ENV = "WIKIMEDIA_SUBJECTS_FILE"
 
+# A staged config is also compiled into a read-only snapshot beside it
+# (``<file>.<fingerprint>.snapshot``) the first time any process loads it:
+# every top-level key (hub name / subject name) sorted into an offset table,
+# each value kept as its own small JSON blob. Later processes mmap the
+# snapshot instead of parsing the whole file — subjects.json alone is ~2.7 MB
+# of JSON that every get-ids / sdc-sync process and every spawned pool worker
+# used to decode in full — and decode only the entries they actually look up.
+# The fingerprint (source path, size, mtime) is in the file NAME, so a
+# snapshot is immutable once written: a relaunch restaging the JSON produces a
+# new snapshot rather than rewriting one that a running session's workers are
+# about to reopen. Pickling a snapshot (``initargs`` to pool workers) sends
+# only that path. Snapshots untouched for ``SNAPSHOT_MAX_AGE_SECONDS`` are
+# pruned when a new one is compiled.
+SNAPSHOT_SUFFIX = ".snapshot"
+SNAPSHOT_MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+_SNAPSHOT_MAGIC = b"DPLACFG1"
+_SNAPSHOT_HEADER = struct.Struct("<8sI")
+_SNAPSHOT_ENTRY = struct.Struct("<IIII")  # key offset, key len, value offset, len
+
 # Wikidata QID pattern (e.g. Q12345).
 _QID_RE = re.compile(r"^Q\d+$")
 
@@ -158,23 +183,197 @@ def resolve_slug(slug: str) -> str | None:
     return _SLUG_BY_HUB_NAME.get(s)
 
 
-def _load_local_json(env_var: str) -> dict | None:
+class ConfigSnapshot(Mapping):
+    """Read-only mapping over a compiled config snapshot (see
+    ``SNAPSHOT_SUFFIX``). Lookups binary-search the mmapped key table and
+    decode just that entry's JSON, memoised so repeat lookups return the same
+    object — as they did from the fully parsed dict."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as fh:
+            self._data = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count = _SNAPSHOT_HEADER.unpack_from(self._data)
+        if magic != _SNAPSHOT_MAGIC:
+            raise ValueError(f"not a config snapshot: {path}")
+        self._keys = _SnapshotKeys(self)
+        self._decoded: dict[str, object] = {}
+
+    def _entry(self, i: int) -> tuple[int, int, int, int]:
+        return _SNAPSHOT_ENTRY.unpack_from(
+            self._data, _SNAPSHOT_HEADER.size + i * _SNAPSHOT_ENTRY.size
+        )
+
+    def _find(self, key: object) -> int | None:
+        if not isinstance(key, str):
+            return None
+        encoded = key.encode("utf-8")
+        i = bisect.bisect_left(self._keys, encoded)
+        if i < self._count and self._keys[i] == encoded:
+            return i
+        return None
+
+    def __getitem__(self, key: str):
+        if key in self._decoded:
+            return self._decoded[key]
+        i = self._find(key)
+        if i is None:
+            raise KeyError(key)
+        _, _, val_off, val_len = self._entry(i)
+        value = json.loads(self._data[val_off : val_off + val_len])
+        self._decoded[key] = value
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._decoded or self._find(key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return (self._keys[i].decode("utf-8") for i in range(self._count))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __reduce__(self):
+        return (_reopen_config_snapshot, (self.path,))
+
+
+class _SnapshotKeys:
+    """Sequence view of a snapshot's sorted, UTF-8 encoded keys, for bisect."""
+
+    def __init__(self, snapshot: ConfigSnapshot) -> None:
+        self._snapshot = snapshot
+
+    def __len__(self) -> int:
+        return self._snapshot._count
+
+    def __getitem__(self, i: int) -> bytes:
+        key_off, key_len, _, _ = self._snapshot._entry(i)
+        return self._snapshot._data[key_off : key_off + key_len]
+
+
+def _reopen_config_snapshot(path: str) -> ConfigSnapshot:
+    # Pool workers unpickle to the parent's exact snapshot file, so the
+    # parent and every worker see one version of the config even if a
+    # concurrent launch restages the JSON mid-run.
+    return ConfigSnapshot(path)
+
+
+def _snapshot_path(source: str) -> str | None:
+    """Snapshot path for the current contents of ``source``; None if the
+    source can't be stat'ed."""
+    try:
+        st = os.stat(source)
+    except OSError:
+        return None
+    fingerprint = hashlib.blake2b(
+        f"{os.path.abspath(source)}:{st.st_size}:{st.st_mtime_ns}".encode(),
+        digest_size=8,
+    ).hexdigest()
+    return f"{source}.{fingerprint}{SNAPSHOT_SUFFIX}"
+
+
+def compile_config_snapshot(data: Mapping, snapshot_path: str) -> None:
+    """Write ``data`` as a snapshot at ``snapshot_path``. Atomic (temp file +
+    ``os.replace``) since concurrently starting processes may race to build
+    the same snapshot; all of them write identical bytes."""
+    items = sorted(
+        (str(k).encode("utf-8"), json.dumps(v, separators=(",", ":")).encode("utf-8"))
+        for k, v in data.items()
+    )
+    offset = _SNAPSHOT_HEADER.size + len(items) * _SNAPSHOT_ENTRY.size
+    table, blobs = [], []
+    for key, value in items:
+        table.append(
+            _SNAPSHOT_ENTRY.pack(offset, len(key), offset + len(key), len(value))
+        )
+        blobs += [key, value]
+        offset += len(key) + len(value)
+    tmp = f"{snapshot_path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as fh:
+        fh.write(_SNAPSHOT_HEADER.pack(_SNAPSHOT_MAGIC, len(items)))
+        fh.writelines(table)
+        fh.writelines(blobs)
+    os.replace(tmp, snapshot_path)
+
+
+def _prune_snapshots(source: str, keep: str) -> None:
+    directory, name = os.path.split(os.path.abspath(source))
+    cutoff = time.time() - SNAPSHOT_MAX_AGE_SECONDS
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return
+    for entry in entries:
+        if (
+            entry.name.startswith(name + ".")
+            and entry.name.endswith(SNAPSHOT_SUFFIX)
+            and entry.path != os.path.abspath(keep)
+        ):
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except OSError:
+                pass
+
+
+def _load_local_json(env_var: str) -> Mapping | None:
     """Return a staged JSON config from the path named by ``env_var``, or None.
 
     None (→ caller falls back to the live fetch) when the var is unset, the file
     is missing/unreadable, or its contents aren't a non-empty object — so a
     truncated or empty stage never silently yields empty config (which for
     institutions would make every hub ineligible).
+
+    Served from the file's compiled :class:`ConfigSnapshot` when one exists;
+    otherwise the JSON is parsed and the snapshot compiled for the next
+    process (best-effort — an unwritable directory just means every process
+    keeps parsing the JSON, as before).
     """
     path = os.environ.get(env_var)
     if not path:
         return None
+    snapshot_path = _snapshot_path(path)
+    if snapshot_path is not None:
+        try:
+            return ConfigSnapshot(snapshot_path)
+        except (OSError, ValueError, struct.error):
+            pass
     try:
         with open(path, encoding="utf-8") as fh:
             data = json.load(fh)
     except (OSError, ValueError):
         return None
-    return data if isinstance(data, dict) and data else None
+    if not (isinstance(data, dict) and data):
+        return None
+    if snapshot_path is not None:
+        try:
+            compile_config_snapshot(data, snapshot_path)
+            _prune_snapshots(path, keep=snapshot_path)
+        except OSError as e:
+            logging.warning("Could not compile config snapshot %s: %s", path, e)
+    return data
+
+
+def compile_staged_configs() -> dict[str, bool]:
+    """Validate every staged config and compile its snapshot if missing.
+
+    Run once per launch by the launcher (after staging) so a multi-target
+    launch's first processes open ready-made snapshots instead of each
+    parsing and compiling the same JSON. Returns env var → whether its
+    config is now served from a snapshot; False covers an unset var, an
+    invalid file and an unwritable directory alike.
+    """
+    ready = {}
+    for env_var in (INSTITUTIONS_FILE_ENV, SUBJECTS_FILE_ENV):
+        config = _load_local_json(env_var)
+        if config is not None and not isinstance(config, ConfigSnapshot):
+            # Freshly compiled by the load above; confirm it opens.
+            config = _load_local_json(env_var)
+        ready[env_var] = isinstance(config, ConfigSnapshot)
+        logging.info(
+            "%s: %s", env_var, "snapshot ready" if ready[env_var] else "no snapshot"
+        )
+    return ready
 
 
 def _fetch_remote_json(url: str, timeout: int, attempts: int = 4) -> dict:
@@ -200,7 +399,7 @@ def _fetch_remote_json(url: str, timeout: int, attempts: int = 4) -> dict:
     raise RuntimeError("unreachable: staged-config fetch retry loop exited")
 
 
-def _load_staged_config(url: str, env_var: str, timeout: int = 5) -> dict:
+def _load_staged_config(url: str, env_var: str, timeout: int = 5) -> Mapping:
     """Local-first loader for a staged ingestion3 JSON config, cached per URL.
 
     Prefers the launch-staged copy named by ``env_var`` (no network); falls back
@@ -215,12 +414,12 @@ def _load_staged_config(url: str, env_var: str, timeout: int = 5) -> dict:
     return _staged_config_cache[url]
 
 
-def load_institutions(timeout: int = 5) -> dict:
+def load_institutions(timeout: int = 5) -> Mapping:
     """institutions_v2.json (hub name → hub/institution config), local-first."""
     return _load_staged_config(INSTITUTIONS_URL, INSTITUTIONS_FILE_ENV, timeout)
 
 
-def load_subjects(timeout: int = 30) -> dict:
+def load_subjects(timeout: int = 30) -> Mapping:
     """subjects.json (DPLA subject name → Wikidata-QID map for P921), local-first.
 
     Larger fallback timeout than load_institutions: subjects.json is ~2.7 MB and
@@ -261,6 +460,20 @@ def is_institution_upload_eligible(
     return inst_data.get("upload", False)
 
 
+def partner_wikidata_ids(canonical_slug: str, timeout: int = 5) -> list[str]:
+    """The hub's and every child institution's Wikidata QIDs from
+    institutions_v2.json — what the uploader's category prewarm resolves."""
+    hub_name = PARTNER_HUBS.get(canonical_slug)
+    if not hub_name:
+        return []
+    hub = load_institutions(timeout).get(hub_name, {})
+    qids = [hub.get("Wikidata", "")]
+    qids.extend(
+        inst.get("Wikidata", "") for inst in hub.get("institutions", {}).values()
+    )
+    return [qid for qid in qids if qid]
+
+
 def check_item_eligibility(
     canonical_slug: str,
     institution_name: str,
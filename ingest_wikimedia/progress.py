@@ -0,0 +1,145 @@
+"""Periodic ``<label>-<phase>.progress.json`` checkpoint for a running phase.
+
+The status workflow used to reconstruct progress by SSM-ing ``ls -t``,
+``grep``, ``tail`` and awk over every label's live log — several round
+trips per label, each scanning a log that can run to gigabytes. Instead the
+downloader, uploader and sdc-sync partner mode keep one tiny JSON file per
+label and phase in the logs directory, rewritten at most every
+:data:`PROGRESS_INTERVAL_SECONDS`::
+
+    {"label": "nara", "phase": "upload", "status": "running",
+     "items_done": 1200, "items_total": 5000, "counts": {"UPLOADED": 3411},
+     "items_per_minute": 14.2, "recent_items_per_minute": 16.0,
+     "bytes_per_second": 2300000, "eta_seconds": 16056, ...}
+
+so every session's progress is one ``cat`` away — read by
+:func:`ingest_wikimedia.status_collector.read_progress` and the status
+script's SSM fallback in place of their awk passes. Writes go to a temp file
+followed by ``os.replace``, which is atomic on POSIX, so a reader never sees
+a half-written file.
+
+"Items done" is the tracker's ``Histogram.ITEM_SECONDS`` observation count,
+which the per-item loops already record and pool workers already ship back
+via ``tracker.diff``. The checkpoint therefore needs no plumbing through the
+pools: :func:`tick` from the parent's merge loop sees the up-to-date count.
+
+Like :mod:`ingest_wikimedia.events`, the active checkpoint is module state —
+one phase per process — so call sites only need :func:`start`, :func:`tick`
+and :func:`finish`. All three are no-ops before :func:`start`.
+"""
+
+import json
+import logging
+import os
+import time
+
+from ingest_wikimedia import logs
+from ingest_wikimedia.tracker import Histogram, Result, Tracker
+
+PROGRESS_SUFFIX = ".progress.json"
+PROGRESS_INTERVAL_SECONDS = 30
+# Trailing window for the "recent" rate. Long enough to smooth over a few
+# slow items, short enough to reflect a throttled or recovering session.
+RECENT_RATE_WINDOW_SECONDS = 600
+
+
+def progress_path(label: str, phase: str) -> str:
+    return os.path.join(logs.LOGS_DIR_BASE, f"{label}-{phase}{PROGRESS_SUFFIX}")
+
+
+class ProgressCheckpoint:
+    """Throttled, atomically-replaced progress file for one phase run."""
+
+    def __init__(
+        self,
+        label: str,
+        phase: str,
+        items_total: int,
+        tracker: Tracker,
+        interval: float = PROGRESS_INTERVAL_SECONDS,
+    ):
+        self.label = label
+        self.phase = phase
+        self.items_total = items_total
+        self.tracker = tracker
+        self.interval = interval
+        self.path = progress_path(label, phase)
+        self.started = time.time()
+        self._last_write = 0.0
+
+    def payload(self, status: str, now: float) -> dict:
+        done = self.tracker.observations(Histogram.ITEM_SECONDS)
+        elapsed = max(now - self.started, 1e-9)
+        per_minute = done * 60 / elapsed
+        recent = (
+            self.tracker.rate(Histogram.ITEM_SECONDS, RECENT_RATE_WINDOW_SECONDS, now)
+            * 60
+        )
+        remaining = max(self.items_total - done, 0)
+        # ETA off the recent rate when there is one — it tracks a session
+        # that sped up or got throttled — else the run-long average.
+        eta_rate = recent or per_minute
+        eta = int(remaining * 60 / eta_rate) if eta_rate and remaining else None
+        return {
+            "label": self.label,
+            "phase": self.phase,
+            "status": status,
+            "pid": os.getpid(),
+            "started": int(self.started),
+            "updated": int(now),
+            "items_done": done,
+            "items_total": self.items_total,
+            "counts": {k.name: v for k, v in self.tracker.data.items() if v},
+            "items_per_minute": round(per_minute, 2),
+            "recent_items_per_minute": round(recent, 2),
+            "bytes_per_second": int(self.tracker.count(Result.BYTES) / elapsed),
+            "eta_seconds": 0 if status != "running" else eta,
+        }
+
+    def write(self, status: str = "running", now: float | None = None) -> None:
+        """Atomically replace the progress file. Never raises: a full disk
+        or permissions problem must not take the phase down with it."""
+        now = time.time() if now is None else now
+        self._last_write = now
+        tmp = f"{self.path}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self.payload(status, now), f)
+            os.replace(tmp, self.path)
+        except OSError as ex:
+            logging.warning(f"Could not write progress file {self.path}: {ex}")
+
+    def maybe_write(self, now: float | None = None) -> None:
+        now = time.time() if now is None else now
+        if now - self._last_write >= self.interval:
+            self.write(now=now)
+
+
+_active: ProgressCheckpoint | None = None
+
+
+def start(partner: str, phase: str, items_total: int, tracker: Tracker) -> None:
+    """Begin checkpointing this process's phase and write the initial file.
+
+    ``phase`` is the same suffix passed to ``setup_logging`` (``download``,
+    ``upload``, ``sdc``) and the label follows the log file's session label.
+    """
+    global _active
+    _active = ProgressCheckpoint(
+        logs.session_label(partner), phase, items_total, tracker
+    )
+    _active.write()
+
+
+def tick(now: float | None = None) -> None:
+    """Rewrite the active checkpoint if the interval has elapsed."""
+    if _active is not None:
+        _active.maybe_write(now)
+
+
+def finish(status: str) -> None:
+    """Write the final state (``complete`` / ``aborted``) and stop."""
+    global _active
+    if _active is not None:
+        _active.write(status)
+        _active = None
@@ -7,6 +7,7 @@ from botocore.exceptions import ClientError
 from mypy_boto3_s3 import S3ServiceResource
 from .common import CHECKSUM
 from .localfs import LocalFS
+from .timings import timed
 
 IIIF_JSON = "iiif.json"
 FILE_LIST_TXT = "file-list.txt"
@@ -61,6 +62,7 @@ class S3Client:
             f"{dpla_id[2]}/{dpla_id[3]}/{dpla_id}/{ordinal}_{dpla_id}"
         ).strip()
 
+    @timed("s3.head_object")
     def s3_file_exists(self, path: str) -> bool:
         """
         Returns True only if the object exists in S3 and has a non-zero size.
@@ -153,12 +155,37 @@ class S3Client:
         else:
             return result.split("\n")
 
-    def write_iiif_manifest(self, partner: str, dpla_id: str, manifest: str) -> None:
+    def write_iiif_manifest(
+        self,
+        partner: str,
+        dpla_id: str,
+        manifest: str,
+        validators: dict[str, str] | None = None,
+    ) -> None:
+        """
+        Writes the IIIF manifest for an item in S3, with the HTTP validators
+        (ETag / Last-Modified) it was served with as object metadata so the
+        next refresh can revalidate instead of refetching.
+        """
+        self.write_item_file(
+            partner,
+            dpla_id,
+            manifest,
+            IIIF_JSON,
+            APPLICATION_JSON,
+            metadata=validators,
+        )
+
+    def get_iiif_manifest_metadata(
+        self, partner: str, dpla_id: str
+    ) -> dict[str, str] | None:
         """
-        Writes the IIIF manifest for an item in S3.
+        Reads the stored IIIF manifest's object metadata (checksum and HTTP
+        validators) without downloading it. None when there is no manifest.
         """
-        self.write_item_file(partner, dpla_id, manifest, IIIF_JSON, APPLICATION_JSON)
+        return self.get_item_file_metadata(partner, dpla_id, IIIF_JSON)
 
+    @timed("s3.put_item_file")
     def write_item_file(
         self,
         partner: str,
@@ -166,16 +193,46 @@ class S3Client:
         data: str,
         filename: str,
         content_type: str,
+        metadata: dict[str, str] | None = None,
     ) -> None:
         """
-        Writes a file for an item to the appropriate place in S3.
+        Writes a file for an item to the appropriate place in S3. ``metadata``
+        is extra S3 user metadata stored alongside the checksum.
         """
 
         s3_path = self.get_item_s3_path(dpla_id, filename, partner)
         s3_object = self.s3.Object(S3_BUCKET, s3_path)
         sha1 = LocalFS.get_bytes_hash(data)
-        s3_object.put(ContentType=content_type, Metadata={CHECKSUM: sha1}, Body=data)
+        s3_object.put(
+            ContentType=content_type,
+            Metadata={**(metadata or {}), CHECKSUM: sha1},
+            Body=data,
+        )
+
+    @timed("s3.head_object")
+    def get_item_file_metadata(
+        self, partner: str, dpla_id: str, file_name: str
+    ) -> dict[str, str] | None:
+        """
+        Returns the S3 user metadata of an item file, or None if it doesn't
+        exist.
+        """
+        s3_path = self.get_item_s3_path(dpla_id, file_name, partner)
+        try:
+            obj = self.s3.Object(S3_BUCKET, s3_path)
+            obj.load()
+            return dict(obj.metadata or {})
+        except ClientError as e:
+            if (
+                "Error" in e.response
+                and "Code" in e.response["Error"]
+                and e.response["Error"]["Code"] in ("404", "NoSuchKey")
+            ):
+                return None
+            else:
+                raise
 
+    @timed("s3.get_item_file")
     def get_item_file(self, partner, dpla_id, file_name) -> str | None:
         s3_path = self.get_item_s3_path(dpla_id, file_name, partner)
 
@@ -77,7 +77,7 @@ import os
 import re
 import unicodedata
 import xml.etree.ElementTree as ET
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from typing import Any
 
 import requests
@@ -236,7 +236,7 @@ _REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 logger = logging.getLogger(__name__)
 
 
-def fetch_institutions_v2() -> dict:
+def fetch_institutions_v2() -> Mapping:
     """Full institutions_v2.json (hub/institution eligibility + Wikidata IDs).
 
     Delegates to ``partners.load_institutions`` so it reads the launch-staged
@@ -246,7 +246,7 @@ def fetch_institutions_v2() -> dict:
     return load_institutions()
 
 
-def fetch_subjects_json() -> dict:
+def fetch_subjects_json() -> Mapping:
     """DPLA-subject → Wikidata-QID map used to populate P921.
 
     Delegates to ``partners.load_subjects`` (local-first, see there) instead of
@@ -3,10 +3,13 @@
 A wikimedia-upload tmux session runs its per-target chain sequentially —
 downloader → uploader → sdc-sync per label, then the next label. At any
 moment **at most one label is active**; the label whose log file was most
-recently written uniquely identifies it. This module exposes the log-filename
-helpers that both ``scripts/wikimedia_upload_status.py`` (for the periodic
-status post) and ``scripts/wikimedia_launch.py`` (for scoping conflict
-detection to still-active targets in a chained session) need.
+recently written uniquely identifies it. (A launch with several partner dirs
+may instead run them as concurrent lanes; such sessions are flagged by
+:data:`CONCURRENT_TARGETS_ENV` and every label of theirs counts as active.)
+This module exposes the log-filename helpers that both
+``scripts/wikimedia_upload_status.py`` (for the periodic status post) and
+``scripts/wikimedia_launch.py`` (for scoping conflict detection to
+still-active targets in a chained session) need.
 
 Kept in ``ingest_wikimedia/`` rather than ``scripts/`` because the two
 consumers run as top-level scripts (``python scripts/foo.py``) and don't share
@@ -34,6 +37,91 @@ def _valid_session_label(label: str) -> bool:
     )
 
 
+# A session whose targets run in concurrent lanes (see the launcher's
+# ``_assemble_pipeline``) re-execs its script with this variable set, so it is
+# in the pane process's own environment. Such a session has no single active
+# label — its direct children are lane subshells — so the pass below reports
+# it as ``name|*`` instead, and every one of its labels counts as in flight.
+# Each lane with a running phase follows as ``name|*|label``, read from the
+# lane's newest child the same way a serial session's label is (a lane whose
+# last command bash exec'd in place has no child; its own environment then
+# carries the label).
+CONCURRENT_TARGETS_ENV = "WIKIMEDIA_TARGET_LANES"
+CONCURRENT_TARGETS_LABEL = "*"
+
+# Shell pass behind :func:`snapshot_running_active_labels`: one ``name|label``
+# line per ``wikimedia-*`` session that has a running direct child. Module-level
+# so ``ingest_wikimedia.status_collector`` can run the identical pass locally
+# on the instance instead of through its own SSM round trip.
+RUNNING_ACTIVE_LABELS_CMD = r"""tmux list-panes -aF '#{session_name}|#{pane_pid}' 2>/dev/null | while IFS='|' read name pane_pid; do
+  case "$name" in wikimedia-*) : ;; *) continue ;; esac
+  if tr '\0' '\n' < /proc/"$pane_pid"/environ 2>/dev/null | grep -q '^WIKIMEDIA_TARGET_LANES='; then
+    echo "$name|*"
+    for lane_pid in $(ps --ppid "$pane_pid" -o pid= 2>/dev/null); do
+      child_pid=$(ps --ppid "$lane_pid" -o pid=,etimes= 2>/dev/null | sort -k2 -n | head -1 | awk '{print $1}')
+      label=$(tr '\0' '\n' < /proc/"${child_pid:-$lane_pid}"/environ 2>/dev/null | grep -m1 '^WIKIMEDIA_SESSION_LABEL=' | cut -d= -f2-)
+      [ -n "$label" ] && echo "$name|*|$label"
+    done
+    continue
+  fi
+  child_pid=$(ps --ppid "$pane_pid" -o pid=,etimes= 2>/dev/null | sort -k2 -n | head -1 | awk '{print $1}')
+  [ -z "$child_pid" ] && continue
+  label=$(tr '\0' '\n' < /proc/"$child_pid"/environ 2>/dev/null | grep -m1 '^WIKIMEDIA_SESSION_LABEL=' | cut -d= -f2-)
+  [ -n "$label" ] && echo "$name|$label"
+done"""
+
+
+def parse_running_active_labels(out: str) -> dict[str, str]:
+    """Parse :data:`RUNNING_ACTIVE_LABELS_CMD` output into
+    ``{session_name: label}``, dropping malformed lines and labels that
+    aren't launcher-shaped. Concurrent-lane sessions' ``*`` lines are
+    :func:`parse_concurrent_sessions`'s."""
+    result: dict[str, str] = {}
+    for line in (out or "").splitlines():
+        name, sep, label = line.partition("|")
+        if not sep:
+            continue
+        name = name.strip()
+        label = label.strip()
+        if label.startswith(CONCURRENT_TARGETS_LABEL):
+            continue
+        if name and _valid_session_label(label):
+            result[name] = label
+    return result
+
+
+def parse_concurrent_sessions(out: str) -> dict[str, list[str]]:
+    """Sessions :data:`RUNNING_ACTIVE_LABELS_CMD` reported as running
+    concurrent target lanes (which :func:`parse_running_active_labels`
+    drops, having no single label to give them), each mapped to the labels
+    of its lanes with a running phase, in report order. A session between
+    phases in every lane maps to an empty list."""
+    result: dict[str, list[str]] = {}
+    for line in (out or "").splitlines():
+        name, sep, rest = line.partition("|")
+        name = name.strip()
+        if not sep or not name:
+            continue
+        marker, _, label = rest.strip().partition("|")
+        if marker != CONCURRENT_TARGETS_LABEL:
+            continue
+        lanes = result.setdefault(name, [])
+        label = label.strip()
+        if _valid_session_label(label) and label not in lanes:
+            lanes.append(label)
+    return result
+
+
+def snapshot_session_activity(
+    client,
+) -> tuple[dict[str, str], dict[str, list[str]]]:
+    """:func:`snapshot_running_active_labels` plus the sessions running
+    concurrent lanes (see :func:`parse_concurrent_sessions`), from the same
+    single SSM roundtrip."""
+    out = ssm_run(client, RUNNING_ACTIVE_LABELS_CMD)
+    return parse_running_active_labels(out), parse_concurrent_sessions(out)
+
+
 def snapshot_running_active_labels(client) -> dict[str, str]:
     """One SSM roundtrip: for every ``wikimedia-*`` tmux session, return
     the active session label read from its currently-running direct-
@@ -54,31 +142,13 @@ def snapshot_running_active_labels(client) -> dict[str, str]:
     alongside the main step. ``lstart`` output is calendar text and
     doesn't sort chronologically.
     """
-    out = ssm_run(
-        client,
-        r"""tmux list-panes -aF '#{session_name}|#{pane_pid}' 2>/dev/null | while IFS='|' read name pane_pid; do
-  case "$name" in wikimedia-*) : ;; *) continue ;; esac
-  child_pid=$(ps --ppid "$pane_pid" -o pid=,etimes= 2>/dev/null | sort -k2 -n | head -1 | awk '{print $1}')
-  [ -z "$child_pid" ] && continue
-  label=$(tr '\0' '\n' < /proc/"$child_pid"/environ 2>/dev/null | grep -m1 '^WIKIMEDIA_SESSION_LABEL=' | cut -d= -f2-)
-  [ -n "$label" ] && echo "$name|$label"
-done""",
-    )
-    result: dict[str, str] = {}
-    for line in (out or "").splitlines():
-        name, sep, label = line.partition("|")
-        if not sep:
-            continue
-        name = name.strip()
-        label = label.strip()
-        if name and _valid_session_label(label):
-            result[name] = label
-    return result
+    return parse_running_active_labels(ssm_run(client, RUNNING_ACTIVE_LABELS_CMD))
 
 
-# Ordered phase suffixes in log filenames (``…-<label>-<phase>.log``). Shared by
-# the two patterns below so a new phase is a one-line change.
-_PHASE_ALT = "id-generation|download|upload|sdc"
+# Ordered phase suffixes in log filenames (``…-<label>-<phase>.log``), as a
+# regex alternation. Shared by the two patterns below and by the status
+# readouts' own log regexes so a new phase is a one-line change.
+LOG_PHASE_ALT = "id-generation|download|upload|sdc"
 
 
 def log_filename_pattern_for_label(label: str) -> str:
@@ -92,7 +162,7 @@ def log_filename_pattern_for_label(label: str) -> str:
     the caller sticks on the wrong target. See lessons.md
     "Log filename phase detection".
     """
-    return rf"-{re.escape(label)}-({_PHASE_ALT})\.log$"
+    return rf"-{re.escape(label)}-({LOG_PHASE_ALT})\.log$"
 
 
 def find_active_label(
@@ -142,7 +212,7 @@ def find_active_label(
     cmd_parts = [
         f"find {paths} -maxdepth 1 -type f -name '*.log'",
         "-regextype posix-extended",
-        f"-regex '.*-({label_alt})-({_PHASE_ALT})\\.log'",
+        f"-regex '.*-({label_alt})-({LOG_PHASE_ALT})\\.log'",
     ]
     if session_created > 0:
         # Time-bound the lookup to files created after this session's
@@ -6,7 +6,10 @@ from typing import Literal
 
 import requests
 
-from ingest_wikimedia.tracker import Result, Tracker
+from ingest_wikimedia.events import events_path_for, iter_events
+from ingest_wikimedia.session_state import CONCURRENT_TARGETS_ENV
+from ingest_wikimedia.timings import format_seconds
+from ingest_wikimedia.tracker import Histogram, Result, Tracker
 
 SLACK_CHANNEL = "C02HEU2L3"
 SLACK_API_URL = "https://slack.com/api/chat.postMessage"
@@ -140,7 +143,8 @@ def _step_start_mtime() -> float | None:
         return None
 
 
-# Counted markers shown in the failure summary.  Patterns match what the
+# Counted markers shown in the failure summary for logs without an events
+# stream (see :func:`_event_counts`).  Patterns match what the
 # downloader and uploader currently emit, anchored loosely so log-format
 # tweaks don't silently zero them out.  Skip subcategories aren't split out
 # because "Skipping ... Already exists" would double-count under a generic
@@ -153,12 +157,34 @@ _LOG_MARKERS: tuple[tuple[str, re.Pattern[str]], ...] = (
 )
 
 
+# Bytes read from the end of a failed step's log (and of its events stream).
+_SUMMARY_READ_BYTES = 2 * 1024 * 1024
+
+
+def _event_counts(log_path: str) -> dict[str, int] | None:
+    """Counters from the newest ``tracker`` snapshot in the log's events
+    stream, or ``None`` when there is none to read — a log written before
+    the stream existed, or a step that died before its first snapshot."""
+    latest = None
+    try:
+        for record in iter_events(
+            events_path_for(log_path), "tracker", tail_bytes=_SUMMARY_READ_BYTES
+        ):
+            latest = record
+    except OSError:
+        return None
+    counts = latest.get("counts") if latest else None
+    return counts if isinstance(counts, dict) else None
+
+
 def _summarize_log(log_path: str, tail_lines: int = 8) -> str | None:
     """Read the log and produce a short multi-line summary.
 
-    Tries to be cheap: only reads up to ~2 MB from the end of the file.  Counts
-    common markers and tails the last N lines so the cause of the failure is
-    visible without SSM-ing in.
+    Tries to be cheap: only reads up to ~2 MB from the end of the file.  Takes
+    the counts from the newest tracker snapshot in the phase's events stream
+    (falling back to counting common markers in the text for older logs) and
+    tails the last N lines so the cause of the failure is visible without
+    SSM-ing in.
 
     Suppresses the "Counts so far" marker line when the tail already contains
     the tool's own ``COUNTS:`` block: those tracker-side counters are
@@ -168,7 +194,7 @@ def _summarize_log(log_path: str, tail_lines: int = 8) -> str | None:
     """
     try:
         size = os.path.getsize(log_path)
-        read_size = min(size, 2 * 1024 * 1024)
+        read_size = min(size, _SUMMARY_READ_BYTES)
         with open(log_path, "rb") as f:
             f.seek(size - read_size)
             data = f.read().decode("utf-8", errors="replace")
@@ -180,7 +206,14 @@ def _summarize_log(log_path: str, tail_lines: int = 8) -> str | None:
     tail_has_counts = any(line.startswith("COUNTS:") for line in tail_line_list)
 
     counts = []
-    if not tail_has_counts:
+    event_counts = None if tail_has_counts else _event_counts(log_path)
+    if event_counts is not None:
+        counts = [
+            f"{n} {name.lower().replace('_', ' ')}"
+            for name, n in event_counts.items()
+            if n
+        ]
+    elif not tail_has_counts:
         for label, pat in _LOG_MARKERS:
             n = len(pat.findall(data))
             if n:
@@ -288,13 +321,19 @@ def notify_pipeline_fail() -> None:
       WIKIMEDIA_LAST_EXIT      — exit code of the failed step (best-effort)
       WIKIMEDIA_PARTNER_DIR    — absolute path to the partner dir, used to
                                  locate the most recent log for tailing
-      WIKIMEDIA_TARGET_IS_LAST — "1" iff this is the final target in the
-                                 batch; switches the failure message
-                                 suffix between "aborting this target;
-                                 batch continues with the next" and
-                                 "aborting batch (this was the final
-                                 target)". Accurate even for
-                                 single-target sessions.
+      WIKIMEDIA_TARGET_IS_LAST — "1" iff this is the final target in its
+                                 lane (in a serial session, the batch);
+                                 switches the failure message suffix
+                                 between "aborting this target; batch
+                                 continues with the next" and "aborting
+                                 batch (this was the final target)".
+                                 Accurate even for single-target sessions.
+      WIKIMEDIA_TARGET_LANES   — set (to the lane count) when the session
+                                 runs its targets as concurrent lanes.
+                                 Every lane has a final target, so there
+                                 the last-target suffix becomes "last
+                                 target in its lane; other lanes
+                                 continue" — the batch isn't over.
 
     Designed to be called as a one-liner from a shell failure handler:
         rc=$?; WIKIMEDIA_LAST_EXIT=$rc python3 -c \\
@@ -320,11 +359,14 @@ def notify_pipeline_fail() -> None:
     step = (os.environ.get("WIKIMEDIA_STEP") or "").strip()
 
     is_last = os.environ.get("WIKIMEDIA_TARGET_IS_LAST") == "1"
-    tail_phrase = (
-        "aborting batch (this was the final target)"
-        if is_last
-        else "aborting this target; batch continues with the next"
-    )
+    if not is_last:
+        tail_phrase = "aborting this target; batch continues with the next"
+    elif os.environ.get(CONCURRENT_TARGETS_ENV):
+        tail_phrase = (
+            "aborting this target (last target in its lane; other lanes continue)"
+        )
+    else:
+        tail_phrase = "aborting batch (this was the final target)"
     # Step-aware header: tells the operator WHICH phase failed
     # (id-generation / download / upload / sdc-sync), not just "the
     # pipeline". Pre-step-tracking this said only "pipeline step
@@ -427,6 +469,33 @@ def _format_runtime(elapsed_seconds: float) -> str:
     return f"{seconds}s"
 
 
+def _item_rate_lines(
+    tracker: Tracker, elapsed_seconds: float, width: int, with_bytes: bool
+) -> list[str]:
+    """Per-item latency and throughput lines for a completion summary.
+
+    Reads the ``Histogram.ITEM_SECONDS`` distribution (p50/p95 are bucket
+    upper bounds, so they read high by at most 2x) and divides the run-long
+    item / byte totals by the runtime. ``width`` pads labels to the calling
+    summary's column. Empty when no item was timed — e.g. a run that found
+    nothing to do — so the summary doesn't show a meaningless ``0/min``.
+    """
+    items = tracker.observations(Histogram.ITEM_SECONDS)
+    if not items:
+        return []
+    p50 = tracker.percentile(Histogram.ITEM_SECONDS, 0.50) or 0.0
+    p95 = tracker.percentile(Histogram.ITEM_SECONDS, 0.95) or 0.0
+    per_minute = items * 60 / elapsed_seconds if elapsed_seconds > 0 else 0.0
+    throughput = f"{per_minute:,.1f} items/min"
+    if with_bytes and elapsed_seconds > 0:
+        bytes_per_second = int(tracker.count(Result.BYTES) / elapsed_seconds)
+        throughput += f" · {_format_bytes(bytes_per_second)}/s"
+    return [
+        f"{'ITEM p50/p95:':<{width}}{format_seconds(p50)} / {format_seconds(p95)}",
+        f"{'THROUGHPUT:':<{width}}{throughput}",
+    ]
+
+
 def _post_completion_notice(
     token: str,
     header: str,
@@ -617,6 +686,7 @@ def notify_upload_complete(
             f"HAND-FIX:      {tracker.count(Result.UPLOAD_HAND_FIX):,}",
             f"FAILED:        {total_failed:,}",
             f"BYTES:         {_format_bytes(tracker.count(Result.BYTES))}",
+            *_item_rate_lines(tracker, elapsed_seconds, 15, with_bytes=True),
             f"Runtime:       {runtime}",
         ],
     )
@@ -697,6 +767,7 @@ def notify_sdc_complete(
         )
     stats_lines.extend(
         [
+            *_item_rate_lines(tracker, elapsed_seconds, 22, with_bytes=False),
             f"SLOT WAIT (avg/wkr):  {_format_runtime(avg_wait)} ({wait_pct:.0f}% of runtime)",
             f"Runtime:              {runtime}",
         ]
@@ -9,6 +9,8 @@ INSTANCE_ID = "i-033eff6c8c168f999"
 REGION = "us-east-1"
 SSM_POLL_INTERVAL = 5
 SSM_MAX_POLLS = 60  # 5 minutes
+# ``free -m`` total / available MB, as two space-separated integers.
+MEMORY_SNAPSHOT_CMD = "free -m | awk 'NR==2{print $2, $7}'"
 
 
 def ssm_run(client, cmd: str, *, as_root: bool = False) -> str:
@@ -71,11 +73,21 @@ def fetch_memory_snapshot(client) -> tuple[int, int] | None:
     import logging
 
     try:
-        raw = ssm_run(client, "free -m | awk 'NR==2{print $2, $7}'")
+        raw = ssm_run(client, MEMORY_SNAPSHOT_CMD)
     except Exception:
         logging.exception("Failed to fetch instance memory snapshot")
         return None
-    parts = raw.split()
+    return parse_memory_snapshot(raw)
+
+
+def parse_memory_snapshot(raw: str) -> tuple[int, int] | None:
+    """Parse :data:`MEMORY_SNAPSHOT_CMD` output into ``(total_mb,
+    available_mb)``, or ``None`` when it's malformed. Split out of
+    :func:`fetch_memory_snapshot` so the on-instance status collector can
+    ship the raw output and the caller parses it the same way."""
+    import logging
+
+    parts = (raw or "").split()
     if len(parts) != 2:
         logging.warning("Unexpected free -m output: %r", raw)
         return None
@@ -12,19 +12,67 @@ import threading
 from collections.abc import Callable
 from concurrent.futures import Future
 
+import requests
+from requests import Session
+
+from .dpla import (
+    IIIF_MANIFEST_DERIVED_FIELD_NAME,
+    IIIF_MANIFEST_FIELD_NAME,
+    IIIF_MANIFEST_PROBE_FIELD_NAME,
+)
 from .s3 import APPLICATION_JSON, SDC_FILENAME, S3Client
+from .timings import timings
+from .web import DEFAULT_CONN_TIMEOUT
 
 _QUEUE_DEPTH_MULTIPLIER = 4
 
 
+def probe_derived_manifest(http_session: Session, source: dict) -> dict:
+    """Return ``source`` with the reachability of its derived IIIF manifest
+    recorded, for :meth:`ingest_wikimedia.dpla.DPLA.is_wiki_eligible`.
+
+    Only manifests get-ids-es derived from ``isShownAt`` (flagged with
+    ``IIIF_MANIFEST_DERIVED_FIELD_NAME``) are probed — a DPLA-supplied
+    ``iiifManifest`` is taken at its word, as the uploader always did. The
+    HEAD runs on the staging pool's worker thread, so a hub's probes proceed
+    as wide as that pool instead of one at a time in the uploader.
+
+    A network error records nothing: an unprobed manifest is treated as
+    present and left to the downloader's fetch, so a transient failure at
+    staging can't make an item ineligible until the next restage. Returns a
+    copy — the caller's main thread is still reading ``source``.
+    """
+    url = source.get(IIIF_MANIFEST_FIELD_NAME)
+    if not url or not source.get(IIIF_MANIFEST_DERIVED_FIELD_NAME):
+        return source
+    try:
+        with timings.time("iiif.manifest_probe"):
+            response = http_session.head(
+                url, allow_redirects=True, timeout=DEFAULT_CONN_TIMEOUT
+            )
+    except requests.RequestException as e:
+        logging.info(f"Derived IIIF manifest probe failed for {url}: {e}")
+        return source
+    return {**source, IIIF_MANIFEST_PROBE_FIELD_NAME: response.status_code}
+
+
 def stage_item_to_s3(
-    s3_client: S3Client, partner: str, dpla_id: str, source: dict
+    s3_client: S3Client,
+    partner: str,
+    dpla_id: str,
+    source: dict,
+    http_session: Session | None = None,
 ) -> None:
     """Write item metadata JSON to S3 as dpla-map.json.
 
+    With ``http_session``, a derived IIIF manifest is probed first (see
+    :func:`probe_derived_manifest`) and the result staged with the item.
+
     Raises on failure so the caller's ThreadPoolExecutor can observe it via
     future.exception() in the done callback.
     """
+    if http_session is not None:
+        source = probe_derived_manifest(http_session, source)
     s3_client.write_item_metadata(partner, dpla_id, json.dumps(source))
 
 
@@ -0,0 +1,641 @@
+"""On-instance status collector for the ``/wikimedia-status`` Slack post.
+
+``scripts/wikimedia_upload_status.py`` runs in GitHub Actions and used to
+assemble its readout from a fan-out of SSM commands: ``tmux ls``, the
+running-child label snapshot, the memory and slot snapshots, and then per
+session a precheck (``tmux display-message`` + ``ls -t | grep``), an optional
+legacy-filename fallback, and the awk pass over the phase log. Each SSM
+command costs a ``send_command`` plus at least one ``get_command_invocation``
+poll, so a busy box with a dozen sessions spent most of the status post
+waiting on SSM — and pushed the slash-command path well past Slack's ack
+budget.
+
+This module runs *on the instance* (``python -m
+ingest_wikimedia.status_collector``) and gathers the same facts locally in
+one invocation, printing a single JSON document::
+
+    {"sessions": [{"session": "wikimedia-nara", "created": 1760000000,
+                   "label": "nara", "labels": ["nara"],
+                   "facts": {"log_file": "…-nara-upload.log", …}}, …],
+     "memory": "7700 3200",
+     "slots": "TOTAL 24\\n…"}
+
+so the Actions side makes exactly one SSM call per status post
+(:data:`COLLECTOR_CMD`). The collector deliberately ships *facts*, not Slack
+text: phase classification, batch-position suffixes and slot annotations
+stay in the status script, which renders the collected document and the
+legacy SSM path through the same functions. ``memory`` and ``slots`` are the
+raw outputs of the shared shell commands, parsed by the same parsers the SSM
+path uses.
+
+The awk programs and the slot-snapshot command live here rather than in the
+status script because ``scripts/`` is not deployed to the instance — only
+``ingest_wikimedia/`` and ``tools/`` are.
+"""
+
+import json
+import logging
+import os
+import re
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+
+from ingest_wikimedia import partners
+from ingest_wikimedia.progress import PROGRESS_SUFFIX
+from ingest_wikimedia.partners import parse_session_labels, resolve_slug
+from ingest_wikimedia.session_state import (
+    LOG_PHASE_ALT,
+    RUNNING_ACTIVE_LABELS_CMD,
+    log_filename_pattern_for_label,
+    parse_concurrent_sessions,
+    parse_running_active_labels,
+)
+from ingest_wikimedia.ssm import MEMORY_SNAPSHOT_CMD
+from ingest_wikimedia.worker_slots import DEFAULT_SLOT_DIR, UPLOADER_PRIORITY_SLOT_DIR
+
+# What the status script sends over SSM. Runs from the deployed checkout's
+# venv so it imports the same ``ingest_wikimedia`` the pipeline runs.
+COLLECTOR_CMD = (
+    "cd /home/ec2-user/ingest-wikimedia && "
+    ".venv/bin/python -m ingest_wikimedia.status_collector"
+)
+
+TMUX_SESSIONS_CMD = (
+    "tmux ls -F '#{session_name}|#{session_created}' 2>/dev/null "
+    "| grep '^wikimedia-' || echo NONE"
+)
+
+# One-pass awk over a phase log, emitting eight integers in the fixed order the
+# parser indexes: DPLA-ID, Uploaded, Skipping, COUNTS, Ordinal, HAND-FIX,
+# MERGED, maintain-scope. HAND-FIX/MERGED read $2 — they come from the
+# prefix-less continuation lines of the multi-line ``COUNTS:`` record. The
+# maintain-scope marker is instead a normal PREFIXED log line
+# (``[INFO] <time>: maintain scope: N files``), so its number is ``$(NF-1)`` —
+# the field before the trailing "files", robust to however wide the log-line
+# prefix is (counting from the message start would miss the prefix, which
+# silently zeroed this out in the first draft).
+# The Ordinal pattern takes exactly one line per ordinal, mirroring sdc-sync's
+# ``ORDINALS`` counter that :func:`counts_from_progress` reads instead: the
+# "-- Ordinal N: <mediaid>" line of a reached ordinal, or the "-- Ordinal N:
+# missing/zero pageid" skip of one that never gets a mediaid. The other
+# "-- Ordinal N:" notes (a pageid recovered by title, a malformed page_numbers
+# skip) follow or precede an ordinal's own line, so matching them would count
+# it twice and make the SDC percentage depend on which path answered.
+# CONTRACT: the "maintain scope: N files" wording is shared with
+# tools/sdc_sync.py's _log_maintain_scope(); change them together.
+SDC_COUNTS_AWK = (
+    "/DPLA ID:/ {d++} "
+    "/Uploaded to/ {u++} "
+    "/Skipping.*Already exists on commons/ {s++} "
+    "/COUNTS:/ {c++} "
+    "/-- Ordinal [0-9]+: (M[0-9]+|missing\\/zero pageid)/ {o++} "
+    "/UPLOAD_HAND_FIX:/ {hf=$2} "
+    "/UPLOAD_MERGED_TO_CANONICAL:/ {mg=$2} "
+    "/maintain scope: [0-9]+ files/ {mt=$(NF-1)} "
+    "END { print d+0; print u+0; print s+0; print c+0; print o+0; "
+    "print hf+0; print mg+0; print mt+0 }"
+)
+
+# Total-ordinals denominator from the download log. Prefer the per-item
+# summary ``Item <id>: N ordinals`` line (downloader.py:563) — emitted for
+# EVERY item regardless of whether its media was freshly fetched or already
+# staged/skipped — and sum its N. Fall back to counting the per-ordinal
+# ``Downloading <partner> <id> <ordinal> from <url>`` line (downloader.py:543)
+# ONLY when no Item-summary lines exist, i.e. old pre-#272 download logs.
+#
+# Counting ``Downloading`` alone fires only on an actual fetch ATTEMPT, not for
+# already-staged skips. So any run whose media was already downloaded (re-runs,
+# SDC-only relaunches, download-once-then-iterate hubs like NARA) had 0
+# ``Downloading`` lines, collapsing the total to 0 and wrongly dropping the
+# status row from file- to item-granularity — even though the ``Item``
+# summaries carried the true counts.
+TOTAL_ORDINALS_AWK = (
+    "BEGIN{item=0; dl=0} "
+    "/Item [a-f0-9]+: [0-9]+ ordinals/ "
+    '{for(i=1;i<=NF;i++) if($i=="ordinals"){item+=$(i-1); break}} '
+    "/Downloading [a-z0-9-]+ [a-f0-9]+ [0-9]+ from / {dl++} "
+    "END {print (item>0 ? item : dl)}"
+)
+
+# Phase logs whose process keeps a ``<label>-<phase>.progress.json``
+# checkpoint (:mod:`ingest_wikimedia.progress`): ``setup_logging``'s
+# timestamped names. The checkpoint already carries every count the two awk
+# programs above extract, so for these the status readout is a ``stat`` and
+# a small JSON read instead of a full pass over a log that can run to
+# gigabytes. The awk programs remain the fallback for runs without a
+# checkpoint — id generation, maintain-mode sdc-sync, legacy logs, and the
+# moment between ``setup_logging`` and the checkpoint's first write.
+_CHECKPOINTED_LOG_RE = re.compile(r"(\d{8})-(\d{6})-(.+)-(download|upload|sdc)\.log")
+
+
+def progress_file_for(log_file: str) -> str | None:
+    """Name of the progress checkpoint kept by the run writing ``log_file``
+    (same directory), or ``None`` for a log whose run keeps none."""
+    match = _CHECKPOINTED_LOG_RE.fullmatch(log_file)
+    return f"{match.group(3)}-{match.group(4)}{PROGRESS_SUFFIX}" if match else None
+
+
+def log_opened_at(log_file: str) -> str | None:
+    """``YYYYMMDD HH:MM:SS`` from a timestamped log name — the box-local
+    time ``setup_logging`` opened it, in the form ``date -d`` parses."""
+    match = _CHECKPOINTED_LOG_RE.fullmatch(log_file)
+    if match is None:
+        return None
+    day, hms = match.group(1), match.group(2)
+    return f"{day} {hms[0:2]}:{hms[2:4]}:{hms[4:6]}"
+
+
+def _opened_epoch(log_file: str) -> float | None:
+    opened = log_opened_at(log_file)
+    if opened is None:
+        return None
+    return time.mktime(time.strptime(opened, "%Y%m%d %H:%M:%S"))
+
+
+def read_progress(log_dir: str, log_file: str) -> dict | None:
+    """The checkpoint for ``log_file``'s run, or ``None``.
+
+    The checkpoint is per label and phase, overwritten by each run, so one
+    last modified before ``log_file`` was opened belongs to an earlier run
+    of the label (one that crashed, or a maintain-mode run that keeps no
+    checkpoint) and is ignored.
+    """
+    name = progress_file_for(log_file)
+    opened = _opened_epoch(log_file)
+    if name is None or opened is None:
+        return None
+    path = os.path.join(log_dir, name)
+    try:
+        if os.stat(path).st_mtime < opened:
+            return None
+        with open(path, encoding="utf-8") as f:
+            doc = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return doc if isinstance(doc, dict) else None
+
+
+def _count(counts: dict, key: str) -> int:
+    value = counts.get(key, 0)
+    return value if isinstance(value, int) else 0
+
+
+def counts_from_progress(doc: dict) -> list[int]:
+    """:data:`SDC_COUNTS_AWK`'s eight values, in its order, from a progress
+    checkpoint. Items are counted as they finish rather than as they start,
+    and a finished run (``complete`` or ``aborted`` — the phase logs its
+    ``COUNTS:`` block either way) stands in for the ``COUNTS:`` marker.
+    Maintain-mode runs keep no checkpoint, so their scope total is 0."""
+    counts = doc.get("counts")
+    counts = counts if isinstance(counts, dict) else {}
+    items_done = doc.get("items_done")
+    return [
+        items_done if isinstance(items_done, int) else 0,
+        _count(counts, "UPLOADED"),
+        _count(counts, "UPLOAD_SKIPPED_ON_COMMONS"),
+        0 if doc.get("status", "running") == "running" else 1,
+        _count(counts, "ORDINALS"),
+        _count(counts, "UPLOAD_HAND_FIX"),
+        _count(counts, "UPLOAD_MERGED_TO_CANONICAL"),
+        0,
+    ]
+
+
+def ordinals_from_progress(doc: dict) -> int | None:
+    """:data:`TOTAL_ORDINALS_AWK`'s sum from a download checkpoint, or
+    ``None`` when the checkpoint predates the ``ORDINALS`` counter."""
+    counts = doc.get("counts")
+    if not isinstance(counts, dict) or "ORDINALS" not in counts:
+        return None
+    return _count(counts, "ORDINALS")
+
+
+# Bash regexes used inside :func:`slot_snapshot_cmd` to filter ``lslocks``
+# rows. The shared-pool regex drives the ``free``/``held`` aggregate line
+# (bounded by the shared pool's known ``TOTAL``); the both-pools regex drives
+# per-session attribution (a Case-2 uploader holding a priority-pool slot
+# should still be visible in the per-session ``[Slots: 1]`` readout even though
+# the shared pool's aggregate ignores it). Interpolated from the shared
+# ``worker_slots`` constants so a rename of either directory can't leave this
+# file silently wrong.
+SHARED_SLOT_DIR_BASENAME = os.path.basename(DEFAULT_SLOT_DIR)
+ALL_SLOT_DIR_BASENAME_RE = "|".join(
+    re.escape(os.path.basename(p))
+    for p in (DEFAULT_SLOT_DIR, UPLOADER_PRIORITY_SLOT_DIR)
+)
+
+# ``LogFacts.tail`` is only consulted for its last line (the slots-busy marker) and
+# for a few download-phase substrings, so cap what each session ships. SSM
+# truncates ``StandardOutputContent`` at 24,000 characters; a truncated
+# document fails to parse and the status script falls back to its per-session
+# SSM path, so the cap is about staying on the fast path, not correctness.
+_TAIL_LINES = 5
+_TAIL_CHARS = 400
+
+_ENUMERATED_RE = re.compile(r"[0-9,]+ items enumerated")
+# Retry-pipeline logs, with or without ``setup_logging``'s timestamp prefix.
+_RETRY_LOG_RE = re.compile(rf"(?:\d{{8}}-\d{{6}}-)?(retry-.+)-({LOG_PHASE_ALT})\.log")
+
+
+def slot_snapshot_cmd() -> str:
+    """Shell command behind the box-wide worker-slot snapshot.
+
+    Emits ``NODIR`` / ``NODATA`` when there is nothing to report, else a
+    ``TOTAL n`` line, three median-smoothing held-count samples, a final
+    ``COUNT n`` and one ``HOLDER <label>`` line per slot-holding PID. Parsed
+    by ``_parse_slot_snapshot`` in ``scripts/wikimedia_upload_status.py``.
+    """
+    return (
+        f"D={DEFAULT_SLOT_DIR}; "
+        f'if [ ! -d "$D" ]; then echo NODIR; exit 0; fi; '
+        # Without lslocks, grep -c on empty stdin returns 0 and we'd
+        # silently report "all free" — so bail to NODATA instead of lying.
+        f"command -v lslocks >/dev/null 2>&1 || {{ echo NODATA; exit 0; }}; "
+        f'echo "TOTAL $(ls "$D" 2>/dev/null | wc -l)"; '
+        # Three quick count-only samples for median smoothing (transient
+        # all-held/all-free blips are common on churn). Counts the
+        # SHARED pool only — the ``TOTAL`` line above is the shared
+        # pool's file count, so ``free = TOTAL - held`` only balances
+        # when both operands sample the same pool.
+        f"SHARED_RE='{SHARED_SLOT_DIR_BASENAME}'; "
+        f"ALL_RE='{ALL_SLOT_DIR_BASENAME_RE}'; "
+        f"for i in 1 2 3; do "
+        f'  lslocks 2>/dev/null | grep -cE "$SHARED_RE"; '
+        f"  sleep 1; "
+        f"done; "
+        # Final structured pass: both pools for per-session attribution
+        # (a Case-2 uploader in the priority pool should still appear in
+        # ``[Slots: 1]`` for its row) plus a 4th shared-only count that
+        # feeds the median alongside the earlier samples.
+        f"HOLDERS=$(lslocks -n -o PID,PATH 2>/dev/null "
+        f'  | grep -E "$ALL_RE" || true); '
+        f'echo "$HOLDERS" | grep -cE "$SHARED_RE" '
+        f"  | (read -r n; echo COUNT $n); "
+        f'echo "$HOLDERS" | awk "{{print \\$1}}" | while read pid; do '
+        f'  [ -z "$pid" ] && continue; '
+        # Each pipeline process (uploader, sdc-sync main and its pool
+        # workers) inherits WIKIMEDIA_SESSION_LABEL from the tmux
+        # environ set by the launcher — a robust per-target signal that
+        # survives multiprocessing.Pool forks.
+        f"  label=$(tr '\\0' '\\n' < /proc/$pid/environ 2>/dev/null "
+        f"    | grep -m1 '^WIKIMEDIA_SESSION_LABEL=' | cut -d= -f2-); "
+        f'  [ -n "$label" ] && echo "HOLDER $label"; '
+        f"done"
+    )
+
+
+class LogFacts(NamedTuple):
+    """Raw per-label facts the status script classifies into a phase string.
+
+    Built either from the SSM path's shell output or by :func:`log_facts`
+    on the instance; the field set is the JSON wire format between the two,
+    so add fields with defaults. Count fields mirror :data:`SDC_COUNTS_AWK`'s
+    output order, ``total`` is the item CSV line count and
+    ``total_ordinals`` the :data:`TOTAL_ORDINALS_AWK` sum over the label's
+    download log. ``enumerated`` is only set for ``-id-generation.log``.
+    """
+
+    log_file: str
+    now: int = 0
+    log_mtime: int = 0
+    tail: str = ""
+    dpla_id_count: int = 0
+    uploaded_count: int = 0
+    skipped_count: int = 0
+    counts_marker: int = 0
+    ordinal_count: int = 0
+    hand_fix_count: int = 0
+    merged_count: int = 0
+    maintain_total: int = 0
+    total: int = 0
+    total_ordinals: int = 0
+    enumerated: str = ""
+
+
+def parse_session_list(out: str) -> list[tuple[str, int]]:
+    """Parse :data:`TMUX_SESSIONS_CMD` output into ``(name, created_epoch)``
+    pairs. ``created`` is 0 when tmux printed something unparseable."""
+    if not out or out.strip() == "NONE":
+        return []
+    sessions = []
+    for line in out.splitlines():
+        name, _, epoch = line.partition("|")
+        try:
+            sessions.append((name.strip(), int(epoch.strip())))
+        except ValueError:
+            sessions.append((name.strip(), 0))
+    return sessions
+
+
+def _sh(cmd: str) -> str:
+    """Run ``cmd`` under bash and return stripped stdout, like ``ssm_run``."""
+    proc = subprocess.run(["bash", "-c", cmd], capture_output=True, text=True)
+    return proc.stdout.strip()
+
+
+def _awk_ints(program: str, path: str, n: int) -> list[int]:
+    """Run an awk ``program`` over ``path`` and return its first ``n`` output
+    lines as ints, zero-filled on any failure."""
+    proc = subprocess.run(["awk", program, path], capture_output=True, text=True)
+    values = []
+    for line in proc.stdout.splitlines()[:n] if proc.returncode == 0 else []:
+        try:
+            values.append(int(line.strip()))
+        except ValueError:
+            values.append(0)
+    return values + [0] * (n - len(values))
+
+
+def _newest_log(log_dir: str, matches, newer_than: int = 0) -> tuple[str, float] | None:
+    """Return ``(filename, mtime)`` of the most recently written regular file
+    in ``log_dir`` whose name satisfies ``matches``, or ``None``.
+
+    The local equivalent of the SSM path's ``ls -t … | grep -E … | head -1``
+    and ``find … -newermt``; ``newer_than`` (epoch seconds, 0 = unbounded)
+    keeps only files modified strictly after it.
+    """
+    best: tuple[str, float] | None = None
+    try:
+        entries = list(os.scandir(log_dir))
+    except OSError:
+        return None
+    for entry in entries:
+        if not matches(entry.name):
+            continue
+        try:
+            if not entry.is_file():
+                continue
+            mtime = entry.stat().st_mtime
+        except OSError:
+            continue
+        if newer_than > 0 and mtime <= newer_than:
+            continue
+        if best is None or mtime > best[1]:
+            best = (entry.name, mtime)
+    return best
+
+
+def _tail(path: str) -> str:
+    """Last :data:`_TAIL_LINES` lines of ``path``, capped to
+    :data:`_TAIL_CHARS` from the end."""
+    try:
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - 64 * 1024))
+            lines = f.read().decode("utf-8", "replace").splitlines()
+    except OSError:
+        return ""
+    return "\n".join(lines[-_TAIL_LINES:]).strip()[-_TAIL_CHARS:]
+
+
+def _count_lines(*paths: str) -> int:
+    """``wc -l`` over ``paths``; missing files count as empty."""
+    total = 0
+    for path in paths:
+        try:
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    total += chunk.count(b"\n")
+        except OSError:
+            continue
+    return total
+
+
+def _last_enumerated(path: str) -> str:
+    last = ""
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                for match in _ENUMERATED_RE.finditer(line):
+                    last = match.group(0)
+    except OSError:
+        pass
+    return last
+
+
+def log_facts(hub: str, label: str) -> LogFacts | None:
+    """Gather :class:`LogFacts` for ``label``'s most recent phase log, or
+    ``None`` when the label has no log yet.
+
+    Mirrors ``get_phase_and_progress``'s SSM commands in the status script:
+    the same anchored filename match, the legacy hub-slug fallback for bare
+    hub labels, the same CSV denominators, and the counts from the run's
+    progress checkpoint when it has one (:func:`read_progress`), else the
+    same awk programs.
+    """
+    base = str(partners.partner_dir_path(hub))
+    log_dir = os.path.join(base, "logs")
+    label_re = re.compile(log_filename_pattern_for_label(label))
+    found = _newest_log(log_dir, lambda name: bool(label_re.search(name)))
+    if found is None and "+" not in label:
+        # Backward compat for pre-session-label bare-hub filenames
+        # (``nara-download.log``); see get_phase_and_progress.
+        legacy_re = re.compile(rf"^{re.escape(hub)}-({LOG_PHASE_ALT})\.log$")
+        found = _newest_log(log_dir, lambda name: bool(legacy_re.search(name)))
+    if found is None:
+        return None
+    log_file, mtime = found
+    log_path = os.path.join(log_dir, log_file)
+    now = int(time.time())
+
+    if log_file.endswith("-id-generation.log"):
+        return LogFacts(
+            log_file, now, int(mtime), enumerated=_last_enumerated(log_path)
+        )
+
+    if label.startswith("retry-"):
+        retry_dir = str(partners.INGEST_WIKI_ROOT / "retry")
+        pdir = os.path.basename(base)
+        total = _count_lines(
+            os.path.join(retry_dir, f"{pdir}-download-retry.csv"),
+            os.path.join(retry_dir, f"{pdir}-upload-retry.csv"),
+        )
+    else:
+        total = _count_lines(os.path.join(base, f"{label}.csv"))
+
+    download_suffix = f"-{label}-download.log"
+    download = _newest_log(log_dir, lambda name: name.endswith(download_suffix))
+    total_ordinals = 0
+    if download:
+        download_progress = read_progress(log_dir, download[0])
+        ordinals = (
+            ordinals_from_progress(download_progress) if download_progress else None
+        )
+        if ordinals is None:
+            download_path = os.path.join(log_dir, download[0])
+            ordinals = _awk_ints(TOTAL_ORDINALS_AWK, download_path, 1)[0]
+        total_ordinals = ordinals
+    progress = read_progress(log_dir, log_file)
+    return LogFacts(
+        log_file,
+        now,
+        int(mtime),
+        _tail(log_path),
+        *(
+            counts_from_progress(progress)
+            if progress is not None
+            else _awk_ints(SDC_COUNTS_AWK, log_path, 8)
+        ),
+        total=total,
+        total_ordinals=total_ordinals,
+    )
+
+
+def _find_active_label(labels: list[str], session_created: int) -> str | None:
+    """Local twin of ``session_state.find_active_label``: the label owning
+    the freshest phase log written since the session started."""
+    hubs = sorted({lbl.split("+")[0] for lbl in labels})
+    label_alt = "|".join(re.escape(lbl) for lbl in labels)
+    any_label_re = re.compile(rf".*-({label_alt})-({LOG_PHASE_ALT})\.log")
+    best: tuple[str, float] | None = None
+    for hub in hubs:
+        found = _newest_log(
+            os.path.join(str(partners.partner_dir_path(hub)), "logs"),
+            lambda name: bool(any_label_re.fullmatch(name)),
+            newer_than=session_created,
+        )
+        if found and (best is None or found[1] > best[1]):
+            best = found
+    if best is None:
+        return None
+    for lbl in labels:
+        if re.search(log_filename_pattern_for_label(lbl), best[0]):
+            return lbl
+    return None
+
+
+def _newest_retry_log() -> str | None:
+    """Filename of the most recently written ``retry-*`` log across every
+    partner directory, for retry sessions that don't name their partner."""
+    best: tuple[str, float] | None = None
+    try:
+        partner_dirs = list(os.scandir(partners.INGEST_WIKI_ROOT))
+    except OSError:
+        return None
+    for entry in partner_dirs:
+        found = _newest_log(
+            os.path.join(entry.path, "logs"),
+            lambda name: bool(_RETRY_LOG_RE.fullmatch(name)),
+        )
+        if found and (best is None or found[1] > best[1]):
+            best = found
+    return best[0] if best else None
+
+
+def collect_session(session: str, created: int, running_labels: dict[str, str]) -> dict:
+    """Collect one session's status entry.
+
+    ``label`` is the row's label (the session name when no label applies),
+    ``labels`` the session's full chain for the batch-position suffix and
+    ``facts`` the :class:`LogFacts` dict for the active label, or ``None``.
+    ``phase`` is set only for outcomes decided here — an unrecognised
+    session name or retry log — and is rendered verbatim.
+    """
+    entry: dict = {"session": session, "created": created}
+    suffix = session.removeprefix("wikimedia-")
+
+    if suffix.startswith("retry-"):
+        # Same resolution as the status script's legacy path: the partner
+        # from the session name when encoded there, else the hub of the
+        # freshest retry-* log on the box.
+        _, _, explicit_partner = suffix.removeprefix("retry-").partition("-")
+        if explicit_partner:
+            hub = resolve_slug(explicit_partner) or explicit_partner
+            label = f"retry-{hub}"
+        else:
+            log_filename = _newest_retry_log()
+            if log_filename is None:
+                return {**entry, "label": session, "phase": "Starting..."}
+            match = _RETRY_LOG_RE.fullmatch(log_filename)
+            if match is None or match.group(2) == "id-generation":
+                return {
+                    **entry,
+                    "label": session,
+                    "phase": f"Unknown (unrecognised log: {log_filename!r})",
+                }
+            label = match.group(1)
+            raw_hub = label.removeprefix("retry-")
+            hub = resolve_slug(raw_hub) or raw_hub
+        facts = log_facts(hub, label)
+        return {
+            **entry,
+            "label": label,
+            "labels": [label],
+            "facts": facts._asdict() if facts else None,
+        }
+
+    labels = parse_session_labels(suffix)
+    if not labels:
+        return {
+            **entry,
+            "label": session,
+            "phase": "Unknown (unrecognised session name)",
+        }
+    entry["labels"] = labels
+    # Prefer the running child's WIKIMEDIA_SESSION_LABEL; fall back to the
+    # log-mtime heuristic only when no child is running.
+    label = running_labels.get(session) or _find_active_label(labels, created)
+    if label is None:
+        return {**entry, "label": labels[0], "facts": None}
+    facts = log_facts(label.split("+")[0], label)
+    return {**entry, "label": label, "facts": facts._asdict() if facts else None}
+
+
+def collect() -> dict:
+    """Collect the whole status document. Per-session failures become an
+    ``Unknown (error)`` entry instead of failing the document.
+
+    A session running concurrent lanes contributes one entry per lane with
+    a running phase — each collected as if that lane's label were the
+    session's running child — so the readout shows every target in flight
+    rather than the freshest log's. With no lane mid-phase it falls back to
+    the single-row lookup.
+    """
+    sessions = parse_session_list(_sh(TMUX_SESSIONS_CMD))
+    with ThreadPoolExecutor(max_workers=min(len(sessions) + 2, 8)) as executor:
+        # The slot snapshot sleeps between its median samples; overlap it
+        # with the per-session log scans rather than serialising after them.
+        slots_future = executor.submit(_sh, slot_snapshot_cmd())
+        memory_future = executor.submit(_sh, MEMORY_SNAPSHOT_CMD)
+        activity = _sh(RUNNING_ACTIVE_LABELS_CMD)
+        running_labels = parse_running_active_labels(activity)
+        lanes = parse_concurrent_sessions(activity)
+
+        def safe_collect(name: str, created: int) -> list[dict]:
+            try:
+                return [
+                    collect_session(name, created, {name: label})
+                    for label in lanes.get(name) or ()
+                ] or [collect_session(name, created, running_labels)]
+            except Exception:
+                logging.exception("Failed to collect status for %s", name)
+                return [
+                    {
+                        "session": name,
+                        "created": created,
+                        "label": name,
+                        "phase": "Unknown (error)",
+                    }
+                ]
+
+        entries = [
+            entry
+            for session_entries in executor.map(lambda s: safe_collect(*s), sessions)
+            for entry in session_entries
+        ]
+        return {
+            "sessions": entries,
+            "memory": memory_future.result(),
+            "slots": slots_future.result(),
+        }
+
+
+def main() -> None:
+    json.dump(collect(), sys.stdout, separators=(",", ":"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""Wall-clock instrumentation for the pipeline's hot-path calls.
+
+Each S3, Elasticsearch, Commons and IIIF round-trip worth knowing about is
+wrapped in :meth:`Timings.time` (or the :func:`timed` decorator), which
+records a call count, total seconds and a fixed log-scale latency histogram
+per operation name, so a phase's log shows where its time went rather than
+only how long it took.
+
+One process-wide :data:`timings` registry backs every wrapper — the wrapped
+call sites (``S3Client`` methods, ``post_es``, ``find_file_by_hash``, …)
+have no tracker to thread through, and each pipeline phase is its own
+process writing its own log, so "per phase" falls out of emitting the
+registry at phase end. Pool workers aggregate exactly like
+:class:`~ingest_wikimedia.tracker.Tracker`: ``snapshot`` before a task,
+return ``diff`` with the task result, ``merge`` in the parent.
+
+The registry is emitted as a ``TIMINGS:`` block just before the terminal
+``COUNTS:`` block, so ``COUNTS:`` stays the last thing a phase writes (the
+status poller and the Slack failure summary key on it).
+"""
+
+import functools
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+# Upper bounds (seconds) of the latency buckets: 1 ms doubling up to ~17.5
+# minutes, plus one overflow bucket. Fixed rather than adaptive so a
+# histogram is a plain list of ints that diffs and merges element-wise
+# across pool workers.
+BUCKET_BOUNDS: tuple[float, ...] = tuple(0.001 * 2**i for i in range(21))
+_N_BUCKETS = len(BUCKET_BOUNDS) + 1
+
+
+def bucket_index(value: float) -> int:
+    """Return the histogram bucket ``value`` falls in (last = overflow)."""
+    for i, bound in enumerate(BUCKET_BOUNDS):
+        if value <= bound:
+            return i
+    return len(BUCKET_BOUNDS)
+
+
+def percentile(buckets: list[int], q: float) -> float | None:
+    """Estimate the ``q`` quantile (0–1) of a bucketed histogram.
+
+    Returns the upper bound of the bucket holding the quantile — a
+    conservative (never under-reporting) estimate with at most 2x error,
+    which is plenty to tell a 40 ms call from a 4 s one. ``None`` for an
+    empty histogram. A quantile landing in the overflow bucket reports the
+    largest finite bound.
+    """
+    total = sum(buckets)
+    if total <= 0:
+        return None
+    rank = q * total
+    seen = 0
+    for i, n in enumerate(buckets):
+        seen += n
+        if seen >= rank and n:
+            return BUCKET_BOUNDS[min(i, len(BUCKET_BOUNDS) - 1)]
+    return BUCKET_BOUNDS[-1]
+
+
+def format_seconds(seconds: float) -> str:
+    """Render a latency compactly: ``850ms``, ``2.3s``, ``4m10s``."""
+    if seconds < 1:
+        return f"{seconds * 1000:.0f}ms"
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    minutes, secs = divmod(int(seconds), 60)
+    return f"{minutes}m{secs:02d}s"
+
+
+def _empty_entry() -> dict:
+    return {"calls": 0, "seconds": 0.0, "buckets": [0] * _N_BUCKETS}
+
+
+class Timings:
+    """Per-operation call counts, total seconds and latency histograms.
+
+    ``data`` maps an operation name (``"s3.get_item_file"``,
+    ``"commons.upload"``, …) to ``{"calls", "seconds", "buckets"}`` — plain
+    picklable values, so :meth:`snapshot` / :meth:`diff` results can cross
+    a ``multiprocessing.Pool`` boundary. Recording is lock-guarded because
+    the get-ids-* tools write S3 from a ``ThreadPoolExecutor``.
+    """
+
+    def __init__(self):
+        self.data: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def record(self, op: str, seconds: float) -> None:
+        with self._lock:
+            entry = self.data.get(op)
+            if entry is None:
+                entry = self.data[op] = _empty_entry()
+            entry["calls"] += 1
+            entry["seconds"] += seconds
+            entry["buckets"][bucket_index(seconds)] += 1
+
+    @contextmanager
+    def time(self, op: str) -> Iterator[None]:
+        """Record the wall-clock duration of the ``with`` body under ``op``.
+
+        Failed calls are recorded too — a timeout that burned 120 s is
+        exactly the kind of cost this exists to surface.
+        """
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(op, time.monotonic() - start)
+
+    def calls(self, op: str) -> int:
+        entry = self.data.get(op)
+        return entry["calls"] if entry else 0
+
+    def seconds(self, op: str) -> float:
+        entry = self.data.get(op)
+        return entry["seconds"] if entry else 0.0
+
+    def reset(self) -> None:
+        with self._lock:
+            self.data = {}
+
+    def snapshot(self) -> dict[str, dict]:
+        """Return a deep-enough copy of the state for :meth:`diff`."""
+        with self._lock:
+            return {
+                op: {
+                    "calls": e["calls"],
+                    "seconds": e["seconds"],
+                    "buckets": list(e["buckets"]),
+                }
+                for op, e in self.data.items()
+            }
+
+    def diff(self, prior: dict[str, dict]) -> dict[str, dict]:
+        """Return what was recorded since ``prior`` (a :meth:`snapshot`).
+
+        Operations with no new calls are omitted, keeping the per-task
+        delta a worker ships back to the parent small.
+        """
+        out: dict[str, dict] = {}
+        for op, entry in self.snapshot().items():
+            before = prior.get(op) or _empty_entry()
+            calls = entry["calls"] - before["calls"]
+            if not calls:
+                continue
+            out[op] = {
+                "calls": calls,
+                "seconds": entry["seconds"] - before["seconds"],
+                "buckets": [
+                    now - then for now, then in zip(entry["buckets"], before["buckets"])
+                ],
+            }
+        return out
+
+    def merge(self, delta: dict[str, dict]) -> None:
+        """Add a worker's :meth:`diff` into this registry. A delta built
+        against a different bucket layout (a worker on a newer schema
+        during a rolling deploy) is ignored rather than corrupting the
+        histogram, mirroring ``Tracker.merge``'s unknown-key tolerance."""
+        with self._lock:
+            for op, entry in delta.items():
+                if len(entry.get("buckets", ())) != _N_BUCKETS:
+                    continue
+                mine = self.data.get(op)
+                if mine is None:
+                    mine = self.data[op] = _empty_entry()
+                mine["calls"] += entry["calls"]
+                mine["seconds"] += entry["seconds"]
+                mine["buckets"] = [
+                    a + b for a, b in zip(mine["buckets"], entry["buckets"])
+                ]
+
+    def __str__(self) -> str:
+        result = "TIMINGS:\n"
+        # Heaviest first: the point of the block is to show where the wall
+        # clock went, so the top line should be the answer.
+        for op, entry in sorted(
+            self.data.items(), key=lambda kv: kv[1]["seconds"], reverse=True
+        ):
+            calls = entry["calls"]
+            if not calls:
+                continue
+            p50 = percentile(entry["buckets"], 0.50)
+            p95 = percentile(entry["buckets"], 0.95)
+            result += (
+                f"{op}: {calls} calls, {format_seconds(entry['seconds'])} total,"
+                f" mean {format_seconds(entry['seconds'] / calls)},"
+                f" p50 {format_seconds(p50 or 0)}, p95 {format_seconds(p95 or 0)}\n"
+            )
+        return result
+
+
+# Process-wide registry every wrapper records into. Spawned pool workers get
+# their own (fresh on re-import) and ship diffs back to the parent.
+timings = Timings()
+
+
+def timed[F: Callable](op: str) -> Callable[[F], F]:
+    """Decorator form of ``timings.time(op)`` for whole-function wrapping."""
+
+    def decorator(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with timings.time(op):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
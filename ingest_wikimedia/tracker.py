@@ -1,5 +1,10 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from enum import Enum, auto
 
+from ingest_wikimedia.timings import BUCKET_BOUNDS, bucket_index, percentile
+
 
 class Result(Enum):
     DOWNLOADED = auto()
@@ -49,10 +54,19 @@ class Result(Enum):
     # counter and hides genuine drift-repair gaps in the same bucket.
     # See the investigation notes on PR that introduced this counter.
     UPLOAD_SKIPPED_COMMONS_DEDUP = auto()
+    # Ordinals skipped because our bytes are already at the intended title
+    # (the "Skipping ...: Already exists on commons" lines). Also bumps
+    # ``SKIPPED``; broken out so the status readout's "already on Commons"
+    # figure can come from the progress checkpoint rather than a log scan.
+    UPLOAD_SKIPPED_ON_COMMONS = auto()
     UPLOADED = auto()
     BYTES = auto()
     ITEM_NOT_PRESENT = auto()
     BAD_IIIF_MANIFEST = auto()
+    # A stale IIIF file list whose manifest revalidated as unchanged (a 304,
+    # or a 200 byte-identical to the stored iiif.json): the cached file list
+    # was reused without re-parsing or rewriting anything.
+    IIIF_MANIFEST_UNCHANGED = auto()
     NO_MEDIA = auto()
     BAD_IMAGE_API = auto()
     RETIRED = auto()
@@ -144,6 +158,41 @@ class Result(Enum):
     # bytes, so it neither inspects hashes nor picks a winner).
     MAINTAIN_RENAMED = auto()
     MAINTAIN_RENAME_BLOCKED = auto()
+    # Ordinals a phase reached, whatever their outcome: the downloader counts
+    # each item's media URLs (the "Item <id>: N ordinals" sum) and sdc-sync
+    # each ordinal it reaches (the "-- Ordinal N: <mediaid>" lines, plus the
+    # "-- Ordinal N: missing/zero pageid" skips). Carried in
+    # the progress checkpoint so the status readout gets its file-level
+    # numerator and denominator without an awk pass over the logs.
+    ORDINALS = auto()
+
+
+class Histogram(Enum):
+    # Wall-clock seconds for one DPLA item through the phase's per-item path
+    # (uploader ``process_item``, sdc-sync ``_process_one_partner_item``),
+    # measured inside the box-wide slot so budget contention — reported
+    # separately as SDC_SLOT_WAIT_SECONDS — doesn't inflate it. Its
+    # observation count doubles as the "items processed" rate series.
+    ITEM_SECONDS = auto()
+
+
+# Counters whose increments are also bucketed by wall-clock minute so a
+# recent rate ("uploads in the last 10 minutes") can be read back, not just
+# the run-long total. Histogram observations are always windowed.
+WINDOWED_RESULTS = frozenset(
+    {Result.DOWNLOADED, Result.UPLOADED, Result.BYTES, Result.SDC_ITEMS_SYNCED}
+)
+# Minutes of per-minute buckets kept per series. Older buckets are pruned so
+# a multi-day run's windows stay bounded; rates over a longer span come from
+# the run-long counters divided by elapsed time instead.
+WINDOW_RETENTION_MINUTES = 60
+# Key under which snapshot()/diff() carry the per-minute windows alongside
+# the Result counters and Histogram buckets.
+_WINDOWS = "windows"
+
+
+def _minute(now: float | None = None) -> int:
+    return int((time.time() if now is None else now) // 60)
 
 
 class Tracker:
@@ -151,36 +200,132 @@ class Tracker:
         self.data = {}
         for value in Result:
             self.data[value] = 0
+        self.histograms: dict[Histogram, list[int]] = {
+            h: [0] * (len(BUCKET_BOUNDS) + 1) for h in Histogram
+        }
+        self.windows: dict[Result | Histogram, dict[int, int]] = {
+            key: {} for key in (*WINDOWED_RESULTS, *Histogram)
+        }
 
     def increment(self, status: Result, amount=1) -> None:
         self.data[status] = self.data[status] + amount
+        if status in WINDOWED_RESULTS:
+            self._window_add(status, _minute(), amount)
 
     def count(self, status: Result) -> int:
         return self.data[status]
 
+    def observe(self, histogram: Histogram, value: float) -> None:
+        """Record one observation (seconds) into ``histogram``."""
+        self.histograms[histogram][bucket_index(value)] += 1
+        self._window_add(histogram, _minute(), 1)
+
+    @contextmanager
+    def measure(self, histogram: Histogram) -> Iterator[None]:
+        """Observe the wall-clock duration of the ``with`` body. Recorded
+        even when the body raises: a crashed item still took that long."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.observe(histogram, time.monotonic() - start)
+
+    def observations(self, histogram: Histogram) -> int:
+        return sum(self.histograms[histogram])
+
+    def percentile(self, histogram: Histogram, q: float) -> float | None:
+        """Bucket-upper-bound estimate of the ``q`` quantile; see
+        :func:`ingest_wikimedia.timings.percentile`."""
+        return percentile(self.histograms[histogram], q)
+
+    def rate(
+        self,
+        key: Result | Histogram,
+        window_seconds: int = 600,
+        now: float | None = None,
+    ) -> float:
+        """Per-second rate of ``key`` over the trailing ``window_seconds``.
+
+        Counts every minute bucket that overlaps the window, including the
+        current partial minute, so the figure slightly under-reads right after
+        a minute boundary. ``window_seconds`` beyond the retention period
+        only sees what was retained.
+        """
+        if window_seconds <= 0:
+            return 0.0
+        current = _minute(now)
+        first = current - (window_seconds + 59) // 60 + 1
+        window = self.windows.get(key, {})
+        total = sum(n for minute, n in window.items() if first <= minute <= current)
+        return total / window_seconds
+
+    def _window_add(self, key: Result | Histogram, minute: int, amount: int) -> None:
+        window = self.windows[key]
+        window[minute] = window.get(minute, 0) + amount
+        if len(window) > WINDOW_RETENTION_MINUTES:
+            cutoff = max(window) - WINDOW_RETENTION_MINUTES
+            for old in [m for m in window if m <= cutoff]:
+                del window[old]
+
     def reset(self):
         for value in Result:
             self.data[value] = 0
+        for buckets in self.histograms.values():
+            buckets[:] = [0] * len(buckets)
+        for window in self.windows.values():
+            window.clear()
 
-    def snapshot(self) -> dict["Result", int]:
-        """Return a shallow copy of the counter state, suitable for
-        per-task delta computation across a multiprocessing Pool.
+    def snapshot(self) -> dict:
+        """Return a copy of the tracker state, suitable for per-task
+        delta computation across a multiprocessing Pool.
+
+        Result counters map to ints as before; each :class:`Histogram`
+        maps to a copy of its bucket list, and the per-minute rate
+        windows ride along under one extra key. Everything is plain
+        picklable data, so the existing ``return tracker.diff(prior)``
+        worker plumbing carries histograms and rates with no changes.
 
         Pair with :meth:`diff` to compute what changed during a unit of
         work, and :meth:`merge` on the parent's tracker to absorb the
         delta returned from a worker process.
         """
-        return dict(self.data)
+        state: dict = dict(self.data)
+        for histogram, buckets in self.histograms.items():
+            state[histogram] = list(buckets)
+        state[_WINDOWS] = {key: dict(w) for key, w in self.windows.items()}
+        return state
 
-    def diff(self, prior: dict["Result", int]) -> dict["Result", int]:
+    def diff(self, prior: dict) -> dict:
         """Return ``{key: self.data[key] - prior[key]}`` for every
         counter, treating missing keys in ``prior`` as zero. Used to
         capture only the counts a worker added during one task —
         contrast with returning the full ``self.data`` from a
-        long-lived worker, which would double-count across tasks."""
-        return {key: self.data[key] - prior.get(key, 0) for key in self.data}
+        long-lived worker, which would double-count across tasks.
+
+        Histograms diff bucket-wise and windows minute-wise; both are
+        omitted when nothing changed so the per-task delta stays small."""
+        delta: dict = {key: self.data[key] - prior.get(key, 0) for key in self.data}
+        for histogram, buckets in self.histograms.items():
+            before = prior.get(histogram) or [0] * len(buckets)
+            changed = [now - then for now, then in zip(buckets, before)]
+            if any(changed):
+                delta[histogram] = changed
+        prior_windows = prior.get(_WINDOWS, {})
+        windows: dict = {}
+        for key, window in self.windows.items():
+            before = prior_windows.get(key, {})
+            changed = {
+                minute: n - before.get(minute, 0)
+                for minute, n in window.items()
+                if n != before.get(minute, 0)
+            }
+            if changed:
+                windows[key] = changed
+        if windows:
+            delta[_WINDOWS] = windows
+        return delta
 
-    def merge(self, delta: dict["Result", int]) -> None:
+    def merge(self, delta: dict) -> None:
         """Add each counter in ``delta`` into ``self.data``. Used by
         the parent process to aggregate per-task deltas returned from
         ``multiprocessing.Pool`` workers. Unknown keys in ``delta``
@@ -190,6 +335,16 @@ class Tracker:
         for key, count in delta.items():
             if key in self.data:
                 self.data[key] += count
+            elif key in self.histograms:
+                buckets = self.histograms[key]
+                if len(count) == len(buckets):
+                    buckets[:] = [a + b for a, b in zip(buckets, count)]
+            elif key == _WINDOWS:
+                for window_key, minutes in count.items():
+                    if window_key not in self.windows:
+                        continue
+                    for minute, n in minutes.items():
+                        self._window_add(window_key, minute, n)
 
     def __str__(self) -> str:
         result = "COUNTS:\n"
@@ -17,6 +17,7 @@ from pywikibot.tools.chars import replace_invisible
 from .common import CHECKSUM, get_list, get_str, get_dict
 from .csrf import with_csrf_recovery
 from .s3 import S3_BUCKET, S3Client
+from .timings import timed
 from .dpla import (
     WIKIDATA_FIELD_NAME,
     EDM_RIGHTS_FIELD_NAME,
@@ -904,6 +905,7 @@ def wiki_file_exists(site: BaseSite, sha1: str) -> bool:
     return False
 
 
+@timed("commons.find_file_by_hash")
 def find_file_by_hash(
     site: BaseSite, sha1: str, preferred_title: str | None = None
 ) -> FilePage | None:
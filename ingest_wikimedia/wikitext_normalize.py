@@ -24,8 +24,8 @@ from __future__ import annotations
 import logging
 import re
 
-import mwparserfromhell
 
+from ingest_wikimedia import wikitext_parse
 from ingest_wikimedia.csrf import with_csrf_recovery
 from ingest_wikimedia.sdc import (
     CASEFOLD_COMPARE_KEYS,
@@ -152,7 +152,7 @@ def _value_matches(
     if _canonical_value(wikitext_value) == _canonical_value(expected):
         return True
 
-    parsed = mwparserfromhell.parse(wikitext_value)
+    parsed = wikitext_parse.parse(wikitext_value)
     templates = parsed.filter_templates(recursive=False)
     if len(templates) == 1:
         tpl = templates[0]
@@ -248,7 +248,7 @@ def has_dpla_metadata_template(wikitext: str) -> bool:
     (:mod:`ingest_wikimedia.legacy_artwork`) without paying the cost
     of a full parse + strip pass when the file isn't on the new
     template form. Pure — no API calls."""
-    return _find_dpla_metadata_template(mwparserfromhell.parse(wikitext)) is not None
+    return _find_dpla_metadata_template(wikitext_parse.parse(wikitext)) is not None
 
 
 def _normalize_param_name(param) -> str:
@@ -295,7 +295,7 @@ def normalize(wikitext: str, expected_params: dict) -> tuple[str, list[str]]:
     that the next pass will catch; the cost of an incorrect strip is
     data loss.
     """
-    wikicode = mwparserfromhell.parse(wikitext)
+    wikicode = wikitext_parse.parse_copy(wikitext)
     template = _find_dpla_metadata_template(wikicode)
     if template is None:
         return wikitext, []
@@ -426,7 +426,7 @@ def _parse_inner_template(value: str, expected_name: str) -> dict | None:
     mwparserfromhell's convention). All values are whitespace-
     stripped — the comparator wants to match the renderer's behavior,
     not the source bytes."""
-    parsed = mwparserfromhell.parse(value)
+    parsed = wikitext_parse.parse(value)
     templates = parsed.filter_templates(recursive=False)
     if len(templates) != 1:
         return None
@@ -465,7 +465,7 @@ def canonicalize(wikitext: str) -> str:
     Files that don't contain a ``{{DPLA metadata}}`` template are
     returned unchanged.
     """
-    wikicode = mwparserfromhell.parse(wikitext)
+    wikicode = wikitext_parse.parse_copy(wikitext)
     template = _find_dpla_metadata_template(wikicode)
     if template is None:
         return wikitext
@@ -0,0 +1,115 @@
+"""Process-wide memoized ``mwparserfromhell.parse`` for the SDC cleanup pass.
+
+One file in the post-SDC cleanup path used to have the same wikitext parsed
+over and over: :func:`~ingest_wikimedia.wikitext_normalize.has_dpla_metadata_template`
+to pick the strip vs. migrate path,
+:func:`~ingest_wikimedia.legacy_artwork.find_legacy_template` three times
+while building one migration plan, :func:`~ingest_wikimedia.legacy_artwork.parse_artwork_params`
+again, and ``trace_param_provenance`` once per historical revision — where
+most consecutive revisions carry byte-identical templates and the same
+small param values (``{{en|…}}`` wrappers, ``{{InFi|Creator|…}}`` rows,
+``{{Institution|wikidata=…}}``) recur on every revision and every file of
+a batch.
+
+:func:`parse` keeps the most recent :data:`PARSE_CACHE_SIZE` distinct
+texts' trees in a bounded LRU keyed by a digest of the text, so each
+distinct wikitext is tokenised once per process. The returned tree is
+SHARED: read-only callers (``filter_templates``, ``params``, ``str()``)
+only. Callers that mutate the tree (``remove``, ``replace``, ``add``,
+``name =``) use :func:`parse_copy`, which returns a private tree. The
+private tree is a fresh parse rather than a ``copy.deepcopy`` of the
+cached one — deep-copying a node tree measured about twice the cost of
+re-tokenising the text with the C tokenizer, so "defensive copy" here
+simply means "not the cached instance".
+
+Cache hits are recorded in the :data:`~ingest_wikimedia.timings.timings`
+registry as ``wikitext.parse_cached`` and every real tokenisation (a miss
+or a :func:`parse_copy`) as ``wikitext.parse``, so the phase-end
+``TIMINGS:`` block reports both — and what the parsing cost — and
+pool workers' numbers reach the parent through the existing
+``timings.diff`` / ``timings.merge`` plumbing with no new return values.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+import mwparserfromhell
+from mwparserfromhell.wikicode import Wikicode
+
+from ingest_wikimedia.timings import timings
+
+# Distinct texts kept. Page-level wikitext is a few KB and param values a
+# few dozen bytes, so even a cache full of whole pages stays in the tens of
+# MB; 1024 covers every revision of a long-history file plus the value
+# strings recurring across a batch.
+PARSE_CACHE_SIZE = 1024
+
+PARSE_OP = "wikitext.parse"
+PARSE_CACHED_OP = "wikitext.parse_cached"
+
+
+def _key(text: str) -> bytes:
+    # A fixed-size digest rather than the text itself: the key would
+    # otherwise pin a second copy of every cached page alongside its tree.
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+class ParseCache:
+    """Bounded LRU of ``text -> Wikicode``. Lock-guarded because the
+    sdc-sync paths run some lookups from thread pools."""
+
+    def __init__(self, maxsize: int = PARSE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, Wikicode] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def parse(self, text: str) -> Wikicode:
+        key = _key(text)
+        with self._lock:
+            wikicode = self._entries.get(key)
+            if wikicode is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if wikicode is not None:
+            timings.record(PARSE_CACHED_OP, 0.0)
+            return wikicode
+        # Parse outside the lock: two threads racing on the same new text
+        # both parse it, which is cheaper than serialising every miss.
+        with timings.time(PARSE_OP):
+            wikicode = mwparserfromhell.parse(text)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = wikicode
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return wikicode
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Process-wide cache every call site shares. Spawned pool workers get their
+# own on re-import.
+parse_cache = ParseCache()
+
+
+def parse(text: str) -> Wikicode:
+    """Return the (shared, cached) parse tree for ``text``. Do not mutate
+    it — use :func:`parse_copy` for that."""
+    return parse_cache.parse(text)
+
+
+def parse_copy(text: str) -> Wikicode:
+    """Return a private parse tree for ``text`` that the caller may mutate."""
+    with timings.time(PARSE_OP):
+        return mwparserfromhell.parse(text)
@@ -26,23 +26,36 @@ Environment variables (set on the Lambda function):
   SLACK_SIGNING_SECRET  — from Slack app Basic Information page
   GH_TOKEN              — GitHub fine-grained PAT with actions:write on dpla/ingest-wikimedia
   GH_REPO               — e.g. dpla/ingest-wikimedia (optional, has default)
+
+Slack gives the whole invocation 3 s, so everything that can outlive one
+invocation lives at module scope and is reused while the container stays warm:
+the keep-alive HTTPS connection to the GitHub API (``_github``) — a cold TLS
+handshake to api.github.com is the single largest cost of a dispatch.
 """
 
 import base64
 import binascii
 import hashlib
 import hmac
+import http.client
 import json
 import logging
 import os
 import shlex
+import threading
 import time
 import urllib.error
 import urllib.parse
-import urllib.request
 
 from ingest_wikimedia.partners import is_dpla_id, is_wikidata_id, resolve_slug
 
+GITHUB_API_URL = "https://api.github.com"
+
+# Seconds to wait on GitHub per dispatch. Leaves room inside Slack's 3 s for
+# signature checks and the reply; a slower answer takes the "may have been
+# dispatched anyway" branch (see ``_is_dispatch_timeout``).
+DISPATCH_TIMEOUT_SECONDS = 2
+
 
 def _verify_slack_signature(
     signing_secret: str, timestamp: str, body: str, signature: str
@@ -66,23 +79,101 @@ def _require_env(key: str) -> str:
     return value
 
 
-def _dispatch_workflow(token: str, repo: str, workflow: str, inputs: dict) -> int:
-    url = f"https://api.github.com/repos/{repo}/actions/workflows/{workflow}/dispatches"
-    req = urllib.request.Request(
-        url,
-        data=json.dumps({"ref": "main", "inputs": inputs}).encode(),
-        headers={
+class _GitHubClient:
+    """One keep-alive connection to the GitHub API, reused across invocations.
+
+    ``urllib.request.urlopen`` opens (and TLS-handshakes) a fresh connection
+    per request; holding an ``http.client`` connection at module scope means
+    only a container's first dispatch pays for that. Failures keep urlopen's
+    shape so callers' error handling is unchanged: non-2xx raises
+    ``urllib.error.HTTPError``, a timeout raises ``TimeoutError`` and any other
+    socket error is wrapped in ``urllib.error.URLError``.
+    """
+
+    def __init__(self, base_url: str = GITHUB_API_URL):
+        parsed = urllib.parse.urlsplit(base_url)
+        self.scheme = parsed.scheme
+        self.netloc = parsed.netloc
+        self.base_path = parsed.path.rstrip("/")
+        self._conn: http.client.HTTPConnection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> http.client.HTTPConnection:
+        cls = (
+            http.client.HTTPSConnection
+            if self.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        return cls(self.netloc, timeout=DISPATCH_TIMEOUT_SECONDS)
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def post_json(self, path: str, token: str, payload: dict) -> int:
+        body = json.dumps(payload).encode()
+        headers = {
             "Authorization": f"Bearer {token}",
             "Accept": "application/vnd.github+json",
             "Content-Type": "application/json",
             "X-GitHub-Api-Version": "2022-11-28",
-        },
-        method="POST",
-    )
-    with urllib.request.urlopen(req, timeout=2) as resp:
+        }
+        with self._lock:
+            # A reused connection GitHub has since closed fails on send or
+            # before any response byte arrives, so the dispatch never reached
+            # it: reconnect and send once more. A fresh connection's failure
+            # is final — retrying could double-dispatch.
+            for attempt in range(2):
+                reused = self._conn is not None
+                if self._conn is None:
+                    self._conn = self._connect()
+                try:
+                    self._conn.request(
+                        "POST", self.base_path + path, body=body, headers=headers
+                    )
+                    resp = self._conn.getresponse()
+                    resp.read()
+                except (
+                    http.client.RemoteDisconnected,
+                    ConnectionResetError,
+                    BrokenPipeError,
+                ) as e:
+                    self.close()
+                    if reused and attempt == 0:
+                        continue
+                    raise urllib.error.URLError(e) from e
+                except TimeoutError:
+                    self.close()
+                    raise
+                except OSError as e:
+                    self.close()
+                    raise urllib.error.URLError(e) from e
+                if resp.will_close:
+                    self.close()
+                break
+        if resp.status >= 400:
+            raise urllib.error.HTTPError(
+                f"{self.scheme}://{self.netloc}{self.base_path}{path}",
+                resp.status,
+                resp.reason,
+                resp.headers,
+                None,
+            )
         return resp.status
 
 
+_github = _GitHubClient()
+
+
+def _dispatch_workflow(token: str, repo: str, workflow: str, inputs: dict) -> int:
+    return _github.post_json(
+        f"/repos/{repo}/actions/workflows/{workflow}/dispatches",
+        token,
+        {"ref": "main", "inputs": inputs},
+    )
+
+
 def _slack_reply(text: str, ephemeral: bool = False) -> dict:
     return {
         "statusCode": 200,
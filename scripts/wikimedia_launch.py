@@ -37,8 +37,10 @@ import boto3
 import requests
 
 from ingest_wikimedia.partners import (
+    INSTITUTIONS_FILE_ENV,
     INSTITUTIONS_URL,
     PARTNER_DIR,
+    SUBJECTS_FILE_ENV,
     SUBJECTS_URL,
     commons_has_files_for_qid,
     is_dpla_id,
@@ -53,7 +55,8 @@ from ingest_wikimedia.partners import (
 )
 from ingest_wikimedia.session_state import (
     active_and_upcoming_labels,
-    snapshot_running_active_labels,
+    CONCURRENT_TARGETS_ENV,
+    snapshot_session_activity,
 )
 from ingest_wikimedia.slack import post_message
 from ingest_wikimedia.ssm import REGION, ssm_run, stage_and_launch_tmux
@@ -65,30 +68,103 @@ from ingest_wikimedia.ssm import REGION, ssm_run, stage_and_launch_tmux
 INSTITUTIONS_LOCAL_PATH = "/home/ec2-user/ingest-wikimedia/institutions_v2.json"
 SUBJECTS_LOCAL_PATH = "/home/ec2-user/ingest-wikimedia/subjects.json"
 
+# Content-addressed store behind those paths: each fetched config is kept as
+# ``<stem>.<sha256 prefix>.json`` and the staged path is a symlink to the
+# current one, with the response's ETag saved alongside. A relaunch whose
+# config hasn't changed gets a 304 and touches nothing — so the file the
+# staged path resolves to keeps its size and mtime, and the mmap snapshot
+# partners compiled for it (keyed on exactly those) stays valid across
+# launches instead of being recompiled by the first process of each one.
+CONFIG_CACHE_DIR = "/home/ec2-user/ingest-wikimedia/config-cache"
+CONFIG_CACHE_MAX_AGE_DAYS = 7
+
+# Run on the box to reject a fetched config that isn't a non-empty JSON object
+# (an HTML error page, a truncated body) before it can replace a good copy —
+# the same test partners._load_local_json applies at read time.
+_CONFIG_VALID_PY = (
+    "import json,sys; d=json.load(open(sys.argv[1]));"
+    " sys.exit(not (isinstance(d, dict) and d))"
+)
+
 
 def _stage_config_cmd(url: str, local_path: str) -> str:
     """Shell snippet staging one ingestion3 config JSON to a local path.
 
     Best-effort: one fetch per launch won't rate-limit, and if it fails the
-    runtime falls back to a retrying live fetch, so a GitHub hiccup must not
-    block the launch (`|| echo`, not `&&`). Atomic: curl to a temp file, mv
-    into place only on success, so a failed/interrupted fetch can't truncate a
-    good copy staged by an earlier launch (which would silently drop this
-    launch back to live fetch).
+    runtime uses the previously staged copy (or, with none, falls back to a
+    retrying live fetch), so a GitHub hiccup must not block the launch — the
+    snippet always succeeds. The fetch is conditional on the ETag saved by
+    the last successful stage, so an unchanged config costs one 304. A new
+    body is validated, stored under its content hash in
+    :data:`CONFIG_CACHE_DIR` (identical bytes under a new ETag reuse the
+    existing blob) and swapped in by atomically repointing the ``local_path``
+    symlink, so a failed or interrupted fetch can't truncate a good copy
+    (which would silently drop this launch back to live fetch). Blobs no
+    longer current and older than :data:`CONFIG_CACHE_MAX_AGE_DAYS` are
+    pruned.
     """
     name = local_path.rsplit("/", 1)[-1]
-    tmp = local_path + ".tmp"
+    stem = name.removesuffix(".json")
+    q = shlex.quote
+    return (
+        f'( d={q(CONFIG_CACHE_DIR)}; l={q(local_path)}; e="$d/{name}.etag"; '
+        f't="$d/{name}.$$.tmp"; mkdir -p "$d"; set --; '
+        '[ -e "$l" ] && [ -s "$e" ] && set -- --etag-compare "$e"; '
+        "c=$(curl -fsSL --retry 5 --retry-delay 2 --retry-all-errors "
+        f'"$@" --etag-save "$t.etag" -o "$t" -w \'%{{http_code}}\' {q(url)}); '
+        f'if [ "$c" = 304 ]; then echo "{name}: unchanged (ETag match), reusing cache"; '
+        f'elif [ "$c" = 200 ] && python3 -c {q(_CONFIG_VALID_PY)} "$t"; then '
+        f'b="$d/{stem}.$(sha256sum "$t" | cut -c1-16).json"; '
+        'if [ -e "$b" ]; then rm -f "$t"; else mv "$t" "$b"; fi; '
+        'ln -sfn "$b" "$l.lnk" && mv -Tf "$l.lnk" "$l" && mv "$t.etag" "$e" '
+        f'&& echo "{name}: staged $b"; '
+        f'else echo "WARN: {name} stage failed (HTTP $c); runtime uses the previous'
+        ' copy or falls back to live fetch"; fi; '
+        'rm -f "$t" "$t.etag"; '
+        f"find \"$d\" -name '{stem}.*.json' -mtime +{CONFIG_CACHE_MAX_AGE_DAYS} "
+        '! -path "$(readlink -f "$l")" -delete 2>/dev/null; true ) && '
+    )
+
+
+def _precompile_configs_cmd() -> str:
+    """Shell snippet (run after ``uv sync``) that validates the staged configs
+    and compiles their snapshots once, so a multi-target launch's first
+    pipeline processes don't each race to parse and compile them. Best-effort
+    like the staging itself: any process still compiles on a miss."""
+    env = (
+        f"{INSTITUTIONS_FILE_ENV}={shlex.quote(INSTITUTIONS_LOCAL_PATH)} "
+        f"{SUBJECTS_FILE_ENV}={shlex.quote(SUBJECTS_LOCAL_PATH)}"
+    )
+    code = "from ingest_wikimedia.partners import compile_staged_configs; compile_staged_configs()"
     return (
-        f"( curl -fsSL --retry 5 --retry-delay 2 --retry-all-errors {shlex.quote(url)} "
-        f"-o {shlex.quote(tmp)} "
-        f"&& mv {shlex.quote(tmp)} {shlex.quote(local_path)} "
-        f"|| echo 'WARN: {name} stage failed; runtime falls back to live fetch' ) && "
+        f"( {env} /home/ec2-user/ingest-wikimedia/.venv/bin/python -c {shlex.quote(code)} "
+        "|| echo 'WARN: config snapshot pre-compile failed; processes compile on demand' ) && "
     )
 
 
 # Each ingest session peaks at ~300–500 MB; 30% of 7.6 GB leaves headroom for 4–5 concurrent sessions.
 MEMORY_HEADROOM_PCT = 30
 
+# Independent targets of one launch run concurrently, at most this many at a
+# time (``--target-concurrency``; 1 = the historical back-to-back chain).
+# Targets sharing a partner directory are never independent — they share its
+# pywikibot apicache/throttle state and log directory — so each partner dir
+# is one lane whose targets run in launch order; lanes run side by side.
+# Commons writes stay bounded by the box-wide WorkerSlotBudget every
+# uploader/sdc-sync process already acquires from, so more lanes means more
+# contention for the same slots, not more load on Commons. A lane only starts
+# while at least MEMORY_HEADROOM_PCT of memory is available (or when it
+# would be the only one running), re-checked every
+# TARGET_GATE_POLL_SECONDS.
+#
+# Concurrency is opt-in: the gate only runs at lane start, and once a lane
+# is running its downloader → uploader → sdc-sync chain (each phase with its
+# own worker pool) is not re-checked against memory. The box is sized for one
+# session's phases at a time, so the default stays the serial chain and an
+# operator raises it for a launch they know fits.
+DEFAULT_TARGET_CONCURRENCY = 1
+TARGET_GATE_POLL_SECONDS = 15
+
 # Tmux-safe session-label slugifier (lowercase alphanumeric + hyphens) lives in
 # ingest_wikimedia.partners as slugify_session_label_component so that
 # wikimedia_kill.py uses the IDENTICAL function — otherwise institutions whose
@@ -98,6 +174,57 @@ MEMORY_HEADROOM_PCT = 30
 _slugify = slugify_session_label_component
 
 
+def _target_lanes(partner_dirs: list[str], concurrency: int) -> list[list[int]]:
+    """Group target indices into lanes: one per partner dir, in first-seen
+    order, or a single lane of every target when ``concurrency <= 1``."""
+    if concurrency <= 1:
+        return [list(range(len(partner_dirs)))]
+    lanes: dict[str, list[int]] = {}
+    for idx, pdir in enumerate(partner_dirs):
+        lanes.setdefault(pdir, []).append(idx)
+    return list(lanes.values())
+
+
+def _assemble_pipeline(
+    setup: str, target_blocks: list[str], lanes: list[list[int]], concurrency: int
+) -> str:
+    """The session script: ``setup``, then the target blocks laid out in
+    ``lanes``.
+
+    A single lane is the historical serial chain. Otherwise each lane runs as
+    a background subshell — so one lane's ``export``s can't leak into
+    another's — started through ``_wm_gate``, which holds it back while
+    ``concurrency`` lanes are running or, with any lane running, while less
+    than MEMORY_HEADROOM_PCT of memory is available; the session then waits
+    for every lane. Background jobs share the pane's process group, so a
+    ``tmux kill-session`` still reaches all of them.
+
+    The script first re-execs itself with ``CONCURRENT_TARGETS_ENV`` set, so
+    the marker is in the pane process's own environment: that is how a later
+    launch's conflict check (``session_state.RUNNING_ACTIVE_LABELS_CMD``)
+    learns every label of this session may be in flight, not just the one
+    after the most recent log.
+    """
+    if len(lanes) == 1:
+        blocks = "; ".join(target_blocks[i] for i in lanes[0])
+        return f"{setup} && {{ {blocks}; }}"
+    gate = (
+        '_wm_gate() { while [ "$(jobs -rp | wc -l)" -ge '
+        f'{concurrency} ] || {{ [ -n "$(jobs -rp)" ] && [ "$(awk '
+        "'/^MemTotal:/{t=$2} /^MemAvailable:/{a=$2} END{print int(a*100/t)}'"
+        f' /proc/meminfo)" -lt {MEMORY_HEADROOM_PCT} ]; }}; do '
+        f"sleep {TARGET_GATE_POLL_SECONDS}; done; }}"
+    )
+    launches = " ".join(
+        f"_wm_gate; ( {'; '.join(target_blocks[i] for i in lane)} ) &" for lane in lanes
+    )
+    marker = (
+        f'[ -n "${CONCURRENT_TARGETS_ENV}" ] || '
+        f'exec env {CONCURRENT_TARGETS_ENV}={len(lanes)} bash "$0"'
+    )
+    return f"{marker}\n{setup} && {{ {gate}; {launches} wait; }}"
+
+
 def _parse_bool(value: str) -> bool:
     """Parse a GitHub Actions boolean-string input into a real bool.
 
@@ -553,6 +680,9 @@ def main() -> None:
     # the flock semaphore and pick up slots as items complete.
     parser.add_argument("--workers", default="24")
     parser.add_argument("--workers-budget", default="24")
+    # Keep in sync with .github/workflows/wikimedia-launch.yml
+    # inputs.target_concurrency.
+    parser.add_argument("--target-concurrency", default=str(DEFAULT_TARGET_CONCURRENCY))
     args = parser.parse_args()
 
     force = _parse_bool(args.force)
@@ -639,6 +769,19 @@ def main() -> None:
                 " (must be an integer >= 0; 0 disables the budget).",
             )
 
+    target_concurrency = DEFAULT_TARGET_CONCURRENCY
+    if args.target_concurrency.strip():
+        try:
+            target_concurrency = int(args.target_concurrency)
+            if target_concurrency < 1:
+                raise ValueError
+        except ValueError:
+            _slack_fail(
+                response_url,
+                f"Invalid --target-concurrency value: {args.target_concurrency!r}"
+                " (must be an integer >= 1; 1 runs targets one after another).",
+            )
+
     # --partner may be a shlex-encoded list: 'bpl "indiana|Indiana State Library"'
     try:
         target_tokens = shlex.split(args.partner)
@@ -929,7 +1072,9 @@ def main() -> None:
         # rate-limits the box IP to HTTP 429 under a multi-target batch.
         + _stage_config_cmd(INSTITUTIONS_URL, INSTITUTIONS_LOCAL_PATH)
         + _stage_config_cmd(SUBJECTS_URL, SUBJECTS_LOCAL_PATH)
-        + "/home/ec2-user/.local/bin/uv sync --project /home/ec2-user/ingest-wikimedia && echo UPDATE_DONE"
+        + "/home/ec2-user/.local/bin/uv sync --project /home/ec2-user/ingest-wikimedia && "
+        + _precompile_configs_cmd()
+        + "echo UPDATE_DONE"
     )
     out = ""
     try:
@@ -1161,13 +1306,13 @@ def main() -> None:
             operational=True,
         )
     try:
-        active_label_snapshot = snapshot_running_active_labels(ssm)
+        active_label_snapshot, concurrent_sessions = snapshot_session_activity(ssm)
     except Exception as e:
         # Fall through to the mtime heuristic per session on failure —
         # conservative correctness is more important than the shared-
         # label edge case when the snapshot roundtrip is broken.
         print(f"Failed to snapshot active labels; falling back to mtime: {e}")
-        active_label_snapshot = {}
+        active_label_snapshot, concurrent_sessions = {}, {}
     # In-memory pre-filter: an existing session can only conflict with a
     # requested target if they share a hub prefix. Sessions on unrelated
     # hubs — the common case when the box runs 3+ concurrent partner
@@ -1198,12 +1343,17 @@ def main() -> None:
             # regardless of which label is currently active in this
             # session. Skip the SSM lookup and move on.
             continue
-        existing_labels = active_and_upcoming_labels(
-            ssm,
-            existing_labels_ordered,
-            session_created=existing_created,
-            active_label=active_label_snapshot.get(existing_name),
-        )
+        if existing_name in concurrent_sessions:
+            # Lanes finish out of order, so "the active label and everything
+            # after it" means nothing here: every label may still be running.
+            existing_labels = set(existing_labels_ordered)
+        else:
+            existing_labels = active_and_upcoming_labels(
+                ssm,
+                existing_labels_ordered,
+                session_created=existing_created,
+                active_label=active_label_snapshot.get(existing_name),
+            )
         for canonical, institutions, label, dpla_id, collection in targets:
             if not institutions and dpla_id is None:
                 # Hub-level request conflicts with any existing session touching this hub
@@ -1336,12 +1486,17 @@ def main() -> None:
             # launch-staged copies so every target reads them from disk instead
             # of re-fetching from raw.githubusercontent.com (per-IP 429 under a
             # multi-target batch).
-            f"export WIKIMEDIA_INSTITUTIONS_FILE={shlex.quote(INSTITUTIONS_LOCAL_PATH)}",
-            f"export WIKIMEDIA_SUBJECTS_FILE={shlex.quote(SUBJECTS_LOCAL_PATH)}",
+            f"export {INSTITUTIONS_FILE_ENV}={shlex.quote(INSTITUTIONS_LOCAL_PATH)}",
+            f"export {SUBJECTS_FILE_ENV}={shlex.quote(SUBJECTS_LOCAL_PATH)}",
         ]
     )
     target_blocks = []
-    last_idx = len(targets) - 1
+    lanes = _target_lanes(
+        [PARTNER_DIR.get(c, c) for c, _, _, _, _ in targets], target_concurrency
+    )
+    # A target is "last" when nothing follows it in its lane — for a serial
+    # session, the batch's final target.
+    last_in_lane = {lane[-1] for lane in lanes}
     for idx, (canonical, institutions, session_label, dpla_id, collection) in enumerate(
         targets
     ):
@@ -1365,12 +1520,13 @@ def main() -> None:
         # WIKIMEDIA_PARTNER_DIR is read by notify_pipeline_fail() to locate
         # the most recent log for this target and include a tail + counts in
         # the Slack failure message.  WIKIMEDIA_TARGET_IS_LAST switches the
-        # failure suffix language ("no further targets in batch" vs
-        # "skipping to next target"); the unset is required so a failure
-        # earlier in the batch doesn't inherit a stale "is last" flag.
+        # failure suffix language ("aborting batch" vs "batch continues with
+        # the next"; with lanes, "last target in its lane"); the unset is
+        # required so a failure earlier in the batch doesn't inherit a stale
+        # "is last" flag.
         is_last_env = (
             "export WIKIMEDIA_TARGET_IS_LAST=1"
-            if idx == last_idx
+            if idx in last_in_lane
             else "unset WIKIMEDIA_TARGET_IS_LAST"
         )
         # ``unset WIKIMEDIA_STEP`` first so a failure in this target's
@@ -1465,7 +1621,7 @@ def main() -> None:
             f" || {{ {notify_fail_cmd} >/dev/null 2>&1 || true; }}"
         )
 
-    pipeline_cmd = f"{setup} && {{ {'; '.join(target_blocks)}; }}"
+    pipeline_cmd = _assemble_pipeline(setup, target_blocks, lanes, target_concurrency)
 
     if slack_token:
         single_item_targets = [
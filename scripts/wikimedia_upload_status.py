@@ -5,6 +5,7 @@ Runs as a GitHub Action on a schedule and on workflow_dispatch (triggered by
 the /wikimedia-status Slack slash command via Lambda).
 """
 
+import json
 import logging
 import os
 import re
@@ -19,31 +20,31 @@ from typing import NamedTuple
 
 from ingest_wikimedia.partners import PARTNER_DIR, parse_session_labels, resolve_slug
 from ingest_wikimedia.session_state import (
-    _PHASE_ALT,
+    LOG_PHASE_ALT,
     find_active_label,
     log_filename_pattern_for_label,
-    snapshot_running_active_labels,
+    snapshot_session_activity,
 )
-from ingest_wikimedia.ssm import REGION, fetch_memory_snapshot, ssm_run
-from ingest_wikimedia.worker_slots import (
-    DEFAULT_SLOT_DIR,
-    SLOTS_BUSY_LOG_MARKER,
-    UPLOADER_PRIORITY_SLOT_DIR,
+from ingest_wikimedia.ssm import (
+    REGION,
+    fetch_memory_snapshot,
+    parse_memory_snapshot,
+    ssm_run,
 )
-
-# Bash regexes used inside :func:`_fetch_slot_snapshot` to filter
-# ``lslocks`` rows. The shared-pool regex drives the ``free``/``held``
-# aggregate line (bounded by the shared pool's known ``TOTAL``); the
-# both-pools regex drives per-session attribution (a Case-2 uploader
-# holding a priority-pool slot should still be visible in the per-session
-# ``[Slots: 1]`` readout even though the shared pool's aggregate ignores
-# it). Interpolated from the shared ``worker_slots`` constants so a
-# rename of either directory can't leave this file silently wrong.
-_SHARED_SLOT_DIR_BASENAME = os.path.basename(DEFAULT_SLOT_DIR)
-_ALL_SLOT_DIR_BASENAME_RE = "|".join(
-    re.escape(os.path.basename(p))
-    for p in (DEFAULT_SLOT_DIR, UPLOADER_PRIORITY_SLOT_DIR)
+from ingest_wikimedia.status_collector import (
+    COLLECTOR_CMD,
+    TMUX_SESSIONS_CMD,
+    TOTAL_ORDINALS_AWK,
+    LogFacts,
+    counts_from_progress,
+    log_opened_at,
+    ordinals_from_progress,
+    parse_session_list,
+    progress_file_for,
+    slot_snapshot_cmd,
 )
+from ingest_wikimedia.status_collector import SDC_COUNTS_AWK as _SDC_COUNTS_AWK
+from ingest_wikimedia.worker_slots import SLOTS_BUSY_LOG_MARKER
 
 
 def _strip_batch_suffix(display_id: str) -> str:
@@ -97,30 +98,6 @@ SLACK_API_URL = "https://slack.com/api/chat.postMessage"
 _UPLOAD_COMPLETE_PREFIX = "Upload complete"
 _SDC_COMPLETE_PREFIX = "SDC complete"
 
-# One-pass awk over a phase log, emitting eight integers in the fixed order the
-# parser indexes: DPLA-ID, Uploaded, Skipping, COUNTS, Ordinal, HAND-FIX,
-# MERGED, maintain-scope. HAND-FIX/MERGED read $2 — they come from the
-# prefix-less continuation lines of the multi-line ``COUNTS:`` record. The
-# maintain-scope marker is instead a normal PREFIXED log line
-# (``[INFO] <time>: maintain scope: N files``), so its number is ``$(NF-1)`` —
-# the field before the trailing "files", robust to however wide the log-line
-# prefix is (counting from the message start would miss the prefix, which
-# silently zeroed this out in the first draft).
-# CONTRACT: the "maintain scope: N files" wording is shared with
-# tools/sdc_sync.py's _log_maintain_scope(); change them together.
-_SDC_COUNTS_AWK = (
-    "/DPLA ID:/ {d++} "
-    "/Uploaded to/ {u++} "
-    "/Skipping.*Already exists on commons/ {s++} "
-    "/COUNTS:/ {c++} "
-    "/-- Ordinal [0-9]+:/ {o++} "
-    "/UPLOAD_HAND_FIX:/ {hf=$2} "
-    "/UPLOAD_MERGED_TO_CANONICAL:/ {mg=$2} "
-    "/maintain scope: [0-9]+ files/ {mt=$(NF-1)} "
-    "END { print d+0; print u+0; print s+0; print c+0; print o+0; "
-    "print hf+0; print mg+0; print mt+0 }"
-)
-
 # Slack Block Kit caps a single ``section`` block's text element at 3000
 # characters. A hub-busy day with many active sessions can collectively
 # exceed that on row count alone, so the formatter splits across multiple
@@ -243,7 +220,7 @@ def get_phase_and_progress(
         # over from the old moving-window apparatus, after which no phase branch
         # matches and status reads "Unknown". The ('+') exclusion is redundant
         # with the anchored pattern but kept for clarity.
-        legacy_pattern = shlex.quote(rf"^{re.escape(hub)}-({_PHASE_ALT})\.log$")
+        legacy_pattern = shlex.quote(rf"^{re.escape(hub)}-({LOG_PHASE_ALT})\.log$")
         log_file = ssm_run(
             client,
             f"ls -t {log_dir}/ 2>/dev/null | grep -E -- {legacy_pattern} "
@@ -271,21 +248,13 @@ def get_phase_and_progress(
             f"grep -oE '[0-9,]+ items enumerated' {log_path} 2>/dev/null | tail -1",
         )
         id_lines = out.splitlines()
-        id_now = _safe_int(id_lines[0]) if id_lines else 0
-        id_mtime = _safe_int(id_lines[1]) if len(id_lines) > 1 else 0
-        # Log predates this session — a stale id-generation log from a prior
-        # run of this label, picked before the new session has written its
-        # own. Same "predates this session" sentinel as the
-        # download/upload/sdc branches (return None → caller renders a bare
-        # "Generating IDs" rather than a stale enumerated count).
-        if session_created > 0 and id_mtime < session_created:
-            return None, 0
-        enumerated = id_lines[2].strip() if len(id_lines) > 2 else ""
-        label_txt = f"Generating IDs ({enumerated})" if enumerated else "Generating IDs"
-        # Same idle/staleness signal as the download/upload/sdc phases: a hung
-        # enumeration (no log write in _STALE_SECONDS) reads distinctly instead
-        # of looking active.
-        return label_txt + _idle_suffix(id_now, id_mtime), id_mtime
+        facts = LogFacts(
+            log_file,
+            now=_safe_int(id_lines[0]) if id_lines else 0,
+            log_mtime=_safe_int(id_lines[1]) if len(id_lines) > 1 else 0,
+            enumerated=id_lines[2].strip() if len(id_lines) > 2 else "",
+        )
+        return phase_from_facts(facts, session_created)
     # Resolve the CSV(s) backing this label so `wc -l` returns a meaningful
     # "items in scope" denominator.
     #
@@ -325,27 +294,9 @@ def get_phase_and_progress(
     # shlex.quote) — single-quoting would disable shell glob expansion
     # so the ``*`` would no longer expand. The slug-shape guard at the
     # top of this function makes the unquoted interpolation safe.
-    # Total-ordinals denominator from the download log. Prefer the per-item
-    # summary ``Item <id>: N ordinals`` line (downloader.py:563) — emitted for
-    # EVERY item regardless of whether its media was freshly fetched or already
-    # staged/skipped — and sum its N. Fall back to counting the per-ordinal
-    # ``Downloading <partner> <id> <ordinal> from <url>`` line (downloader.py:543)
-    # ONLY when no Item-summary lines exist, i.e. old pre-#272 download logs.
-    #
-    # The previous code counted ``Downloading`` alone on the assumption it was
-    # "emitted unconditionally for every ordinal" — but it fires only on an
-    # actual fetch ATTEMPT, not for already-staged skips. So any run whose media
-    # was already downloaded (re-runs, SDC-only relaunches, download-once-then-
-    # iterate hubs like NARA) had 0 ``Downloading`` lines, collapsing the total
-    # to 0 and wrongly dropping the status row from file- to item-granularity —
-    # even though the ``Item`` summaries carried the true counts.
-    ordinals_awk = (
-        "BEGIN{item=0; dl=0} "
-        "/Item [a-f0-9]+: [0-9]+ ordinals/ "
-        '{for(i=1;i<=NF;i++) if($i=="ordinals"){item+=$(i-1); break}} '
-        "/Downloading [a-z0-9-]+ [a-f0-9]+ [0-9]+ from / {dl++} "
-        "END {print (item>0 ? item : dl)}"
-    )
+    # Total-ordinals denominator: ``TOTAL_ORDINALS_AWK`` sums the per-item
+    # ``Item <id>: N ordinals`` summaries, falling back to counting
+    # ``Downloading`` lines for pre-#272 logs (see its definition).
     # One awk pass (``_SDC_COUNTS_AWK``) counts all the marker lines in a single
     # sequential read of the log; the previous code ran several separate
     # `grep -c` invocations over the same file, which on multi-GB NARA logs
@@ -354,6 +305,26 @@ def get_phase_and_progress(
     # skipping, counts, ordinal, hand-fix, merged, maintain-scope), followed by
     # the CSV total from `wc -l`. The download-log ordinal sum is emitted after a
     # fresh separator so the output sections stay self-describing.
+    #
+    # Both awk passes are skipped when the run keeps a progress checkpoint
+    # (``<label>-<phase>.progress.json``) written since its log was opened:
+    # the checkpoint's JSON line is emitted in place of the awk output and
+    # read with the status collector's parsers. A checkpoint older than the
+    # log belongs to an earlier run of the label and falls back to awk, as
+    # does a download checkpoint from before the ORDINALS counter existed.
+    counts_cmd = (
+        f"awk '{_SDC_COUNTS_AWK}' {log_path} 2>/dev/null "
+        f"|| printf '0\\n0\\n0\\n0\\n0\\n0\\n0\\n0\\n'"
+    )
+    progress_name = progress_file_for(log_file)
+    opened = log_opened_at(log_file)
+    if progress_name and opened:
+        progress_path = shlex.quote(f"{base}/logs/{progress_name}")
+        counts_cmd = (
+            f'if [ -s {progress_path} ] && [ "$(stat -c %Y {progress_path})" '
+            f"-ge \"$(date -d '{opened}' +%s)\" ]; "
+            f"then cat {progress_path}; echo; else {counts_cmd}; fi"
+        )
     out = ssm_run(
         client,
         f"date +%s; "
@@ -361,13 +332,18 @@ def get_phase_and_progress(
         f"echo {sep}; "
         f"tail -5 {log_path}; "
         f"echo {sep}; "
-        f"awk '{_SDC_COUNTS_AWK}' {log_path} 2>/dev/null "
-        f"|| printf '0\\n0\\n0\\n0\\n0\\n0\\n0\\n0\\n'; "
+        f"{counts_cmd}; "
         f"{csv_count_cmd}; "
         f"echo {sep}; "
         f"DOWNLOG=$(ls -t {log_dir}/*-{label}-download.log 2>/dev/null | head -1); "
+        f"DP={log_dir}/{label}-download.progress.json; "
         f'if [ -n "$DOWNLOG" ]; then '
-        f"awk '{ordinals_awk}' \"$DOWNLOG\" 2>/dev/null || echo 0; "
+        f'OPENED=$(basename "$DOWNLOG" | sed -E '
+        f"'s/^([0-9]{{8}})-([0-9]{{2}})([0-9]{{2}})([0-9]{{2}})-.*/\\1 \\2:\\3:\\4/'); "
+        f'if [ -s "$DP" ] && grep -q \'"ORDINALS"\' "$DP" '
+        f'&& [ "$(stat -c %Y "$DP")" -ge "$(date -d "$OPENED" +%s 2>/dev/null)" ]; '
+        f'then cat "$DP"; echo; '
+        f"else awk '{TOTAL_ORDINALS_AWK}' \"$DOWNLOG\" 2>/dev/null || echo 0; fi; "
         f"else echo 0; fi",
     )
 
@@ -376,12 +352,16 @@ def get_phase_and_progress(
     now = _safe_int(pre_sep[0]) if pre_sep else 0
     log_mtime = _safe_int(pre_sep[1]) if len(pre_sep) > 1 else 0
 
-    # Log predates this session — no new log yet, treat same as no log.
-    if session_created > 0 and log_mtime < session_created:
-        return None, 0
-
     tail = sections[1].strip() if len(sections) > 1 else ""
     count_lines = sections[2].strip().splitlines() if len(sections) > 2 else []
+    if count_lines and count_lines[0].startswith("{"):
+        # The progress checkpoint stood in for the awk pass.
+        try:
+            doc = json.loads(count_lines[0])
+        except ValueError:
+            doc = None
+        awk_lines = counts_from_progress(doc) if isinstance(doc, dict) else [0] * 8
+        count_lines = [str(n) for n in awk_lines] + count_lines[1:]
 
     # Layout matches the awk-then-wc shell command above: the awk pass emits
     # eight counts (DPLA-ID, Uploaded, Skipping, COUNTS, Ordinal, HAND-FIX,
@@ -408,7 +388,82 @@ def get_phase_and_progress(
     # Sum of `Item <id>: N ordinals` lines from the download log — the true
     # file count once downloads have completed. 0 when no download log was
     # found (legacy sessions, or the session is still in get-ids-es).
-    total_ordinals = _safe_int(sections[3].strip()) if len(sections) > 3 else 0
+    ordinals_out = sections[3].strip() if len(sections) > 3 else ""
+    if ordinals_out.startswith("{"):
+        try:
+            doc = json.loads(ordinals_out)
+        except ValueError:
+            doc = None
+        ordinals = ordinals_from_progress(doc) if isinstance(doc, dict) else None
+        total_ordinals = ordinals or 0
+    else:
+        total_ordinals = _safe_int(ordinals_out)
+
+    facts = LogFacts(
+        log_file,
+        now,
+        log_mtime,
+        tail,
+        dpla_id_count,
+        uploaded_count,
+        skipped_count,
+        counts_marker,
+        ordinal_count,
+        hand_fix_count,
+        merged_count,
+        maintain_total,
+        total,
+        total_ordinals,
+    )
+    return phase_from_facts(facts, session_created)
+
+
+def phase_from_facts(
+    facts: LogFacts, session_created: int = 0
+) -> tuple[str | None, int]:
+    """Classify a label's :class:`LogFacts` into ``(phase_str, log_mtime)``.
+
+    Pure function shared by the two ways the facts reach the status script:
+    :func:`get_phase_and_progress`'s per-label SSM commands and the
+    on-instance status collector's JSON document. ``phase_str`` is ``None``
+    when the log predates ``session_created`` (a stale log from a prior
+    run of this label — treated the same as no log).
+    """
+    (
+        log_file,
+        now,
+        log_mtime,
+        tail,
+        dpla_id_count,
+        uploaded_count,
+        skipped_count,
+        counts_marker,
+        ordinal_count,
+        hand_fix_count,
+        merged_count,
+        maintain_total,
+        total,
+        total_ordinals,
+        enumerated,
+    ) = facts
+
+    if log_file.endswith("-id-generation.log"):
+        # Log predates this session — a stale id-generation log from a prior
+        # run of this label, picked before the new session has written its
+        # own. Same "predates this session" sentinel as the
+        # download/upload/sdc branches (return None → caller renders a bare
+        # "Generating IDs" rather than a stale enumerated count).
+        if session_created > 0 and log_mtime < session_created:
+            return None, 0
+        label_txt = f"Generating IDs ({enumerated})" if enumerated else "Generating IDs"
+        # Same idle/staleness signal as the download/upload/sdc phases: a hung
+        # enumeration (no log write in _STALE_SECONDS) reads distinctly instead
+        # of looking active.
+        return label_txt + _idle_suffix(now, log_mtime), log_mtime
+
+    # Log predates this session — no new log yet, treat same as no log.
+    if session_created > 0 and log_mtime < session_created:
+        return None, 0
 
     def pct(n: int) -> str:
         return f"{n / total * 100:.1f}" if total > 0 else "?"
@@ -579,54 +634,25 @@ def _fetch_slot_snapshot(ssm) -> SlotSnapshot | None:
     also needed for the readout.
     """
     try:
-        out = ssm_run(
-            ssm,
-            f"D={DEFAULT_SLOT_DIR}; "
-            f'if [ ! -d "$D" ]; then echo NODIR; exit 0; fi; '
-            # Without lslocks, grep -c on empty stdin returns 0 and we'd
-            # silently report "all free" — so bail to NODATA instead of lying.
-            f"command -v lslocks >/dev/null 2>&1 || {{ echo NODATA; exit 0; }}; "
-            f'echo "TOTAL $(ls "$D" 2>/dev/null | wc -l)"; '
-            # Three quick count-only samples for median smoothing (transient
-            # all-held/all-free blips are common on churn). Counts the
-            # SHARED pool only — the ``TOTAL`` line above is the shared
-            # pool's file count, so ``free = TOTAL - held`` only balances
-            # when both operands sample the same pool.
-            f"SHARED_RE='{_SHARED_SLOT_DIR_BASENAME}'; "
-            f"ALL_RE='{_ALL_SLOT_DIR_BASENAME_RE}'; "
-            f"for i in 1 2 3; do "
-            f'  lslocks 2>/dev/null | grep -cE "$SHARED_RE"; '
-            f"  sleep 1; "
-            f"done; "
-            # Final structured pass: both pools for per-session attribution
-            # (a Case-2 uploader in the priority pool should still appear in
-            # ``[Slots: 1]`` for its row) plus a 4th shared-only count that
-            # feeds the median alongside the earlier samples.
-            f"HOLDERS=$(lslocks -n -o PID,PATH 2>/dev/null "
-            f'  | grep -E "$ALL_RE" || true); '
-            f'echo "$HOLDERS" | grep -cE "$SHARED_RE" '
-            f"  | (read -r n; echo COUNT $n); "
-            f'echo "$HOLDERS" | awk "{{print \\$1}}" | while read pid; do '
-            f'  [ -z "$pid" ] && continue; '
-            # Each pipeline process (uploader, sdc-sync main and its pool
-            # workers) inherits WIKIMEDIA_SESSION_LABEL from the tmux
-            # environ set by the launcher — a robust per-target signal that
-            # survives multiprocessing.Pool forks.
-            f"  label=$(tr '\\0' '\\n' < /proc/$pid/environ 2>/dev/null "
-            f"    | grep -m1 '^WIKIMEDIA_SESSION_LABEL=' | cut -d= -f2-); "
-            f'  [ -n "$label" ] && echo "HOLDER $label"; '
-            f"done",
-        )
+        out = ssm_run(ssm, slot_snapshot_cmd())
     except Exception as e:
         logging.warning("Could not read slot snapshot: %s", e)
         return None
+    return _parse_slot_snapshot(out)
 
-    # Parse guarded by its own try/except: unexpected output (a malformed
-    # ``TOTAL``/``COUNT`` sample, an ``lslocks`` upgrade that reshapes a
-    # column) MUST NOT propagate through ``slots_future.result()`` in
-    # ``main`` and abort the entire status post — the slot line is
-    # optional context, not load-bearing. Degrades to ``None`` the same
-    # way :func:`fetch_memory_snapshot` does for its own parse failures.
+
+def _parse_slot_snapshot(out: str) -> SlotSnapshot | None:
+    """Parse :func:`~ingest_wikimedia.status_collector.slot_snapshot_cmd`
+    output — from :func:`_fetch_slot_snapshot`'s SSM call or the status
+    collector's ``slots`` field — into a :class:`SlotSnapshot`.
+
+    Guarded by its own try/except: unexpected output (a malformed
+    ``TOTAL``/``COUNT`` sample, an ``lslocks`` upgrade that reshapes a
+    column) MUST NOT propagate into ``main`` and abort the entire status
+    post — the slot line is optional context, not load-bearing. Degrades
+    to ``None`` the same way :func:`fetch_memory_snapshot` does for its own
+    parse failures.
+    """
     try:
         total: int | None = None
         held_samples: list[int] = []
@@ -758,6 +784,154 @@ def post_to_slack(
         raise RuntimeError(f"Slack API error: {data.get('error')}")
 
 
+def _with_batch_suffix(label: str, labels: list[str]) -> str:
+    """For multi-label batches, suffix a ``[<pos>/<total>]`` position
+    annotation so the reader can tell at a glance how far along the
+    institution chain this row is.
+
+    The earlier ``(+N more)`` form counted batch size − 1 and was
+    ambiguous: a session showing ``(+72 more)`` could be on the FIRST
+    institution or the LAST one (73 of 73). ``[73/73]`` makes it
+    unambiguous.
+    """
+    if len(labels) <= 1:
+        return label
+    try:
+        pos = labels.index(label) + 1
+    except ValueError:
+        # A running child's label that isn't in the session's chain.
+        return f"{label} [?/{len(labels)}]"
+    return f"{label} [{pos}/{len(labels)}]"
+
+
+def _fetch_collected(ssm) -> dict | None:
+    """Run the on-instance status collector in one SSM call and return its
+    JSON document, or ``None`` when the fast path isn't usable.
+
+    ``None`` covers an instance whose deployed ``ingest_wikimedia`` predates
+    the collector (the module import fails and SSM reports ``Failed``) and
+    output SSM truncated past its stdout cap (the JSON won't parse); the
+    caller then falls back to the per-session SSM path. ``TimeoutError``
+    propagates — a box that doesn't answer one SSM call won't answer the
+    fallback's dozen either.
+    """
+    try:
+        out = ssm_run(ssm, COLLECTOR_CMD)
+    except TimeoutError:
+        raise
+    except Exception as e:
+        logging.warning("Status collector unavailable, using SSM fan-out: %s", e)
+        return None
+    try:
+        collected = json.loads(out)
+    except ValueError:
+        logging.warning("Status collector output did not parse, using SSM fan-out")
+        return None
+    if not isinstance(collected, dict) or not isinstance(
+        collected.get("sessions"), list
+    ):
+        logging.warning("Status collector output malformed, using SSM fan-out")
+        return None
+    return collected
+
+
+def _row_from_collected(entry: dict) -> tuple[str, str]:
+    """Render one collector session entry as a ``(display_id, phase)`` row,
+    matching what ``fetch`` in :func:`main` returns for the same session."""
+    label = entry.get("label") or entry.get("session") or "(unknown)"
+    display_id = _with_batch_suffix(label, entry.get("labels") or [])
+    if entry.get("phase"):
+        return display_id, entry["phase"]
+    phase = None
+    if entry.get("facts"):
+        fields = {k: v for k, v in entry["facts"].items() if k in LogFacts._fields}
+        phase, _ = phase_from_facts(LogFacts(**fields), entry.get("created") or 0)
+    if phase is None:
+        # No log for the label yet: a retry session is still starting; a
+        # launch session is in get-ids-es, before any phase has written.
+        phase = "Starting..." if label.startswith("retry-") else "Generating IDs"
+    return display_id, phase
+
+
+def _post_collected(token: str, collected: dict, notify_if_idle: bool) -> None:
+    """Post the status readout for a :func:`_fetch_collected` document."""
+
+    def memory_line() -> str | None:
+        raw = collected.get("memory")
+        return _format_memory_line(parse_memory_snapshot(raw)) if raw else None
+
+    entries = collected["sessions"]
+    if not entries:
+        _post_idle(token, notify_if_idle, memory_line)
+        return
+    rows = []
+    for entry in entries:
+        try:
+            display_id, phase = _row_from_collected(entry)
+        except Exception:
+            logging.exception("Failed to render collected status: %r", entry)
+            display_id, phase = str(entry.get("session")), "Unknown (error)"
+        print(f"{display_id}: {phase}")
+        rows.append((display_id, phase))
+    _post_rows(
+        token,
+        rows,
+        memory_line=memory_line(),
+        slot_snapshot=_parse_slot_snapshot(collected.get("slots") or ""),
+    )
+
+
+def _post_rows(
+    token: str,
+    rows: list[tuple[str, str]],
+    memory_line: str | None,
+    slot_snapshot: SlotSnapshot | None,
+) -> None:
+    slots_line = slot_snapshot.line if slot_snapshot is not None else None
+    # Under saturation (0 shared slots free), attach a per-session [Slots: N]
+    # or [Awaiting slot] suffix so an operator can see at a glance which
+    # sessions are actually holding the pool vs. blocked on acquire. Skipped
+    # in the headroom regime because every session in a slot-consuming phase
+    # trivially holds its full allotment there.
+    if slot_snapshot is not None and slot_snapshot.free == 0:
+        rows = [
+            (
+                display_id,
+                phase
+                + _slot_suffix_for_row(display_id, phase, slot_snapshot.holds_by_label),
+            )
+            for display_id, phase in rows
+        ]
+    post_to_slack(token, rows, memory_line=memory_line, slots_line=slots_line)
+    print("Posted to Slack.")
+
+
+def _post_idle(token: str, notify_if_idle: bool, memory_line) -> None:
+    """No ``wikimedia-*`` sessions: post the idle readout if asked to.
+    ``memory_line`` is a thunk so the memory lookup only runs when posting."""
+    print("No active wikimedia sessions.")
+    if notify_if_idle:
+        post_to_slack(
+            token,
+            [("(none)", "No active Wikimedia upload sessions.")],
+            memory_line=memory_line(),
+        )
+        print("Posted idle status to Slack.")
+
+
+def _post_ssm_timeout(token: str, e: TimeoutError) -> None:
+    logging.error("SSM poll timed out: %s", e)
+    post_to_slack(
+        token,
+        [
+            (
+                "(error)",
+                "Status check timed out — SSM did not respond. Try again shortly.",
+            )
+        ],
+    )
+
+
 def main() -> None:
     token = (os.environ.get("DPLA_SLACK_BOT_TOKEN") or "").strip()
     if not token:
@@ -769,76 +943,73 @@ def main() -> None:
 
     notify_if_idle = os.environ.get("NOTIFY_IF_IDLE", "false").lower() == "true"
 
+    # Fast path: one SSM call runs the on-instance collector, which gathers
+    # every session's facts locally. Falls through to the per-session SSM
+    # fan-out below when the collector isn't usable (an instance not yet
+    # updated with it, or output SSM truncated).
+    try:
+        collected = _fetch_collected(ssm)
+    except TimeoutError as e:
+        _post_ssm_timeout(token, e)
+        return
+    if collected is not None:
+        _post_collected(token, collected, notify_if_idle)
+        return
+
     try:
         # ``-F`` returns structured ``name|epoch`` lines instead of the
         # verbose default format. Pinning the fields we want avoids
         # fragile string parsing of the "created Sun Jul 5 …" text and
         # gives us the session-creation epoch we need to time-bound
         # :func:`find_active_label`'s log lookup.
-        session_out = ssm_run(
-            ssm,
-            "tmux ls -F '#{session_name}|#{session_created}' 2>/dev/null "
-            "| grep '^wikimedia-' || echo NONE",
-        )
+        session_out = ssm_run(ssm, TMUX_SESSIONS_CMD)
     except TimeoutError as e:
-        logging.error("SSM poll timed out: %s", e)
-        post_to_slack(
-            token,
-            [
-                (
-                    "(error)",
-                    "Status check timed out — SSM did not respond. Try again shortly.",
-                )
-            ],
-        )
+        _post_ssm_timeout(token, e)
         return
 
     # Each entry: ``(session_name, session_created_epoch)``.
     # session_created_epoch is used to bound the log-mtime lookup so a
     # concurrent session writing to one of this session's completed
     # labels can't hijack the "active" row.
-    def _parse_session_line(line: str) -> tuple[str, int]:
-        name, _, epoch = line.partition("|")
-        try:
-            return name.strip(), int(epoch.strip())
-        except ValueError:
-            return name.strip(), 0
-
-    sessions_with_created = (
-        [_parse_session_line(line) for line in session_out.splitlines()]
-        if session_out and session_out != "NONE"
-        else []
-    )
+    sessions_with_created = parse_session_list(session_out)
     sessions = [name for name, _ in sessions_with_created]
 
     if not sessions:
-        print("No active wikimedia sessions.")
-        if notify_if_idle:
-            post_to_slack(
-                token,
-                [("(none)", "No active Wikimedia upload sessions.")],
-                memory_line=_format_memory_line(fetch_memory_snapshot(ssm)),
-            )
-            print("Posted idle status to Slack.")
+        _post_idle(
+            token,
+            notify_if_idle,
+            lambda: _format_memory_line(fetch_memory_snapshot(ssm)),
+        )
         return
 
-    # Maps original session name → (display_id, phase) pair. ``fetch``
-    # now returns ``display_id`` (the active label) as the first
-    # element, distinct from the tmux session name we used to index
-    # by, so the session-name → result mapping is rebuilt here from
-    # the ``futures`` dict (which remembers the submitting session for
-    # each future) to preserve the order of the original ``tmux ls``
-    # output in the Slack readout.
-    results: dict[str, tuple[str, str]] = {}
+    # Maps original session name → its (display_id, phase) rows. ``fetch``
+    # returns ``display_id`` (the active label) as the first element,
+    # distinct from the tmux session name we used to index by, so the
+    # session-name → result mapping is rebuilt here from the ``futures``
+    # dict (which remembers the submitting session for each future) to
+    # preserve the order of the original ``tmux ls`` output in the Slack
+    # readout. A session running concurrent lanes has one row per lane.
+    results: dict[str, list[tuple[str, str]]] = {}
 
     session_created_by_name = dict(sessions_with_created)
     # ``fetch`` waits on this future for the subprocess-based active-
-    # label signal (see :func:`snapshot_running_active_labels`). Assigned
-    # inside the executor block below; declared here so the closure
-    # captures the name and can be mutated at runtime.
-    active_labels_future: Future[dict[str, str]] | None = None
+    # label signal and the concurrent-lane sessions (see
+    # :func:`snapshot_session_activity`). Assigned inside the executor
+    # block below; declared here so the closure captures the name and can
+    # be mutated at runtime.
+    activity_future: Future[tuple[dict[str, str], dict[str, list[str]]]] | None = None
+
+    def label_row(session: str, label: str, labels: list[str]) -> tuple[str, str]:
+        hub = label.split("+")[0]
+        display_label = _with_batch_suffix(label, labels)
+        try:
+            phase, _ = get_phase_and_progress(ssm, session, hub, label)
+        except Exception:
+            logging.exception("Failed to get status for %s (%s)", session, label)
+            return display_label, "Unknown (error)"
+        return display_label, phase if phase is not None else "Generating IDs"
 
-    def fetch(session: str) -> tuple[str, str]:
+    def fetch(session: str) -> list[tuple[str, str]]:
         suffix = session.removeprefix("wikimedia-")
         session_created = session_created_by_name.get(session, 0)
 
@@ -867,10 +1038,10 @@ def main() -> None:
                     )
                 except Exception:
                     logging.exception("Failed to find retry logs for %s", session)
-                    return session, "Unknown (error)"
+                    return [(session, "Unknown (error)")]
                 line = find_out.strip()
                 if not line:
-                    return session, "Starting..."
+                    return [(session, "Starting...")]
                 # Output format: "<epoch.ns> <absolute-path>"
                 # e.g. "1747601234.0000000000 /home/ec2-user/ingest-wikimedia/indiana/logs/retry-indiana-upload.log"
                 _, _, log_path = line.partition(" ")
@@ -882,7 +1053,7 @@ def main() -> None:
                 elif log_filename.endswith("-sdc.log"):
                     label = log_filename[: -len("-sdc.log")]
                 else:
-                    return session, f"Unknown (unrecognised log: {log_filename!r})"
+                    return [(session, f"Unknown (unrecognised log: {log_filename!r})")]
                 raw_hub = label.removeprefix("retry-")
                 hub = resolve_slug(raw_hub) or raw_hub
 
@@ -892,22 +1063,26 @@ def main() -> None:
                 logging.exception(
                     "Failed to get retry status for %s (%s)", session, label
                 )
-                return label, "Unknown (error)"
-            return label, phase if phase is not None else "Starting..."
+                return [(label, "Unknown (error)")]
+            return [(label, phase if phase is not None else "Starting...")]
 
         labels = parse_session_labels(suffix)
         if not labels:
-            return session, "Unknown (unrecognised session name)"
-        multi = len(labels) > 1
+            return [(session, "Unknown (unrecognised session name)")]
 
-        # Prefer the subprocess-based active-label snapshot; fall back
-        # to the log-mtime lookup only when no running child was found
-        # (id-generation cold start, between steps, or chain finished).
+        # A concurrent-lane session has no single active label: one row per
+        # lane with a running phase. Otherwise prefer the subprocess-based
+        # active-label snapshot; fall back to the log-mtime lookup only when
+        # no running child was found (id-generation cold start, between
+        # steps, or chain finished).
         try:
-            snapshot = active_labels_future.result() if active_labels_future else {}
+            snapshot, lanes = activity_future.result() if activity_future else ({}, {})
         except Exception:
             logging.exception("Snapshot future failed for %s", session)
-            snapshot = {}
+            snapshot, lanes = {}, {}
+        lane_labels = lanes.get(session) or []
+        if lane_labels:
+            return [label_row(session, label, labels) for label in lane_labels]
         subprocess_label = snapshot.get(session)
         if subprocess_label is not None:
             active: tuple[str, int] | None = (subprocess_label, 0)
@@ -916,39 +1091,14 @@ def main() -> None:
                 active = find_active_label(ssm, labels, session_created=session_created)
             except Exception:
                 logging.exception("Failed to find active label for %s", session)
-                return labels[0], "Unknown (error)"
-
-        # For multi-label batches, suffix a `[<pos>/<total>]` position
-        # annotation so the reader can tell at a glance how far along
-        # the institution chain this row is. The earlier `(+N more)`
-        # form counted batch size − 1 and was ambiguous: a session
-        # showing `(+72 more)` could be on the FIRST institution or
-        # the LAST one (73 of 73). `[73/73]` makes it unambiguous.
-        def _with_batch_suffix(label: str) -> str:
-            if not multi:
-                return label
-            try:
-                pos = labels.index(label) + 1
-            except ValueError:
-                # Defensive: should never happen — every label we route
-                # through this helper came from `labels` itself.
-                return f"{label} [?/{len(labels)}]"
-            return f"{label} [{pos}/{len(labels)}]"
+                return [(labels[0], "Unknown (error)")]
 
         if active is None:
             # No log file matches any label yet — pipeline is in
             # get-ids-es, before any downstream phase has written.
-            return _with_batch_suffix(labels[0]), "Generating IDs"
+            return [(_with_batch_suffix(labels[0], labels), "Generating IDs")]
 
-        label, _ = active
-        hub = label.split("+")[0]
-        display_label = _with_batch_suffix(label)
-        try:
-            phase, _ = get_phase_and_progress(ssm, session, hub, label)
-        except Exception:
-            logging.exception("Failed to get status for %s (%s)", session, label)
-            return display_label, "Unknown (error)"
-        return display_label, phase if phase is not None else "Generating IDs"
+        return [label_row(session, active[0], labels)]
 
     # Memory snapshot is independent of every per-session fetch — submit it
     # to the same executor so the SSM round-trip overlaps with the session
@@ -958,36 +1108,24 @@ def main() -> None:
     # its result only if the snapshot hasn't landed by the time the
     # thread needs it.
     with ThreadPoolExecutor(max_workers=min(len(sessions) + 3, 8)) as executor:
-        active_labels_future = executor.submit(snapshot_running_active_labels, ssm)
+        activity_future = executor.submit(snapshot_session_activity, ssm)
         memory_future = executor.submit(fetch_memory_snapshot, ssm)
         slots_future = executor.submit(_fetch_slot_snapshot, ssm)
         futures = {executor.submit(fetch, s): s for s in sessions}
         for future in as_completed(futures):
             session = futures[future]
-            display_id, phase = future.result()
-            results[session] = (display_id, phase)
-            print(f"{display_id}: {phase}")
+            results[session] = future.result()
+            for display_id, phase in results[session]:
+                print(f"{display_id}: {phase}")
         memory_line = _format_memory_line(memory_future.result())
         slot_snapshot = slots_future.result()
 
-    rows = [results[s] for s in sessions if s in results]
-    slots_line = slot_snapshot.line if slot_snapshot is not None else None
-    # Under saturation (0 shared slots free), attach a per-session [Slots: N]
-    # or [Awaiting slot] suffix so an operator can see at a glance which
-    # sessions are actually holding the pool vs. blocked on acquire. Skipped
-    # in the headroom regime because every session in a slot-consuming phase
-    # trivially holds its full allotment there.
-    if slot_snapshot is not None and slot_snapshot.free == 0:
-        rows = [
-            (
-                display_id,
-                phase
-                + _slot_suffix_for_row(display_id, phase, slot_snapshot.holds_by_label),
-            )
-            for display_id, phase in rows
-        ]
-    post_to_slack(token, rows, memory_line=memory_line, slots_line=slots_line)
-    print("Posted to Slack.")
+    _post_rows(
+        token,
+        [row for s in sessions for row in results.get(s, ())],
+        memory_line=memory_line,
+        slot_snapshot=slot_snapshot,
+    )
 
 
 if __name__ == "__main__":
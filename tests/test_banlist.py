@@ -5,6 +5,7 @@ add IDs on top of it. These tests pin that invariant and the fail-safe
 behavior (network error / empty run / garbage never shrinks the banlist).
 """
 
+import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -30,6 +31,7 @@ def _isolated_cache(tmp_path, monkeypatch):
     """Point the remote cache at an empty tmp file so tests never read or
     write the real cache, and each test starts with a cold (absent) cache."""
     monkeypatch.setattr(banlist_mod, "CACHE_PATH", tmp_path / "cache.txt")
+    monkeypatch.setattr(banlist_mod, "INDEX_PATH", tmp_path / "banlist.idx")
 
 
 def _json_lines(*ids: str) -> str:
@@ -237,3 +239,62 @@ def test_remote_disabled_via_env(monkeypatch):
         bl = Banlist()  # default -> env-controlled
         get.assert_not_called()
     assert bl.dpla_id_banlist == COMMITTED_IDS
+
+
+def test_index_is_reused_until_a_source_changes():
+    """The compiled index is built once and mapped by later loads; touching
+    the remote cache invalidates it."""
+    banlist_mod.CACHE_PATH.write_text(NEW_ID + "\n")
+    first = Banlist(fetch_remote=True)
+    assert first.is_banned(NEW_ID)
+    assert len(first) == len(COMMITTED_IDS) + 1
+
+    with patch.object(banlist_mod, "_read_cache") as read_cache:
+        again = Banlist(fetch_remote=True)
+        read_cache.assert_not_called()  # served from the index alone
+    assert again.is_banned(NEW_ID)
+
+    other = "b" * 32
+    banlist_mod.CACHE_PATH.write_text(f"{NEW_ID}\n{other}\n")
+    os.utime(banlist_mod.CACHE_PATH, ns=(1, 1))  # guarantee a new mtime
+    assert Banlist(fetch_remote=True).is_banned(other)
+
+
+def test_is_banned_rejects_non_ids_and_unlisted_ids():
+    bl = Banlist(fetch_remote=False)
+    assert bl.is_banned(min(COMMITTED_IDS))
+    assert bl.is_banned(max(COMMITTED_IDS))
+    assert not bl.is_banned("0" * 32)
+    assert not bl.is_banned("not-an-id")
+    assert not bl.is_banned(min(COMMITTED_IDS).upper())
+
+
+def _index_files() -> list[Path]:
+    template = banlist_mod.INDEX_PATH
+    return sorted(template.parent.glob(f"{template.stem}.*{template.suffix}"))
+
+
+def test_corrupt_index_is_rebuilt():
+    Banlist(fetch_remote=False)
+    (index,) = _index_files()
+    index.write_bytes(b"garbage")
+    assert Banlist(fetch_remote=False).dpla_id_banlist == COMMITTED_IDS
+    assert index.read_bytes().startswith(banlist_mod.INDEX_MAGIC)
+
+
+def test_remote_and_committed_only_loads_keep_separate_indexes():
+    """Alternating modes on one box must not rebuild each other's index on
+    every load; an index whose sources changed is pruned on the next write."""
+    banlist_mod.CACHE_PATH.write_text(NEW_ID + "\n")
+    Banlist(fetch_remote=True)
+    Banlist(fetch_remote=False)
+    assert len(_index_files()) == 2
+
+    with patch.object(banlist_mod, "_write_index") as write_index:
+        assert Banlist(fetch_remote=True).is_banned(NEW_ID)
+        assert not Banlist(fetch_remote=False).is_banned(NEW_ID)
+        write_index.assert_not_called()
+
+    banlist_mod.CACHE_PATH.write_text(f"{NEW_ID}\n{'b' * 32}\n")
+    Banlist(fetch_remote=True)
+    assert len(_index_files()) == 2  # the superseded remote index is gone
@@ -9,9 +9,15 @@ upload touch flow:
   ``touch()`` on each, surviving per-page errors.
 """
 
+import json
+import time
 from unittest.mock import MagicMock, patch
 
-from ingest_wikimedia.categories import CategoryEnsurer, touch_institution_files
+from ingest_wikimedia.categories import (
+    CATEGORY_CACHE_TTL_SECONDS,
+    CategoryEnsurer,
+    touch_institution_files,
+)
 
 
 def _new_ensurer():
@@ -91,6 +97,56 @@ def test_dry_run_does_not_count_as_newly_created():
     assert e.newly_created == set()
 
 
+def _entity(category_qid=None):
+    if category_qid is None:
+        return {"claims": {}}
+    return {
+        "claims": {
+            "P8464": [{"mainsnak": {"datavalue": {"value": {"id": category_qid}}}}]
+        }
+    }
+
+
+def test_prewarm_batches_wbgetentities_and_persists_ready(tmp_path):
+    cache = tmp_path / "categories.json"
+    e = CategoryEnsurer(commons_site=MagicMock(), cache_path=cache)
+    repo = e._wikidata_repo = MagicMock()
+    repo.simple_request.return_value.submit.side_effect = [
+        {"entities": {f"Q{i}": _entity(f"Q9{i}") for i in range(50)}},
+        {"entities": {"Q50": _entity(), "Q51": _entity("Q951")}},
+    ]
+    assert e.prewarm([f"Q{i}" for i in range(52)] + [""]) == 51
+    assert repo.simple_request.call_count == 2
+    assert repo.simple_request.call_args.kwargs["action"] == "wbgetentities"
+    assert "Q50" not in e._ensured
+
+    # A fresh ensurer (another worker, the next run) answers from the cache
+    # with no network round-trip.
+    fresh = CategoryEnsurer(commons_site=MagicMock(), cache_path=cache)
+    with patch.object(fresh, "_commons_category_exists") as exists:
+        fresh.ensure("Q51", "Foo Institution", "Q999")
+    exists.assert_not_called()
+    assert fresh._get_hub_category_qid("Q7") == "Q97"
+
+
+def test_cache_entries_expire_and_dry_run_never_persists(tmp_path):
+    cache = tmp_path / "categories.json"
+    stale = time.time() - CATEGORY_CACHE_TTL_SECONDS - 1
+    cache.write_text(json.dumps({"ready": {"Q1": stale, "Q2": time.time()}}))
+    e = CategoryEnsurer(commons_site=MagicMock(), cache_path=cache)
+    assert e._ensured == {"Q2"}
+
+    dry = CategoryEnsurer(commons_site=MagicMock(), dry_run=True, cache_path=cache)
+    with patch.object(dry, "_commons_category_exists", return_value=True):
+        dry.ensure("Q3", "Foo Institution", "Q999")
+    assert "Q3" not in json.loads(cache.read_text())["ready"]
+
+    live = CategoryEnsurer(commons_site=MagicMock(), cache_path=cache)
+    with patch.object(live, "_commons_category_exists", return_value=True):
+        live.ensure("Q3", "Foo Institution", "Q999")
+    assert set(json.loads(cache.read_text())["ready"]) == {"Q1", "Q2", "Q3"}
+
+
 def test_touch_institution_files_touches_each_search_hit():
     site = MagicMock()
     pages = [MagicMock(), MagicMock(), MagicMock()]
@@ -162,3 +218,77 @@ def test_touch_institution_files_default_does_not_log_per_touch(caplog):
     # The "Touching: ..." per-page line should NOT appear by default; this is
     # the regression guard for the new opt-in `log_each` flag.
     assert "Touching" not in messages
+
+
+def _purge_site(purged_titles, stuck_titles):
+    """A site whose purge API confirms ``purged_titles`` and whose category
+    check reports ``stuck_titles`` still in the unknown-institution category."""
+    site = MagicMock()
+    requests = []
+
+    def simple_request(**params):
+        requests.append(params)
+        req = MagicMock()
+        if params["action"] == "purge":
+            req.submit.return_value = {
+                "purge": [
+                    {"title": t, "purged": "", "linkupdate": ""}
+                    if t in purged_titles
+                    else {"title": t}
+                    for t in params["titles"]
+                ]
+            }
+        else:
+            req.submit.return_value = {
+                "query": {
+                    "pages": [
+                        {"title": t, "categories": [{"title": "c"}]}
+                        if t in stuck_titles
+                        else {"title": t}
+                        for t in params["titles"]
+                    ]
+                }
+            }
+        return req
+
+    site.simple_request.side_effect = simple_request
+    return site, requests
+
+
+def test_rerender_pages_purges_in_batches_and_touches_only_stragglers(monkeypatch):
+    from ingest_wikimedia import categories
+
+    monkeypatch.setattr(categories, "PURGE_BATCH", 2)
+    pages = []
+    for i in range(5):
+        p = MagicMock()
+        p.title.return_value = f"File:{i}.jpg"
+        pages.append(p)
+    titles = [p.title() for p in pages]
+    # 0-3 purge fine, 4 fails to purge; 1 stays in the unknown category.
+    site, requests = _purge_site(set(titles[:4]), {"File:1.jpg"})
+
+    done = categories.rerender_pages(site, pages)
+
+    purges = [r for r in requests if r["action"] == "purge"]
+    assert [len(r["titles"]) for r in purges] == [2, 2, 1]
+    assert all(r["forcelinkupdate"] for r in purges)
+    assert {p.title() for p in done} == set(titles)
+    for i, page in enumerate(pages):
+        if i in (1, 4):
+            page.touch.assert_called_once()  # straggler / unpurged fallback
+        else:
+            page.touch.assert_not_called()
+
+
+def test_touch_institution_files_purge_mode_uses_rerender():
+    site = MagicMock()
+    page = MagicMock()
+    page.title.return_value = "File:A.jpg"
+    site.search.return_value = iter([page])
+    with patch(
+        "ingest_wikimedia.categories.rerender_pages", return_value=[page]
+    ) as rerender:
+        assert touch_institution_files(site, "Q1", purge=True) == 1
+    rerender.assert_called_once()
+    page.touch.assert_not_called()
@@ -6,6 +6,11 @@ import pytest
 
 from ingest_wikimedia.common import CHECKSUM
 from ingest_wikimedia.dpla import IIIF_MANIFEST_FIELD_NAME, MEDIA_MASTER_FIELD_NAME
+from ingest_wikimedia.iiif import (
+    MANIFEST_ETAG_METADATA,
+    MANIFEST_LAST_MODIFIED_METADATA,
+    ManifestFetch,
+)
 from ingest_wikimedia.tracker import Result
 
 
@@ -379,7 +384,7 @@ def test_process_item_uses_cached_file_list(downloader):
         sleep_secs=0,
     )
 
-    downloader.iiif.get_iiif_manifest.assert_not_called()
+    downloader.iiif.fetch_iiif_manifest.assert_not_called()
 
 
 def test_process_item_fetches_manifest_when_cache_empty(downloader):
@@ -391,7 +396,7 @@ def test_process_item_fetches_manifest_when_cache_empty(downloader):
         IIIF_MANIFEST_FIELD_NAME, "http://example.com/manifest.json"
     )
     downloader.s3_client.get_file_list.return_value = []
-    downloader.iiif.get_iiif_manifest.return_value = manifest
+    downloader.iiif.fetch_iiif_manifest.return_value = ManifestFetch(manifest)
     downloader.iiif.get_iiif_urls.return_value = []
 
     downloader.process_item(
@@ -403,8 +408,8 @@ def test_process_item_fetches_manifest_when_cache_empty(downloader):
         sleep_secs=0,
     )
 
-    downloader.iiif.get_iiif_manifest.assert_called_once_with(
-        "http://example.com/manifest.json"
+    downloader.iiif.fetch_iiif_manifest.assert_called_once_with(
+        "http://example.com/manifest.json", etag=None, last_modified=None
     )
 
 
@@ -418,7 +423,7 @@ def test_process_item_fetches_manifest_when_overwrite(downloader):
         IIIF_MANIFEST_FIELD_NAME, "http://example.com/manifest.json"
     )
     downloader.s3_client.get_file_list.return_value = cached_urls
-    downloader.iiif.get_iiif_manifest.return_value = manifest
+    downloader.iiif.fetch_iiif_manifest.return_value = ManifestFetch(manifest)
     downloader.iiif.get_iiif_urls.return_value = cached_urls
 
     downloader.process_item(
@@ -430,7 +435,104 @@ def test_process_item_fetches_manifest_when_overwrite(downloader):
         sleep_secs=0,
     )
 
-    downloader.iiif.get_iiif_manifest.assert_called_once()
+    downloader.iiif.fetch_iiif_manifest.assert_called_once()
+
+
+def _stale_iiif_item(downloader, stored_metadata):
+    downloader.s3_client.get_item_metadata.return_value = _staged_metadata(
+        IIIF_MANIFEST_FIELD_NAME, "http://example.com/manifest.json"
+    )
+    downloader.s3_client.get_file_list.return_value = ["http://example.com/p1.jpg"]
+    downloader.s3_client.get_iiif_manifest_metadata.return_value = stored_metadata
+    downloader._s3_key_age_days = MagicMock(return_value=400)
+
+
+def _run_item(downloader):
+    downloader.process_item(
+        overwrite=False,
+        dry_run=True,
+        verbose=False,
+        partner="bpl",
+        dpla_id="abcd1234",
+        sleep_secs=0,
+    )
+
+
+def test_process_item_revalidates_stale_manifest_with_stored_validators(downloader):
+    _stale_iiif_item(
+        downloader,
+        {MANIFEST_ETAG_METADATA: '"v1"', MANIFEST_LAST_MODIFIED_METADATA: "Mon"},
+    )
+    downloader.iiif.fetch_iiif_manifest.return_value = ManifestFetch(
+        None, not_modified=True
+    )
+
+    _run_item(downloader)
+
+    downloader.iiif.fetch_iiif_manifest.assert_called_once_with(
+        "http://example.com/manifest.json", etag='"v1"', last_modified="Mon"
+    )
+    downloader.tracker.increment.assert_any_call(Result.IIIF_MANIFEST_UNCHANGED)
+    downloader.iiif.get_iiif_urls.assert_not_called()
+    downloader.s3_client.write_iiif_manifest.assert_not_called()
+    downloader.s3_client.write_file_list.assert_not_called()
+
+
+def test_process_item_logs_manifest_fetch_error(downloader, caplog):
+    # The fetch may have run on a prefetch thread; its failure is logged here,
+    # in the item's own scope, not where the fetch happened.
+    _stale_iiif_item(downloader, {})
+    downloader.iiif.fetch_iiif_manifest.return_value = ManifestFetch(
+        None, error="Unable to read IIIF manifest at http://example.com/manifest.json"
+    )
+
+    with caplog.at_level("WARNING"):
+        _run_item(downloader)
+
+    assert "Unable to read IIIF manifest at" in caplog.text
+    downloader.tracker.increment.assert_any_call(Result.FAILED)
+
+
+def test_process_item_byte_identical_manifest_skips_rewrite(downloader):
+    from ingest_wikimedia.localfs import LocalFS
+
+    manifest = {"@context": "ctx", "items": []}
+    _stale_iiif_item(
+        downloader, {CHECKSUM: LocalFS.get_bytes_hash(json.dumps(manifest))}
+    )
+    downloader.iiif.fetch_iiif_manifest.return_value = ManifestFetch(
+        manifest, etag='"v2"'
+    )
+
+    _run_item(downloader)
+
+    downloader.iiif.get_iiif_urls.assert_not_called()
+    downloader.s3_client.write_file_list.assert_not_called()
+    # Only the newly-learned ETag is persisted, so the next sweep gets a 304.
+    downloader.s3_client.write_iiif_manifest.assert_called_once_with(
+        "bpl", "abcd1234", json.dumps(manifest), {MANIFEST_ETAG_METADATA: '"v2"'}
+    )
+
+
+def test_process_item_changed_manifest_rewrites_file_list(downloader):
+    manifest = {"@context": "ctx", "items": ["new"]}
+    _stale_iiif_item(downloader, {CHECKSUM: "old-sha1"})
+    downloader.iiif.fetch_iiif_manifest.return_value = ManifestFetch(
+        manifest, last_modified="Tue"
+    )
+    downloader.iiif.get_iiif_urls.return_value = ["http://example.com/new.jpg"]
+
+    _run_item(downloader)
+
+    downloader.s3_client.write_iiif_manifest.assert_called_once_with(
+        "bpl",
+        "abcd1234",
+        json.dumps(manifest),
+        {MANIFEST_LAST_MODIFIED_METADATA: "Tue"},
+    )
+    downloader.s3_client.write_file_list.assert_called_once_with(
+        "bpl", "abcd1234", ["http://example.com/new.jpg"]
+    )
 
 
 def test_process_item_media_master_skips_manifest(downloader):
@@ -447,7 +549,70 @@ def test_process_item_media_master_skips_manifest(downloader):
         sleep_secs=0,
     )
 
-    downloader.iiif.get_iiif_manifest.assert_not_called()
+    downloader.iiif.fetch_iiif_manifest.assert_not_called()
+
+
+def test_prefetcher_yields_in_order_and_looks_ahead(downloader):
+    import threading
+
+    from tools.downloader import ItemPrefetcher
+
+    release = threading.Event()
+    started = []
+
+    def load(partner, dpla_id, overwrite, max_age_days):
+        started.append(dpla_id)
+        if dpla_id == "a":
+            release.wait(5)
+        return dpla_id
+
+    downloader.load_item_inputs = load
+    prefetcher = ItemPrefetcher(downloader, "bpl", ["a", "b", "c", "d"], False, 365, 2)
+    it = iter(prefetcher)
+    dpla_id, future = next(it)
+    assert dpla_id == "a"
+    # "b" and "c" are already being resolved while "a" is still in flight.
+    for _ in range(100):
+        if {"b", "c"} <= set(started):
+            break
+        threading.Event().wait(0.01)
+    assert {"b", "c"} <= set(started)
+    release.set()
+    assert future.result() == "a"
+    assert [(i, f.result()) for i, f in it] == [("b", "b"), ("c", "c"), ("d", "d")]
+
+    assert list(ItemPrefetcher(downloader, "bpl", ["x"], False, 365, 0)) == [
+        ("x", None)
+    ]
+
+
+def test_process_item_uses_prefetched_inputs(downloader):
+    from concurrent.futures import Future
+
+    from tools.downloader import ItemInputs
+
+    prefetched = Future()
+    prefetched.set_result(
+        ItemInputs({MEDIA_MASTER_FIELD_NAME: ["http://example.com/file.jpg"]})
+    )
+    downloader.process_item(
+        overwrite=False,
+        dry_run=True,
+        verbose=False,
+        partner="texas",
+        dpla_id="abcd1234",
+        sleep_secs=0,
+        prefetched=prefetched,
+    )
+    downloader.s3_client.get_item_metadata.assert_not_called()
+    downloader.s3_client.write_file_list.assert_called_once_with(
+        "texas", "abcd1234", ["http://example.com/file.jpg"]
+    )
+
+    failed = Future()
+    failed.set_exception(RuntimeError("s3 down"))
+    downloader.process_item(False, True, False, "texas", "abcd1234", 0, 365, failed)
+    downloader.tracker.increment.assert_called_with(Result.FAILED)
 
 
 # ---------------------------------------------------------------------------
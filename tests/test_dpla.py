@@ -9,11 +9,15 @@ from requests import Session
 from ingest_wikimedia.banlist import Banlist, BANLIST_FILE_NAME
 from ingest_wikimedia.dpla import (
     EDM_IS_SHOWN_AT,
+    IIIF_MANIFEST_DERIVED_FIELD_NAME,
+    IIIF_MANIFEST_FIELD_NAME,
+    IIIF_MANIFEST_PROBE_FIELD_NAME,
     MEDIA_MASTER_FIELD_NAME,
     RIGHTS_CATEGORY_FIELD_NAME,
     DPLA,
 )
 from ingest_wikimedia.iiif import IIIF
+from ingest_wikimedia.partners import ConfigSnapshot, compile_config_snapshot
 from ingest_wikimedia.s3 import S3Client
 from ingest_wikimedia.tracker import Tracker
 
@@ -224,6 +228,50 @@ def test_not_wiki_eligible_media(
     assert not eligible
 
 
+def test_wiki_eligible_derived_manifest_is_network_free(
+    dpla, good_dpla_id, good_item_metadata, good_provider, good_data_provider
+):
+    del good_item_metadata[MEDIA_MASTER_FIELD_NAME]
+    assert dpla.is_wiki_eligible(
+        good_dpla_id, good_item_metadata, good_provider, good_data_provider
+    )
+    dpla.http_session.head.assert_not_called()
+    assert IIIF_MANIFEST_FIELD_NAME not in good_item_metadata
+
+
+def test_not_wiki_eligible_when_staging_probe_failed(
+    dpla, good_dpla_id, good_item_metadata, good_provider, good_data_provider
+):
+    del good_item_metadata[MEDIA_MASTER_FIELD_NAME]
+    good_item_metadata[IIIF_MANIFEST_FIELD_NAME] = "http://example.com/manifest.json"
+    good_item_metadata[IIIF_MANIFEST_PROBE_FIELD_NAME] = 404
+    assert not dpla.is_wiki_eligible(
+        good_dpla_id, good_item_metadata, good_provider, good_data_provider
+    )
+    good_item_metadata[IIIF_MANIFEST_PROBE_FIELD_NAME] = 200
+    assert dpla.is_wiki_eligible(
+        good_dpla_id, good_item_metadata, good_provider, good_data_provider
+    )
+
+
+def test_probe_derived_manifest_records_status_on_a_copy():
+    from ingest_wikimedia.staging import probe_derived_manifest
+
+    session = MagicMock()
+    session.head.return_value.status_code = 404
+    derived = {
+        IIIF_MANIFEST_FIELD_NAME: "http://example.com/manifest.json",
+        IIIF_MANIFEST_DERIVED_FIELD_NAME: True,
+    }
+    probed = probe_derived_manifest(session, derived)
+    assert probed[IIIF_MANIFEST_PROBE_FIELD_NAME] == 404
+    assert IIIF_MANIFEST_PROBE_FIELD_NAME not in derived
+
+    supplied = {IIIF_MANIFEST_FIELD_NAME: "http://example.com/manifest.json"}
+    assert probe_derived_manifest(session, supplied) is supplied
+    session.head.assert_called_once()
+
+
 def test_get_provider_and_data_provider(dpla):
     item_metadata = {
         "provider": {"name": "test_provider"},
@@ -238,6 +286,36 @@ def test_get_provider_and_data_provider(dpla):
     assert data_provider == {}
 
 
+def test_provider_lookup_through_config_snapshot(dpla, tmp_path, good_item_metadata):
+    """The staged institutions config is served as a ConfigSnapshot (a
+    Mapping, not a dict); provider lookups and eligibility must see through
+    it exactly as they do a parsed dict."""
+    institutions = {
+        "Test Hub": {
+            "Wikidata": "Q1",
+            "upload": True,
+            "institutions": {"Test Library": {"Wikidata": "Q2", "upload": True}},
+        }
+    }
+    path = str(tmp_path / "institutions_v2.json.snapshot")
+    compile_config_snapshot(institutions, path)
+    snapshot = ConfigSnapshot(path)
+    item_metadata = {
+        **good_item_metadata,
+        "provider": {"name": "Test Hub"},
+        "dataProvider": {"name": "Test Library"},
+    }
+
+    provider, data_provider = dpla.get_provider_and_data_provider(
+        item_metadata, snapshot
+    )
+    assert (provider, data_provider) == dpla.get_provider_and_data_provider(
+        item_metadata, institutions
+    )
+    assert data_provider == {"Wikidata": "Q2", "upload": True}
+    assert dpla.is_wiki_eligible("12345", item_metadata, provider, data_provider)
+
+
 def test_get_providers_data(dpla):
     # get_providers_data delegates to partners.load_institutions (local-first,
     # urllib) — no longer the requests http_session — so patch that.
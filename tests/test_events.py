@@ -0,0 +1,180 @@
+"""Tests for ``ingest_wikimedia.events`` — the JSONL event stream that
+``setup_logging`` writes next to each phase's human log."""
+
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+
+import pytest
+
+from ingest_wikimedia import events
+from ingest_wikimedia import logs as logs_mod
+from ingest_wikimedia.tracker import Result, Tracker
+
+
+@pytest.fixture
+def phase_log(tmp_path, monkeypatch):
+    """Run ``setup_logging`` into ``tmp_path`` and restore root-logger state
+    afterwards; yields ``(log_path, events_path)``."""
+    root = logging.getLogger()
+    saved_handlers = list(root.handlers)
+    saved_level = root.level
+    saved_hook = sys.excepthook
+    for h in saved_handlers:
+        root.removeHandler(h)
+    monkeypatch.setattr(logs_mod, "LOGS_DIR_BASE", str(tmp_path))
+    monkeypatch.setenv("WIKIMEDIA_SESSION_LABEL", "nara")
+    try:
+        logs_mod.setup_logging("nara", "sdc", console=False)
+        (log_path,) = tmp_path.glob("*-nara-sdc.log")
+        yield log_path, tmp_path / events.events_path_for(log_path.name)
+    finally:
+        sys.excepthook = saved_hook
+        for h in list(root.handlers):
+            root.removeHandler(h)
+            h.close()
+        for h in saved_handlers:
+            root.addHandler(h)
+        root.setLevel(saved_level)
+
+
+def _read(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_events_path_for_replaces_log_suffix():
+    assert (
+        events.events_path_for("logs/20260101-000000-nara-sdc.log")
+        == "logs/20260101-000000-nara-sdc.events.jsonl"
+    )
+
+
+def test_setup_logging_writes_phase_start_and_keeps_text_log_clean(phase_log):
+    log_path, events_path = phase_log
+    events.emit("ordinal", dpla_id="a" * 32, status="ERROR")
+    logging.info("a human line")
+
+    records = _read(events_path)
+    assert records[0]["event"] == "phase_start"
+    assert records[0]["label"] == "nara" and records[0]["phase"] == "sdc"
+    assert records[1] == {
+        "ts": records[1]["ts"],
+        "event": "ordinal",
+        "dpla_id": "a" * 32,
+        "status": "ERROR",
+    }
+    text = log_path.read_text()
+    assert "a human line" in text
+    assert "ordinal" not in text  # event records never reach the text log
+
+
+def test_item_context_records_seconds_and_error_class(phase_log):
+    _, events_path = phase_log
+    with events.item("b" * 32):
+        pass
+    with pytest.raises(KeyError):
+        with events.item("c" * 32):
+            raise KeyError("boom")
+
+    ends = [r for r in _read(events_path) if r["event"] == "item_end"]
+    assert [r["dpla_id"] for r in ends] == ["b" * 32, "c" * 32]
+    assert "error_class" not in ends[0]
+    assert ends[1]["error_class"] == "KeyError"
+    assert all(r["seconds"] >= 0 for r in ends)
+
+
+def test_cause_chain_follows_explicit_and_implicit_chaining():
+    class ReadTimeout(Exception):
+        pass
+
+    try:
+        try:
+            try:
+                raise ReadTimeout("read timed out")
+            except ReadTimeout as inner:
+                raise ConnectionError("retries exhausted") from inner
+        except ConnectionError:
+            raise RuntimeError("SDC sync failed")
+    except RuntimeError as ex:
+        assert events.cause_chain(ex) == ["ConnectionError", "ReadTimeout"]
+
+    assert events.cause_chain(ValueError("plain")) == []
+
+
+def test_worker_events_cross_a_queue_handler(phase_log):
+    """Pool workers forward records via QueueHandler → QueueListener; the
+    event payload must survive ``QueueHandler.prepare`` and land in the
+    parent's JSONL handler (and only there)."""
+    log_path, events_path = phase_log
+    q: queue.Queue = queue.Queue()
+    listener = logging.handlers.QueueListener(
+        q, *logging.getLogger().handlers, respect_handler_level=True
+    )
+    worker_logger = logging.getLogger("fake-worker")
+    worker_logger.propagate = False
+    worker_logger.addHandler(logging.handlers.QueueHandler(q))
+    listener.start()
+    try:
+        record = logging.getLogger(events.EVENTS_LOGGER_NAME).makeRecord(
+            events.EVENTS_LOGGER_NAME,
+            logging.INFO,
+            __file__,
+            0,
+            "item_end",
+            None,
+            None,
+            extra={"event_fields": {"event": "item_end", "dpla_id": "d" * 32}},
+        )
+        worker_logger.handle(record)
+    finally:
+        listener.stop()
+    assert any(r.get("dpla_id") == "d" * 32 for r in _read(events_path))
+    assert "item_end" not in log_path.read_text()
+
+
+def test_maybe_emit_tracker_is_throttled(phase_log, monkeypatch):
+    _, events_path = phase_log
+    monkeypatch.setattr(events, "_last_tracker_emit", 0.0)
+    tracker = Tracker()
+    tracker.increment(Result.UPLOADED, 3)
+    events.maybe_emit_tracker(tracker, now=1000.0)
+    events.maybe_emit_tracker(tracker, now=1010.0)  # inside the interval
+    events.maybe_emit_tracker(tracker, now=1061.0)
+    snapshots = [r for r in _read(events_path) if r["event"] == "tracker"]
+    assert len(snapshots) == 2
+    assert snapshots[0]["counts"] == {"UPLOADED": 3}
+    assert snapshots[0]["final"] is False
+
+
+def test_iter_events_skips_torn_lines(tmp_path):
+    path = tmp_path / "x.events.jsonl"
+    path.write_text(
+        '{"event": "item_start", "dpla_id": "a"}\n'
+        '{"event": "item_end", "dpla_id": "a"}\n'
+        '{"event": "item_st'
+    )
+    assert [r["event"] for r in events.iter_events(str(path))] == [
+        "item_start",
+        "item_end",
+    ]
+    assert len(list(events.iter_events(str(path), "item_end"))) == 1
+
+
+def test_iter_events_tail_bytes_drops_the_partial_first_line(tmp_path):
+    path = tmp_path / "x.events.jsonl"
+    first = '{"event": "tracker", "counts": {"UPLOADED": 1}}\n'
+    last = '{"event": "tracker", "counts": {"UPLOADED": 2}}\n'
+    path.write_text(first + last)
+    tail = list(events.iter_events(str(path), "tracker", tail_bytes=len(last) + 5))
+    assert [r["counts"]["UPLOADED"] for r in tail] == [2]
+
+
+def test_parse_event_line_filters_by_name_and_rejects_non_objects():
+    line = '{"event": "ordinal", "dpla_id": "a"}\n'
+    assert events.parse_event_line(line) == {"event": "ordinal", "dpla_id": "a"}
+    assert events.parse_event_line(line, "ordinal")["dpla_id"] == "a"
+    assert events.parse_event_line(line, "item_end") is None
+    assert events.parse_event_line("[1, 2]\n") is None
+    assert events.parse_event_line('{"event": "ord') is None
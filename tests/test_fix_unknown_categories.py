@@ -0,0 +1,134 @@
+"""Tests for ``tools.fix_unknown_categories --bulk`` — one-pass, grouped,
+resumable draining of the unknown-institution category."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tools import fix_unknown_categories as fuc
+
+
+def _page(title: str, inst: str | None, hub: str | None = "Q900"):
+    page = MagicMock()
+    page.title.return_value = title
+    page.exists.return_value = True
+    parts = []
+    if inst:
+        parts.append(f"{{{{Institution|wikidata={inst}}}}}")
+    if hub:
+        parts.append(f"{{{{DPLA|hub={hub}}}}}")
+    page.text = "\n".join(parts)
+    return page
+
+
+def _run(pages, cursor, ensurer=None):
+    site = MagicMock()
+    site.preloadpages.side_effect = lambda pages, groupsize: iter(pages)
+    category = MagicMock()
+    category.members.return_value = pages
+    ensurer = ensurer or MagicMock()
+    with (
+        patch.object(fuc, "get_wikidata_site"),
+        patch.object(fuc.pywikibot, "ItemPage"),
+    ):
+        result = fuc.run_bulk(site, ensurer, category, str(cursor), touch_workers=2)
+    return result, site, ensurer
+
+
+def test_bulk_groups_members_and_ensures_each_institution_once(tmp_path):
+    pages = [
+        _page("File:A1.jpg", "Q1"),
+        _page("File:B1.jpg", "Q2"),
+        _page("File:A2.jpg", "Q1"),
+        _page("File:Bad.jpg", None),
+    ]
+    (institutions, touched), site, ensurer = _run(pages, tmp_path / "c.json")
+    assert (institutions, touched) == (2, 3)
+    # One enumeration, one batched wikitext load, one ensure per institution.
+    site.preloadpages.assert_called_once()
+    assert [c.args[0] for c in ensurer.ensure.call_args_list] == ["Q1", "Q2"]
+    for page in pages[:3]:
+        page.touch.assert_called_once()
+    pages[3].touch.assert_not_called()
+
+
+def test_bulk_resumes_an_interrupted_pass_from_cursor(tmp_path):
+    cursor = tmp_path / "c.json"
+    ensurer = MagicMock()
+    ensurer.ensure.side_effect = [None, KeyboardInterrupt]
+    first = [
+        _page("File:A1.jpg", "Q1"),
+        _page("File:B1.jpg", "Q2"),
+        _page("File:Bad.jpg", None),
+    ]
+    with pytest.raises(KeyboardInterrupt):
+        _run(first, cursor, ensurer)
+
+    # The retry sees the same members plus a new one: only the new file is
+    # loaded, the Q1 file is not touched again and Q1 is not re-ensured.
+    again = [
+        _page("File:A1.jpg", "Q1"),
+        _page("File:B1.jpg", "Q2"),
+        _page("File:Bad.jpg", None),
+        _page("File:A3.jpg", "Q1"),
+    ]
+    (_, touched), site, ensurer = _run(again, cursor)
+    assert touched == 2
+    assert [p.title() for p in site.preloadpages.call_args.args[0]] == ["File:A3.jpg"]
+    assert [c.args[0] for c in ensurer.ensure.call_args_list] == ["Q2"]
+    again[0].touch.assert_not_called()
+
+
+def test_bulk_checkpoints_each_preload_batch(tmp_path, monkeypatch):
+    monkeypatch.setattr(fuc, "PRELOAD_BATCH", 2)
+    cursor = tmp_path / "c.json"
+    pages = [_page(f"File:A{i}.jpg", "Q1") for i in range(5)]
+    site = MagicMock()
+
+    def preload_then_die(pages, groupsize):
+        yield from pages[:3]
+        raise KeyboardInterrupt
+
+    site.preloadpages.side_effect = preload_then_die
+    category = MagicMock()
+    category.members.return_value = pages
+    with pytest.raises(KeyboardInterrupt):
+        fuc.run_bulk(site, MagicMock(), category, str(cursor))
+    assert sorted(fuc._load_cursor(str(cursor))["grouped"]) == [
+        "File:A0.jpg",
+        "File:A1.jpg",
+    ]
+
+    _, site, _ = _run(pages, cursor)
+    assert [p.title() for p in site.preloadpages.call_args.args[0]] == [
+        "File:A2.jpg",
+        "File:A3.jpg",
+        "File:A4.jpg",
+    ]
+
+
+def test_bulk_completed_pass_clears_cursor(tmp_path):
+    """A finished pass must not leave titles that later passes would skip
+    forever, even if the files fall back into the category."""
+    cursor = tmp_path / "c.json"
+    bad = _page("File:Bad.jpg", None)
+    _run([_page("File:A1.jpg", "Q1"), bad], cursor)
+    assert not cursor.exists()
+
+    (_, touched), site, _ = _run([_page("File:A1.jpg", "Q1"), bad], cursor)
+    assert touched == 1
+    assert len(site.preloadpages.call_args.args[0]) == 2
+
+
+def test_bulk_failed_ensure_leaves_group_for_next_run(tmp_path):
+    cursor = tmp_path / "c.json"
+    ensurer = MagicMock()
+    ensurer.ensure.side_effect = RuntimeError("wikidata down")
+    page = _page("File:A1.jpg", "Q1")
+    (_, touched), _, _ = _run([page], cursor, ensurer)
+    assert touched == 0
+    page.touch.assert_not_called()
+
+    (_, touched), _, ensurer = _run([page], cursor)
+    assert touched == 1
+    ensurer.ensure.assert_called_once()
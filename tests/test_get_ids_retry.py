@@ -4,14 +4,18 @@ The upload and download scanners are exercised indirectly by integration
 tests on the retry pipeline; this file focuses on parse_sdc_log because
 its classification rules are dense (every transient pattern is one
 substring match) and the scanner is the only point where structural
-errors are deliberately excluded from the retry CSV.
+errors are deliberately excluded from the retry CSV. The last tests cover
+the per-log checkpoints that let a re-run scan only the appended tail.
 """
 
+import json
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
 
-from tools.get_ids_retry import parse_sdc_log
+from tools import get_ids_retry
+from tools.get_ids_retry import parse_sdc_events, parse_sdc_log
 
 MAXLAG_BLOCK = """\
 [INFO] 09:11:50:  -- Ordinal 113: M192146077 (something)
@@ -179,3 +183,145 @@ def test_traceback_terminates_at_next_error_marker(tmp_path):
     result = parse_sdc_log(log)
     assert id_b in result
     assert id_a not in result
+
+
+def _write_events(tmp_path: Path, records: list[dict]) -> Path:
+    path = tmp_path / "20260101-000000-nara-sdc.events.jsonl"
+    path.write_text("".join(json.dumps(r) + "\n" for r in records))
+    return path
+
+
+def test_parse_sdc_events_classifies_by_error_class_and_message(tmp_path):
+    """The structured stream carries the exception class and message per
+    ordinal, so the same transient/structural split applies without
+    reassembling a traceback."""
+    events = _write_events(
+        tmp_path,
+        [
+            {"event": "item_start", "dpla_id": "1" * 32},
+            {
+                "event": "ordinal",
+                "status": "ERROR",
+                "dpla_id": "1" * 32,
+                "error_class": "MaxlagTimeoutError",
+                "error": "Maximum retries attempted due to maxlag",
+            },
+            {
+                "event": "ordinal",
+                "status": "ERROR",
+                "dpla_id": "2" * 32,
+                "error_class": "RuntimeError",
+                "error": "wbeditentity failed for M1: invalid-claim — bad",
+            },
+        ],
+    )
+    assert parse_sdc_events(events) == {"1" * 32}
+
+
+def test_parse_sdc_events_matches_a_transient_cause_behind_a_wrapper(tmp_path):
+    """A retry loop that gives up re-raises a generic error; the transient
+    class only survives in the event's cause chain."""
+    events = _write_events(
+        tmp_path,
+        [
+            {
+                "event": "ordinal",
+                "status": "ERROR",
+                "dpla_id": "3" * 32,
+                "error_class": "RuntimeError",
+                "error": "SDC write for M123 gave up",
+                "causes": ["ReadTimeout"],
+            },
+            {
+                "event": "ordinal",
+                "status": "ERROR",
+                "dpla_id": "4" * 32,
+                "error_class": "RuntimeError",
+                "error": "SDC write for M456 gave up",
+                "causes": ["KeyError"],
+            },
+        ],
+    )
+    assert parse_sdc_events(events) == {"3" * 32}
+
+
+def test_collect_partner_ids_prefers_events_over_text_log(tmp_path, monkeypatch):
+    """When a phase log has an ``.events.jsonl`` twin, the structured stream
+    is authoritative; the text log is only parsed for pre-event-stream runs."""
+    log_dir = tmp_path / "nara" / "logs"
+    log_dir.mkdir(parents=True)
+    (log_dir / "20260101-000000-nara-sdc.log").write_text(
+        MAXLAG_BLOCK.format(id="9" * 32)
+    )
+    (log_dir / "20260101-000000-nara-sdc.events.jsonl").write_text(
+        json.dumps(
+            {
+                "event": "ordinal",
+                "status": "ERROR",
+                "dpla_id": "8" * 32,
+                "error_class": "ReadTimeout",
+                "error": "timed out",
+            }
+        )
+        + "\n"
+    )
+    monkeypatch.setattr(get_ids_retry, "BASE_DIR", tmp_path)
+    cutoff = datetime.now(tz=timezone.utc) - timedelta(days=1)
+    _, _, sdc = get_ids_retry.collect_partner_ids("nara", cutoff)
+    assert sdc == {"8" * 32}
+
+
+def _spy_feed_offsets(monkeypatch) -> list[int]:
+    """Record the offset every scan of a log starts reading from."""
+    offsets: list[int] = []
+    feed_lines = get_ids_retry._feed_lines
+
+    def spy(f, scan, offset):
+        offsets.append(offset)
+        return feed_lines(f, scan, offset)
+
+    monkeypatch.setattr(get_ids_retry, "_feed_lines", spy)
+    return offsets
+
+
+def test_scan_incremental_reads_only_the_appended_tail(tmp_path, monkeypatch):
+    """A second run resumes at the checkpointed offset, and an SDC error block
+    cut off mid-traceback by the checkpoint is classified on its whole
+    traceback once the rest of it arrives."""
+    offsets = _spy_feed_offsets(monkeypatch)
+    log = tmp_path / "20260101-000000-nara-sdc.log"
+    head, _, rest = MAXLAG_BLOCK.format(id="1" * 32).partition("  File")
+    log.write_text(head)
+    scan = get_ids_retry._SdcScan
+
+    assert get_ids_retry.scan_incremental(log, scan) == set()
+    first_size = log.stat().st_size
+    with open(log, "a") as f:
+        # The last line is still being written: not checkpointed.
+        f.write("  File" + rest + "[INFO] 09:22:00:  -- Ordinal 115: M1")
+    assert get_ids_retry.scan_incremental(log, scan) == {"1" * 32}
+    assert get_ids_retry.scan_incremental(log, scan) == parse_sdc_log(log)
+    assert offsets[:2] == [0, first_size]
+    assert offsets[2] == log.stat().st_size - len(
+        "[INFO] 09:22:00:  -- Ordinal 115: M1"
+    )
+    assert (tmp_path / get_ids_retry.RETRY_INDEX_DIR / f"{log.name}.json").is_file()
+
+
+def test_scan_incremental_rescans_a_replaced_log(tmp_path, monkeypatch):
+    """A log replaced with different content is re-read from the start, even
+    when it is no shorter than the checkpointed offset."""
+    offsets = _spy_feed_offsets(monkeypatch)
+    log = tmp_path / "20260101-000000-nara-sdc.log"
+    log.write_text(MAXLAG_BLOCK.format(id="1" * 32))
+    scan = get_ids_retry._SdcScan
+    assert get_ids_retry.scan_incremental(log, scan) == {"1" * 32}
+
+    log.write_text(MAXLAG_BLOCK.format(id="2" * 32) * 2)
+    assert get_ids_retry.scan_incremental(log, scan) == {"2" * 32}
+    assert offsets == [0, 0]
+
+    log.write_text(READONLY_BLOCK.format(id="3" * 32))
+    assert get_ids_retry.scan_incremental(log, scan) == {"3" * 32}
+    assert get_ids_retry.scan_incremental(log, scan, rescan=True) == {"3" * 32}
+    assert offsets == [0, 0, 0, 0]
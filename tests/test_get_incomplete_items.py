@@ -0,0 +1,62 @@
+"""Tests for ``tools.get_incomplete_items`` — the one-pass completeness scan."""
+
+import io
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from tools.get_incomplete_items import (
+    IncompleteItem,
+    get_incomplete_items,
+    iter_incomplete_items,
+)
+
+A = "a" * 32
+B = "b" * 32
+C = "c" * 32
+
+
+def _folder(dpla_id: str) -> str:
+    return f"nara/images/{dpla_id[0]}/{dpla_id[1]}/{dpla_id[2]}/{dpla_id[3]}/{dpla_id}"
+
+
+def _fake_s3(objects: dict[str, str]):
+    """A boto3-resource stand-in: one sorted listing plus client GETs."""
+    s3 = MagicMock()
+    listing = [SimpleNamespace(key=k) for k in sorted(objects)]
+    s3.Bucket.return_value.objects.filter.return_value = listing
+    s3.meta.client.get_object.side_effect = lambda Bucket, Key: {
+        "Body": io.BytesIO(objects[Key].encode("utf-8"))
+    }
+    return s3
+
+
+def test_reports_missing_ordinals_from_a_single_listing():
+    objects = {
+        # A: 3 listed, ordinal 2 missing; sidecars never count as media.
+        f"{_folder(A)}/file-list.txt": "u1\nu2\nu3",
+        f"{_folder(A)}/1_{A}": "",
+        f"{_folder(A)}/3_{A}": "",
+        f"{_folder(A)}/dpla-map.json": "{}",
+        f"{_folder(A)}/sdc.json": "{}",
+        # B: complete.
+        f"{_folder(B)}/file-list.txt": "u1\nu2",
+        f"{_folder(B)}/1_{B}": "",
+        f"{_folder(B)}/2_{B}": "",
+        # C: no media at all.
+        f"{_folder(C)}/file-list.txt": "u1",
+        f"{_folder(C)}/iiif.json": "{}",
+    }
+    s3 = _fake_s3(objects)
+    assert list(iter_incomplete_items(s3, "nara", workers=2)) == [
+        IncompleteItem(A, [2]),
+        IncompleteItem(C, [1]),
+    ]
+    # One listing of the partner prefix; no per-item re-listing.
+    s3.Bucket.return_value.objects.filter.assert_called_once_with(Prefix="nara/images/")
+    assert get_incomplete_items(_fake_s3(objects), "nara") == [A, C]
+
+
+def test_folders_without_a_file_list_are_ignored():
+    s3 = _fake_s3({f"{_folder(A)}/1_{A}": "", f"{_folder(A)}/dpla-map.json": "{}"})
+    assert list(iter_incomplete_items(s3, "nara")) == []
+    s3.meta.client.get_object.assert_not_called()
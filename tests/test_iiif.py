@@ -2,9 +2,15 @@ import pytest
 
 from unittest.mock import patch, MagicMock
 
+import requests
 from requests import Session
 
-from ingest_wikimedia.iiif import IIIF, IIIF_IMAGE_API_V2, IIIF_V3_FULL_RES_JPG_SUFFIX
+from ingest_wikimedia.iiif import (
+    IIIF,
+    IIIF_IMAGE_API_V2,
+    IIIF_V3_FULL_RES_JPG_SUFFIX,
+    PROBE_FAILURES_BEFORE_NEGATIVE,
+)
 from ingest_wikimedia.tracker import Tracker
 
 
@@ -123,6 +129,48 @@ def test_get_iiif_manifest(iiif: IIIF):
     assert result == {"manifest": "data"}
 
 
+def test_fetch_iiif_manifest_conditional(iiif: IIIF):
+    iiif.http_session = MagicMock()
+    not_modified = MagicMock(status_code=304)
+    iiif.http_session.get.return_value = not_modified
+    result = iiif.fetch_iiif_manifest(
+        "http://example.com/manifest", etag='"abc"', last_modified="Mon"
+    )
+    assert result.not_modified and result.manifest is None
+    iiif.http_session.get.assert_called_once_with(
+        "http://example.com/manifest",
+        headers={"If-None-Match": '"abc"', "If-Modified-Since": "Mon"},
+    )
+
+    fresh = MagicMock(status_code=200, headers={"ETag": '"def"'})
+    fresh.json.return_value = {"manifest": "data"}
+    iiif.http_session.get.return_value = fresh
+    result = iiif.fetch_iiif_manifest("http://example.com/manifest", etag='"abc"')
+    assert result.manifest == {"manifest": "data"}
+    assert result.validators() == {"manifest-etag": '"def"'}
+
+
+def test_fetch_iiif_manifest_returns_failure_without_logging(iiif: IIIF, caplog):
+    iiif.http_session = MagicMock()
+    iiif.http_session.get.side_effect = requests.ConnectionError("boom")
+    with caplog.at_level("WARNING"):
+        result = iiif.fetch_iiif_manifest("http://example.com/manifest")
+        assert result.manifest is None and not result.not_modified
+        assert (
+            result.error
+            == "Unable to read IIIF manifest at http://example.com/manifest"
+        )
+        assert caplog.text == ""
+
+        invalid = iiif.fetch_iiif_manifest("not a url")
+        assert invalid.error == "Invalid IIIF manifest url: not a url"
+        assert caplog.text == ""
+
+        # The plain getter still reports why it came back empty.
+        assert iiif.get_iiif_manifest("not a url") is None
+        assert "Invalid IIIF manifest url: not a url" in caplog.text
+
+
 def test_contentdm_iiif_url(iiif: IIIF):
     is_shown_at = "http://www.ohiomemory.org/cdm/ref/collection/p16007coll33/id/126923"
     expected_url = (
@@ -147,3 +195,60 @@ def test_texas_imageapi_url(iiif: IIIF):
     url = "https://texashistory.unt.edu/iiif/ark:/67531/metapth540971/m1/1"
     expected_url = "https://texashistory.unt.edu/iiif/ark:/67531/metapth540971/m1/1/full/max/0/default.jpg"
     assert iiif.maximize_iiif_url(url, IIIF_V3_FULL_RES_JPG_SUFFIX) == expected_url
+
+
+def test_maximize_fallback_probes_each_server_once(iiif: IIIF):
+    iiif.http_session = MagicMock()
+    iiif.http_session.head.return_value = MagicMock(
+        ok=True, headers={"Content-Type": "image/jpeg"}
+    )
+    first = iiif.maximize_iiif_url(
+        "https://good.org/images/a", "/full/max/0/default.jpg"
+    )
+    second = iiif.maximize_iiif_url(
+        "https://good.org/images/b", "/full/max/0/default.jpg"
+    )
+    assert first == "https://good.org/images/a/full/max/0/default.jpg"
+    assert second == "https://good.org/images/b/full/max/0/default.jpg"
+    iiif.http_session.head.assert_called_once()
+
+
+def test_maximize_fallback_negative_caches_failing_server(iiif: IIIF):
+    iiif.http_session = MagicMock()
+    iiif.http_session.head.return_value = MagicMock(ok=False, status_code=404)
+    for i in range(PROBE_FAILURES_BEFORE_NEGATIVE + 2):
+        assert iiif.maximize_iiif_url(f"https://bad.org/img/{i}", "/full") == ""
+    assert iiif.http_session.head.call_count == PROBE_FAILURES_BEFORE_NEGATIVE
+
+
+def test_maximize_fallback_keys_on_service_path_and_suffix(iiif: IIIF):
+    """A proven suffix on one service says nothing about another suffix, or
+    another service path on the same host: both are probed."""
+    iiif.http_session = MagicMock()
+    iiif.http_session.head.return_value = MagicMock(
+        ok=True, status_code=200, headers={"Content-Type": "image/jpeg"}
+    )
+    v3, other = IIIF_V3_FULL_RES_JPG_SUFFIX, "/full/full/0/default.jpg"
+    iiif.maximize_iiif_url("https://good.org/images/a", v3)
+    iiif.maximize_iiif_url("https://good.org/images/b", v3)
+    assert iiif.http_session.head.call_count == 1
+
+    iiif.http_session.head.return_value = MagicMock(
+        ok=True, status_code=200, headers={"Content-Type": "text/html"}
+    )
+    assert iiif.maximize_iiif_url("https://good.org/images/c", other) == ""
+    assert iiif.maximize_iiif_url("https://good.org/other/d", v3) == ""
+    assert iiif.http_session.head.call_count == 3
+
+
+def test_maximize_fallback_transient_probe_failures_are_not_cached(iiif: IIIF):
+    iiif.http_session = MagicMock()
+    iiif.http_session.head.return_value = MagicMock(ok=False, status_code=503)
+    for i in range(PROBE_FAILURES_BEFORE_NEGATIVE + 2):
+        assert iiif.maximize_iiif_url(f"https://slow.org/img/{i}", "/full") == ""
+    assert iiif.http_session.head.call_count == PROBE_FAILURES_BEFORE_NEGATIVE + 2
+
+    iiif.http_session.head.return_value = MagicMock(
+        ok=True, status_code=200, headers={"Content-Type": "image/jpeg"}
+    )
+    assert iiif.maximize_iiif_url("https://slow.org/img/x", "/full") != ""
@@ -153,9 +153,9 @@ def test_dispatch_helper_treats_raw_timeout_as_possibly_dispatched(
 ):
     """Bare ``TimeoutError`` must not surface as 'internal error'.
 
-    Kept as a backstop even though ``urllib.request.urlopen`` normally wraps
-    timeouts in ``URLError`` — defensive in case a future urllib change (or
-    a different code path) propagates the raw exception.
+    This is the shape the module-level ``http.client`` connection raises on
+    a slow GitHub API (``urllib.request.urlopen`` used to wrap it in
+    ``URLError`` — covered by the next test).
     """
     monkeypatch.setenv("SLACK_SIGNING_SECRET", "shh")
     monkeypatch.setenv("GH_TOKEN", "tok")
@@ -369,3 +369,136 @@ def test_duplicate_hub_slug_deduped_across_mixed_targets(monkeypatch, handler_mo
     partner = dispatched[0]["inputs"]["partner"]
     assert partner.count("bpl") == 1
     assert "pa" in partner
+
+
+class _StubGitHub:
+    """Local stand-in for GitHub's workflow-dispatch endpoint: HTTP/1.1
+    keep-alive, 204 per POST, counting the TCP connections it accepts."""
+
+    def __init__(self):
+        import http.server
+        import threading
+
+        stub = self
+        self.connections = 0
+        self.sockets: list = []
+        self.requests: list[dict] = []
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                stub.connections += 1
+                stub.sockets.append(self.connection)
+
+            def do_POST(self):
+                length = int(self.headers["Content-Length"])
+                stub.requests.append(
+                    {"path": self.path, "body": json.loads(self.rfile.read(length))}
+                )
+                self.send_response(204)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *_a):
+                pass
+
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def drop_idle_connections(self):
+        """Close every open connection server-side, as GitHub does with
+        keep-alive connections left idle between invocations."""
+        import socket
+
+        for sock in self.sockets:
+            sock.shutdown(socket.SHUT_RDWR)
+        self.sockets.clear()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def test_warm_invocations_reuse_the_github_connection(monkeypatch, handler_module):
+    """Cold vs warm: the first invocation opens the connection, every later
+    one reuses it — which is what keeps warm dispatches well inside Slack's
+    3 s even when GitHub's TLS handshake is slow. The stub is plain HTTP on
+    loopback, so each new connection is charged a simulated ``handshake``
+    to make the cold/warm difference measurable."""
+    import time
+
+    handshake = 0.2
+    stub = _StubGitHub()
+    try:
+        client = handler_module._GitHubClient(stub.url)
+        plain_connect = client._connect
+
+        def slow_connect():
+            conn = plain_connect()
+            open_socket = conn.connect
+
+            def connect():
+                time.sleep(handshake)
+                open_socket()
+
+            conn.connect = connect
+            return conn
+
+        monkeypatch.setattr(client, "_connect", slow_connect)
+        monkeypatch.setattr(handler_module, "_github", client)
+        monkeypatch.setenv("SLACK_SIGNING_SECRET", "shh")
+        monkeypatch.setenv("GH_TOKEN", "tok")
+        monkeypatch.setattr(
+            handler_module, "_verify_slack_signature", lambda *_a, **_k: True
+        )
+        latencies = []
+        for _ in range(5):
+            start = time.perf_counter()
+            reply = handler_module.handler(_make_event("bpl"), None)
+            latencies.append(time.perf_counter() - start)
+            assert "Launching pipeline for `bpl`" in _decode_reply(reply)["text"]
+        cold, warm = latencies[0], max(latencies[1:])
+
+        assert stub.connections == 1
+        assert cold >= handshake
+        assert warm < cold - handshake / 2
+        assert len(stub.requests) == 5
+        assert stub.requests[0]["path"] == (
+            "/repos/dpla/ingest-wikimedia/actions/workflows/"
+            "wikimedia-launch.yml/dispatches"
+        )
+        assert stub.requests[0]["body"]["inputs"]["partner"] == "bpl"
+        assert warm < handler_module.DISPATCH_TIMEOUT_SECONDS
+
+        # GitHub dropping the idle keep-alive connection costs one reconnect,
+        # not a failed dispatch.
+        stub.drop_idle_connections()
+        reply = handler_module.handler(_make_event("bpl"), None)
+        assert "Launching pipeline" in _decode_reply(reply)["text"]
+        assert stub.connections == 2
+        assert len(stub.requests) == 6
+    finally:
+        stub.close()
+
+
+def test_github_http_errors_keep_urllib_shape(monkeypatch, handler_module):
+    import http.client
+    import urllib.error
+
+    class _Resp:
+        status, reason, headers, will_close = 403, "Forbidden", {}, False
+
+        def read(self):
+            return b""
+
+    conn = http.client.HTTPConnection("example.invalid")
+    monkeypatch.setattr(conn, "request", lambda *_a, **_k: None)
+    monkeypatch.setattr(conn, "getresponse", lambda: _Resp())
+    client = handler_module._GitHubClient()
+    client._conn = conn
+    with pytest.raises(urllib.error.HTTPError) as exc:
+        client.post_json("/x", "tok", {})
+    assert exc.value.code == 403
@@ -1541,8 +1541,8 @@ def test_post_legacy_import_claims_submits_atomic_wbeditentity():
 def test_fetch_revision_snapshots_projects_revid_user_text():
     """The pywikibot Revision object's three relevant fields are
     projected into the dataclass; anything else is dropped. Also pins
-    that content=True is the call shape (without it pywikibot doesn't
-    populate .text)."""
+    that the history walk is metadata-only (content=False): content is
+    fetched separately, and only for the revisions that need it."""
 
     class _Rev:
         def __init__(self, revid, user, text):
@@ -1557,7 +1557,7 @@ def test_fetch_revision_snapshots_projects_revid_user_text():
     assert len(snapshots) == 2
     assert snapshots[0].revid == 1 and snapshots[0].user == "DPLA_bot"
     assert snapshots[1].text == "{{Artwork|title=B}}"
-    file_page.revisions.assert_called_once_with(content=True)
+    file_page.revisions.assert_called_once_with(content=False)
 
 
 def test_fetch_revision_snapshots_tolerates_missing_user_and_text():
@@ -1577,6 +1577,92 @@ def test_fetch_revision_snapshots_tolerates_missing_user_and_text():
     assert snapshots[0].user == "" and snapshots[0].text == ""
 
 
+class _MetaRev:
+    """A metadata-only pywikibot Revision: ``text`` is unset."""
+
+    def __init__(self, revid, user, sha1):
+        self.revid, self.user, self.sha1, self.text = revid, user, sha1, None
+
+
+def _content_site(texts: dict[int, str]):
+    """Site whose ``prop=revisions&revids=…`` query serves ``texts`` and
+    records which revids each request asked for."""
+    site = MagicMock()
+    site.requested = []
+
+    def simple_request(**params):
+        revids = [int(r) for r in params["revids"].split("|")]
+        site.requested.append(revids)
+        request = MagicMock()
+        request.submit.return_value = {
+            "query": {
+                "pages": {
+                    "42": {
+                        "revisions": [
+                            {"revid": r, "slots": {"main": {"*": texts[r]}}}
+                            for r in revids
+                            if r in texts
+                        ]
+                    }
+                }
+            }
+        }
+        return request
+
+    site.simple_request.side_effect = simple_request
+    return site
+
+
+def test_fetch_revision_snapshots_fetches_content_once_per_sha1_and_caches(
+    tmp_path,
+):
+    """Metadata first; content only for distinct sha1s. A re-run against the
+    on-disk cache fetches just the latest revision's text."""
+    from ingest_wikimedia.legacy_artwork import RevisionParamsCache
+
+    texts = {
+        1: "{{Artwork|title=A}}",
+        2: "{{Artwork|title=Vandal}}",
+        3: "{{Artwork|title=A}}",  # revert of 2 → same sha1 as 1
+        4: "{{Artwork|title=B}}",
+    }
+    metas = [
+        _MetaRev(4, "Editor1", "s4"),
+        _MetaRev(3, "Patroller", "s1"),
+        _MetaRev(2, "Vandal", "s2"),
+        _MetaRev(1, "DPLA bot", "s1"),
+    ]
+    cache = RevisionParamsCache(str(tmp_path / "revs.sqlite"))
+
+    page = MagicMock()
+    page.revisions.return_value = metas
+    page.site = _content_site(texts)
+    first = fetch_revision_snapshots(page, cache=cache)
+    assert sorted(sum(page.site.requested, [])) == [2, 3, 4]
+    assert {r.revid: r.params["title"] for r in first} == {
+        4: "B",
+        3: "A",
+        2: "Vandal",
+        1: "A",
+    }
+    assert trace_param_provenance(first) == {"title": "Editor1"}
+
+    page.site = _content_site(texts)
+    second = fetch_revision_snapshots(page, cache=cache)
+    assert page.site.requested == [[4]]
+    assert second[0].text == texts[4]
+    assert [r.params for r in second] == [r.params for r in first]
+
+
+def test_fetch_revision_snapshots_raises_when_content_missing():
+    page = MagicMock()
+    page.title.return_value = "File:X.jpg"
+    page.revisions.return_value = [_MetaRev(2, "Editor1", "s2")]
+    page.site = _content_site({})
+    with pytest.raises(RuntimeError, match="incomplete revision content"):
+        fetch_revision_snapshots(page)
+
+
 # --- rescue_wikitext (cross-page, preserve-by-default) --------------------
 
 
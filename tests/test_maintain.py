@@ -6,10 +6,12 @@ so the rung-selection logic is exercised without a live cluster.
 """
 
 from ingest_wikimedia.maintain import (
+    ResolveRequest,
     ResolveResult,
     extract_stable_token,
     normalize_url_candidates,
     resolve_current_dpla_id,
+    resolve_current_dpla_ids,
 )
 
 NC = "https://lib.digitalnc.org/record/100550"
@@ -80,6 +82,33 @@ class _Resp:
         }
 
 
+class _AggResp:
+    """The batched ``isShownAt`` query's per-URL buckets."""
+
+    def __init__(self, by_url):
+        self._by_url = by_url
+
+    def json(self):
+        return {
+            "_shards": {"failed": 0},
+            "hits": {"total": {"value": 0}, "hits": []},
+            "aggregations": {
+                "by_url": {
+                    "buckets": [
+                        {
+                            "key": url,
+                            "doc_count": len(ids),
+                            "records": {
+                                "hits": {"hits": [{"_id": i} for i in ids[:2]]}
+                            },
+                        }
+                        for url, ids in self._by_url.items()
+                    ]
+                }
+            },
+        }
+
+
 class FakeES:
     """Routes a query dict to canned hits by shape."""
 
@@ -93,8 +122,15 @@ class FakeES:
         self.calls.append(query)
         q = query["query"]
         if "ids" in q:
-            wanted = q["ids"]["values"][0]
-            return _Resp([wanted] if wanted in self.live_ids else [])
+            return _Resp([i for i in q["ids"]["values"] if i in self.live_ids])
+        if "aggs" in query:
+            return _AggResp(
+                {
+                    u: self.isshownat[u]
+                    for u in q["terms"]["isShownAt"]
+                    if self.isshownat.get(u)
+                }
+            )
         if "terms" in q and "isShownAt" in q["terms"]:
             ids: list[str] = []
             for u in q["terms"]["isShownAt"]:
@@ -232,3 +268,62 @@ def test_all_anchors_miss_is_unresolved():
     assert r.dpla_id is None
     assert r.anchor == "unresolved"
     assert r.ambiguous is False
+
+
+# --- batched ladder ----------------------------------------------------------
+
+
+def test_batch_matches_single_file_ladder_in_three_queries():
+    ga = "http://dlg.galileo.usg.edu/id:arl_awc_awc337"
+    scope = {"term": {"dataProvider.name.not_analyzed": "X"}}
+    es = FakeES(
+        live_ids={CURRENT_ID},
+        isshownat={
+            "https://lib.digitalnc.org/record/100550": ["b" * 32],
+            "https://x.org/record/shared": ["c" * 32, "d" * 32],
+        },
+        wildcard={"arl_awc_awc337": ["e" * 32]},
+    )
+    files = [
+        ResolveRequest(CURRENT_ID, NC, None),  # embedded
+        ResolveRequest(DEAD_ID, "http://lib.digitalnc.org/record/100550", None),
+        ResolveRequest(None, "https://x.org/record/shared", None),  # ambiguous
+        ResolveRequest(DEAD_ID, ga, scope),  # wildcard residue
+        ResolveRequest(None, None, None),  # nothing to go on
+    ]
+    single = [
+        resolve_current_dpla_id(
+            embedded_id=f.embedded_id,
+            recorded_url=f.recorded_url,
+            scope_filter=f.scope_filter,
+            query_fn=FakeES(
+                live_ids=es.live_ids, isshownat=es.isshownat, wildcard=es.wildcard
+            ),
+        )
+        for f in files
+    ]
+    assert resolve_current_dpla_ids(files, query_fn=es) == single
+    assert [r.anchor for r in single] == [
+        "embedded",
+        "isShownAt",
+        "unresolved",
+        "wildcard",
+        "unresolved",
+    ]
+    # One ids query, one aggregated terms query, one wildcard for the residue.
+    assert len(es.calls) == 3
+
+
+def test_batch_defers_scope_to_the_residue():
+    calls = []
+
+    def scope():
+        calls.append(1)
+        return {"term": {"dataProvider.name.not_analyzed": "X"}}
+
+    es = FakeES(live_ids={CURRENT_ID})
+    (r,) = resolve_current_dpla_ids(
+        [ResolveRequest(CURRENT_ID, NC, scope)], query_fn=es
+    )
+    assert r.anchor == "embedded"
+    assert calls == []
@@ -0,0 +1,71 @@
+"""Tests for ``tools.nuke`` — listing-driven, batched DeleteObjects purges."""
+
+from unittest.mock import MagicMock
+
+from tools import nuke
+
+A = "a" * 32
+B = "b" * 32
+
+
+def _client(keys_by_item: dict[str, list[tuple[str, int]]], errors=()):
+    client = MagicMock()
+
+    def paginate(Bucket, Prefix):
+        dpla_id = Prefix.rstrip("/").rsplit("/", 1)[-1]
+        return [{"Contents": [{"Key": k, "Size": s} for k, s in keys_by_item[dpla_id]]}]
+
+    client.get_paginator.return_value.paginate.side_effect = paginate
+    client.delete_objects.return_value = {"Errors": list(errors)}
+    return client
+
+
+def test_dry_run_reports_counts_and_bytes_without_deleting():
+    client = _client({A: [("x/1", 10), ("x/2", 5)], B: [("y/1", 1)]})
+    summary = nuke.nuke_items(client, "nara", [A, B], dry_run=True, workers=2)
+    assert summary == nuke.NukeSummary(2, 3, 16, 0, 0)
+    client.delete_objects.assert_not_called()
+
+
+def test_keys_are_pooled_into_batches_across_items(monkeypatch):
+    monkeypatch.setattr(nuke, "DELETE_BATCH_SIZE", 2)
+    client = _client(
+        {A: [("x/1", 1), ("x/2", 1), ("x/3", 1)], B: [("y/1", 1)]},
+        errors=[{"Key": "x/1", "Code": "AccessDenied", "Message": "no"}],
+    )
+    summary = nuke.nuke_items(client, "nara", [A, B], workers=2)
+    deleted = [
+        [o["Key"] for o in c.kwargs["Delete"]["Objects"]]
+        for c in client.delete_objects.call_args_list
+    ]
+    assert sorted(k for batch in deleted for k in batch) == ["x/1", "x/2", "x/3", "y/1"]
+    assert all(len(batch) <= 2 for batch in deleted)
+    assert len(deleted) == 2
+    assert summary.keys == 4
+    assert summary.failed_keys == 2  # one reported error per call
+
+
+def test_deletes_start_before_every_item_is_listed(monkeypatch):
+    """Listings are windowed, so the first DeleteObjects runs while most of
+    the ID file is still unlisted rather than queued behind all of it."""
+    monkeypatch.setattr(nuke, "DELETE_BATCH_SIZE", 1)
+    ids = [f"{i:032x}" for i in range(100)]
+    client = _client({i: [(f"{i}/1", 1)] for i in ids})
+    listed: list[str] = []
+    listed_at_first_delete: list[int] = []
+    list_item_keys = nuke.list_item_keys
+
+    def spy_list(client, partner, dpla_id):
+        listed.append(dpla_id)
+        return list_item_keys(client, partner, dpla_id)
+
+    def spy_delete(**kwargs):
+        if not listed_at_first_delete:
+            listed_at_first_delete.append(len(listed))
+        return {"Errors": []}
+
+    monkeypatch.setattr(nuke, "list_item_keys", spy_list)
+    client.delete_objects.side_effect = spy_delete
+    summary = nuke.nuke_items(client, "nara", ids, workers=1)
+    assert summary.keys == 100 and summary.failed_keys == 0
+    assert listed_at_first_delete[0] <= 2 * 4  # ~one window of listings, not 100
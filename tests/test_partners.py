@@ -13,6 +13,8 @@ non-eligible matches never leak to the launcher.
 """
 
 import json
+import os
+import pickle
 import urllib.error
 from unittest.mock import MagicMock, patch
 
@@ -153,6 +155,46 @@ def test_load_subjects_prefers_local_file(tmp_path, monkeypatch):
         urlopen.assert_not_called()
 
 
+def test_staged_config_compiles_snapshot_for_later_processes(tmp_path, monkeypatch):
+    """The first load of a staged file compiles a snapshot; the next process
+    maps it instead of parsing the JSON, with identical lookups."""
+    data = {"Photographs": {"id": ["Q125191"]}, "Maps": {"id": []}, "Ünïcode": 1}
+    f = tmp_path / "subjects.json"
+    f.write_text(json.dumps(data))
+    monkeypatch.setenv(partners.SUBJECTS_FILE_ENV, str(f))
+    assert partners.load_subjects() == data
+    assert len(list(tmp_path.glob("subjects.json.*.snapshot"))) == 1
+
+    partners._staged_config_cache.clear()  # a fresh process
+    with patch.object(partners.json, "load") as json_load:
+        snap = partners.load_subjects()
+        json_load.assert_not_called()
+    assert isinstance(snap, partners.ConfigSnapshot)
+    assert snap == data
+    assert snap["Photographs"] is snap["Photographs"]  # decoded once
+    assert "Ünïcode" in snap and "Nope" not in snap and 5 not in snap
+    assert snap.get("Nope", {}) == {}
+    assert sorted(snap) == sorted(data)
+    # Workers receive the snapshot path, not the decoded tables.
+    clone = pickle.loads(pickle.dumps(snap))
+    assert clone.path == snap.path and clone == data
+
+
+def test_restaged_config_gets_a_new_snapshot(tmp_path, monkeypatch):
+    f = tmp_path / "institutions_v2.json"
+    f.write_text(json.dumps({"Hub": {"upload": False}}))
+    monkeypatch.setenv(partners.INSTITUTIONS_FILE_ENV, str(f))
+    partners.load_institutions()
+    first = partners._snapshot_path(str(f))
+
+    f.write_text(json.dumps({"Hub": {"upload": True}}))
+    os.utime(f, ns=(1, 1))
+    partners._staged_config_cache.clear()
+    assert partners.load_institutions()["Hub"] == {"upload": True}
+    assert partners._snapshot_path(str(f)) != first
+    assert os.path.exists(first)  # old snapshot left for running sessions
+
+
 def test_load_subjects_fetches_when_no_local_file():
     data = {"Photographs": "Q125191"}
     with patch.object(
@@ -178,6 +220,30 @@ def test_load_institutions_and_subjects_cached_independently(tmp_path, monkeypat
         urlopen.assert_not_called()
 
 
+def test_compile_staged_configs_snapshots_through_the_staged_symlink(
+    tmp_path, monkeypatch
+):
+    """The launcher stages configs as symlinks into a content-addressed
+    cache; the pre-compile step leaves a snapshot every later process opens,
+    and restaging identical content keeps it valid."""
+    blob = tmp_path / "institutions_v2.0123abcd.json"
+    blob.write_text(json.dumps({"Hub": {"upload": True}}))
+    link = tmp_path / "institutions_v2.json"
+    link.symlink_to(blob)
+    monkeypatch.setenv(partners.INSTITUTIONS_FILE_ENV, str(link))
+    monkeypatch.setenv(partners.SUBJECTS_FILE_ENV, str(tmp_path / "missing.json"))
+
+    assert partners.compile_staged_configs() == {
+        partners.INSTITUTIONS_FILE_ENV: True,
+        partners.SUBJECTS_FILE_ENV: False,
+    }
+    snapshots = list(tmp_path.glob("*.snapshot"))
+    assert len(snapshots) == 1
+    with patch.object(partners, "compile_config_snapshot") as compile_:
+        assert partners.load_institutions()["Hub"] == {"upload": True}
+        compile_.assert_not_called()
+
+
 def test_resolve_wikidata_id_drops_hub_level_match_when_hub_upload_false():
     """A QID that matches a hub entry whose ``upload`` is ``False`` must
     NOT produce a ``(slug, None)`` result, even if other (institution-
@@ -0,0 +1,85 @@
+"""Tests for ``ingest_wikimedia.progress`` — the per-phase progress file the
+status tooling reads instead of scanning live logs."""
+
+import json
+
+import pytest
+
+from ingest_wikimedia import logs as logs_mod
+from ingest_wikimedia import progress
+from ingest_wikimedia.tracker import Histogram, Result, Tracker
+
+
+@pytest.fixture
+def logs_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(logs_mod, "LOGS_DIR_BASE", str(tmp_path))
+    monkeypatch.delenv("WIKIMEDIA_SESSION_LABEL", raising=False)
+    monkeypatch.setattr(progress, "_active", None)
+    return tmp_path
+
+
+def _read(path) -> dict:
+    return json.loads(path.read_text())
+
+
+def test_start_writes_initial_file_under_session_label(logs_dir, monkeypatch):
+    monkeypatch.setenv("WIKIMEDIA_SESSION_LABEL", "nara+nps")
+    progress.start("nara", "upload", 10, Tracker())
+    data = _read(logs_dir / "nara+nps-upload.progress.json")
+    assert data["label"] == "nara+nps"
+    assert data["phase"] == "upload"
+    assert data["status"] == "running"
+    assert (data["items_done"], data["items_total"]) == (0, 10)
+    assert data["eta_seconds"] is None
+    # Only the final file survives; the temp file was renamed over it.
+    assert [p.name for p in logs_dir.iterdir()] == ["nara+nps-upload.progress.json"]
+
+
+def test_payload_reports_counts_throughput_and_eta(logs_dir):
+    tracker = Tracker()
+    checkpoint = progress.ProgressCheckpoint("nara", "upload", 100, tracker)
+    checkpoint.started = 1_000_000.0
+    for _ in range(20):
+        tracker.observe(Histogram.ITEM_SECONDS, 1.0)
+    tracker.increment(Result.UPLOADED, 25)
+    tracker.increment(Result.BYTES, 600_000)
+
+    data = checkpoint.payload("running", now=1_000_000.0 + 600)
+    assert data["items_done"] == 20
+    assert data["counts"] == {"UPLOADED": 25, "BYTES": 600_000}
+    assert data["items_per_minute"] == 2.0
+    assert data["bytes_per_second"] == 1000
+    # No recent-window observations at this fake clock → ETA falls back to
+    # the run-long 2 items/min: 80 remaining items = 40 minutes.
+    assert data["eta_seconds"] == 2400
+
+
+def test_tick_is_throttled(logs_dir):
+    tracker = Tracker()
+    progress.start("nara", "sdc", 5, tracker)
+    path = logs_dir / "nara-sdc.progress.json"
+    first = progress._active._last_write
+    tracker.observe(Histogram.ITEM_SECONDS, 1.0)
+    progress.tick(now=first + 1)
+    assert _read(path)["items_done"] == 0
+    progress.tick(now=first + progress.PROGRESS_INTERVAL_SECONDS)
+    assert _read(path)["items_done"] == 1
+
+
+def test_finish_writes_final_status_and_stops(logs_dir):
+    tracker = Tracker()
+    progress.start("nara", "download", 1, tracker)
+    progress.finish("aborted")
+    data = _read(logs_dir / "nara-download.progress.json")
+    assert data["status"] == "aborted"
+    assert data["eta_seconds"] == 0
+    progress.tick()  # no active checkpoint: harmless no-op
+    progress.finish("complete")
+    assert _read(logs_dir / "nara-download.progress.json")["status"] == "aborted"
+
+
+def test_write_failure_is_logged_not_raised(tmp_path, monkeypatch, caplog):
+    monkeypatch.setattr(logs_mod, "LOGS_DIR_BASE", str(tmp_path / "missing"))
+    checkpoint = progress.ProgressCheckpoint("nara", "upload", 1, Tracker())
+    checkpoint.write()
+    assert "Could not write progress file" in caplog.text
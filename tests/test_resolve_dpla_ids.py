@@ -9,6 +9,7 @@ institution — so a single-ID maintain launch against a de-opted institution
 upload flag" INELIGIBLE message even when both Wikidata IDs were present.
 """
 
+import json
 from unittest.mock import MagicMock, patch
 
 from click.testing import CliRunner
@@ -125,3 +126,61 @@ def test_maintain_lets_upload_off_institution_through():
     assert result.exit_code == 0, result.output
     assert "abc HUB=ia" in result.output
     s3_client.write_item_metadata.assert_called_once()
+
+
+def _es_batches(sources: dict[str, dict], calls: list):
+    """``post_es`` stand-in answering each ``terms`` query from ``sources``."""
+
+    def post(query):
+        ids = query["query"]["terms"]["id"]
+        calls.append(ids)
+        if "boom" in ids:
+            raise RuntimeError("es down")
+        resp = MagicMock()
+        resp.json.return_value = {
+            "hits": {"hits": [{"_source": sources[i]} for i in ids if i in sources]}
+        }
+        return resp
+
+    return post
+
+
+def test_batch_mode_groups_es_queries_and_streams_jsonl(tmp_path, monkeypatch):
+    """Thousands of IDs go to ES in ES_BATCH_SIZE groups; output stays in
+    input order, a failed ES batch only errors its own IDs, and duplicates
+    are resolved once."""
+    monkeypatch.setattr(resolve_dpla_ids, "ES_BATCH_SIZE", 2)
+    ids_file = tmp_path / "ids.csv"
+    ids_file.write_text("c\nboom\nd\na\n")
+    calls: list = []
+    sources = {i: _make_source(i) for i in ("a", "c", "d")}
+    with (
+        patch.object(resolve_dpla_ids, "post_es", _es_batches(sources, calls)),
+        patch.object(resolve_dpla_ids, "check_es_response", lambda _: None),
+        patch.object(resolve_dpla_ids, "Banlist") as banlist_cls,
+        patch.object(resolve_dpla_ids, "S3Client") as s3_cls,
+        patch.object(resolve_dpla_ids, "resolve_slug", return_value="ia"),
+        patch.object(
+            resolve_dpla_ids, "check_item_eligibility", return_value=(True, "")
+        ),
+    ):
+        banlist_cls.return_value.is_banned.side_effect = lambda i: i == "d"
+        result = CliRunner().invoke(
+            resolve_dpla_ids.main,
+            ["a", "b", "--ids-file", str(ids_file), "--jsonl", "--workers", "3"],
+        )
+    assert result.exit_code == 0, result.output
+    assert calls == [["a", "b"], ["c", "boom"], ["d"]]
+    assert [json.loads(line) for line in result.output.splitlines()] == [
+        {"id": "a", "status": "eligible", "hub": "ia"},
+        {"id": "b", "status": "not_found"},
+        {"id": "c", "status": "error", "error": "es down"},
+        {"id": "boom", "status": "error", "error": "es down"},
+        {"id": "d", "status": "ineligible", "reason": "on banlist"},
+    ]
+    assert s3_cls.return_value.write_item_metadata.call_count == 1
+
+
+def test_no_ids_is_a_usage_error():
+    result = CliRunner().invoke(resolve_dpla_ids.main, [])
+    assert result.exit_code == 2
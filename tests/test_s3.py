@@ -103,7 +103,12 @@ def test_write_iiif_manifest(s3_client: S3Client):
     s3_client.write_item_file = Mock()
     s3_client.write_iiif_manifest("partner", "abcd1234", "manifest")
     s3_client.write_item_file.assert_called_once_with(
-        "partner", "abcd1234", "manifest", "iiif.json", "application/json"
+        "partner",
+        "abcd1234",
+        "manifest",
+        "iiif.json",
+        "application/json",
+        metadata=None,
     )
 
 
@@ -131,3 +136,17 @@ def test_read_item_file(s3_client: S3Client):
 
     result = s3_client.get_item_file("partner", "abcd1234", "file.txt")
     assert result == "data"
+
+
+def test_get_item_file_metadata(s3_client: S3Client):
+    mock_s3 = Mock()
+    mock_s3.Object.return_value.metadata = {CHECKSUM: "abc", "manifest-etag": '"1"'}
+    s3_client.s3 = mock_s3
+    assert s3_client.get_iiif_manifest_metadata("partner", "abcd1234") == {
+        CHECKSUM: "abc",
+        "manifest-etag": '"1"',
+    }
+    mock_s3.Object.return_value.load.side_effect = ClientError(
+        {"Error": {"Code": "404"}}, "load"
+    )
+    assert s3_client.get_iiif_manifest_metadata("partner", "abcd1234") is None
@@ -1910,6 +1910,78 @@ def test_post_sdc_cleanup_for_item_isolates_per_page_failures(monkeypatch, caplo
     assert any("post-SDC cleanup failed" in r.message for r in caplog.records)
 
 
+def test_post_sdc_cleanup_for_item_preloads_wikitext_in_batches(monkeypatch):
+    """Every ordinal page is preloaded through one ``preloadpages`` call
+    (batched by 50 titles) before the per-page dispatcher runs, and a
+    preload failure falls back to lazy loads rather than skipping cleanup."""
+    from ingest_wikimedia import wikimedia
+    from ingest_wikimedia.dpla import DPLA
+    from tools import sdc_sync
+
+    s3 = MagicMock()
+    s3.get_item_metadata.return_value = json.dumps({"id": "d1", "sourceResource": {}})
+    fake_site = MagicMock(name="site")
+    monkeypatch.setattr(sdc_sync, "hubs", {}, raising=False)
+    monkeypatch.setattr(sdc_sync, "site", fake_site, raising=False)
+    monkeypatch.setattr(
+        DPLA,
+        "get_provider_and_data_provider",
+        staticmethod(lambda doc, hubs: ({"name": "p"}, {"name": "d"})),
+    )
+    monkeypatch.setattr(
+        wikimedia, "dpla_metadata_params", lambda *a, **kw: {"title": "x"}
+    )
+    monkeypatch.setattr(sdc_sync.pywikibot, "FilePage", lambda site, title: title)
+    seen = []
+    monkeypatch.setattr(
+        sdc_sync,
+        "_post_sdc_cleanup_for_page",
+        lambda page, *a, **kw: seen.append(page) or False,
+    )
+    ordinals = [(str(i), {"title": f"T{i}"}) for i in range(120)]
+
+    sdc_sync._post_sdc_cleanup_for_item(s3, "nara", "d1", ordinals)
+    fake_site.preloadpages.assert_called_once()
+    args, kwargs = fake_site.preloadpages.call_args
+    assert args[0] == [f"T{i}" for i in range(120)]
+    assert kwargs["groupsize"] == 50
+    assert len(seen) == 120
+
+    seen.clear()
+    fake_site.preloadpages.side_effect = RuntimeError("api down")
+    sdc_sync._post_sdc_cleanup_for_item(s3, "nara", "d1", ordinals[:2])
+    assert seen == ["T0", "T1"]
+
+
+def test_post_sdc_cleanup_for_page_skips_guard_when_already_clean(monkeypatch):
+    """A ``{{DPLA metadata}}`` page with nothing to strip or canonicalise is
+    classified locally: no entity-guard fetch, no ``normalize_page``."""
+    from ingest_wikimedia import wikimedia, wikitext_normalize
+    from tools import sdc_sync
+
+    fake_page = MagicMock(name="FilePage")
+    fake_page.exists.return_value = True
+    fake_page.pageid = 7
+    fake_page.text = "{{DPLA metadata\n| title = Community title\n}}"
+    monkeypatch.setattr(
+        wikimedia, "dpla_metadata_params", lambda *a, **kw: {"title": "X"}
+    )
+
+    def no_fetch(mid):
+        raise AssertionError("guard fetch must not run for a clean page")
+
+    monkeypatch.setattr(sdc_sync, "_fetch_entity_for_cleanup_guard", no_fetch)
+    monkeypatch.setattr(
+        wikitext_normalize,
+        "normalize_page",
+        lambda *a, **kw: pytest.fail("normalize_page must not run"),
+    )
+
+    assert not sdc_sync._post_sdc_cleanup_for_page(
+        fake_page, "dpla-id", {}, {"Wikidata": "Q1"}, {"Wikidata": "Q2"}
+    )
+
+
 # ---------------------------------------------------------------------------
 # _post_sdc_cleanup_for_page — strip-or-migrate dispatcher
 # ---------------------------------------------------------------------------
@@ -6293,15 +6365,90 @@ def test_worker_maintain_group_task_processes_each_file_and_returns_delta():
         patch.object(sdc_sync, "_worker_slot_budget", _NoopSlot()),
         patch.object(sdc_sync, "site", MagicMock(), create=True),
         patch.object(sdc_sync.pywikibot, "FilePage", return_value=MagicMock()),
+        patch.object(
+            sdc_sync, "_maintain_resolve_batch", return_value=["r1", "r3"]
+        ) as mock_batch,
         patch.object(sdc_sync, "_maintain_process_file") as mock_proc,
     ):
-        delta = sdc_sync._worker_maintain_group_task(group)
+        delta, timings_delta = sdc_sync._worker_maintain_group_task(group)
     # Both files of the group processed in this one worker; mediaid derived
-    # from pageid; embedded_id carried through.
+    # from pageid; embedded_id carried through; resolved in one batch.
+    mock_batch.assert_called_once()
     assert mock_proc.call_count == 2
     assert mock_proc.call_args_list[0].args[0] == "M1"
     assert mock_proc.call_args_list[1].args[0] == "M3"
+    assert [c.kwargs["result"] for c in mock_proc.call_args_list] == ["r1", "r3"]
     assert delta == {"sentinel": 1}
+    # _maintain_process_file is mocked, so no timed calls ran in the group.
+    assert timings_delta == {}
+
+
+def test_worker_maintain_group_task_falls_back_to_per_file_resolve():
+    """A failed batched resolve leaves each file to resolve on its own."""
+    from tools import sdc_sync
+
+    class _NoopSlot:
+        total_wait_seconds = 0
+
+        def acquire(self):
+            from contextlib import nullcontext
+
+            return nullcontext()
+
+    with (
+        patch.object(sdc_sync, "tracker", MagicMock()),
+        patch.object(sdc_sync, "_worker_slot_budget", _NoopSlot()),
+        patch.object(sdc_sync, "site", MagicMock(), create=True),
+        patch.object(sdc_sync.pywikibot, "FilePage", return_value=MagicMock()),
+        patch.object(
+            sdc_sync, "_maintain_resolve_batch", side_effect=RuntimeError("es down")
+        ),
+        patch.object(sdc_sync, "_maintain_process_file") as mock_proc,
+    ):
+        sdc_sync._worker_maintain_group_task([("t", 1, "id_a")])
+    assert mock_proc.call_args.kwargs["result"] is None
+
+
+def test_maintain_process_batch_falls_back_to_per_file_resolve():
+    """The streaming --cat path survives a failed batched resolve too: every
+    buffered file is still maintained, each resolving on its own."""
+    from tools import sdc_sync
+
+    files = [(f"M{i}", f"id{i}", MagicMock(), f"t{i}") for i in range(3)]
+    with (
+        patch.object(
+            sdc_sync, "_maintain_resolve_batch", side_effect=RuntimeError("es down")
+        ),
+        patch.object(sdc_sync, "_maintain_process_file") as mock_proc,
+    ):
+        sdc_sync._maintain_process_batch(files, tally=None)
+    assert [c.args[0] for c in mock_proc.call_args_list] == ["M0", "M1", "M2"]
+    assert all(c.kwargs["result"] is None for c in mock_proc.call_args_list)
+
+
+def test_maintain_resolve_batch_reads_urls_and_defers_scope():
+    from tools import sdc_sync
+
+    page = MagicMock()
+    page.text = "{{DPLA|url=http://x.org/record/100550}}"
+    captured = {}
+
+    def fake_resolve(files):
+        captured["files"] = files
+        return ["result"]
+
+    with (
+        patch.object(sdc_sync, "resolve_current_dpla_ids", side_effect=fake_resolve),
+        patch.object(sdc_sync, "_maintain_scope_filter", return_value="S") as scope,
+    ):
+        out = sdc_sync._maintain_resolve_batch([("M7", "deadid", page, "File:X.jpg")])
+        assert out == ["result"]
+        (req,) = captured["files"]
+        assert req.embedded_id == "deadid"
+        assert req.recorded_url == "http://x.org/record/100550"
+        scope.assert_not_called()  # lazy until the wildcard rung
+        assert req.scope_filter() == "S"
+        scope.assert_called_once_with("M7")
 
 
 def test_run_maintain_parallel_delegates_to_run_pool():
@@ -7077,6 +7224,33 @@ def test_partner_item_malformed_page_numbers_skips_ordinal(monkeypatch):
         assert calls == [], f"expected skip for malformed page_numbers={bad!r}"
 
 
+def test_partner_item_skipped_ordinals_still_count_as_ordinals(monkeypatch):
+    # The status readout takes the SDC file count from the checkpoint's ORDINALS
+    # when it can and from an awk count of "-- Ordinal N:" lines when it can't.
+    # A missing-pageid skip is its ordinal's only such line, so it must land in
+    # ORDINALS too; a malformed page_numbers skip comes after the ordinal was
+    # already counted and must not count it again.
+    from tools import sdc_sync
+
+    monkeypatch.setattr(sdc_sync, "_resolve_pageid_from_title", lambda t: None)
+    ordinals = {
+        "1": {"status": "UPLOADED", "pageid": 100, "title": "X - a.jpg"},
+        "2": {"status": "UPLOADED", "pageid": 0, "title": "X - b.jpg"},
+        "3": {
+            "status": "UPLOADED",
+            "pageid": 300,
+            "title": "X - c.jpg",
+            "page_numbers": "notalist",
+        },
+    }
+    calls = _drive_partner_item(monkeypatch, ordinals=ordinals, file_list=["u1"])
+    assert calls == [("M100", 1)]
+    increments = [c.args[0] for c in sdc_sync.tracker.increment.call_args_list]
+    assert increments.count(Result.ORDINALS) == 3
+    assert Result.SDC_ORDINALS_SKIPPED_MISSING_PAGEID in increments
+    assert Result.SDC_ORDINALS_SKIPPED_ERROR in increments
+
+
 def test_partner_item_explicit_null_page_numbers_skips_ordinal(monkeypatch):
     # Explicit null is distinct from an absent key: the fixed writer never emits
     # null (it writes [] for "no pages"), so a present null is untrusted → skip,
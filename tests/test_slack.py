@@ -24,7 +24,7 @@ from ingest_wikimedia.slack import (
     notify_sdc_complete,
     notify_upload_complete,
 )
-from ingest_wikimedia.tracker import Result, Tracker
+from ingest_wikimedia.tracker import Histogram, Result, Tracker
 
 
 def test_notify_phase_start_supports_sdc_sync_phase():
@@ -206,6 +206,25 @@ def test_summarize_log_counts_markers_and_tails_last_lines(tmp_path):
     assert "Failed: Upload error" in summary
 
 
+def test_summarize_log_takes_counts_from_the_events_stream(tmp_path):
+    """With an ``.events.jsonl`` twin, the newest tracker snapshot supplies
+    the counts; the text markers are only the fallback for older logs."""
+    log = tmp_path / "20260101-000000-nara-upload.log"
+    log.write_text(
+        "[INFO] Uploaded to https://commons.wikimedia.org/wiki/File:Foo.jpg\n"
+        "[ERROR] Failed: Upload error for xyz\n"
+    )
+    (tmp_path / "20260101-000000-nara-upload.events.jsonl").write_text(
+        '{"event": "tracker", "counts": {"UPLOADED": 1}, "final": false}\n'
+        '{"event": "item_end", "dpla_id": "a"}\n'
+        '{"event": "tracker", "counts": {"UPLOADED": 40, "FAILED": 3}, '
+        '"final": false}\n'
+    )
+    summary = _summarize_log(str(log))
+    assert "Counts so far: 40 uploaded, 3 failed" in summary
+    assert "1 uploaded" not in summary
+
+
 def test_summarize_log_missing_file_returns_none(tmp_path):
     assert _summarize_log(str(tmp_path / "nope.log")) is None
 
@@ -269,6 +288,21 @@ def test_notify_pipeline_fail_says_aborting_batch_when_last():
     assert "SIGKILL" in msg
 
 
+def test_notify_pipeline_fail_last_in_a_lane_does_not_end_the_batch():
+    """In a concurrent-lane session every lane's final target is exported
+    as last; its failure must not claim the whole batch is over."""
+    msg = _capture_message(
+        {
+            "DPLA_SLACK_BOT_TOKEN": "x",
+            "WIKIMEDIA_SESSION_LABEL": "nara+foo",
+            "WIKIMEDIA_TARGET_IS_LAST": "1",
+            "WIKIMEDIA_TARGET_LANES": "3",
+        }
+    )
+    assert "last target in its lane; other lanes continue" in msg
+    assert "aborting batch" not in msg
+
+
 def test_notify_pipeline_fail_treats_any_value_other_than_1_as_not_last():
     # Defensive: an empty or "0" value should be treated as "not last" so a
     # half-set env doesn't accidentally claim there are no more targets.
@@ -654,6 +688,7 @@ def _capture_completion_message(env: dict, tracker_counts: dict) -> dict:
     keyword arguments passed to `_post_completion_notice` (header,
     plain_text, stats_lines) so the test can assert on them."""
     tracker = MagicMock(spec=Tracker)
+    tracker.observations.return_value = 0  # no per-item timings
     tracker.count.side_effect = lambda result: tracker_counts.get(result, 0)
     captured: dict = {}
 
@@ -796,6 +831,7 @@ def test_notify_upload_complete_upload_only_retry_ignores_stale_download_log(
 def _capture_sdc_completion_message(env: dict, tracker_counts: dict) -> dict:
     """Mirror of `_capture_completion_message` for `notify_sdc_complete`."""
     tracker = MagicMock(spec=Tracker)
+    tracker.observations.return_value = 0  # no per-item timings
     tracker.count.side_effect = lambda result: tracker_counts.get(result, 0)
     captured: dict = {}
 
@@ -887,6 +923,7 @@ def test_notify_sdc_complete_reports_slot_wait_contention():
     workers) as a share of runtime — a stable whole-run contention figure,
     not a point-in-time slot-count snapshot."""
     tracker = MagicMock(spec=Tracker)
+    tracker.observations.return_value = 0  # no per-item timings
     # 240 worker-seconds aggregate ÷ 4 workers = 60s avg/worker; over a
     # 300s runtime that's 20%.
     counts = {Result.SDC_SLOT_WAIT_SECONDS: 240}
@@ -910,6 +947,7 @@ def test_notify_sdc_complete_reports_slot_wait_contention():
 def test_notify_sdc_complete_dry_run_adds_suffix():
     """`dry_run=True` appends the same italicized note as upload-complete."""
     tracker = MagicMock(spec=Tracker)
+    tracker.observations.return_value = 0  # no per-item timings
     tracker.count.return_value = 0
     captured: dict = {}
     with (
@@ -934,6 +972,7 @@ def test_notify_sdc_complete_skipped_without_token(monkeypatch, caplog):
     """Without DPLA_SLACK_BOT_TOKEN we must skip silently (just warn)."""
     monkeypatch.delenv("DPLA_SLACK_BOT_TOKEN", raising=False)
     tracker = MagicMock(spec=Tracker)
+    tracker.observations.return_value = 0  # no per-item timings
     tracker.count.return_value = 0
     with patch("ingest_wikimedia.slack._post_completion_notice") as mock_post:
         notify_sdc_complete(
@@ -980,6 +1019,7 @@ def _capture_sdc_completion(env: dict, tracker_counts: dict, maintain: bool) ->
     kwargs passed to _post_completion_notice so tests can assert on
     stats_lines."""
     tracker = MagicMock(spec=Tracker)
+    tracker.observations.return_value = 0  # no per-item timings
     tracker.count.side_effect = lambda result: tracker_counts.get(result, 0)
     captured: dict = {}
     with (
@@ -1020,3 +1060,47 @@ def test_notify_sdc_complete_non_maintain_omits_rename_counters():
     lines = captured["stats_lines"]
     assert not any(s.startswith("RENAMED:") for s in lines)
     assert not any(s.startswith("RENAME BLOCKED:") for s in lines)
+
+
+def test_notify_sdc_complete_reports_item_latency_and_throughput():
+    """A real Tracker with per-item observations yields the ITEM p50/p95 and
+    THROUGHPUT lines (items/min over the runtime), ahead of SLOT WAIT."""
+    tracker = Tracker()
+    for _ in range(18):
+        tracker.observe(Histogram.ITEM_SECONDS, 0.3)
+    for _ in range(2):
+        tracker.observe(Histogram.ITEM_SECONDS, 20.0)
+    captured: dict = {}
+    with (
+        patch.dict(os.environ, {"DPLA_SLACK_BOT_TOKEN": "x"}, clear=True),
+        patch("ingest_wikimedia.slack._post_completion_notice") as mock_post,
+    ):
+        mock_post.side_effect = lambda **kwargs: captured.update(kwargs)
+        notify_sdc_complete(tracker=tracker, partner_label="nara", elapsed_seconds=60.0)
+    stats = captured["stats_lines"]
+    assert "ITEM p50/p95:         512ms / 32.8s" in stats
+    assert "THROUGHPUT:           20.0 items/min" in stats
+
+
+def test_notify_upload_complete_throughput_includes_bytes_per_second():
+    tracker = Tracker()
+    tracker.observe(Histogram.ITEM_SECONDS, 2.0)
+    tracker.increment(Result.BYTES, 10 * 1024 * 1024)
+    captured: dict = {}
+    with (
+        patch.dict(os.environ, {"DPLA_SLACK_BOT_TOKEN": "x"}, clear=True),
+        patch("ingest_wikimedia.slack._post_completion_notice") as mock_post,
+    ):
+        mock_post.side_effect = lambda **kwargs: captured.update(kwargs)
+        notify_upload_complete(
+            tracker=tracker, partner_label="si", elapsed_seconds=10.0
+        )
+    line = next(s for s in captured["stats_lines"] if s.startswith("THROUGHPUT:"))
+    assert line == "THROUGHPUT:    6.0 items/min · 1.0 MB/s"
+
+
+def test_notify_upload_complete_omits_rate_lines_without_items():
+    captured = _capture_completion_message(
+        env={"DPLA_SLACK_BOT_TOKEN": "x"}, tracker_counts={Result.UPLOADED: 1}
+    )
+    assert not any(s.startswith("THROUGHPUT:") for s in captured["stats_lines"])
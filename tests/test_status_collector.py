@@ -0,0 +1,192 @@
+"""Tests for ``ingest_wikimedia.status_collector`` — the on-instance half of
+the single-SSM-call status post."""
+
+import json
+import os
+
+import pytest
+
+from ingest_wikimedia import partners
+from ingest_wikimedia import status_collector as sc
+
+
+@pytest.fixture
+def root(tmp_path, monkeypatch):
+    monkeypatch.setattr(partners, "INGEST_WIKI_ROOT", tmp_path)
+    return tmp_path
+
+
+def _log(root, pdir: str, name: str, text: str = "", mtime: int = 1_700_000_000):
+    logs = root / pdir / "logs"
+    logs.mkdir(parents=True, exist_ok=True)
+    path = logs / name
+    path.write_text(text)
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_parse_session_list():
+    assert sc.parse_session_list("NONE") == []
+    assert sc.parse_session_list("wikimedia-nara|1700\nwikimedia-bpl|x") == [
+        ("wikimedia-nara", 1700),
+        ("wikimedia-bpl", 0),
+    ]
+
+
+def test_log_facts_counts_upload_log_and_download_denominator(root):
+    _log(
+        root,
+        "bpl",
+        "20260101-000000-bpl+phillips-academy-upload.log",
+        "[INFO] t: DPLA ID: " + "a" * 32 + "\n"
+        "[INFO] t: Uploaded to https://commons.wikimedia.org/x\n"
+        "[INFO] t: Skipping: Already exists on commons\n"
+        "[INFO] t: worker slots busy; waiting\n",
+    )
+    _log(
+        root,
+        "bpl",
+        "20260101-000000-bpl+phillips-academy-download.log",
+        f"[INFO] t: Item {'a' * 32}: 7 ordinals\n",
+    )
+    (root / "bpl" / "bpl+phillips-academy.csv").write_text("a\nb\nc\n")
+
+    facts = sc.log_facts("bpl", "bpl+phillips-academy")
+    assert facts.log_file == "20260101-000000-bpl+phillips-academy-upload.log"
+    assert facts.log_mtime == 1_700_000_000
+    assert (facts.dpla_id_count, facts.uploaded_count, facts.skipped_count) == (
+        1,
+        1,
+        1,
+    )
+    assert (facts.total, facts.total_ordinals) == (3, 7)
+    assert facts.tail.splitlines()[-1].endswith("worker slots busy; waiting")
+
+
+def test_log_facts_ignores_sibling_label_and_reads_id_generation(root):
+    _log(
+        root,
+        "bpl",
+        "20260101-000000-bpl+phillips-academy-andover-upload.log",
+        mtime=1_700_000_100,
+    )
+    _log(
+        root,
+        "bpl",
+        "20260101-000000-bpl+phillips-academy-id-generation.log",
+        "1,000 items enumerated so far\n2,500 items enumerated so far\n",
+    )
+    facts = sc.log_facts("bpl", "bpl+phillips-academy")
+    assert facts.log_file.endswith("-bpl+phillips-academy-id-generation.log")
+    assert facts.enumerated == "2,500 items enumerated"
+    assert sc.log_facts("bpl", "bpl+someone-else") is None
+
+
+def test_collect_session_prefers_running_label_then_mtime(root, monkeypatch):
+    session = "wikimedia-bpl+phillips-academy+other"
+    labels = ["bpl+phillips-academy", "bpl+other"]
+    _log(root, "bpl", "20260101-000000-bpl+phillips-academy-sdc.log", mtime=100)
+    _log(root, "bpl", "20260101-000000-bpl+other-download.log", mtime=200)
+
+    monkeypatch.setattr(sc, "parse_session_labels", lambda _suffix: labels)
+    by_mtime = sc.collect_session(session, 50, {})
+    by_child = sc.collect_session(session, 50, {session: "bpl+phillips-academy"})
+    assert by_mtime["label"] == "bpl+other"
+    assert by_mtime["labels"] == labels
+    assert by_mtime["facts"]["log_file"].endswith("-bpl+other-download.log")
+    assert by_child["label"] == "bpl+phillips-academy"
+
+
+def test_collect_renders_one_entry_per_running_lane(root, monkeypatch):
+    session = "wikimedia-bpl+x-and-1-more"
+    _log(root, "bpl", "20260101-000000-bpl+x-upload.log", mtime=100)
+    _log(root, "pa", "20260101-000000-pa+y-download.log", mtime=200)
+    outputs = {
+        sc.TMUX_SESSIONS_CMD: f"{session}|50\n",
+        sc.RUNNING_ACTIVE_LABELS_CMD: (
+            f"{session}|*\n{session}|*|bpl+x\n{session}|*|pa+y\n"
+        ),
+    }
+    monkeypatch.setattr(sc, "_sh", lambda cmd: outputs.get(cmd, ""))
+    monkeypatch.setattr(sc, "parse_session_labels", lambda _s: ["bpl+x", "pa+y"])
+    entries = sc.collect()["sessions"]
+    assert [e["label"] for e in entries] == ["bpl+x", "pa+y"]
+    assert entries[0]["facts"]["log_file"].endswith("-bpl+x-upload.log")
+    assert entries[1]["facts"]["log_file"].endswith("-pa+y-download.log")
+
+
+def test_collect_session_no_log_and_unrecognised_name(root, monkeypatch):
+    monkeypatch.setattr(sc, "parse_session_labels", lambda s: ["bpl+x"] if s else [])
+    assert sc.collect_session("wikimedia-bpl+x", 0, {})["facts"] is None
+    unknown = sc.collect_session("wikimedia-", 0, {})
+    assert unknown["phase"] == "Unknown (unrecognised session name)"
+
+
+def test_collect_session_retry_without_partner_uses_newest_retry_log(root):
+    _log(root, "indiana", "20260101-000000-retry-indiana-upload.log", mtime=200)
+    _log(root, "bpl", "retry-bpl-upload.log", mtime=100)
+    entry = sc.collect_session("wikimedia-retry-7d", 0, {})
+    assert entry["label"] == "retry-indiana"
+    assert entry["facts"]["log_file"] == "20260101-000000-retry-indiana-upload.log"
+
+
+def _opened(log_name: str) -> int:
+    return int(sc._opened_epoch(log_name))
+
+
+def test_log_facts_reads_the_progress_checkpoint_instead_of_the_log(root):
+    """A checkpoint written since the log was opened supplies the counts
+    and the download denominator; the logs themselves are not scanned."""
+    upload = "20260101-000000-bpl+phillips-academy-upload.log"
+    download = "20260101-000000-bpl+phillips-academy-download.log"
+    opened = _opened(upload)
+    # Log text the awk pass would count differently, to prove it isn't read.
+    _log(root, "bpl", upload, "[INFO] t: DPLA ID: " + "a" * 32 + "\n", opened + 60)
+    _log(root, "bpl", download, "", opened + 60)
+    logs = root / "bpl" / "logs"
+    for phase, doc in (
+        (
+            "upload",
+            {
+                "status": "running",
+                "items_done": 40,
+                "counts": {
+                    "UPLOADED": 90,
+                    "SKIPPED": 20,
+                    "UPLOAD_SKIPPED_ON_COMMONS": 12,
+                    "UPLOAD_HAND_FIX": 2,
+                    "UPLOAD_MERGED_TO_CANONICAL": 3,
+                },
+            },
+        ),
+        (
+            "download",
+            {"status": "complete", "items_done": 50, "counts": {"ORDINALS": 300}},
+        ),
+    ):
+        path = logs / f"bpl+phillips-academy-{phase}.progress.json"
+        path.write_text(json.dumps(doc))
+        os.utime(path, (opened + 30, opened + 30))
+
+    facts = sc.log_facts("bpl", "bpl+phillips-academy")
+    assert (
+        facts.dpla_id_count,
+        facts.uploaded_count,
+        facts.skipped_count,
+        facts.counts_marker,
+        facts.hand_fix_count,
+        facts.merged_count,
+        facts.total_ordinals,
+    ) == (40, 90, 12, 0, 2, 3, 300)
+
+
+def test_log_facts_ignores_a_checkpoint_from_an_earlier_run(root):
+    log_name = "20260101-000000-nara-sdc.log"
+    opened = _opened(log_name)
+    _log(root, "nara", log_name, "[INFO] t: DPLA ID: " + "a" * 32 + "\n", opened)
+    stale = root / "nara" / "logs" / "nara-sdc.progress.json"
+    stale.write_text(json.dumps({"status": "complete", "items_done": 999}))
+    os.utime(stale, (opened - 60, opened - 60))
+
+    facts = sc.log_facts("nara", "nara")
+    assert (facts.dpla_id_count, facts.counts_marker) == (1, 0)
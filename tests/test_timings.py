@@ -0,0 +1,128 @@
+import pickle
+
+import pytest
+
+from ingest_wikimedia import timings as timings_mod
+from ingest_wikimedia.timings import (
+    BUCKET_BOUNDS,
+    Timings,
+    bucket_index,
+    format_seconds,
+    percentile,
+)
+
+
+@pytest.fixture
+def timings():
+    return Timings()
+
+
+def test_bucket_index_boundaries():
+    assert bucket_index(0.0) == 0
+    assert bucket_index(0.001) == 0
+    assert bucket_index(0.0011) == 1
+    assert bucket_index(0.5) == 9  # 0.512 s bucket
+    assert bucket_index(10_000) == len(BUCKET_BOUNDS)  # overflow
+
+
+def test_percentile_empty_histogram_is_none():
+    assert percentile([0] * (len(BUCKET_BOUNDS) + 1), 0.5) is None
+
+
+def test_percentile_reports_bucket_upper_bound():
+    buckets = [0] * (len(BUCKET_BOUNDS) + 1)
+    buckets[bucket_index(0.01)] = 90
+    buckets[bucket_index(3.0)] = 10
+    assert percentile(buckets, 0.5) == BUCKET_BOUNDS[bucket_index(0.01)]
+    assert percentile(buckets, 0.95) == BUCKET_BOUNDS[bucket_index(3.0)]
+
+
+def test_format_seconds():
+    assert format_seconds(0.0421) == "42ms"
+    assert format_seconds(2.34) == "2.3s"
+    assert format_seconds(250) == "4m10s"
+
+
+def test_record_accumulates_calls_and_seconds(timings: Timings):
+    timings.record("s3.get_item_file", 0.02)
+    timings.record("s3.get_item_file", 0.04)
+    assert timings.calls("s3.get_item_file") == 2
+    assert timings.seconds("s3.get_item_file") == pytest.approx(0.06)
+    assert timings.calls("never.called") == 0
+
+
+def test_time_context_manager_records_even_on_exception(timings: Timings):
+    with pytest.raises(RuntimeError):
+        with timings.time("commons.upload"):
+            raise RuntimeError("boom")
+    assert timings.calls("commons.upload") == 1
+
+
+def test_timed_decorator_records_into_module_registry(monkeypatch):
+    registry = Timings()
+    monkeypatch.setattr(timings_mod, "timings", registry)
+
+    @timings_mod.timed("es.search")
+    def search(x):
+        return x * 2
+
+    assert search(21) == 42
+    assert search.__name__ == "search"
+    assert registry.calls("es.search") == 1
+
+
+# ---------------------------------------------------------------------------
+# snapshot / diff / merge — same per-task delta contract as Tracker, so pool
+# workers can ship their timings back to the parent alongside counters.
+# ---------------------------------------------------------------------------
+
+
+def test_snapshot_is_independent_copy(timings: Timings):
+    timings.record("op", 0.1)
+    snap = timings.snapshot()
+    timings.record("op", 0.1)
+    assert snap["op"]["calls"] == 1
+    assert sum(snap["op"]["buckets"]) == 1
+
+
+def test_diff_omits_untouched_ops(timings: Timings):
+    timings.record("old", 0.1)
+    prior = timings.snapshot()
+    timings.record("new", 0.2)
+    timings.record("new", 0.2)
+    delta = timings.diff(prior)
+    assert set(delta) == {"new"}
+    assert delta["new"]["calls"] == 2
+    assert sum(delta["new"]["buckets"]) == 2
+
+
+def test_diff_then_merge_round_trip_across_pickle(timings: Timings):
+    worker = Timings()
+    prior = worker.snapshot()
+    worker.record("sdc.wbeditentity", 0.3)
+    worker.record("sdc.wbeditentity", 1.5)
+    delta = pickle.loads(pickle.dumps(worker.diff(prior)))
+
+    timings.record("sdc.wbeditentity", 0.3)
+    timings.merge(delta)
+    assert timings.calls("sdc.wbeditentity") == 3
+    assert timings.seconds("sdc.wbeditentity") == pytest.approx(2.1)
+    assert sum(timings.data["sdc.wbeditentity"]["buckets"]) == 3
+
+
+def test_merge_ignores_mismatched_bucket_layout(timings: Timings):
+    timings.merge({"op": {"calls": 1, "seconds": 1.0, "buckets": [1, 0]}})
+    assert timings.calls("op") == 0
+
+
+def test_str_sorted_by_total_time(timings: Timings):
+    timings.record("cheap", 0.01)
+    timings.record("expensive", 2.0)
+    lines = str(timings).splitlines()
+    assert lines[0] == "TIMINGS:"
+    assert lines[1].startswith("expensive: 1 calls, 2.0s total")
+    assert lines[2].startswith("cheap: 1 calls, 10ms total")
+
+
+def test_str_empty_registry(timings: Timings):
+    assert str(timings) == "TIMINGS:\n"
@@ -1,5 +1,14 @@
+import pickle
+
 import pytest
-from ingest_wikimedia.tracker import Tracker, Result
+from ingest_wikimedia import tracker as tracker_mod
+from ingest_wikimedia.timings import BUCKET_BOUNDS, bucket_index
+from ingest_wikimedia.tracker import (
+    WINDOW_RETENTION_MINUTES,
+    Histogram,
+    Tracker,
+    Result,
+)
 
 
 @pytest.fixture
@@ -120,3 +129,73 @@ def test_snapshot_diff_merge_round_trip(tracker: Tracker):
     # The pre-existing 100 from the worker's earlier task DID NOT
     # bleed into the parent — diff isolated only this-task's delta.
     assert tracker.count(Result.DOWNLOADED) == 0
+
+
+# ---------------------------------------------------------------------------
+# Histograms and per-minute rate windows — carried through the same
+# snapshot / diff / merge dict so pool workers need no extra plumbing.
+# ---------------------------------------------------------------------------
+
+
+def test_observe_and_percentiles(tracker: Tracker):
+    for _ in range(9):
+        tracker.observe(Histogram.ITEM_SECONDS, 0.3)
+    tracker.observe(Histogram.ITEM_SECONDS, 20.0)
+    assert tracker.observations(Histogram.ITEM_SECONDS) == 10
+    assert (
+        tracker.percentile(Histogram.ITEM_SECONDS, 0.5)
+        == BUCKET_BOUNDS[bucket_index(0.3)]
+    )
+    assert (
+        tracker.percentile(Histogram.ITEM_SECONDS, 0.95)
+        == BUCKET_BOUNDS[bucket_index(20.0)]
+    )
+
+
+def test_measure_records_even_when_body_raises(tracker: Tracker):
+    with pytest.raises(ValueError):
+        with tracker.measure(Histogram.ITEM_SECONDS):
+            raise ValueError("item crashed")
+    assert tracker.observations(Histogram.ITEM_SECONDS) == 1
+
+
+def test_rate_counts_trailing_window_only(tracker: Tracker, monkeypatch):
+    now = 1_000_000 * 60.0
+    monkeypatch.setattr(tracker_mod.time, "time", lambda: now - 3600)
+    tracker.increment(Result.UPLOADED, 100)  # an hour ago — outside 10m
+    monkeypatch.setattr(tracker_mod.time, "time", lambda: now)
+    tracker.increment(Result.UPLOADED, 60)
+    assert tracker.rate(Result.UPLOADED, window_seconds=600, now=now) == 0.1
+    # The run-long counter still has everything.
+    assert tracker.count(Result.UPLOADED) == 160
+
+
+def test_windows_are_pruned_to_retention(tracker: Tracker, monkeypatch):
+    for minute in range(WINDOW_RETENTION_MINUTES + 30):
+        monkeypatch.setattr(tracker_mod.time, "time", lambda m=minute: m * 60.0)
+        tracker.increment(Result.BYTES, 1)
+    assert len(tracker.windows[Result.BYTES]) <= WINDOW_RETENTION_MINUTES
+
+
+def test_histogram_and_window_round_trip_through_merge(tracker: Tracker):
+    """Worker-side observations reach the parent via the unchanged
+    snapshot → diff → merge cycle (and survive pickling across the Pool)."""
+    worker = Tracker()
+    worker.observe(Histogram.ITEM_SECONDS, 5.0)
+    prior = worker.snapshot()
+    worker.observe(Histogram.ITEM_SECONDS, 1.0)
+    worker.increment(Result.SDC_ITEMS_SYNCED)
+    delta = pickle.loads(pickle.dumps(worker.diff(prior)))
+
+    tracker.merge(delta)
+    assert tracker.observations(Histogram.ITEM_SECONDS) == 1
+    assert tracker.count(Result.SDC_ITEMS_SYNCED) == 1
+    assert tracker.rate(Result.SDC_ITEMS_SYNCED, window_seconds=60) > 0
+
+
+def test_diff_omits_unchanged_histograms_and_windows(tracker: Tracker):
+    tracker.observe(Histogram.ITEM_SECONDS, 1.0)
+    prior = tracker.snapshot()
+    delta = tracker.diff(prior)
+    assert Histogram.ITEM_SECONDS not in delta
+    assert "windows" not in delta
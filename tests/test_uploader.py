@@ -101,6 +101,7 @@ def test_sleeps_then_touches_each_newly_created_qid():
     assert qids_touched == {"Q1", "Q2", "Q3"}
     for call in touch_mock.call_args_list:
         assert call.args[0] is site
+        assert call.kwargs == {"purge": True}
 
 
 def test_per_qid_exception_does_not_stop_remaining_qids(caplog):
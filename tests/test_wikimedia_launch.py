@@ -6,6 +6,7 @@ tests cover the argument-validation surface added in PR 5b/5c so a typo
 in `--sdc-only` handling can't ship silently.
 """
 
+import json
 from unittest.mock import patch
 
 import pytest
@@ -1084,3 +1085,139 @@ def test_active_and_upcoming_labels_threads_session_created():
     assert kwargs.get("session_created") == 1699000000, (
         f"session_created must be forwarded to find_active_label; got kwargs={kwargs!r}"
     )
+
+
+class _ConfigServer:
+    """Serves one JSON body with an ETag, answering If-None-Match with 304."""
+
+    def __init__(self, body: bytes, etag: str):
+        import http.server
+        import threading
+
+        stub = self
+        self.body, self.etag, self.hits = body, etag, []
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.headers.get("If-None-Match") == stub.etag:
+                    stub.hits.append(304)
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                stub.hits.append(200)
+                self.send_response(200)
+                self.send_header("ETag", stub.etag)
+                self.send_header("Content-Length", str(len(stub.body)))
+                self.end_headers()
+                self.wfile.write(stub.body)
+
+            def log_message(self, *_a):
+                pass
+
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/i.json"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+
+@pytest.mark.skipif(
+    __import__("shutil").which("curl") is None, reason="needs curl on PATH"
+)
+def test_stage_config_cmd_reuses_content_addressed_copy(tmp_path, monkeypatch):
+    """Run the staging snippet for real: the first launch stores the body
+    under its hash behind a symlink; an unchanged config is a 304 that leaves
+    the resolved file untouched (so its snapshot stays valid); a new body is
+    swapped in; an invalid one never replaces the good copy."""
+    import os
+    import subprocess
+
+    import scripts.wikimedia_launch as launch_mod
+
+    cache = tmp_path / "config-cache"
+    local = tmp_path / "institutions_v2.json"
+    monkeypatch.setattr(launch_mod, "CONFIG_CACHE_DIR", str(cache))
+    server = _ConfigServer(b'{"Hub": {"Wikidata": "Q1"}}', '"v1"')
+
+    def stage():
+        cmd = launch_mod._stage_config_cmd(server.url, str(local)) + "true"
+        return subprocess.run(
+            ["bash", "-c", cmd], capture_output=True, text=True, check=True
+        ).stdout
+
+    try:
+        assert "staged" in stage()
+        first = os.path.realpath(local)
+        assert local.is_symlink() and first.startswith(str(cache))
+        assert json.loads(local.read_text()) == {"Hub": {"Wikidata": "Q1"}}
+        mtime = os.stat(local).st_mtime_ns
+
+        assert "unchanged" in stage()
+        assert server.hits == [200, 304]
+        assert os.path.realpath(local) == first
+        assert os.stat(local).st_mtime_ns == mtime
+
+        server.body, server.etag = b'{"Hub": {"Wikidata": "Q2"}}', '"v2"'
+        stage()
+        assert os.path.realpath(local) != first
+        assert json.loads(local.read_text()) == {"Hub": {"Wikidata": "Q2"}}
+
+        server.body, server.etag = b"<html>rate limited</html>", '"v3"'
+        assert "WARN" in stage()
+        assert json.loads(local.read_text()) == {"Hub": {"Wikidata": "Q2"}}
+        assert not list(cache.glob("*.tmp*"))
+    finally:
+        server.server.shutdown()
+        server.server.server_close()
+
+
+def test_target_lanes_group_by_partner_dir_in_launch_order():
+    from scripts.wikimedia_launch import _target_lanes
+
+    dirs = ["bpl", "nara", "bpl", "pa"]
+    assert _target_lanes(dirs, 3) == [[0, 2], [1], [3]]
+    assert _target_lanes(dirs, 1) == [[0, 1, 2, 3]]
+
+
+def test_assemble_pipeline_serial_is_the_historical_chain():
+    from scripts.wikimedia_launch import _assemble_pipeline
+
+    assert _assemble_pipeline("setup", ["a", "b"], [[0, 1]], 3) == "setup && { a; b; }"
+
+
+def test_assemble_pipeline_runs_lanes_concurrently_in_order(tmp_path, monkeypatch):
+    """Run the assembled script for real: lanes overlap (capped at the
+    concurrency), a lane's targets keep their order, and one lane's exports
+    don't leak into another."""
+    import subprocess
+    import time
+
+    import scripts.wikimedia_launch as launch_mod
+
+    monkeypatch.setattr(launch_mod, "TARGET_GATE_POLL_SECONDS", 0.05)
+    # No memory gate on a CI box that happens to be short on memory.
+    monkeypatch.setattr(launch_mod, "MEMORY_HEADROOM_PCT", 0)
+    out = tmp_path / "out"
+
+    def block(name: str) -> str:
+        return (
+            f"export X={name}; sleep 0.4;"
+            f" echo {name}-$X-${launch_mod.CONCURRENT_TARGETS_ENV} >> {out}"
+        )
+
+    script = launch_mod._assemble_pipeline(
+        "true",
+        [block("a1"), block("b"), block("a2"), block("c")],
+        [[0, 2], [1], [3]],
+        2,
+    )
+    script_path = tmp_path / "pipeline.sh"
+    script_path.write_text(script)
+    start = time.monotonic()
+    subprocess.run(["bash", str(script_path)], check=True)
+    elapsed = time.monotonic() - start
+
+    lines = out.read_text().split()
+    # Every lane sees the re-exec marker the conflict check looks for.
+    assert sorted(lines) == ["a1-a1-3", "a2-a2-3", "b-b-3", "c-c-3"]
+    assert lines.index("a1-a1-3") < lines.index("a2-a2-3")
+    # Serial would take 1.6 s; two lanes at a time finish in about 0.8 s.
+    assert elapsed < 1.4
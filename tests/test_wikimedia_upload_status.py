@@ -397,6 +397,16 @@ def test_sdc_counts_awk_extracts_fields_from_prefixed_log_lines():
         "[INFO] 16:43:00: maintain scope: 4000 files\n"
         "[INFO] 16:43:01: DPLA ID: aaaa\n"
         "[INFO] 16:43:02: -- Ordinal 1: M1\n"
+        # One count per ordinal: the recovered-pageid note and the malformed
+        # page_numbers skip each sit beside an ordinal's own "M<id>" line, while
+        # a missing-pageid skip is the only line its ordinal gets.
+        "[INFO] 16:43:02: -- Ordinal 2: upload-result pageid was 0; resolved to 5"
+        " via Commons title lookup.\n"
+        "[INFO] 16:43:02: -- Ordinal 2: M5 (X.jpg)\n"
+        "[WARNING] 16:43:02: -- Ordinal 2: malformed page_numbers 'x' in"
+        " upload-result.json; skipping ordinal\n"
+        "[WARNING] 16:43:02: -- Ordinal 3: missing/zero pageid (None) for 'Y.jpg'"
+        " and title→pageid fallback failed; skipping.\n"
         "[INFO] 16:43:03: Uploaded to https://commons.wikimedia.org/wiki/File:X.jpg\n"
         "[INFO] 16:43:04: DPLA ID: bbbb\n"
         "[INFO] 16:43:05: Skipping cccc 1: Already exists on commons.\n"
@@ -412,7 +422,7 @@ def test_sdc_counts_awk_extracts_fields_from_prefixed_log_lines():
     )
     assert result.returncode == 0, result.stderr
     # order: DPLA-ID, Uploaded, Skipping, COUNTS, Ordinal, HAND-FIX, MERGED, scope
-    assert result.stdout.split() == ["2", "1", "1", "1", "1", "3", "7", "4000"], (
+    assert result.stdout.split() == ["2", "1", "1", "1", "3", "3", "7", "4000"], (
         result.stdout
     )
 
@@ -1192,6 +1202,34 @@ def test_snapshot_running_active_labels_empty_output():
         assert snapshot_running_active_labels(client=None) == {}
 
 
+def test_snapshot_session_activity_reports_concurrent_lane_sessions():
+    """A session running concurrent target lanes reports ``name|*`` plus a
+    ``name|*|label`` line per lane mid-phase: it gets no single active label
+    but is listed (so the launcher treats all of its labels as in flight)
+    with the labels its readout renders a row for."""
+    from unittest.mock import patch
+
+    from ingest_wikimedia.session_state import snapshot_session_activity
+
+    with patch(
+        "ingest_wikimedia.session_state.ssm_run",
+        return_value=(
+            "wikimedia-bpl+x+pa+y|*\n"
+            "wikimedia-bpl+x+pa+y|*|bpl+x\n"
+            "wikimedia-bpl+x+pa+y|*|pa+y\n"
+            "wikimedia-nara+z|*\n"
+            "wikimedia-retry-7d-ohio|retry-ohio\n"
+        ),
+    ):
+        labels, concurrent = snapshot_session_activity(client=None)
+    assert labels == {"wikimedia-retry-7d-ohio": "retry-ohio"}
+    assert concurrent == {
+        "wikimedia-bpl+x+pa+y": ["bpl+x", "pa+y"],
+        "wikimedia-nara+z": [],
+    }
+    assert "wikimedia-nara+z" in concurrent
+
+
 def test_active_and_upcoming_labels_uses_provided_active_label_over_mtime():
     """Passing a pre-resolved ``active_label`` skips the mtime lookup —
     load-bearing property: callers pre-fetch the snapshot once, then
@@ -1333,7 +1371,7 @@ def test_post_to_slack_payload_contains_multiple_section_blocks_for_busy_day():
 
 
 def test_main_uses_subprocess_snapshot_over_mtime_for_active_label():
-    """When ``snapshot_running_active_labels`` returns an active label
+    """When ``snapshot_session_activity`` returns an active label
     for a session, ``fetch`` must use it — NOT fall through to
     :func:`find_active_label`'s log-mtime heuristic. This is the fix
     for the two-sessions-share-a-label bug: mtime can't distinguish
@@ -1374,12 +1412,15 @@ def test_main_uses_subprocess_snapshot_over_mtime_for_active_label():
             ],
         ),
         patch(
-            "scripts.wikimedia_upload_status.snapshot_running_active_labels",
-            return_value={
-                "wikimedia-texas+livingston-and-1-more": (
-                    "texas+botanical-research-institute-of-texas"
-                ),
-            },
+            "scripts.wikimedia_upload_status.snapshot_session_activity",
+            return_value=(
+                {
+                    "wikimedia-texas+livingston-and-1-more": (
+                        "texas+botanical-research-institute-of-texas"
+                    ),
+                },
+                {},
+            ),
         ),
         patch(
             "scripts.wikimedia_upload_status.find_active_label",
@@ -1409,6 +1450,71 @@ def test_main_uses_subprocess_snapshot_over_mtime_for_active_label():
     assert "Uploading (100 / 500 files, ~20.0%)" in text
 
 
+def test_main_renders_a_row_per_running_lane_of_a_concurrent_session():
+    """A concurrent-lane session has no single active label; every lane
+    with a running phase gets its own row instead of the freshest log's
+    label standing in for the whole session."""
+    from unittest.mock import patch
+
+    from scripts.wikimedia_upload_status import main
+
+    session = "wikimedia-bpl+x-and-2-more"
+    captured, fake_post = _capture_slack_post()
+
+    def phase(_ssm, _session, hub, label):
+        return f"Uploading {label}", 1700009999
+
+    with (
+        patch.dict(
+            "os.environ",
+            {"DPLA_SLACK_BOT_TOKEN": "tok-xxx", "NOTIFY_IF_IDLE": "false"},
+        ),
+        patch("scripts.wikimedia_upload_status.boto3.client", return_value=object()),
+        patch(
+            "scripts.wikimedia_upload_status.ssm_run",
+            return_value=f"{session}|1700000000\n",
+        ),
+        patch(
+            "scripts.wikimedia_upload_status.fetch_memory_snapshot",
+            return_value=None,
+        ),
+        patch(
+            "scripts.wikimedia_upload_status._fetch_slot_snapshot",
+            return_value=None,
+        ),
+        patch(
+            "scripts.wikimedia_upload_status.parse_session_labels",
+            return_value=["bpl+x", "pa+y", "nara+z"],
+        ),
+        patch(
+            "scripts.wikimedia_upload_status.snapshot_session_activity",
+            return_value=({}, {session: ["bpl+x", "nara+z"]}),
+        ),
+        patch(
+            "scripts.wikimedia_upload_status.find_active_label",
+            side_effect=AssertionError("lane rows must not guess by mtime"),
+        ),
+        patch(
+            "scripts.wikimedia_upload_status.get_phase_and_progress",
+            side_effect=phase,
+        ),
+        patch(
+            "scripts.wikimedia_upload_status.requests.post",
+            side_effect=fake_post,
+        ),
+    ):
+        main()
+
+    text = "\n".join(
+        b["text"]["text"]
+        for b in captured["payload"]["blocks"]
+        if b.get("type") == "section"
+    )
+    assert "bpl+x [1/3]" in text and "Uploading bpl+x" in text
+    assert "nara+z [3/3]" in text and "Uploading nara+z" in text
+    assert "pa+y" not in text
+
+
 def test_main_rows_use_display_id_from_fetch_not_session_name():
     """Regression: ``fetch()`` returns ``(display_id, phase)`` where
     ``display_id`` is the active label, NOT the tmux session name. The
@@ -2182,3 +2288,169 @@ def test_institution_label_no_log_does_not_run_hub_slug_fallback():
         )
     assert phase is None, phase  # caller (main) renders this as "Generating IDs"
     assert len(calls) == 1, "must not run the hub-slug fallback query for a '+' label"
+
+
+def test_main_uses_single_collector_call_when_available():
+    """Fast path: one SSM call runs the on-instance collector and the whole
+    readout — rows, batch position, memory and slot lines — is rendered from
+    its JSON document with no further SSM round trips."""
+    import json
+    from unittest.mock import patch
+
+    from scripts.wikimedia_upload_status import main
+
+    document = {
+        "sessions": [
+            {
+                "session": "wikimedia-texas+a-and-1-more",
+                "created": 1700000000,
+                "label": "texas+b",
+                "labels": ["texas+a", "texas+b"],
+                "facts": {
+                    "log_file": "20260101-000000-texas+b-upload.log",
+                    "now": 1700000100,
+                    "log_mtime": 1700000090,
+                    "dpla_id_count": 3,
+                    "uploaded_count": 5,
+                    "skipped_count": 1,
+                    "total": 10,
+                    "total_ordinals": 12,
+                    "some_future_field": 1,
+                },
+            },
+            {
+                "session": "wikimedia-nara",
+                "created": 1700000000,
+                "label": "nara",
+                "labels": ["nara"],
+                "facts": None,
+            },
+        ],
+        "memory": "8000 2000",
+        "slots": "TOTAL 24\n0\n0\n0\nCOUNT 0\n",
+    }
+    calls: list[str] = []
+
+    def fake_ssm_run(_client, cmd, **_kwargs):
+        calls.append(cmd)
+        return json.dumps(document)
+
+    captured, fake_post = _capture_slack_post()
+    with (
+        patch.dict(
+            "os.environ",
+            {"DPLA_SLACK_BOT_TOKEN": "tok-xxx", "NOTIFY_IF_IDLE": "false"},
+        ),
+        patch("scripts.wikimedia_upload_status.boto3.client", return_value=object()),
+        patch("scripts.wikimedia_upload_status.ssm_run", side_effect=fake_ssm_run),
+        patch("scripts.wikimedia_upload_status.requests.post", side_effect=fake_post),
+    ):
+        main()
+
+    assert len(calls) == 1 and "ingest_wikimedia.status_collector" in calls[0]
+    blocks = captured["payload"]["blocks"]
+    text = blocks[1]["text"]["text"]
+    assert "`texas+b [2/2]` Uploading (6 / 12 files, ~50.0%)" in text
+    assert "`nara` Generating IDs" in text
+    context = blocks[-1]["elements"][0]["text"]
+    assert "Worker slots: ~24 free of 24 (0 held)" in context
+    assert "Memory: 6,000 / 8,000 MB used (25% available)" in context
+
+
+def test_fetch_collected_falls_back_on_unusable_output():
+    """A box without the collector (SSM ``Failed``) or output SSM truncated
+    mid-document yields ``None`` so ``main`` takes the SSM fan-out path;
+    a timeout propagates."""
+    from unittest.mock import patch
+
+    import pytest
+
+    from scripts.wikimedia_upload_status import _fetch_collected
+
+    for effect in (RuntimeError("ended with Failed"), ['{"sessions": [']):
+        with patch("scripts.wikimedia_upload_status.ssm_run", side_effect=effect):
+            assert _fetch_collected(object()) is None
+    with patch(
+        "scripts.wikimedia_upload_status.ssm_run", side_effect=TimeoutError("slow")
+    ):
+        with pytest.raises(TimeoutError):
+            _fetch_collected(object())
+
+
+def test_row_from_collected_matches_fetch_fallbacks():
+    from scripts.wikimedia_upload_status import _row_from_collected
+
+    assert _row_from_collected(
+        {"session": "wikimedia-retry-7d-nara", "label": "retry-nara", "facts": None}
+    ) == ("retry-nara", "Starting...")
+    assert _row_from_collected(
+        {"session": "wikimedia-x", "label": "wikimedia-x", "phase": "Unknown (error)"}
+    ) == ("wikimedia-x", "Unknown (error)")
+    # A log that predates the session reads as no log yet.
+    stale = {
+        "session": "wikimedia-nara",
+        "created": 1700000000,
+        "label": "nara",
+        "labels": ["nara"],
+        "facts": {"log_file": "x-nara-upload.log", "log_mtime": 1600000000},
+    }
+    assert _row_from_collected(stale) == ("nara", "Generating IDs")
+
+
+def test_get_phase_and_progress_reads_checkpoints_over_ssm(tmp_path):
+    """The SSM path emits a fresh progress checkpoint in place of both awk
+    passes; run the real shell against a local copy of the partner dir."""
+    import json
+    import os
+    import subprocess
+    from unittest.mock import patch
+
+    from ingest_wikimedia import status_collector
+    from scripts.wikimedia_upload_status import get_phase_and_progress
+
+    upload = "20260101-000000-bpl+phillips-academy-upload.log"
+    download = "20260101-000000-bpl+phillips-academy-download.log"
+    opened = int(status_collector._opened_epoch(upload))
+    logs = tmp_path / "logs"
+    logs.mkdir()
+    (logs / upload).write_text("[INFO] t: DPLA ID: " + "a" * 32 + "\n")
+    (logs / download).write_text(f"[INFO] t: Item {'a' * 32}: 7 ordinals\n")
+    (tmp_path / "bpl+phillips-academy.csv").write_text("a\n" * 50)
+    for phase, doc in (
+        ("upload", {"status": "running", "items_done": 40, "counts": {"UPLOADED": 90}}),
+        ("download", {"status": "complete", "counts": {"ORDINALS": 300}}),
+    ):
+        path = logs / f"bpl+phillips-academy-{phase}.progress.json"
+        path.write_text(json.dumps(doc))
+        os.utime(path, (opened + 30, opened + 30))
+    base = "/home/ec2-user/ingest-wikimedia/bpl"
+
+    def run_locally(_client, command, **_kwargs):
+        if "tmux display-message" in command:
+            return f"{opened}\n{upload}\n"
+        return subprocess.run(
+            ["bash", "-c", command.replace(base, str(tmp_path))],
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+
+    with patch("scripts.wikimedia_upload_status.ssm_run", side_effect=run_locally):
+        phase, _ = get_phase_and_progress(
+            client=None,
+            session="wikimedia-bpl+phillips-academy",
+            hub="bpl",
+            label="bpl+phillips-academy",
+        )
+    assert phase.startswith("Uploading (90 / 300 files"), phase
+
+    # A checkpoint from an earlier run of the label: back to the awk counts.
+    for path in logs.glob("*.progress.json"):
+        os.utime(path, (opened - 60, opened - 60))
+    with patch("scripts.wikimedia_upload_status.ssm_run", side_effect=run_locally):
+        phase, _ = get_phase_and_progress(
+            client=None,
+            session="wikimedia-bpl+phillips-academy",
+            hub="bpl",
+            label="bpl+phillips-academy",
+        )
+    assert phase.startswith("Uploading (0 / 7 files"), phase
@@ -0,0 +1,56 @@
+"""Tests for ``ingest_wikimedia.wikitext_parse`` — the shared parse cache
+behind the SDC cleanup pass's template lookups."""
+
+import pytest
+
+from ingest_wikimedia import wikitext_parse
+from ingest_wikimedia.legacy_artwork import find_legacy_template
+from ingest_wikimedia.timings import timings
+from ingest_wikimedia.wikitext_normalize import canonicalize, has_dpla_metadata_template
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(wikitext_parse, "parse_cache", wikitext_parse.ParseCache())
+    timings.reset()
+    yield wikitext_parse.parse_cache
+    timings.reset()
+
+
+def test_parse_returns_shared_tree_and_counts_hits(fresh_cache):
+    first = wikitext_parse.parse("{{en|hello}}")
+    second = wikitext_parse.parse("{{en|hello}}")
+    assert first is second
+    assert (fresh_cache.hits, fresh_cache.misses) == (1, 1)
+    assert timings.calls(wikitext_parse.PARSE_OP) == 1
+    assert timings.calls(wikitext_parse.PARSE_CACHED_OP) == 1
+
+
+def test_parse_copy_is_private(fresh_cache):
+    shared = wikitext_parse.parse("{{en|hello}}")
+    private = wikitext_parse.parse_copy("{{en|hello}}")
+    assert private is not shared
+    private.remove(private.filter_templates()[0])
+    assert str(wikitext_parse.parse("{{en|hello}}")) == "{{en|hello}}"
+
+
+def test_lru_evicts_least_recently_used():
+    cache = wikitext_parse.ParseCache(maxsize=2)
+    a = cache.parse("a")
+    cache.parse("b")
+    assert cache.parse("a") is a  # refreshes "a"
+    cache.parse("c")  # evicts "b"
+    assert len(cache) == 2
+    assert cache.parse("a") is a
+    cache.parse("b")
+    assert cache.misses == 4
+
+
+def test_call_sites_share_one_parse_and_mutators_do_not_corrupt_it(fresh_cache):
+    text = "== {{int:filedesc}} ==\n{{DPLA metadata\n  | title = X\n}}\n"
+    assert has_dpla_metadata_template(text)
+    assert has_dpla_metadata_template(text)
+    assert find_legacy_template(text) is None
+    assert (fresh_cache.hits, fresh_cache.misses) == (2, 1)
+    assert "| title = X\n" in canonicalize(text)
+    assert str(wikitext_parse.parse(text)) == text
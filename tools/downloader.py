@@ -2,13 +2,23 @@ import json
 import logging
 import os
 import time
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
+from itertools import islice
+from typing import NamedTuple
 
 from ingest_wikimedia.dpla import (
     MEDIA_MASTER_FIELD_NAME,
     IIIF_MANIFEST_FIELD_NAME,
 )
-from ingest_wikimedia.iiif import IIIF
+from ingest_wikimedia.iiif import (
+    IIIF,
+    MANIFEST_ETAG_METADATA,
+    MANIFEST_LAST_MODIFIED_METADATA,
+    ManifestFetch,
+)
 from ingest_wikimedia.localfs import LocalFS
 from ingest_wikimedia.s3 import S3_BUCKET, S3_KEY_METADATA, S3Client, FILE_LIST_TXT
 from typing import IO
@@ -24,16 +34,22 @@ from ingest_wikimedia.common import (
     CHECKSUM,
     CONTENT_TYPE,
 )
+from ingest_wikimedia import events, progress
 from ingest_wikimedia.logs import setup_logging
 from ingest_wikimedia.slack import notify_download_complete, notify_phase_start
+from ingest_wikimedia.timings import timings
 from ingest_wikimedia.tools_context import ToolsContext
-from ingest_wikimedia.tracker import Result, Tracker
+from ingest_wikimedia.tracker import Histogram, Result, Tracker
 from ingest_wikimedia.web import Web
 from ingest_wikimedia.wikimedia import check_content_type
 
 DOWNLOAD_BUFFER_SIZE = 4 * 1024 * 1024  # 4 MB
 CREDENTIAL_RETRY_MAX = 3
 CREDENTIAL_RETRY_BASE_DELAY_SECS = 5
+# Items whose media URLs are resolved ahead of the one downloading. Each
+# look-ahead item holds at most one manifest fetch in flight, so this is
+# also the extra concurrency a partner's IIIF server sees.
+PREFETCH_DEPTH = 4
 
 
 class Downloader:
@@ -154,16 +170,19 @@ class Downloader:
                     except (TypeError, ValueError):
                         pass  # zero-byte stub or unreadable length — fall through to upload
 
-                with tqdm(
-                    total=os.stat(f.name).st_size,
-                    desc="S3 Upload",
-                    leave=False,
-                    unit="B",
-                    unit_divisor=1024,
-                    unit_scale=True,
-                    delay=2,
-                    ncols=100,
-                ) as t:
+                with (
+                    tqdm(
+                        total=os.stat(f.name).st_size,
+                        desc="S3 Upload",
+                        leave=False,
+                        unit="B",
+                        unit_divisor=1024,
+                        unit_scale=True,
+                        delay=2,
+                        ncols=100,
+                    ) as t,
+                    timings.time("s3.upload_media"),
+                ):
                     obj.upload_fileobj(
                         Fileobj=f,
                         ExtraArgs={
@@ -198,24 +217,25 @@ class Downloader:
         """
         bytes_written = 0
         try:
-            response = self.http_session.get(media_url, stream=True)
-            response.raise_for_status()
-            total_size = int(response.headers.get("content-length", 0))
-            with tqdm(
-                total=total_size,
-                desc="HTTP Download",
-                leave=False,
-                unit="B",
-                unit_divisor=1024,
-                unit_scale=True,
-                delay=2,
-                ncols=100,
-            ) as t:
-                with open(local_file, "wb") as f:
-                    for chunk in response.iter_content(DOWNLOAD_BUFFER_SIZE):
-                        t.update(len(chunk))
-                        f.write(chunk)
-                        bytes_written += len(chunk)
+            with timings.time("http.download"):
+                response = self.http_session.get(media_url, stream=True)
+                response.raise_for_status()
+                total_size = int(response.headers.get("content-length", 0))
+                with tqdm(
+                    total=total_size,
+                    desc="HTTP Download",
+                    leave=False,
+                    unit="B",
+                    unit_divisor=1024,
+                    unit_scale=True,
+                    delay=2,
+                    ncols=100,
+                ) as t:
+                    with open(local_file, "wb") as f:
+                        for chunk in response.iter_content(DOWNLOAD_BUFFER_SIZE):
+                            t.update(len(chunk))
+                            f.write(chunk)
+                            bytes_written += len(chunk)
 
         except Exception as e:
             raise RuntimeError(f"Failed downloading {media_url} to local") from e
@@ -392,6 +412,15 @@ class Downloader:
         except Exception as e:
             self.tracker.increment(Result.FAILED)
             logging.warning(f"Failed: {dpla_id} {ordinal}", exc_info=e)
+            events.emit(
+                "ordinal",
+                dpla_id=dpla_id,
+                ordinal=ordinal,
+                status="FAILED",
+                error_class=type(e.__cause__ or e).__name__,
+                error=str(e.__cause__ or e),
+                url=media_url,
+            )
             return "FAILED"
 
         finally:
@@ -403,6 +432,139 @@ class Downloader:
         # tallies sound if the control flow ever evolves.
         return "FAILED"
 
+    def load_item_inputs(
+        self,
+        partner: str,
+        dpla_id: str,
+        overwrite: bool,
+        max_age_days: int | None,
+    ) -> "ItemInputs":
+        """
+        Performs every remote read :meth:`process_item` needs to resolve an
+        item's media URLs — staged metadata, cached file list and its age,
+        and for a stale IIIF item the (conditional) manifest fetch — and
+        nothing else: no logging of outcomes, no counters, no writes.
+
+        Being side-effect free is what lets :class:`ItemPrefetcher` run it
+        on a background thread for the next few items while the current
+        item's media downloads; :meth:`process_item` then applies the
+        outcome on the main thread, inside that item's log and event scope.
+        That includes a failed manifest read, which comes back as
+        :attr:`ManifestFetch.error` rather than being logged here.
+
+        With a cached file list, the stored manifest's ETag / Last-Modified
+        (kept as ``iiif.json`` object metadata) go out as a conditional GET.
+        ``--overwrite`` or no list yet fetches unconditionally.
+        """
+        item_metadata_str = self.s3_client.get_item_metadata(partner, dpla_id)
+        item_metadata = None
+        if item_metadata_str:
+            try:
+                candidate = json.loads(item_metadata_str)
+                if candidate.get("_staged_by_get_ids_es"):
+                    item_metadata = candidate
+            except (json.JSONDecodeError, AttributeError):
+                pass  # Malformed metadata — treated as absent by the caller.
+
+        if (
+            item_metadata is None
+            or MEDIA_MASTER_FIELD_NAME in item_metadata
+            or IIIF_MANIFEST_FIELD_NAME not in item_metadata
+        ):
+            return ItemInputs(item_metadata)
+
+        cached_urls = self.s3_client.get_file_list(partner, dpla_id)
+        use_cache = not overwrite and bool(cached_urls)
+        if use_cache and max_age_days is not None:
+            file_list_path = self.s3_client.get_item_s3_path(
+                dpla_id, FILE_LIST_TXT, partner
+            )
+            cache_age = self._s3_key_age_days(file_list_path)
+            # cache_age is None means the key vanished since get_file_list
+            # read it (TOCTOU); treat as stale so the manifest is re-fetched.
+            if cache_age is None or cache_age >= max_age_days:
+                use_cache = False
+        if use_cache:
+            return ItemInputs(item_metadata, cached_urls, use_cache=True)
+
+        if overwrite:
+            cached_urls = []
+        stored = (
+            self.s3_client.get_iiif_manifest_metadata(partner, dpla_id)
+            if cached_urls
+            else None
+        ) or {}
+        fetched = self.iiif.fetch_iiif_manifest(
+            get_str(item_metadata, IIIF_MANIFEST_FIELD_NAME),
+            etag=stored.get(MANIFEST_ETAG_METADATA),
+            last_modified=stored.get(MANIFEST_LAST_MODIFIED_METADATA),
+        )
+        return ItemInputs(item_metadata, cached_urls, False, stored, fetched)
+
+    def refresh_iiif_file_list(
+        self, partner: str, dpla_id: str, inputs: "ItemInputs"
+    ) -> list[str] | None:
+        """
+        Applies a stale IIIF item's manifest fetch (see
+        :meth:`load_item_inputs`) to its stored file list.
+
+        A ``304`` — or a ``200`` whose body is byte-identical to the stored
+        manifest, for servers that ignore the validators — means nothing
+        changed: the cached list is returned without re-parsing the manifest
+        or rewriting ``file-list.txt`` / ``iiif.json``. Refresh sweeps over
+        CONTENTdm-heavy hubs are dominated by exactly that case.
+
+        Only a changed (or first-seen) manifest is stored, with its new
+        validators, parsed and written out as a fresh file list. An
+        unchanged manifest deliberately leaves ``file-list.txt``'s age alone,
+        so the next sweep revalidates it again — a body-less 304 is cheap.
+        Returns None after counting a failure.
+        """
+        manifest_url = get_str(inputs.item_metadata, IIIF_MANIFEST_FIELD_NAME)
+        cached_urls = inputs.cached_urls or []
+        stored = inputs.stored_manifest or {}
+        fetched = inputs.fetched
+        if fetched is not None and fetched.not_modified:
+            logging.info(
+                f"IIIF manifest for {dpla_id} not modified; reusing file list."
+            )
+            self.tracker.increment(Result.IIIF_MANIFEST_UNCHANGED)
+            return cached_urls
+        if fetched is None or not fetched.manifest:
+            if fetched is not None and fetched.error:
+                logging.warning(fetched.error)
+            logging.warning(
+                f"Could not retrieve IIIF manifest for {dpla_id}: {manifest_url}"
+            )
+            self.tracker.increment(Result.FAILED)
+            return None
+
+        manifest_json = json.dumps(fetched.manifest)
+        validators = fetched.validators()
+        if cached_urls and stored.get(CHECKSUM) == LocalFS.get_bytes_hash(
+            manifest_json
+        ):
+            logging.info(f"IIIF manifest for {dpla_id} unchanged; reusing file list.")
+            self.tracker.increment(Result.IIIF_MANIFEST_UNCHANGED)
+            if validators and any(stored.get(k) != v for k, v in validators.items()):
+                # Same body, new validators (e.g. the server only started
+                # sending an ETag): store them so the next sweep gets a 304.
+                self.s3_client.write_iiif_manifest(
+                    partner, dpla_id, manifest_json, validators
+                )
+            return cached_urls
+
+        self.s3_client.write_iiif_manifest(partner, dpla_id, manifest_json, validators)
+        media_urls = self.iiif.get_iiif_urls(fetched.manifest)
+        if not media_urls:
+            logging.warning(
+                f"No image URLs extracted from IIIF manifest for {dpla_id}: {manifest_url}"
+            )
+            self.tracker.increment(Result.FAILED)
+            return None
+        self.s3_client.write_file_list(partner, dpla_id, media_urls)
+        return media_urls
+
     def process_item(
         self,
         overwrite: bool,
@@ -412,6 +574,7 @@ class Downloader:
         dpla_id: str,
         sleep_secs: float,
         max_age_days: int | None = 365,
+        prefetched: "Future[ItemInputs] | None" = None,
     ) -> None:
         """
         For every item, tries to get a list of files for it and stores the
@@ -421,18 +584,20 @@ class Downloader:
         runtime eligibility check is performed here. If staged metadata is
         missing or lacks the get-ids-es marker, the item is skipped — re-run
         get-ids-es to regenerate it.
+
+        ``prefetched`` is this item's :meth:`load_item_inputs` already
+        running on an :class:`ItemPrefetcher` thread; without it the reads
+        happen inline.
         """
 
         try:
-            item_metadata_str = self.s3_client.get_item_metadata(partner, dpla_id)
-            item_metadata = None
-            if item_metadata_str:
-                try:
-                    candidate = json.loads(item_metadata_str)
-                    if candidate.get("_staged_by_get_ids_es"):
-                        item_metadata = candidate
-                except (json.JSONDecodeError, AttributeError):
-                    pass  # Malformed metadata — treated as absent; handled below.
+            if prefetched is not None:
+                inputs = prefetched.result()
+            else:
+                inputs = self.load_item_inputs(
+                    partner, dpla_id, overwrite, max_age_days
+                )
+            item_metadata = inputs.item_metadata
 
             if item_metadata is None:
                 # Metadata missing or lacks the get-ids-es staging marker.
@@ -446,39 +611,12 @@ class Downloader:
                 self.s3_client.write_file_list(partner, dpla_id, media_urls)
 
             elif IIIF_MANIFEST_FIELD_NAME in item_metadata:
-                cached_urls = self.s3_client.get_file_list(partner, dpla_id)
-                use_cache = not overwrite and bool(cached_urls)
-                if use_cache and max_age_days is not None:
-                    file_list_path = self.s3_client.get_item_s3_path(
-                        dpla_id, FILE_LIST_TXT, partner
-                    )
-                    cache_age = self._s3_key_age_days(file_list_path)
-                    # cache_age is None means the key vanished since get_file_list
-                    # read it (TOCTOU); treat as stale so the manifest is re-fetched.
-                    if cache_age is None or cache_age >= max_age_days:
-                        use_cache = False
-                if use_cache:
-                    media_urls = cached_urls
+                if inputs.use_cache:
+                    media_urls = inputs.cached_urls
                 else:
-                    manifest_url = get_str(item_metadata, IIIF_MANIFEST_FIELD_NAME)
-                    manifest = self.iiif.get_iiif_manifest(manifest_url)
-                    if not manifest:
-                        logging.warning(
-                            f"Could not retrieve IIIF manifest for {dpla_id}: {manifest_url}"
-                        )
-                        self.tracker.increment(Result.FAILED)
+                    media_urls = self.refresh_iiif_file_list(partner, dpla_id, inputs)
+                    if media_urls is None:
                         return
-                    self.s3_client.write_iiif_manifest(
-                        partner, dpla_id, json.dumps(manifest)
-                    )
-                    media_urls = self.iiif.get_iiif_urls(manifest)
-                    if not media_urls:
-                        logging.warning(
-                            f"No image URLs extracted from IIIF manifest for {dpla_id}: {manifest_url}"
-                        )
-                        self.tracker.increment(Result.FAILED)
-                        return
-                    self.s3_client.write_file_list(partner, dpla_id, media_urls)
 
             else:
                 # item metadata has neither media_master nor IIIF manifest field
@@ -560,6 +698,7 @@ class Downloader:
         # honest about how much of the work was real downloads vs how
         # much was already-staged-skip churn.
         if not dry_run:
+            self.tracker.increment(Result.ORDINALS, len(media_urls))
             logging.info(
                 f"Item {dpla_id}: {len(media_urls)} ordinals"
                 f" (skipped={item_counts['SKIPPED']},"
@@ -570,6 +709,90 @@ class Downloader:
             )
 
 
+class ItemInputs(NamedTuple):
+    """The remote reads behind one item's media-URL resolution — see
+    :meth:`Downloader.load_item_inputs`. ``item_metadata`` None means no
+    valid staged metadata; the IIIF fields are only set for manifest items.
+    """
+
+    item_metadata: dict | None
+    cached_urls: list[str] | None = None
+    use_cache: bool = False
+    stored_manifest: dict[str, str] | None = None
+    fetched: ManifestFetch | None = None
+
+
+class ItemPrefetcher:
+    """Runs :meth:`Downloader.load_item_inputs` up to ``depth`` items ahead
+    of the item being downloaded, on a small thread pool.
+
+    Resolving an item's media URLs is dominated by remote latency — the
+    staged-metadata and file-list S3 reads and, for IIIF items, a manifest
+    GET that takes 1–3 s on CONTENTdm — all of which used to sit on the
+    critical path between one item's last media download and the next
+    item's first. Iterating a prefetcher yields ``(dpla_id, future)`` in
+    input order while the following items' reads are already in flight.
+
+    Only reads happen off the main thread (the shared S3 and HTTP clients
+    are already used from thread pools elsewhere); all outcome logging,
+    counters and writes stay in :meth:`Downloader.process_item`, so each
+    item's log lines and events still land inside its own ``DPLA ID:``
+    scope. ``depth`` 0 disables prefetching.
+    """
+
+    def __init__(
+        self,
+        downloader: "Downloader",
+        partner: str,
+        dpla_ids: list[str],
+        overwrite: bool,
+        max_age_days: int | None,
+        depth: int = PREFETCH_DEPTH,
+    ):
+        self.downloader = downloader
+        self.partner = partner
+        self.dpla_ids = dpla_ids
+        self.overwrite = overwrite
+        self.max_age_days = max_age_days
+        self.depth = depth
+
+    def __len__(self) -> int:
+        return len(self.dpla_ids)
+
+    def _submit(self, pool: ThreadPoolExecutor, dpla_id: str) -> Future:
+        return pool.submit(
+            self.downloader.load_item_inputs,
+            self.partner,
+            dpla_id,
+            self.overwrite,
+            self.max_age_days,
+        )
+
+    def __iter__(self) -> Iterator[tuple[str, Future | None]]:
+        if self.depth <= 0:
+            for dpla_id in self.dpla_ids:
+                yield dpla_id, None
+            return
+        pool = ThreadPoolExecutor(max_workers=self.depth, thread_name_prefix="prefetch")
+        try:
+            ids = iter(self.dpla_ids)
+            # The current item plus ``depth`` look-ahead items in flight.
+            window = deque(
+                (dpla_id, self._submit(pool, dpla_id))
+                for dpla_id in islice(ids, self.depth + 1)
+            )
+            while window:
+                dpla_id, future = window.popleft()
+                next_id = next(ids, None)
+                if next_id is not None:
+                    window.append((next_id, self._submit(pool, next_id)))
+                yield dpla_id, future
+        finally:
+            # An aborted run must not block on look-ahead fetches nobody
+            # will consume.
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
 @click.command()
 @click.argument("ids-file", type=click.File("r"))
 @click.argument("partner")
@@ -604,6 +827,16 @@ class Downloader:
         " are downloaded the same way."
     ),
 )
+@click.option(
+    "--prefetch-depth",
+    default=PREFETCH_DEPTH,
+    type=click.IntRange(min=0),
+    help=(
+        "Resolve media URLs (staged metadata, IIIF manifests) for this many"
+        f" upcoming items in the background (default: {PREFETCH_DEPTH}; 0"
+        " disables). Forced to 0 when --sleep is set."
+    ),
+)
 def main(
     ids_file: IO,
     partner: str,
@@ -614,10 +847,17 @@ def main(
     max_age_days: int | None,
     notify_complete: bool,
     maintain: bool,
+    prefetch_depth: int,
 ):
     setup_logging(partner, "download", logging.INFO)
     start_time = time.time()
     tools_context = ToolsContext.init(partner)
+    if sleep and prefetch_depth:
+        # --sleep paces requests to the partner's server one at a time;
+        # look-ahead manifest GETs on the prefetch threads would run
+        # alongside the media downloads and defeat it.
+        logging.info("--sleep is set; item prefetch disabled.")
+        prefetch_depth = 0
 
     downloader = Downloader(
         partner,
@@ -639,23 +879,38 @@ def main(
     notify_phase_start(partner, "download")
     logging.info(f"Starting download for {partner}")
 
+    progress_status = "aborted"
     try:
         local_fs.setup_temp_dir()
         dpla_ids = load_ids(ids_file)
-        for dpla_id in tqdm(dpla_ids, desc="Downloading Items", unit="Item", ncols=100):
+        progress.start(partner, "download", len(dpla_ids), tracker)
+        prefetcher = ItemPrefetcher(
+            downloader, partner, dpla_ids, overwrite, max_age_days, prefetch_depth
+        )
+        for dpla_id, prefetched in tqdm(
+            prefetcher, desc="Downloading Items", unit="Item", ncols=100
+        ):
             logging.info(f"DPLA ID: {dpla_id}")
-            downloader.process_item(
-                overwrite,
-                dry_run,
-                verbose,
-                partner,
-                dpla_id,
-                sleep,
-                max_age_days,
-            )
+            with tracker.measure(Histogram.ITEM_SECONDS), events.item(dpla_id):
+                downloader.process_item(
+                    overwrite,
+                    dry_run,
+                    verbose,
+                    partner,
+                    dpla_id,
+                    sleep,
+                    max_age_days,
+                    prefetched,
+                )
+            events.maybe_emit_tracker(tracker)
+            progress.tick()
+        progress_status = "complete"
 
     finally:
         elapsed = time.time() - start_time
+        events.emit_phase_end(tracker, timings)
+        progress.finish(progress_status)
+        logging.info("\n" + str(timings))
         logging.info("\n" + str(tracker))
         logging.info(f"{elapsed} seconds.")
         local_fs.cleanup_temp_dir()
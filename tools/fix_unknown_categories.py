@@ -7,24 +7,39 @@ For each iteration, take one file from the category, determine its institution,
 create the category infrastructure if needed, then touch all Commons file pages
 for that institution via search — which triggers the Wikidata Infobox template
 to re-evaluate and re-categorize them. Repeat until the category is empty.
+
+``--bulk`` drains it in one pass instead: enumerate the category once, load
+the members' wikitext in batches, group the files by (institution QID, hub
+QID), ensure each institution's category once, and null-edit the grouped
+files themselves on a small thread pool — no per-institution restart of the
+category listing and no CirrusSearch. Progress is checkpointed to a cursor
+file after every preload batch and every group, so an interrupted run resumes
+without re-reading or re-touching what it already handled (delete the file to
+start over). A pass that runs to the end deletes the cursor: files it touched
+leave the category once re-rendered, and anything still there — stuck,
+unparseable, or returned to it later — is looked at afresh next time.
 """
 
+import json
 import logging
+import os
 import re
 import time
+from collections import defaultdict
 
 import click
 import pywikibot
 
-from ingest_wikimedia.categories import CategoryEnsurer, touch_institution_files
+from ingest_wikimedia.categories import (
+    UNKNOWN_INSTITUTION_CATEGORY,
+    CategoryEnsurer,
+    rerender_pages,
+    touch_institution_files,
+    touch_pages,
+)
 from ingest_wikimedia.logs import setup_logging
 from ingest_wikimedia.wikimedia import get_site, get_wikidata_site
 
-UNKNOWN_INSTITUTION_CATEGORY = (
-    "Category:Media contributed by the Digital Public Library of America"
-    " with unknown institution"
-)
-
 # Matches: {{ Institution | ... | wikidata = Q12345 | ... }} (parameter order–agnostic)
 _INSTITUTION_QID_RE = re.compile(
     r"\{\{\s*Institution\b(?:(?!\}\}).)*?\|\s*wikidata\s*=\s*(Q\d+)",
@@ -37,6 +52,14 @@ _HUB_QID_RE = re.compile(
 )
 
 
+# Members whose wikitext is fetched per API request in --bulk mode.
+PRELOAD_BATCH = 50
+# Concurrent null edits in --bulk mode (still bounded by pywikibot's put
+# throttle; see touch_pages).
+TOUCH_WORKERS = 4
+DEFAULT_CURSOR_FILE = "fix-unknown-categories.cursor.json"
+
+
 def _extract_institution_qid(wikitext: str) -> str | None:
     match = _INSTITUTION_QID_RE.search(wikitext)
     return match.group(1) if match else None
@@ -47,9 +70,154 @@ def _extract_hub_qid(wikitext: str) -> str | None:
     return match.group(1) if match else None
 
 
+def _load_cursor(path: str) -> dict:
+    """The ``--bulk`` checkpoint of an unfinished pass: titles already
+    touched or found unparseable, institution QIDs already ensured, and
+    ``grouped`` — title → ``[institution QID, hub QID]`` for members whose
+    wikitext was already read. Empty when absent."""
+    try:
+        with open(path) as f:
+            raw = json.load(f)
+    except FileNotFoundError:
+        raw = {}
+    cursor: dict = {
+        k: set(raw.get(k, [])) for k in ("touched", "unparseable", "ensured")
+    }
+    cursor["grouped"] = dict(raw.get("grouped", {}))
+    return cursor
+
+
+def _save_cursor(path: str, cursor: dict) -> None:
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(
+            {k: v if isinstance(v, dict) else sorted(v) for k, v in cursor.items()},
+            f,
+        )
+    os.replace(tmp, path)
+
+
+def group_members_by_institution(
+    commons_site, pages, cursor: dict, cursor_path: str
+) -> dict[tuple[str, str], list]:
+    """Group ``pages`` by (institution QID, hub QID).
+
+    Members the cursor already grouped are placed from it; the rest have
+    their wikitext loaded in batches, and the cursor is saved after each
+    batch so an interruption mid-preload keeps what was read. Pages neither
+    Q-ID can be read from go to the cursor's ``unparseable``."""
+    groups: dict[tuple[str, str], list] = defaultdict(list)
+    to_load = []
+    for page in pages:
+        known = cursor["grouped"].get(page.title())
+        if known:
+            groups[(known[0], known[1])].append(page)
+        else:
+            to_load.append(page)
+    loaded = 0
+    for page in commons_site.preloadpages(to_load, groupsize=PRELOAD_BATCH):
+        title = page.title()
+        wikitext = page.text if page.exists() else ""
+        institution_qid = _extract_institution_qid(wikitext)
+        hub_qid = _extract_hub_qid(wikitext)
+        if institution_qid and hub_qid:
+            groups[(institution_qid, hub_qid)].append(page)
+            cursor["grouped"][title] = [institution_qid, hub_qid]
+        else:
+            logging.warning(f"Could not extract Q-IDs from '{title}' — skipping.")
+            cursor["unparseable"].add(title)
+        loaded += 1
+        if loaded % PRELOAD_BATCH == 0:
+            _save_cursor(cursor_path, cursor)
+    _save_cursor(cursor_path, cursor)
+    return groups
+
+
+def run_bulk(
+    commons_site,
+    category_ensurer: CategoryEnsurer,
+    unknown_cat,
+    cursor_path: str,
+    touch_workers: int = TOUCH_WORKERS,
+    verbose: bool = False,
+    purge: bool = False,
+) -> tuple[int, int]:
+    """The ``--bulk`` pass. Returns (institutions processed, files touched).
+
+    Resumes from ``cursor_path`` when an earlier pass was interrupted, and
+    deletes it once this pass gets through every group."""
+    cursor = _load_cursor(cursor_path)
+    skip = cursor["touched"] | cursor["unparseable"]
+    pages = [p for p in unknown_cat.members(namespaces=[6]) if p.title() not in skip]
+    logging.info(f"{len(pages)} files to process ({len(skip)} done per cursor).")
+
+    groups = group_members_by_institution(commons_site, pages, cursor, cursor_path)
+    logging.info(f"{len(groups)} (institution, hub) groups.")
+
+    repo = None
+    institutions_processed = files_touched = 0
+    for (institution_qid, hub_qid), group in groups.items():
+        if institution_qid not in cursor["ensured"]:
+            try:
+                if repo is None:
+                    repo = get_wikidata_site().data_repository()
+                institution_item = pywikibot.ItemPage(repo, institution_qid)
+                institution_item.get()
+                institution_name = institution_item.labels.get("en", institution_qid)
+                logging.info(
+                    f"Processing institution: {institution_name} ({institution_qid})"
+                )
+                category_ensurer.ensure(institution_qid, institution_name, hub_qid)
+            except Exception as e:
+                # Left out of the cursor, so the next run retries the group.
+                logging.error(
+                    f"Failed to process institution {institution_qid}"
+                    f" ({len(group)} files)",
+                    exc_info=e,
+                )
+                continue
+            cursor["ensured"].add(institution_qid)
+        institutions_processed += 1
+
+        rerender = rerender_pages if purge else touch_pages
+        touched = rerender(commons_site, group, log_each=verbose, workers=touch_workers)
+        files_touched += len(touched)
+        cursor["touched"].update(p.title() for p in touched)
+        _save_cursor(cursor_path, cursor)
+        logging.info(f"Touched {len(touched)}/{len(group)} files for {institution_qid}")
+
+    # The pass is complete. Failed groups and stuck files are still in the
+    # category, so the next pass finds them again; a kept cursor would
+    # instead hide its titles from every later pass.
+    try:
+        os.remove(cursor_path)
+    except FileNotFoundError:
+        pass
+    return institutions_processed, files_touched
+
+
 @click.command()
 @click.option("--verbose", is_flag=True)
-def main(verbose: bool) -> None:
+@click.option(
+    "--bulk",
+    is_flag=True,
+    help="Drain the category in one pass, grouped by institution (resumable).",
+)
+@click.option(
+    "--cursor-file",
+    default=DEFAULT_CURSOR_FILE,
+    show_default=True,
+    help="--bulk checkpoint of an interrupted pass; delete it to start over.",
+)
+@click.option("--touch-workers", default=TOUCH_WORKERS, show_default=True)
+@click.option(
+    "--purge",
+    is_flag=True,
+    help="Re-render with batched purges; null-edit only files that stay stuck.",
+)
+def main(
+    verbose: bool, bulk: bool, cursor_file: str, touch_workers: int, purge: bool
+) -> None:
     setup_logging("fix-unknown-categories", "fix", logging.INFO)
     start_time = time.time()
 
@@ -58,6 +226,23 @@ def main(verbose: bool) -> None:
 
     unknown_cat = pywikibot.Category(commons_site, UNKNOWN_INSTITUTION_CATEGORY)
 
+    if bulk:
+        institutions_processed, files_touched = run_bulk(
+            commons_site,
+            category_ensurer,
+            unknown_cat,
+            cursor_file,
+            touch_workers=touch_workers,
+            verbose=verbose,
+            purge=purge,
+        )
+        logging.info(
+            f"Done. Institutions processed: {institutions_processed}, "
+            f"files touched: {files_touched}, "
+            f"elapsed: {time.time() - start_time:.1f}s"
+        )
+        return
+
     institutions_processed = 0
     files_touched = 0
     # Tracks files we cannot parse, so we don't loop on them forever
@@ -118,7 +303,9 @@ def main(verbose: bool) -> None:
 
         # Touch all Commons file pages for this institution so the Wikidata Infobox
         # template re-evaluates and moves them out of the unknown-institution category.
-        count = touch_institution_files(commons_site, institution_qid, log_each=verbose)
+        count = touch_institution_files(
+            commons_site, institution_qid, log_each=verbose, purge=purge
+        )
         files_touched += count
         logging.info(f"Touched {count} files for {institution_name}")
 
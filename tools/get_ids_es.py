@@ -50,6 +50,7 @@ from ingest_wikimedia.common import get_dict, get_list
 from ingest_wikimedia.dpla import (
     DC_TITLE_FIELD_NAME,
     DPLA,
+    IIIF_MANIFEST_DERIVED_FIELD_NAME,
     SOURCE_RESOURCE_FIELD_NAME,
 )
 from ingest_wikimedia.partners import PARTNER_HUBS
@@ -71,6 +72,7 @@ from ingest_wikimedia.staging import (
     stage_item_to_s3,
     stage_sdc_to_s3,
 )
+from ingest_wikimedia.web import Web
 from ingest_wikimedia.wikimedia import get_page_title
 
 PAGE_SIZE = 500
@@ -413,6 +415,9 @@ def main(
     # wait (they hold the last good list).
     banlist = Banlist(wait_for_run=single_id is None)
     s3_client = S3Client()
+    # Shared by the staging workers' derived-manifest probes. No DPLA API
+    # secret: the probes go to partner CONTENTdm servers.
+    probe_session = Web({}).get_http_session(partner)
     search_after = None
 
     s3_sem, failed, _on_s3_done = make_s3_stage_context(S3_WRITE_WORKERS)
@@ -522,6 +527,10 @@ def main(
                     iiif_url = IIIF.contentdm_iiif_url(is_shown_at)
                     if iiif_url:
                         source[IIIF_MANIFEST_FIELD] = iiif_url
+                        # Probed for reachability by stage_item_to_s3 on
+                        # the worker thread; the uploader's eligibility
+                        # check reads the recorded status.
+                        source[IIIF_MANIFEST_DERIVED_FIELD_NAME] = True
 
                 # Mark as staged by get-ids-es so the downloader can
                 # distinguish fresh ES-sourced objects from legacy API ones.
@@ -529,7 +538,12 @@ def main(
 
                 s3_sem.acquire()
                 future = executor.submit(
-                    stage_item_to_s3, s3_client, partner, dpla_id, source
+                    stage_item_to_s3,
+                    s3_client,
+                    partner,
+                    dpla_id,
+                    source,
+                    probe_session,
                 )
                 future.add_done_callback(_on_s3_done(dpla_id))
 
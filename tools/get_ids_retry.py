@@ -22,10 +22,12 @@ Output: one CSV per partner per failure type, written to --output-dir.
 A summary table is printed to stdout.
 
 Usage:
-    get-ids-retry <days> [--partner PARTNER] [--output-dir DIR]
+    get-ids-retry <days> [--partner PARTNER] [--output-dir DIR] [--rescan]
 """
 
 import csv
+import hashlib
+import json
 import logging
 import os
 import re
@@ -35,6 +37,7 @@ from pathlib import Path
 
 import click
 
+from ingest_wikimedia.events import events_path_for, parse_event_line
 
 BASE_DIR = Path(
     os.environ.get("INGEST_WIKIMEDIA_DIR", "/home/ec2-user/ingest-wikimedia")
@@ -124,6 +127,232 @@ SDC_TRANSIENT_ERRORS = (
 
 SDC_TRANSIENT_RE = re.compile("|".join(re.escape(e) for e in SDC_TRANSIENT_ERRORS))
 
+# Per-log scan checkpoints, one JSON file per scanned log under
+# ``<partner>/logs/RETRY_INDEX_DIR``. Each records how far into the log the
+# last run read (a byte offset at a line boundary), the scanner's carry-over
+# state at that point (the "current" DPLA ID, a half-collected SDC
+# traceback) and the IDs collected so far. Phase logs only ever grow, so the
+# next run seeks to the offset and scans just the new tail — a finished
+# multi-GB uploader log costs one ``stat`` and a small JSON read instead of
+# a full regex pass on every ``/wikimedia-upload retry``.
+RETRY_INDEX_DIR = ".retry-index"
+
+# Bumped when the checkpoint layout or a scanner's state changes shape.
+RETRY_INDEX_VERSION = 1
+
+# Leading bytes hashed into each checkpoint so a log replaced in place (same
+# name, new content — a restored backup, a manual edit) is noticed even when
+# it is no shorter than the checkpointed offset.
+RETRY_INDEX_HEAD_BYTES = 4096
+
+# Checkpoints are only valid for the classification rules that produced
+# them: adding a transient pattern must re-classify old logs, not just the
+# tail written after the change.
+_RULES_DIGEST = hashlib.blake2b(
+    "\0".join(
+        r.pattern
+        for r in (
+            UPLOAD_TRANSIENT_RE,
+            DPLA_ID_RE,
+            DOWNLOAD_FAILED_RE,
+            SDC_ORDINAL_ERROR_RE,
+            SDC_TRANSIENT_RE,
+        )
+    ).encode("utf-8"),
+    digest_size=8,
+).hexdigest()
+
+
+class _UploadScan:
+    """Line-at-a-time state of :func:`parse_upload_log`."""
+
+    kind = "upload"
+
+    def __init__(self, state: dict | None = None):
+        state = state or {}
+        self.current_id: str | None = state.get("current_id")
+        self.failures: set[str] = set(state.get("failures", ()))
+        self.successes: set[str] = set(state.get("successes", ()))
+
+    def feed(self, line: str) -> None:
+        m = DPLA_ID_RE.search(line)
+        if m:
+            self.current_id = m.group(1)
+        elif self.current_id:
+            if UPLOAD_TRANSIENT_RE.search(line):
+                self.failures.add(self.current_id)
+            elif "Uploaded to" in line:
+                self.successes.add(self.current_id)
+
+    def state(self) -> dict:
+        return {
+            "current_id": self.current_id,
+            "failures": sorted(self.failures),
+            "successes": sorted(self.successes),
+        }
+
+    def result(self) -> tuple[set[str], set[str]]:
+        return set(self.failures), set(self.successes)
+
+
+class _DownloadScan:
+    """Line-at-a-time state of :func:`parse_download_log`."""
+
+    kind = "download"
+
+    def __init__(self, state: dict | None = None):
+        state = state or {}
+        self.current_id: str | None = state.get("current_id")
+        self.failed: set[str] = set(state.get("failed", ()))
+
+    def feed(self, line: str) -> None:
+        m = DOWNLOAD_FAILED_RE.search(line)
+        if m:
+            self.current_id = m.group(1)
+        elif self.current_id and "Failed downloading" in line:
+            if EMPTY_URL_FAILURE not in line:
+                self.failed.add(self.current_id)
+            self.current_id = None
+
+    def state(self) -> dict:
+        return {"current_id": self.current_id, "failed": sorted(self.failed)}
+
+    def result(self) -> set[str]:
+        return set(self.failed)
+
+
+class _SdcScan:
+    """Line-at-a-time state of :func:`parse_sdc_log`.
+
+    An error block still open at a checkpoint (its traceback may continue in
+    the next tail) is carried in the state rather than classified, so a
+    block split across two runs is judged on its whole traceback.
+    :meth:`result` classifies the open block without closing it.
+    """
+
+    kind = "sdc"
+
+    def __init__(self, state: dict | None = None):
+        state = state or {}
+        self.current_id: str | None = state.get("current_id")
+        self.traceback: list[str] = list(state.get("traceback", ()))
+        self.retryable: set[str] = set(state.get("retryable", ()))
+
+    def _classify(self, into: set[str]) -> None:
+        if self.current_id and self.traceback:
+            if SDC_TRANSIENT_RE.search("".join(self.traceback)):
+                into.add(self.current_id)
+
+    def _flush(self) -> None:
+        # Close the current traceback block: if it matched a transient
+        # pattern, register the ID for retry.  Reset state regardless.
+        self._classify(self.retryable)
+        self.current_id = None
+        self.traceback = []
+
+    def feed(self, line: str) -> None:
+        m = SDC_ORDINAL_ERROR_RE.search(line)
+        if m:
+            # New error block: flush any prior, start fresh.
+            self._flush()
+            self.current_id = m.group(1)
+            return
+        if self.current_id is None:
+            return
+        # Inside an error block: collect traceback lines until the
+        # next [INFO] / [ERROR] marker.  Anything starting with
+        # "[INFO] " or "[ERROR] " ends the block.  (A terminating line
+        # that is itself a new ordinal error was handled above.)
+        if line.startswith("[INFO] ") or line.startswith("[ERROR] "):
+            self._flush()
+            return
+        self.traceback.append(line)
+
+    def state(self) -> dict:
+        return {
+            "current_id": self.current_id,
+            "traceback": self.traceback,
+            "retryable": sorted(self.retryable),
+        }
+
+    def result(self) -> set[str]:
+        retryable = set(self.retryable)
+        self._classify(retryable)
+        return retryable
+
+
+class _DownloadEventsScan:
+    """Line-at-a-time state of :func:`parse_download_events`."""
+
+    kind = "download-events"
+
+    def __init__(self, state: dict | None = None):
+        self.failed: set[str] = set((state or {}).get("failed", ()))
+
+    def feed(self, line: str) -> None:
+        record = parse_event_line(line, "ordinal")
+        if (
+            record
+            and record.get("status") == "FAILED"
+            and record.get("url")
+            and record.get("dpla_id")
+        ):
+            self.failed.add(record["dpla_id"])
+
+    def state(self) -> dict:
+        return {"failed": sorted(self.failed)}
+
+    def result(self) -> set[str]:
+        return set(self.failed)
+
+
+class _SdcEventsScan:
+    """Line-at-a-time state of :func:`parse_sdc_events`."""
+
+    kind = "sdc-events"
+
+    def __init__(self, state: dict | None = None):
+        self.retryable: set[str] = set((state or {}).get("retryable", ()))
+
+    def feed(self, line: str) -> None:
+        record = parse_event_line(line, "ordinal")
+        if not record or record.get("status") != "ERROR" or not record.get("dpla_id"):
+            return
+        # ``causes`` lists the classes the error was wrapped around (see
+        # ``events.cause_chain``): a retry loop that gives up re-raises a
+        # generic error whose own class and message name no transient.
+        causes = " ".join(str(c) for c in record.get("causes") or ())
+        blob = f"{record.get('error_class', '')}: {record.get('error', '')} {causes}"
+        if SDC_TRANSIENT_RE.search(blob):
+            self.retryable.add(record["dpla_id"])
+
+    def state(self) -> dict:
+        return {"retryable": sorted(self.retryable)}
+
+    def result(self) -> set[str]:
+        return set(self.retryable)
+
+
+def _feed_lines(f, scan, offset: int) -> tuple[int, str | None]:
+    """Feed every complete line of binary file ``f`` from ``offset`` to
+    ``scan``. Returns the offset just past the last complete line and the
+    trailing partial line (a line the writer has not finished), if any."""
+    f.seek(offset)
+    for raw in f:
+        if not raw.endswith(b"\n"):
+            return offset, raw.decode("utf-8", errors="replace")
+        scan.feed(raw.decode("utf-8", errors="replace"))
+        offset += len(raw)
+    return offset, None
+
+
+def _scan_whole(path: Path, scan):
+    with open(path, "rb") as f:
+        _, tail = _feed_lines(f, scan, 0)
+    if tail is not None:
+        scan.feed(tail)
+    return scan.result()
+
 
 def parse_upload_log(path: Path) -> tuple[set[str], set[str]]:
     """Return (transient_failure_ids, successfully_uploaded_ids) from an upload log.
@@ -134,36 +363,12 @@ def parse_upload_log(path: Path) -> tuple[set[str], set[str]]:
                              wrong title).
     successfully_uploaded_ids — IDs for which at least one file reached Commons ("Uploaded to").
     """
-    failures: set[str] = set()
-    successes: set[str] = set()
-    current_id: str | None = None
-    with open(path, encoding="utf-8", errors="replace") as f:
-        for line in f:
-            m = DPLA_ID_RE.search(line)
-            if m:
-                current_id = m.group(1)
-            elif current_id:
-                if UPLOAD_TRANSIENT_RE.search(line):
-                    failures.add(current_id)
-                elif "Uploaded to" in line:
-                    successes.add(current_id)
-    return failures, successes
+    return _scan_whole(path, _UploadScan())
 
 
 def parse_download_log(path: Path) -> set[str]:
     """Return DPLA IDs that hit media-server download failures (non-empty URL)."""
-    failed: set[str] = set()
-    current_id: str | None = None
-    with open(path, encoding="utf-8", errors="replace") as f:
-        for line in f:
-            m = DOWNLOAD_FAILED_RE.search(line)
-            if m:
-                current_id = m.group(1)
-            elif current_id and "Failed downloading" in line:
-                if EMPTY_URL_FAILURE not in line:
-                    failed.add(current_id)
-                current_id = None
-    return failed
+    return _scan_whole(path, _DownloadScan())
 
 
 def parse_sdc_log(path: Path) -> set[str]:
@@ -185,50 +390,134 @@ def parse_sdc_log(path: Path) -> set[str]:
     Commons-side state, so re-syncing the whole item is safe and cheap —
     the already-clean ordinals produce zero writes).
     """
-    retryable: set[str] = set()
-    current_id: str | None = None
-    current_traceback: list[str] = []
+    return _scan_whole(path, _SdcScan())
 
-    def _flush() -> None:
-        # Close the current traceback block: if it matched a transient
-        # pattern, register the ID for retry.  Reset state regardless.
-        nonlocal current_id, current_traceback
-        if current_id and current_traceback:
-            blob = "".join(current_traceback)
-            if SDC_TRANSIENT_RE.search(blob):
-                retryable.add(current_id)
-        current_id = None
-        current_traceback = []
-
-    with open(path, encoding="utf-8", errors="replace") as f:
-        for line in f:
-            m = SDC_ORDINAL_ERROR_RE.search(line)
-            if m:
-                # New error block: flush any prior, start fresh.
-                _flush()
-                current_id = m.group(1)
-                continue
-            if current_id is None:
-                continue
-            # Inside an error block: collect traceback lines until the
-            # next [INFO] / [ERROR] marker.  Anything starting with
-            # "[INFO] " or "[ERROR] " ends the block.
-            if line.startswith("[INFO] ") or line.startswith("[ERROR] "):
-                _flush()
-                # If this terminating line is itself a new ordinal error,
-                # re-classify it as the start of the next block.
-                m2 = SDC_ORDINAL_ERROR_RE.search(line)
-                if m2:
-                    current_id = m2.group(1)
-                continue
-            current_traceback.append(line)
-        # End-of-file: flush whatever is pending.
-        _flush()
-    return retryable
+
+def parse_download_events(path: Path) -> set[str]:
+    """Structured twin of :func:`parse_download_log` over the phase's
+    ``.events.jsonl``: IDs with a FAILED ``ordinal`` event for a non-empty
+    media URL."""
+    return _scan_whole(path, _DownloadEventsScan())
+
+
+def parse_sdc_events(path: Path) -> set[str]:
+    """Structured twin of :func:`parse_sdc_log` over the phase's
+    ``.events.jsonl``. Each per-ordinal failure is one ``ordinal`` event
+    carrying the exception class, message and cause chain, so classification
+    no longer depends on reassembling a traceback from the text log."""
+    return _scan_whole(path, _SdcEventsScan())
+
+
+def _index_path(path: Path) -> Path:
+    return path.parent / RETRY_INDEX_DIR / f"{path.name}.json"
+
+
+def _head_digest(f, length: int) -> str:
+    f.seek(0)
+    return hashlib.blake2b(f.read(length), digest_size=16).hexdigest()
+
+
+def _load_checkpoint(index_file: Path, kind: str, st: os.stat_result) -> dict | None:
+    try:
+        with open(index_file, encoding="utf-8") as f:
+            checkpoint = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(checkpoint, dict)
+        or checkpoint.get("version") != RETRY_INDEX_VERSION
+        or checkpoint.get("rules") != _RULES_DIGEST
+        or checkpoint.get("kind") != kind
+        or checkpoint.get("ino") != st.st_ino
+        or not isinstance(checkpoint.get("offset"), int)
+        # Shrunk: truncated or replaced; the offset no longer means anything.
+        or checkpoint["offset"] > st.st_size
+    ):
+        return None
+    return checkpoint
+
+
+def _save_checkpoint(index_file: Path, checkpoint: dict) -> None:
+    tmp = index_file.with_name(f"{index_file.name}.{os.getpid()}.tmp")
+    try:
+        index_file.parent.mkdir(exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(checkpoint, f, separators=(",", ":"))
+        os.replace(tmp, index_file)
+    except OSError as e:
+        # A read-only logs dir costs the next run a full re-scan, nothing more.
+        logging.warning("Could not write retry index %s: %s", index_file, e)
+        tmp.unlink(missing_ok=True)
+
+
+def scan_incremental(path: Path, scan_cls, rescan: bool = False):
+    """Return ``scan_cls``'s result for the whole of ``path``, reading only
+    the bytes appended since the last call.
+
+    The checkpoint is reused when the file is the same inode, has not
+    shrunk below the checkpointed offset, and its first
+    ``RETRY_INDEX_HEAD_BYTES`` still hash the same; otherwise (or with
+    ``rescan``) the log is scanned from the start. Only complete lines are
+    checkpointed: a line the writer is still in the middle of is fed to a
+    throwaway copy of the scanner for this result and re-read, whole, next
+    time.
+    """
+    st = path.stat()
+    index_file = _index_path(path)
+    checkpoint = None if rescan else _load_checkpoint(index_file, scan_cls.kind, st)
+
+    with open(path, "rb") as f:
+        if checkpoint is not None:
+            # Compare over the bytes the checkpoint actually saw.
+            seen = min(checkpoint["offset"], RETRY_INDEX_HEAD_BYTES)
+            if checkpoint.get("head") != _head_digest(f, seen):
+                checkpoint = None
+        if checkpoint is None:
+            offset, scan = 0, scan_cls()
+        else:
+            offset, scan = checkpoint["offset"], scan_cls(checkpoint["state"])
+        start = offset
+        offset, tail = _feed_lines(f, scan, offset)
+        head = _head_digest(f, min(offset, RETRY_INDEX_HEAD_BYTES))
+
+    if checkpoint is None or offset != start:
+        _save_checkpoint(
+            index_file,
+            {
+                "version": RETRY_INDEX_VERSION,
+                "rules": _RULES_DIGEST,
+                "kind": scan_cls.kind,
+                "ino": st.st_ino,
+                "offset": offset,
+                "head": head,
+                "state": scan.state(),
+            },
+        )
+    if tail is not None:
+        scan = scan_cls(scan.state())
+        scan.feed(tail)
+    return scan.result()
+
+
+def _prune_index(log_dir: Path) -> None:
+    """Drop checkpoints whose log has been deleted or rotated away."""
+    index_dir = log_dir / RETRY_INDEX_DIR
+    if not index_dir.is_dir():
+        return
+    for index_file in index_dir.glob("*.json"):
+        if not (log_dir / index_file.name[: -len(".json")]).exists():
+            index_file.unlink(missing_ok=True)
+
+
+def _events_file(log_file: Path) -> Path | None:
+    """The ``.events.jsonl`` written alongside ``log_file``, if any. Logs
+    from before the event stream existed have none and are parsed as text."""
+    events_file = Path(events_path_for(str(log_file)))
+    return events_file if events_file.is_file() else None
 
 
 def collect_partner_ids(
-    partner: str, cutoff: datetime
+    partner: str, cutoff: datetime, rescan: bool = False
 ) -> tuple[set[str], set[str], set[str]]:
     """Scan logs for *partner* and return ``(upload, download, sdc)`` retry sets.
 
@@ -250,8 +539,13 @@ def collect_partner_ids(
     excluded — the per-item SDC sync is idempotent, so re-running them is a
     no-op that produces zero writes; the simpler "any transient error in the
     window" rule is cheaper than tracking per-run outcomes.
+
+    Every log (and events file) is read through :func:`scan_incremental`,
+    so only what was appended since the previous run is scanned; ``rescan``
+    ignores the checkpoints and re-reads everything.
     """
     log_dir = BASE_DIR / partner / "logs"
+    _prune_index(log_dir)
     # id → "retry" | "done"; later log files (by mtime) overwrite earlier ones.
     outcomes: dict[str, str] = {}
     download_failures: set[str] = set()
@@ -262,7 +556,7 @@ def collect_partner_ids(
     ):
         if datetime.fromtimestamp(log_file.stat().st_mtime, tz=timezone.utc) < cutoff:
             continue
-        file_failures, file_successes = parse_upload_log(log_file)
+        file_failures, file_successes = scan_incremental(log_file, _UploadScan, rescan)
         for dpla_id in file_failures:
             outcomes[dpla_id] = "retry"
         for dpla_id in file_successes - file_failures:
@@ -271,12 +565,22 @@ def collect_partner_ids(
     for log_file in sorted(log_dir.glob("*-download.log")):
         if datetime.fromtimestamp(log_file.stat().st_mtime, tz=timezone.utc) < cutoff:
             continue
-        download_failures.update(parse_download_log(log_file))
+        events_file = _events_file(log_file)
+        download_failures.update(
+            scan_incremental(events_file, _DownloadEventsScan, rescan)
+            if events_file
+            else scan_incremental(log_file, _DownloadScan, rescan)
+        )
 
     for log_file in sorted(log_dir.glob("*-sdc.log")):
         if datetime.fromtimestamp(log_file.stat().st_mtime, tz=timezone.utc) < cutoff:
             continue
-        sdc_failures.update(parse_sdc_log(log_file))
+        events_file = _events_file(log_file)
+        sdc_failures.update(
+            scan_incremental(events_file, _SdcEventsScan, rescan)
+            if events_file
+            else scan_incremental(log_file, _SdcScan, rescan)
+        )
 
     upload_failures = {dpla_id for dpla_id, o in outcomes.items() if o == "retry"}
     fully_uploaded = {dpla_id for dpla_id, o in outcomes.items() if o == "done"}
@@ -322,7 +626,12 @@ def _discover_partners() -> list[str]:
     show_default=True,
     help="Directory to write retry CSV files.",
 )
-def main(days: int, partner: str | None, output_dir: str) -> None:
+@click.option(
+    "--rescan",
+    is_flag=True,
+    help=f"Ignore the per-log checkpoints in logs/{RETRY_INDEX_DIR} and re-read every log.",
+)
+def main(days: int, partner: str | None, output_dir: str, rescan: bool) -> None:
     """Extract failed DPLA IDs from the last DAYS days of logs for retry.
 
     Writes one CSV per partner per failure type to OUTPUT_DIR:
@@ -344,7 +653,7 @@ def main(days: int, partner: str | None, output_dir: str) -> None:
             logging.warning("No logs directory for partner '%s', skipping.", p)
             continue
 
-        upload_ids, download_ids, sdc_ids = collect_partner_ids(p, cutoff)
+        upload_ids, download_ids, sdc_ids = collect_partner_ids(p, cutoff, rescan)
         for suffix, ids in (
             ("upload", upload_ids),
             ("download", download_ids),
@@ -1,46 +1,121 @@
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterator, NamedTuple
+
 import click
 
-from ingest_wikimedia.s3 import S3_BUCKET
+from ingest_wikimedia.s3 import FILE_LIST_TXT, S3_BUCKET
 from ingest_wikimedia.tools_context import ToolsContext
 
+# Concurrent file-list GETs. The listing itself is one sequential paginated
+# stream; these only overlap the per-item body reads with it.
+FILE_LIST_WORKERS = 16
 
-def get_incomplete_items(s3, prefix) -> list[str]:
-    """Gets a list of incomplete items from S3."""
 
+class IncompleteItem(NamedTuple):
+    dpla_id: str
+    # 1-based ordinals listed in file-list.txt with no ``<ordinal>_<dpla_id>``
+    # media object in the item's folder.
+    missing_ordinals: list[int]
+
+
+def _check_item(
+    client, dpla_id: str, file_list_key: str, present: set[int]
+) -> IncompleteItem | None:
+    file_list = (
+        client.get_object(Bucket=S3_BUCKET, Key=file_list_key)["Body"]
+        .read()
+        .decode("utf-8")
+    )
+    file_count = len(file_list.split("\n"))
+    missing = [o for o in range(1, file_count + 1) if o not in present]
+    return IncompleteItem(dpla_id, missing) if missing else None
+
+
+def iter_incomplete_items(
+    s3, prefix, workers: int = FILE_LIST_WORKERS
+) -> Iterator[IncompleteItem]:
+    """Yield the partner's incomplete items from ONE listing of its prefix.
+
+    S3 lists keys in lexicographic order, so every key of an item folder
+    (``<prefix>/images/a/b/c/d/<dpla_id>/...``) arrives contiguously: the
+    media ordinals present are collected as the listing streams, and when the
+    folder closes its ``file-list.txt`` is fetched on a worker thread and
+    compared against them. That replaces the per-item ``Prefix=folder``
+    re-listing (an extra LIST call per item) with nothing, and keeps the
+    file-list GETs off the listing's critical path.
+
+    Items are yielded in listing order as soon as they're checked; at most
+    ``workers * 4`` checks are in flight, so memory stays bounded on a 1M-item
+    hub. Only ``<ordinal>_<dpla_id>`` objects count as media — the staged
+    sidecars (``dpla-map.json``, ``iiif.json``, ``sdc.json``,
+    ``upload-result.json``) never do.
+    """
+    client = s3.meta.client
     bucket = s3.Bucket(S3_BUCKET)
-    incomplete_items = []
-
-    for object_summary in bucket.objects.filter(Prefix=f"{prefix}/images/"):
-        key = object_summary.key
-        if key.endswith("file-list.txt"):
-            dpla_id = key.split("/")[-2]
-            folder = "/".join(key.split("/")[0:-1])
-            file_list = object_summary.get()["Body"].read().decode("utf-8")
-            file_count = len(file_list.split("\n"))
-            media_files = []
-            for object_summary2 in bucket.objects.filter(Prefix=folder):
-                key = object_summary2.key
-                if (
-                    key.endswith("file-list.txt")
-                    or key.endswith("dpla-map.json")
-                    or key.endswith("iiif.json")
-                ):
-                    continue
-                media_files.append(key)
-
-            if len(media_files) != file_count:
-                incomplete_items.append(dpla_id)
-
-    return incomplete_items
+    pending: deque[Future] = deque()
+    window = max(1, workers) * 4
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        folder = None
+        dpla_id = ""
+        file_list_key = None
+        present: set[int] = set()
+
+        def close_folder():
+            if file_list_key is not None:
+                pending.append(
+                    pool.submit(_check_item, client, dpla_id, file_list_key, present)
+                )
+
+        for object_summary in bucket.objects.filter(Prefix=f"{prefix}/images/"):
+            key_folder, _, name = object_summary.key.rpartition("/")
+            if key_folder != folder:
+                close_folder()
+                folder = key_folder
+                dpla_id = key_folder.rpartition("/")[2]
+                file_list_key = None
+                present = set()
+            if name == FILE_LIST_TXT:
+                file_list_key = object_summary.key
+            else:
+                ordinal, _, suffix = name.partition("_")
+                if suffix == dpla_id and ordinal.isdigit():
+                    present.add(int(ordinal))
+
+            while pending and (pending[0].done() or len(pending) > window):
+                result = pending.popleft().result()
+                if result is not None:
+                    yield result
+        close_folder()
+
+        while pending:
+            result = pending.popleft().result()
+            if result is not None:
+                yield result
+
+
+def get_incomplete_items(s3, prefix) -> list[str]:
+    """Gets a list of incomplete items from S3."""
+    return [item.dpla_id for item in iter_incomplete_items(s3, prefix)]
 
 
 @click.command()
 @click.argument("partner")
-def main(partner: str):
+@click.option(
+    "--show-missing",
+    is_flag=True,
+    help="Append each item's missing ordinals (comma-separated) after its ID.",
+)
+@click.option("--workers", default=FILE_LIST_WORKERS, show_default=True)
+def main(partner: str, show_missing: bool, workers: int):
     tools_context = ToolsContext.init(partner)
     s3 = tools_context.get_s3_client().get_s3()
-    for item_id in get_incomplete_items(s3, partner):
-        print(item_id)
+    for item in iter_incomplete_items(s3, partner, workers=workers):
+        if show_missing:
+            print(item.dpla_id, ",".join(map(str, item.missing_ordinals)), flush=True)
+        else:
+            print(item.dpla_id, flush=True)
 
 
 if __name__ == "__main__":
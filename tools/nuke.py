@@ -1,23 +1,154 @@
 import logging
-import subprocess
 import time
-from typing import IO
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import IO, NamedTuple
 
 import click
+from botocore.exceptions import BotoCoreError, ClientError
 from tqdm import tqdm
 
 from ingest_wikimedia.common import load_ids
 from ingest_wikimedia.logs import setup_logging
 
-from ingest_wikimedia.s3 import S3_BUCKET
+from ingest_wikimedia.s3 import S3_BUCKET, S3Client
 from ingest_wikimedia.tools_context import ToolsContext
 
+# DeleteObjects' per-request maximum.
+DELETE_BATCH_SIZE = 1000
+
+# Listing and delete calls in flight. Kept under S3Client's
+# max_pool_connections (25) so the threads never queue on the HTTP pool.
+NUKE_WORKERS = 16
+
+
+class NukeSummary(NamedTuple):
+    items: int
+    keys: int
+    bytes: int
+    # Items whose listing failed (nothing of theirs was deleted) and keys
+    # DeleteObjects reported as not deleted.
+    failed_items: int
+    failed_keys: int
+
+
+def list_item_keys(client, partner: str, dpla_id: str) -> list[tuple[str, int]]:
+    """Every ``(key, size)`` under the item's folder."""
+    prefix = S3Client.get_item_s3_path(dpla_id, "", partner)
+    paginator = client.get_paginator("list_objects_v2")
+    return [
+        (obj["Key"], obj["Size"])
+        for page in paginator.paginate(Bucket=S3_BUCKET, Prefix=prefix)
+        for obj in page.get("Contents", [])
+    ]
+
+
+def delete_keys(client, keys: list[str]) -> list[dict]:
+    """One ``DeleteObjects`` call; returns its per-key ``Errors`` (quiet
+    mode reports only failures)."""
+    response = client.delete_objects(
+        Bucket=S3_BUCKET,
+        Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+    )
+    return response.get("Errors", [])
+
+
+def _list_or_none(client, partner: str, dpla_id: str) -> list[tuple[str, int]] | None:
+    try:
+        return list_item_keys(client, partner, dpla_id)
+    except (BotoCoreError, ClientError) as e:
+        logging.error(f"Could not list {dpla_id}: {e}")
+        return None
+
+
+def nuke_items(
+    client,
+    partner: str,
+    dpla_ids: list[str],
+    dry_run: bool = False,
+    workers: int = NUKE_WORKERS,
+) -> NukeSummary:
+    """Delete everything under each item's folder.
+
+    Item folders are listed concurrently and their keys pooled into
+    ``DELETE_BATCH_SIZE``-key ``DeleteObjects`` calls on the same pool, so
+    a purge costs roughly one LIST per item plus one DELETE per thousand keys
+    — instead of an ``aws s3 rm --recursive`` process (spawn, credential
+    resolution, listing, one DELETE per key) per item. ``dry_run`` only
+    lists, and the summary reports what would be deleted.
+
+    At most ``workers * 4`` listings are in flight (as in
+    ``iter_incomplete_items``): submitting every listing up front would queue
+    the deletes behind the whole ID file, so nothing is deleted until every
+    item has been listed.
+    """
+    items = keys = total_bytes = failed_items = 0
+    deletes: list[tuple[Future, int]] = []
+    batch: list[str] = []
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+
+        def listings():
+            pending: deque[tuple[str, Future]] = deque()
+            window = max(1, workers) * 4
+            for dpla_id in dpla_ids:
+                future = pool.submit(_list_or_none, client, partner, dpla_id)
+                pending.append((dpla_id, future))
+                if len(pending) >= window:
+                    done_id, done = pending.popleft()
+                    yield done_id, done.result()
+            while pending:
+                done_id, done = pending.popleft()
+                yield done_id, done.result()
+
+        for dpla_id, item_keys in tqdm(
+            listings(), total=len(dpla_ids), desc="Nuking Items", unit="Item", ncols=100
+        ):
+            if item_keys is None:
+                failed_items += 1
+                continue
+            item_bytes = sum(size for _, size in item_keys)
+            logging.info(
+                f"DPLA ID: {dpla_id}: {len(item_keys)} keys, {item_bytes} bytes"
+            )
+            items += 1
+            keys += len(item_keys)
+            total_bytes += item_bytes
+            if dry_run:
+                continue
+            batch.extend(key for key, _ in item_keys)
+            while len(batch) >= DELETE_BATCH_SIZE:
+                chunk, batch = batch[:DELETE_BATCH_SIZE], batch[DELETE_BATCH_SIZE:]
+                deletes.append((pool.submit(delete_keys, client, chunk), len(chunk)))
+        if batch:
+            deletes.append((pool.submit(delete_keys, client, batch), len(batch)))
+
+        failed_keys = 0
+        for future, size in deletes:
+            try:
+                errors = future.result()
+            except (BotoCoreError, ClientError) as e:
+                # The whole batch failed; count it all as not deleted. A
+                # re-run lists only what is left.
+                logging.error(f"DeleteObjects failed: {e}")
+                failed_keys += size
+                continue
+            for error in errors:
+                logging.error(
+                    f"Could not delete {error.get('Key')}: "
+                    f"{error.get('Code')} {error.get('Message')}"
+                )
+            failed_keys += len(errors)
+
+    return NukeSummary(items, keys, total_bytes, failed_items, failed_keys)
+
 
 @click.command()
 @click.argument("ids-file", type=click.File("r"))
 @click.argument("partner")
 @click.option("--dry-run", is_flag=True)
-def main(ids_file: IO, partner: str, dry_run: bool):
+@click.option("--workers", default=NUKE_WORKERS, show_default=True)
+def main(ids_file: IO, partner: str, dry_run: bool, workers: int):
     start_time = time.time()
     tools_context = ToolsContext.init(partner)
     s3 = tools_context.get_s3_client()
@@ -26,15 +157,22 @@ def main(ids_file: IO, partner: str, dry_run: bool):
     setup_logging(partner, "nuke-items", logging.INFO)
     logging.info(f"Nuking items for {partner}")
     dpla_ids = load_ids(ids_file)
-    for dpla_id in tqdm(dpla_ids, desc="Nuking Items", unit="Item", ncols=100):
-        logging.info(f"DPLA ID: {dpla_id}")
-        s3_path = s3.get_item_s3_path(dpla_id, "", partner)
-        command = ["aws", "s3", "rm", f"s3://{S3_BUCKET}/{s3_path}", "--recursive"]
-        if dry_run:
-            command.append("--dryrun")
-        subprocess.run(command, check=True)
-
+    summary = nuke_items(
+        s3.get_s3().meta.client, partner, dpla_ids, dry_run=dry_run, workers=workers
+    )
+    verb = "Would delete" if dry_run else "Deleted"
+    logging.info(
+        f"{verb} {summary.keys - summary.failed_keys} keys"
+        f" ({summary.bytes} bytes) across {summary.items} items."
+    )
+    if summary.failed_items or summary.failed_keys:
+        logging.error(
+            f"{summary.failed_items} items could not be listed;"
+            f" {summary.failed_keys} keys were not deleted. Re-run to retry."
+        )
     logging.info(f"{time.time() - start_time} seconds.")
+    if summary.failed_items or summary.failed_keys:
+        raise SystemExit(1)
 
 
 if __name__ == "__main__":
@@ -1,24 +1,33 @@
 """Resolve DPLA item IDs: check upload eligibility and stage metadata to S3.
 
-Used by wikimedia_launch.py to handle single-item upload targets.  All IDs are
-resolved in a single Elasticsearch request.  For each ID, applies the same
-upload-eligibility criteria as get-ids-es (rights, media presence, hub known,
-institution has Wikidata ID and upload=True per institutions_v2.json), stages
-the full item metadata to S3 as dpla-map.json, and writes one status line to
-stdout for the launch script to parse.
+Used by wikimedia_launch.py to handle single-item upload targets, and by
+operators triaging long lists of IDs.  IDs are resolved with one Elasticsearch
+``terms`` request per :data:`ES_BATCH_SIZE` IDs.  For each ID, applies the
+same upload-eligibility criteria as get-ids-es (rights, media presence, hub
+known, institution has Wikidata ID and upload=True per institutions_v2.json),
+stages the full item metadata to S3 as dpla-map.json, and writes one status
+line to stdout for the launch script to parse.
 
 Output format (one line per ID):
   {id} HUB={canonical}       item is eligible; metadata has been staged to S3
   {id} NOT_FOUND              no document found in the ES index for this ID
   {id} INELIGIBLE:{reason}   item exists but fails an eligibility check
   {id} ERROR:{message}        unexpected error during processing
+
+With ``--jsonl`` each line is instead a JSON object
+``{"id": …, "status": "eligible"|"not_found"|"ineligible"|"error", …}`` with a
+``hub``, ``reason`` or ``error`` key as applicable.
 """
 
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Iterable, Iterator, NamedTuple
 
 import click
 
 from ingest_wikimedia.banlist import Banlist
+from ingest_wikimedia.common import load_ids
 from ingest_wikimedia.es import check_es_response, post_es
 from ingest_wikimedia.iiif import IIIF
 from ingest_wikimedia.partners import check_item_eligibility, resolve_slug
@@ -28,9 +37,108 @@ _IIIF_MANIFEST_FIELD = "iiifManifest"
 _MEDIA_MASTER_FIELD = "mediaMaster"
 _IS_SHOWN_AT_FIELD = "isShownAt"
 
+# IDs per ES ``terms`` query. Well under the index's max_result_window and
+# the terms-query limit, and small enough that the first results of a
+# thousands-ID list stream out after one short round-trip.
+ES_BATCH_SIZE = 500
+
+# Items checked and staged concurrently. The only I/O per item is the
+# dpla-map.json PUT; kept under S3Client's max_pool_connections (25).
+RESOLVE_WORKERS = 8
+
+
+class Resolution(NamedTuple):
+    dpla_id: str
+    # "eligible" | "not_found" | "ineligible" | "error"
+    status: str
+    # Hub slug for eligible items, the reason / error message otherwise.
+    detail: str = ""
+
+    def line(self) -> str:
+        """The launch script's one-line status format."""
+        if self.status == "eligible":
+            return f"{self.dpla_id} HUB={self.detail}"
+        if self.status == "not_found":
+            return f"{self.dpla_id} NOT_FOUND"
+        if self.status == "ineligible":
+            return f"{self.dpla_id} INELIGIBLE:{self.detail}"
+        return f"{self.dpla_id} ERROR:{self.detail}"
+
+    def jsonl(self) -> str:
+        record = {"id": self.dpla_id, "status": self.status}
+        key = {"eligible": "hub", "ineligible": "reason", "error": "error"}.get(
+            self.status
+        )
+        if key:
+            record[key] = self.detail
+        return json.dumps(record)
+
+
+def _fetch_sources(dpla_ids: list[str]) -> dict[str, dict]:
+    """One ES ``terms`` query for ``dpla_ids``; ``id -> _source``."""
+    resp = post_es(
+        {
+            "query": {"terms": {"id": dpla_ids}},
+            "size": len(dpla_ids),
+        }
+    )
+    resp.raise_for_status()
+    data = resp.json()
+    check_es_response(data)
+    hits = data.get("hits", {}).get("hits", [])
+    return {hit["_source"]["id"]: hit["_source"] for hit in hits}
+
+
+def resolve_ids(
+    dpla_ids: Iterable[str],
+    banlist: Banlist,
+    *,
+    maintain: bool = False,
+    workers: int = RESOLVE_WORKERS,
+) -> Iterator[Resolution]:
+    """Yield a :class:`Resolution` per ID, in input order (duplicates dropped).
+
+    IDs go to ES :data:`ES_BATCH_SIZE` at a time; each batch's items are
+    checked and staged on a ``workers``-thread pool while the next batch's
+    query is issued only once they're done, so memory stays bounded by one
+    batch of documents however long the list. A failed ES query marks just
+    its batch as errors; a failure on one item never stops the others.
+    """
+    local = threading.local()
+
+    def process(dpla_id: str, source: dict | None) -> Resolution:
+        if source is None:
+            return Resolution(dpla_id, "not_found")
+        # boto3 resources aren't thread-safe: one S3Client per thread.
+        if not hasattr(local, "s3_client"):
+            local.s3_client = S3Client()
+        try:
+            return _process_one(
+                dpla_id, source, banlist, local.s3_client, maintain=maintain
+            )
+        except Exception as e:
+            return Resolution(dpla_id, "error", str(e))
+
+    unique = list(dict.fromkeys(dpla_ids))
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for start in range(0, len(unique), ES_BATCH_SIZE):
+            batch = unique[start : start + ES_BATCH_SIZE]
+            try:
+                found = _fetch_sources(batch)
+            except Exception as e:
+                for dpla_id in batch:
+                    yield Resolution(dpla_id, "error", str(e))
+                continue
+            yield from pool.map(lambda i: process(i, found.get(i)), batch)
+
 
 @click.command()
-@click.argument("dpla_ids", nargs=-1, required=True)
+@click.argument("dpla_ids", nargs=-1)
+@click.option(
+    "--ids-file",
+    type=click.File("r"),
+    help="Also resolve the IDs in this file (first CSV column, as get-ids-es writes).",
+)
 @click.option(
     "--maintain",
     is_flag=True,
@@ -43,35 +151,25 @@ _IS_SHOWN_AT_FIELD = "isShownAt"
         " same flag on get-ids-es."
     ),
 )
-def main(dpla_ids: tuple[str, ...], maintain: bool) -> None:
+@click.option("--jsonl", is_flag=True, help="Emit one JSON object per ID.")
+@click.option("--workers", default=RESOLVE_WORKERS, show_default=True)
+def main(
+    dpla_ids: tuple[str, ...],
+    ids_file: IO | None,
+    maintain: bool,
+    jsonl: bool,
+    workers: int,
+) -> None:
     """Resolve DPLA_IDS, check eligibility, and stage metadata to S3."""
+    ids = list(dpla_ids) + (load_ids(ids_file) if ids_file else [])
+    if not ids:
+        raise click.UsageError("Pass DPLA IDs as arguments or with --ids-file.")
     # Launch path: block on an in-progress Quarry run so the eligibility gate
     # uses the freshly-generated banlist.
     banlist = Banlist(wait_for_run=True)
-    s3_client = S3Client()
-
-    # Single batched ES query for all IDs — avoids N round-trips.
-    resp = post_es(
-        {
-            "query": {"terms": {"id": list(dpla_ids)}},
-            "size": len(dpla_ids),
-        }
-    )
-    resp.raise_for_status()
-    data = resp.json()
-    check_es_response(data)
-    hits = data.get("hits", {}).get("hits", [])
-    found: dict[str, dict] = {hit["_source"]["id"]: hit["_source"] for hit in hits}
 
-    for dpla_id in dpla_ids:
-        try:
-            source = found.get(dpla_id)
-            if source is None:
-                print(f"{dpla_id} NOT_FOUND", flush=True)
-                continue
-            _process_one(dpla_id, source, banlist, s3_client, maintain=maintain)
-        except Exception as e:
-            print(f"{dpla_id} ERROR:{e}", flush=True)
+    for resolution in resolve_ids(ids, banlist, maintain=maintain, workers=workers):
+        print(resolution.jsonl() if jsonl else resolution.line(), flush=True)
 
 
 def _process_one(
@@ -81,15 +179,13 @@ def _process_one(
     s3_client: S3Client,
     *,
     maintain: bool = False,
-) -> None:
+) -> Resolution:
     if banlist.is_banned(dpla_id):
-        print(f"{dpla_id} INELIGIBLE:on banlist", flush=True)
-        return
+        return Resolution(dpla_id, "ineligible", "on banlist")
 
     rights = source.get("rightsCategory", "")
     if rights != "Unlimited Re-Use":
-        print(f"{dpla_id} INELIGIBLE:rights={rights!r}", flush=True)
-        return
+        return Resolution(dpla_id, "ineligible", f"rights={rights!r}")
 
     has_media = bool(
         source.get(_MEDIA_MASTER_FIELD)
@@ -97,14 +193,12 @@ def _process_one(
         or IIIF.contentdm_iiif_url(source.get(_IS_SHOWN_AT_FIELD, ""))
     )
     if not has_media:
-        print(f"{dpla_id} INELIGIBLE:no media", flush=True)
-        return
+        return Resolution(dpla_id, "ineligible", "no media")
 
     provider_name = (source.get("provider") or {}).get("name", "")
     canonical = resolve_slug(provider_name)
     if not canonical:
-        print(f"{dpla_id} INELIGIBLE:unknown hub {provider_name!r}", flush=True)
-        return
+        return Resolution(dpla_id, "ineligible", f"unknown hub {provider_name!r}")
 
     # Check institution-level eligibility per institutions_v2.json. Both
     # profiles (upload / maintain) require the two Wikidata IDs; maintain
@@ -116,8 +210,7 @@ def _process_one(
     dp_name = (source.get("dataProvider") or {}).get("name", "")
     eligible, reason = check_item_eligibility(canonical, dp_name, maintain=maintain)
     if not eligible:
-        print(f"{dpla_id} INELIGIBLE:{reason}", flush=True)
-        return
+        return Resolution(dpla_id, "ineligible", reason)
 
     # Derive CONTENTdm IIIF manifest URL if needed (mirrors get-ids-es behaviour).
     if not source.get(_IIIF_MANIFEST_FIELD) and not source.get(_MEDIA_MASTER_FIELD):
@@ -130,7 +223,7 @@ def _process_one(
     source["_staged_by_get_ids_es"] = True
     s3_client.write_item_metadata(canonical, dpla_id, json.dumps(source))
 
-    print(f"{dpla_id} HUB={canonical}", flush=True)
+    return Resolution(dpla_id, "eligible", canonical)
 
 
 if __name__ == "__main__":
@@ -10,7 +10,9 @@ from ingest_wikimedia.common import get_list, get_dict, CHECKSUM
 from ingest_wikimedia.s3 import S3Client, S3_BUCKET
 from ingest_wikimedia.tools_context import ToolsContext
 from ingest_wikimedia.dpla import DPLA
+from ingest_wikimedia import events
 from ingest_wikimedia.logs import setup_logging
+from ingest_wikimedia.timings import timings
 from ingest_wikimedia.tracker import Result, Tracker
 from ingest_wikimedia.wikimedia import (
     MIME_UNKNOWN_EXT,
@@ -193,6 +195,8 @@ def main(partner: str, dry_run: bool) -> None:
                 tracker.increment(Result.FAILED)
 
     finally:
+        events.emit_phase_end(tracker, timings)
+        logging.info("\n" + str(timings))
         logging.info("\n" + str(tracker))
         logging.info(f"{time.time() - start_time} seconds.")
 
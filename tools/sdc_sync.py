@@ -14,7 +14,9 @@ import os
 import time
 import tomllib
 import urllib.parse
+from collections.abc import Mapping
 from pywikibot import pagegenerators
+from ingest_wikimedia import events, progress
 from ingest_wikimedia.logs import setup_logging
 from ingest_wikimedia.sdc import (
     CHUNKABLE_PROPS,
@@ -37,9 +39,15 @@ from ingest_wikimedia.common import get_dict, get_list
 from ingest_wikimedia.csrf import CsrfRecoveryFailed, with_csrf_recovery
 from ingest_wikimedia.dpla import DC_TITLE_FIELD_NAME, SOURCE_RESOURCE_FIELD_NAME
 from ingest_wikimedia.es import check_es_response, post_es
-from ingest_wikimedia.maintain import resolve_current_dpla_id
+from ingest_wikimedia.maintain import (
+    ResolveRequest,
+    resolve_current_dpla_id,
+    resolve_current_dpla_ids,
+)
+from ingest_wikimedia.partners import partner_dir_path
 from ingest_wikimedia.slack import notify_phase_start, notify_sdc_complete
-from ingest_wikimedia.tracker import Result, Tracker
+from ingest_wikimedia.timings import timings
+from ingest_wikimedia.tracker import Histogram, Result, Tracker
 from ingest_wikimedia.wikimedia import extract_dpla_id_from_commons_title
 from ingest_wikimedia.worker_slots import WorkerSlotBudget
 
@@ -58,9 +66,9 @@ args: argparse.Namespace
 method: str = "livecat"
 dpla_api: str
 site: pywikibot.site.BaseSite
-hubs: dict
+hubs: Mapping
 rights: dict
-subject_ids: dict
+subject_ids: Mapping
 _s3_partner: str | None = None
 _s3_client = None
 # Maintain ``--cat`` mode (``--build-sdc-on-miss``): when a re-linked id has no
@@ -935,7 +943,8 @@ def get_entity(mediaid):
     if cached is not None:
         return cached
     try:
-        raw = site.simple_request(action="wbgetentities", ids=mediaid).submit()
+        with timings.time("sdc.wbgetentities"):
+            raw = site.simple_request(action="wbgetentities", ids=mediaid).submit()
     except pywikibot.exceptions.APIError as e:
         # A file deleted between upload and SDC sync surfaces here as
         # ``no-such-entity``; without the translation it would bubble
@@ -2420,7 +2429,8 @@ def _submit_sdc_write(action, mediaid, dpla_id, **params):
                 f" {e.code} — {_truncate(getattr(e, 'info', ''))}"
             ) from e
 
-    with_csrf_recovery(site, f"{action} {mediaid} ({dpla_id})", _do_write)
+    with timings.time(f"sdc.{action}"):
+        with_csrf_recovery(site, f"{action} {mediaid} ({dpla_id})", _do_write)
 
 
 def _snak_content_key(snak):
@@ -4291,6 +4301,63 @@ def _maintain_resolve(title, embedded_id, file_page, mediaid):
     )
 
 
+# Files re-linked per batched resolve: one ES ``ids`` query and one ``terms``
+# query per batch instead of one or more per file. Bounded so a 50K-file
+# category never builds a single 200K-variant request body, and so the
+# streaming --cat path holds only this many pages before processing them.
+_MAINTAIN_RESOLVE_BATCH = 200
+
+
+def _maintain_resolve_batch(files):
+    """:func:`_maintain_resolve` for a batch of ``(mediaid, embedded_id,
+    file_page, title)`` tuples — the :func:`_maintain_process_file` argument
+    order — returning one :class:`ResolveResult` per file, in order.
+
+    The source URL is still read per file (it lives in each file's
+    wikitext); only the ES side of the ladder is batched. Wildcard scopes
+    stay lazy, so only the residue pays for a P195 read.
+    """
+    return resolve_current_dpla_ids(
+        [
+            ResolveRequest(
+                embedded_id=embedded_id,
+                recorded_url=_extract_source_url(file_page),
+                scope_filter=functools.partial(_maintain_scope_filter, mediaid),
+            )
+            for mediaid, embedded_id, file_page, _title in files
+        ]
+    )
+
+
+def _maintain_resolve_batch_or_defer(files):
+    """:func:`_maintain_resolve_batch`, or one ``None`` per file when the
+    batched resolve raises.
+
+    A ``None`` result makes :func:`_maintain_process_file` resolve that file on
+    its own, so one bad page (or a transient ES error) costs only its own file
+    instead of the whole batch — the per-file behavior from before batching.
+    """
+    try:
+        return _maintain_resolve_batch(files)
+    except Exception:
+        logging.exception(
+            "maintain: batched resolve failed (%d files); resolving one at a time",
+            len(files),
+        )
+        return [None] * len(files)
+
+
+def _maintain_process_batch(files, tally=None):
+    """Resolve ``files`` with one :func:`_maintain_resolve_batch_or_defer` and
+    then maintain each file in order."""
+    for (mediaid, embedded_id, file_page, title), result in zip(
+        files, _maintain_resolve_batch_or_defer(files)
+    ):
+        _maintain_process_file(
+            mediaid, embedded_id, file_page, title, tally=tally, result=result
+        )
+
+
 @functools.lru_cache(maxsize=1)
 def _maintain_es_doc(dpla_id):
     """Return the item's ES ``_source`` for the ``--build-sdc-on-miss`` route,
@@ -4474,7 +4541,9 @@ def _maintain_rename(file_page, dpla_id):
 _MAINTAIN_TALLY_ANCHORS = ("embedded", "isShownAt", "wildcard", "unresolved")
 
 
-def _maintain_process_file(mediaid, embedded_id, file_page, title, tally=None):
+def _maintain_process_file(
+    mediaid, embedded_id, file_page, title, tally=None, result=None
+):
     """Maintain one Commons file: re-link to its current DPLA id, then either
     tally the resolver outcome (``--count-only`` pre-flight sizing — ``tally``
     given, nothing written) or SDC-sync it.
@@ -4486,8 +4555,13 @@ def _maintain_process_file(mediaid, embedded_id, file_page, title, tally=None):
     fallback is the api.dp.la load this path exists to avoid. When ``--from-s3``
     is not set at all (e.g. an ad-hoc ``--file`` run), it falls back to the live
     ``process_one`` for that single file.
+
+    ``result`` is this file's outcome from a batched
+    :func:`_maintain_resolve_batch`; when omitted the file is resolved on its
+    own.
     """
-    result = _maintain_resolve(title, embedded_id, file_page, mediaid)
+    if result is None:
+        result = _maintain_resolve(title, embedded_id, file_page, mediaid)
     dpla_id = result.dpla_id or embedded_id
     if result.dpla_id and result.dpla_id != embedded_id:
         logging.info(
@@ -4569,6 +4643,8 @@ def _emit_maintain_summary(label, elapsed_seconds, workers=1):
     ``workers`` is the real worker count so the SLOT WAIT (avg/wkr) line divides
     the aggregate worker-seconds correctly; the serial paths keep the default 1.
     """
+    events.emit_phase_end(tracker, timings)
+    logging.info("\n" + str(timings))
     logging.info("\n" + str(tracker))
     logging.info(f"{elapsed_seconds} seconds.")
     notify_sdc_complete(
@@ -5063,6 +5139,17 @@ def _post_sdc_cleanup_for_page(
             )
             return False
 
+    # Pure local pre-check before the entity-guard round trip below: a
+    # page whose template already strips and canonicalises to itself
+    # needs no edit, so there is nothing for the guard to protect.
+    # ``normalize_page`` would reach the same no-op verdict, but only
+    # after the guard's wbgetentities call. With the item's wikitext
+    # preloaded in bulk (:func:`_preload_cleanup_pages`) this makes an
+    # already-clean ordinal cost zero API requests.
+    stripped_text, _stripped = wikitext_normalize.normalize(text, expected_params)
+    if wikitext_normalize.canonicalize(stripped_text) == text:
+        return False
+
     # Defensive guard against the upstream null-pageid bug shape and
     # any future regression: ``normalize_page`` strips wikitext params
     # whose values match ``expected_params``, on the premise that the
@@ -5116,14 +5203,52 @@ def _post_sdc_cleanup_for_page(
         return False
 
 
+# Titles per batched ``prop=revisions|info`` query when preloading an item's
+# ordinal pages for cleanup. 50 is the API's non-bot ``titles`` limit and
+# also keeps a content-bearing response for large multi-page items well
+# under the response-size cap that would otherwise force continuations.
+_CLEANUP_PRELOAD_BATCH = 50
+
+
+def _preload_cleanup_pages(pages: list, dpla_id: str) -> None:
+    """Load current wikitext + page info for every page in ``pages`` in
+    batched queries of :data:`_CLEANUP_PRELOAD_BATCH` titles.
+
+    ``site.preloadpages`` updates the passed ``FilePage`` objects in place
+    (latest revision with content, page id, redirect flag), so the
+    per-page dispatcher's ``exists()`` / ``.text`` / ``pageid`` reads and
+    ``normalize_page``'s redirect check are served locally instead of one
+    sequential GET per ordinal — hundreds for a multi-page item. The
+    save path is unaffected: the preloaded revision carries the
+    timestamp pywikibot uses for edit-conflict detection.
+
+    Best-effort: a failed preload is logged and the pages fall back to
+    pywikibot's lazy per-page loads.
+    """
+    if not pages:
+        return
+    try:
+        with timings.time("commons.preload_wikitext"):
+            for _page in site.preloadpages(pages, groupsize=_CLEANUP_PRELOAD_BATCH):
+                pass
+    except Exception as e:
+        logging.warning(
+            f" -- cleanup: batched wikitext preload failed for {dpla_id}: {e!r};"
+            " falling back to per-page loads."
+        )
+
+
 def _post_sdc_cleanup_for_item(
     s3, partner: str, dpla_id: str, ordinal_items: list[tuple[str, dict]]
 ) -> set[str]:
     """Per-item post-SDC cleanup (partner mode).
 
     Reads ``dpla-map.json`` from S3, resolves provider / data_provider,
-    pre-computes the canonical params once for the item, then walks
-    every ordinal page through :func:`_post_sdc_cleanup_for_page`.
+    pre-computes the canonical params once for the item, preloads every
+    ordinal page's wikitext in bulk (:func:`_preload_cleanup_pages`),
+    then walks each page through :func:`_post_sdc_cleanup_for_page`,
+    which classifies it from the preloaded text and only issues API
+    calls for pages that actually need an edit.
 
     Best-effort throughout: any S3 / pywikibot / parse failure is
     logged but never raised. SDC sync has already committed and counted
@@ -5178,18 +5303,21 @@ def _post_sdc_cleanup_for_item(
         )
         return edited
 
+    pages: list[tuple[str, str, object]] = []
     for ord_str, data in ordinal_items:
         title = data.get("title")
         if not title or title == "?":
             continue
         try:
-            page = pywikibot.FilePage(site, title)
+            pages.append((ord_str, title, pywikibot.FilePage(site, title)))
         except Exception:
             logging.exception(
                 f" -- cleanup: FilePage construction failed for ordinal"
                 f" {ord_str} ({title}) of {dpla_id}; skipping."
             )
-            continue
+    _preload_cleanup_pages([page for _o, _t, page in pages], dpla_id)
+
+    for ord_str, title, page in pages:
         # Best-effort, per page: the post-SDC cleanup (wikitext strip /
         # legacy migration) loads the page text, which can hit a transient
         # Commons API timeout under concurrency. The item's SDC has already
@@ -5308,6 +5436,14 @@ def _run_legacy_migration_mode(partner: str, ids_file: str) -> None:
     # wikimedia_upload_status can detect progress identically.
     setup_logging(partner, "legacy-migration", logging.INFO)
     notify_phase_start(partner, "legacy-migration")
+    # Parsed revision params persist in the partner directory, so a re-run
+    # (after a crash or a --limit trial) only fetches content for revisions
+    # saved since the last pass. The path is absolute: this mode is run by
+    # hand, often from the launch base dir, where a cwd-relative cache would
+    # be shared by every partner.
+    legacy_artwork.enable_revision_cache(
+        str(partner_dir_path(partner) / legacy_artwork.REVISION_CACHE_FILENAME)
+    )
     start_time = time.time()
     tracker.reset()
 
@@ -5349,6 +5485,8 @@ def _run_legacy_migration_mode(partner: str, ids_file: str) -> None:
     finally:
         elapsed = time.time() - start_time
         if completed:
+            events.emit_phase_end(tracker, timings)
+            logging.info("\n" + str(timings))
             logging.info("\n" + str(tracker))
             logging.info(f"{elapsed} seconds.")
             # No dedicated Slack notification helper yet — reuse the SDC
@@ -5471,7 +5609,8 @@ def _run_pool(tasks, *, workers, initializer, initargs, task_fn):
     Routes worker log records to the parent's handlers (the open ``-sdc.log``)
     through a ``multiprocessing.Queue`` + ``QueueListener``, runs ``task_fn``
     over ``tasks`` with ``imap_unordered``, and merges each task's returned
-    tracker delta into the parent ``tracker``. ``initargs`` are forwarded to
+    ``(tracker_delta, timings_delta)`` pair into the parent ``tracker`` and
+    :data:`~ingest_wikimedia.timings.timings` registry. ``initargs`` are forwarded to
     ``initializer`` AFTER the log queue — every worker initializer takes
     ``log_queue`` as its first parameter.
 
@@ -5494,9 +5633,13 @@ def _run_pool(tasks, *, workers, initializer, initargs, task_fn):
             initializer=initializer,
             initargs=(log_queue, *initargs),
         ) as pool:
-            for delta in pool.imap_unordered(task_fn, tasks):
+            for delta, timings_delta in pool.imap_unordered(task_fn, tasks):
                 if delta:
                     tracker.merge(delta)
+                if timings_delta:
+                    timings.merge(timings_delta)
+                events.maybe_emit_tracker(tracker)
+                progress.tick()
     finally:
         listener.stop()
 
@@ -5516,7 +5659,10 @@ def _run_partner_mode_parallel(partner, dpla_ids, workers):
     ``initargs`` pickles the parent's already-fetched mapping tables (``hubs`` /
     ``rights`` / ``subject_ids``) across to each worker so the cleanup path
     (``DPLA.get_provider_and_data_provider`` with ``hubs``) doesn't NameError
-    under spawn, and all workers + parent agree on one snapshot.
+    under spawn, and all workers + parent agree on one snapshot. When the
+    configs came from a launch-staged file they are
+    :class:`~ingest_wikimedia.partners.ConfigSnapshot` views, which pickle as
+    the path of their mmapped snapshot rather than the decoded tables.
     """
     tasks = [
         (partner, dpla_id, idx, len(dpla_ids))
@@ -5636,6 +5782,7 @@ def _worker_partner_task(args):
     """
     partner, dpla_id, idx, total = args
     prior = tracker.snapshot()
+    prior_timings = timings.snapshot()
     wait_before = _worker_slot_budget.total_wait_seconds
     try:
         # Workers create their own S3Client lazily on first use; the
@@ -5651,7 +5798,11 @@ def _worker_partner_task(args):
         # S3 reads and all the per-ordinal writes — keeps the acquire in
         # one place; pywikibot's per-worker maxlag backoff remains the
         # real per-write safety net.
-        with _worker_slot_budget.acquire():
+        with (
+            _worker_slot_budget.acquire(),
+            tracker.measure(Histogram.ITEM_SECONDS),
+            events.item(dpla_id),
+        ):
             _process_one_partner_item(s3, partner, dpla_id, idx, total)
     except CsrfRecoveryFailed:
         # Session-level fatal — propagate to _run_partner_mode_parallel's
@@ -5679,7 +5830,7 @@ def _worker_partner_task(args):
     wait_delta = int(_worker_slot_budget.total_wait_seconds) - int(wait_before)
     if wait_delta:
         tracker.increment(Result.SDC_SLOT_WAIT_SECONDS, wait_delta)
-    return tracker.diff(prior)
+    return tracker.diff(prior), timings.diff(prior_timings)
 
 
 def _get_partner_s3_client():
@@ -6011,6 +6162,10 @@ def _process_one_partner_item(s3, partner, dpla_id, idx, total):
                 " title→pageid fallback failed; skipping."
             )
             tracker.increment(Result.SDC_ORDINALS_SKIPPED_MISSING_PAGEID)
+            # Still an ordinal the phase reached: counted like a synced one so
+            # the checkpoint total matches the status readout's awk count,
+            # which takes this line as well as the "<mediaid> (<title>)" one.
+            tracker.increment(Result.ORDINALS)
             # Treat as an ordinal error for item-level bucket
             # classification — an item where every ordinal had
             # null pageid should not silently fall into the
@@ -6020,6 +6175,7 @@ def _process_one_partner_item(s3, partner, dpla_id, idx, total):
             continue
         mediaid = f"M{pageid}"
         logging.info(f" -- Ordinal {ord_str}: {mediaid} ({title})")
+        tracker.increment(Result.ORDINALS)
 
         # Snapshot write counters so we can detect whether this
         # ordinal's sync actually changed anything on Commons.
@@ -6115,11 +6271,21 @@ def _process_one_partner_item(s3, partner, dpla_id, idx, total):
             # ordinal. Mirrors the uploader's CSRF abort contract
             # (PR #350) and the Toledo 2026-06-25 lesson.
             raise
-        except Exception:
+        except Exception as ex:
             logging.exception(
                 f" -- Ordinal {ord_str} ({mediaid}) for {dpla_id}:"
                 " SDC sync failed after retries; skipping ordinal."
             )
+            events.emit(
+                "ordinal",
+                dpla_id=dpla_id,
+                ordinal=ord_str,
+                mediaid=mediaid,
+                status="ERROR",
+                error_class=type(ex).__name__,
+                error=str(ex),
+                causes=events.cause_chain(ex),
+            )
             tracker.increment(Result.SDC_ORDINALS_SKIPPED_ERROR)
             had_ordinal_error = True
             continue
@@ -6278,22 +6444,34 @@ def _init_maintain_worker(
 def _worker_maintain_group_task(group):
     """Pool worker entrypoint for parallel maintain: process one id-group (all
     files sharing an embedded DPLA id) serially in this worker, returning the
-    per-group tracker delta.
+    per-group ``(tracker_delta, timings_delta)`` pair.
 
     Snapshot/diff gives the parent only what this group contributed (workers
     are reused across groups). One box-wide slot is held for the whole group —
     matching partner mode's per-item slot — and a per-file try/except keeps one
-    bad page from dropping the rest of the group.
+    bad page from dropping the rest of the group. The group's files are
+    re-linked with one :func:`_maintain_resolve_batch_or_defer` (groups are already
+    capped at one item's ordinals, so no further chunking is needed).
     """
     prior = tracker.snapshot()
+    prior_timings = timings.snapshot()
     wait_before = _worker_slot_budget.total_wait_seconds
     try:
         with _worker_slot_budget.acquire():
+            files = []
             for title, pageid, embedded_id in group:
                 try:
                     file_page = pywikibot.FilePage(site, title)
+                except Exception:
+                    logging.exception("maintain: worker failed on %s", title)
+                    tracker.increment(Result.SDC_ITEMS_SKIPPED_ERROR)
+                    continue
+                files.append(("M" + str(pageid), embedded_id, file_page, title))
+            results = _maintain_resolve_batch_or_defer(files)
+            for (mediaid, embedded_id, file_page, title), result in zip(files, results):
+                try:
                     _maintain_process_file(
-                        "M" + str(pageid), embedded_id, file_page, title
+                        mediaid, embedded_id, file_page, title, result=result
                     )
                 except Exception:
                     logging.exception("maintain: worker failed on %s", title)
@@ -6304,7 +6482,7 @@ def _worker_maintain_group_task(group):
     wait_delta = int(_worker_slot_budget.total_wait_seconds) - int(wait_before)
     if wait_delta:
         tracker.increment(Result.SDC_SLOT_WAIT_SECONDS, wait_delta)
-    return tracker.diff(prior)
+    return tracker.diff(prior), timings.diff(prior_timings)
 
 
 def _maintain_parallel_enabled(maintain, workers, count_only, from_s3_partner):
@@ -6441,6 +6619,7 @@ def _run_partner_mode(partner, ids_file):
         f" (workers={workers})"
     )
     completed = False
+    progress.start(partner, "sdc", len(dpla_ids), tracker)
     try:
         if workers <= 1:
             # Single-process: parent's module-level tracker is mutated
@@ -6450,10 +6629,16 @@ def _run_partner_mode(partner, ids_file):
             # (no-op when the budget is 0, so a plain run is unchanged).
             slot_budget = WorkerSlotBudget(_workers_budget)
             for local_count, dpla_id in enumerate(dpla_ids, start=1):
-                with slot_budget.acquire():
+                with (
+                    slot_budget.acquire(),
+                    tracker.measure(Histogram.ITEM_SECONDS),
+                    events.item(dpla_id),
+                ):
                     _process_one_partner_item(
                         s3, partner, dpla_id, local_count, len(dpla_ids)
                     )
+                events.maybe_emit_tracker(tracker)
+                progress.tick()
             # One process, so its accumulated wait IS the session total.
             slot_wait = int(slot_budget.total_wait_seconds)
             if slot_wait:
@@ -6490,6 +6675,7 @@ def _run_partner_mode(partner, ids_file):
         raise
     finally:
         elapsed = time.time() - start_time
+        progress.finish("complete" if completed else "aborted")
         # Emit the terminal "COUNTS:" marker and Slack completion message
         # only on a successful loop completion. The shell-level failure
         # handler (`notify_pipeline_fail`) will surface aborted runs via a
@@ -6498,6 +6684,8 @@ def _run_partner_mode(partner, ids_file):
         # would treat the SDC phase as done based on the spurious COUNTS:
         # line.
         if completed:
+            events.emit_phase_end(tracker, timings)
+            logging.info("\n" + str(timings))
             logging.info("\n" + str(tracker))
             logging.info(f"{elapsed} seconds.")
             notify_sdc_complete(
@@ -6736,6 +6924,10 @@ def main() -> None:
         # status poller falls back to a bare per-file count). Forcing a scope
         # marker would require an eager pre-enumeration that defeats streaming.
         tally = _new_maintain_tally(args.maintain and args.count_only)
+        # Maintain files are re-linked in batches of _MAINTAIN_RESOLVE_BATCH
+        # (one ES ids + terms query per batch), so they're buffered here and
+        # processed when the batch fills, at --limit, or at the end.
+        batch = []
         for page in generator:
             title = page.title()
             print("\n" + title)
@@ -6749,14 +6941,17 @@ def main() -> None:
             # FilePage handle).
             file_page = pywikibot.FilePage(site, title)
             if args.maintain:
-                _maintain_process_file(
-                    mediaid, embedded_id, file_page, title, tally=tally
-                )
+                batch.append((mediaid, embedded_id, file_page, title))
+                if len(batch) >= _MAINTAIN_RESOLVE_BATCH:
+                    _maintain_process_batch(batch, tally=tally)
+                    batch = []
             else:
                 _safe_process_one(mediaid, embedded_id, file_page=file_page)
             if args.limit and count >= args.limit:
                 print(f" -- Reached --limit {args.limit}, stopping.")
                 break
+        if batch:
+            _maintain_process_batch(batch, tally=tally)
         if tally is not None:
             _report_maintain_tally(tally, count)
         elif args.maintain:
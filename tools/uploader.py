@@ -69,14 +69,16 @@ from ingest_wikimedia.common import (
     CHECKSUM,
 )
 from ingest_wikimedia.localfs import LocalFS
+from ingest_wikimedia import events, progress
 from ingest_wikimedia.logs import setup_logging
 from ingest_wikimedia.slack import notify_phase_start
+from ingest_wikimedia.timings import timings
 from ingest_wikimedia.s3 import (
     S3_BUCKET,
     S3Client,
 )
 from ingest_wikimedia.tools_context import ToolsContext
-from ingest_wikimedia.tracker import Result, Tracker
+from ingest_wikimedia.tracker import Histogram, Result, Tracker
 from ingest_wikimedia.sha1_lock import (
     SHA1_LOCK_DIR,
     acquire_sha1_lock,
@@ -87,7 +89,12 @@ from ingest_wikimedia.worker_slots import (
     UPLOADER_PRIORITY_SLOTS,
     WorkerSlotBudget,
 )
-from ingest_wikimedia.categories import CategoryEnsurer, touch_institution_files
+from ingest_wikimedia.categories import (
+    CATEGORY_CACHE_PATH,
+    CategoryEnsurer,
+    touch_institution_files,
+)
+from ingest_wikimedia.partners import partner_wikidata_ids
 from ingest_wikimedia.csrf import (
     CsrfRecoveryFailed,
     MAX_CSRF_RECOVERIES,
@@ -613,7 +620,8 @@ class Uploader:
         """
         if self.no_create and (not filepage.exists() or filepage.isRedirectPage()):
             raise NewFilePageBlocked(filepage.title())
-        return self.site.upload(filepage=filepage, **kwargs)
+        with timings.time("commons.upload"):
+            return self.site.upload(filepage=filepage, **kwargs)
 
     def _refresh_pageid_with_retries(self, page_title: str) -> int | None:
         """Resolve the Commons pageid for ``page_title`` post-upload,
@@ -872,6 +880,7 @@ class Uploader:
                         f"Skipping {dpla_id} {ordinal}: Already exists on commons."
                     )
                     self.tracker.increment(Result.SKIPPED)
+                    self.tracker.increment(Result.UPLOAD_SKIPPED_ON_COMMONS)
                     return {
                         "status": ORDINAL_SKIPPED,
                         "title": page_title,
@@ -1036,6 +1045,7 @@ class Uploader:
                             f"commons (normalized identity)."
                         )
                         self.tracker.increment(Result.SKIPPED)
+                        self.tracker.increment(Result.UPLOAD_SKIPPED_ON_COMMONS)
                         return {
                             "status": ORDINAL_SKIPPED,
                             "title": canonical_title,
@@ -2747,6 +2757,13 @@ class Uploader:
                     # a NoneType here would crash the whole item's upload loop.
                     if isinstance(result, dict):
                         result["page_numbers"] = ordinal_pages
+                        events.emit(
+                            "ordinal",
+                            dpla_id=dpla_id,
+                            ordinal=ordinal,
+                            status=result.get("status"),
+                            error=result.get("error"),
+                        )
                     ordinal_results[str(ordinal)] = result
                 except UploadTimeoutError as ex:
                     ordinal_results[str(ordinal)] = {
@@ -2935,7 +2952,9 @@ def _init_upload_worker(
     global _worker_providers_json, _worker_partner, _worker_dry_run, _worker_verbose
 
     commons_site = get_site()
-    category_ensurer = CategoryEnsurer(commons_site, dry_run=dry_run)
+    category_ensurer = CategoryEnsurer(
+        commons_site, dry_run=dry_run, cache_path=CATEGORY_CACHE_PATH
+    )
     tools_context = ToolsContext.init(partner)
     tools_context.get_local_fs().setup_temp_dir()
 
@@ -2987,7 +3006,7 @@ def _worker_warmup(_ignored):
 
 def _worker_upload_task(dpla_id: str):
     """Process one DPLA item in the pool worker; return
-    ``(dpla_id, tracker_delta, newly_created_delta)``.
+    ``(dpla_id, tracker_delta, newly_created_delta, timings_delta)``.
 
     ``tracker_delta`` is the change in the worker's tracker counters
     across this one item — the parent merges it into its own tracker
@@ -3004,6 +3023,10 @@ def _worker_upload_task(dpla_id: str):
     that the parent's ensurer would otherwise never see — leaving
     first-batch files stranded in Category:Unknown institution.
 
+    ``timings_delta`` is the same snapshot → diff of the worker's
+    :data:`~ingest_wikimedia.timings.timings` registry, so the parent's
+    ``TIMINGS:`` block covers every worker's Commons and S3 calls.
+
     Wraps ``process_item`` in the same slot-acquire that the single-
     worker path uses. A worker-level exception is logged and swallowed
     so a bad item doesn't kill the pool worker; ``CsrfRecoveryFailed``
@@ -3012,9 +3035,14 @@ def _worker_upload_task(dpla_id: str):
     every subsequent item.
     """
     prior = _worker_uploader.tracker.snapshot()
+    prior_timings = timings.snapshot()
     prior_newly_created = set(_worker_uploader.category_ensurer.newly_created)
     try:
-        with _worker_slot_budget.acquire():
+        with (
+            _worker_slot_budget.acquire(),
+            _worker_uploader.tracker.measure(Histogram.ITEM_SECONDS),
+            events.item(dpla_id),
+        ):
             _worker_uploader.process_item(
                 dpla_id,
                 _worker_providers_json,
@@ -3030,7 +3058,7 @@ def _worker_upload_task(dpla_id: str):
     newly_created_delta = (
         _worker_uploader.category_ensurer.newly_created - prior_newly_created
     )
-    return dpla_id, delta, newly_created_delta
+    return dpla_id, delta, newly_created_delta, timings.diff(prior_timings)
 
 
 def _run_upload_pool(
@@ -3098,7 +3126,7 @@ def _run_upload_pool(
             ]
             for r in warmup_results:
                 r.get(timeout=120)
-            for dpla_id, delta, newly_created_delta in tqdm(
+            for dpla_id, delta, newly_created_delta, timings_delta in tqdm(
                 pool.imap_unordered(_worker_upload_task, dpla_ids),
                 total=len(dpla_ids),
                 desc="Uploading Items",
@@ -3106,7 +3134,10 @@ def _run_upload_pool(
                 ncols=100,
             ):
                 tracker.merge(delta)
+                timings.merge(timings_delta)
                 newly_created.update(newly_created_delta)
+                events.maybe_emit_tracker(tracker)
+                progress.tick()
     finally:
         listener.stop()
 
@@ -3181,7 +3212,9 @@ def main(
     tools_context = ToolsContext.init(partner)
 
     commons_site = get_site()
-    category_ensurer = CategoryEnsurer(commons_site, dry_run=dry_run)
+    category_ensurer = CategoryEnsurer(
+        commons_site, dry_run=dry_run, cache_path=CATEGORY_CACHE_PATH
+    )
 
     uploader = Uploader(
         tools_context.get_tracker(),
@@ -3240,6 +3273,9 @@ def main(
     # when the run aborted mid-loop. Defined *before* the outer try so
     # it's in scope for the finally even if an early setup step raises.
     session_aborted = False
+    # Final state for the progress checkpoint; only a loop that ran to the
+    # end flips it, so an unexpected exception also reads as aborted.
+    progress_status = "aborted"
 
     try:
         local_fs.setup_temp_dir()
@@ -3254,7 +3290,18 @@ def main(
         providers_json = dpla.get_providers_data()
         logging.info(f"Starting upload for {partner}")
 
+        # Resolve every hub/institution category up front in a few batched
+        # wbgetentities calls. The answers land in the on-disk category
+        # cache, which the pool workers' ensurers load at init — so they
+        # start out knowing which institutions are already set up instead of
+        # each re-asking Commons and Wikidata item by item.
+        try:
+            category_ensurer.prewarm(partner_wikidata_ids(partner))
+        except Exception as e:
+            logging.warning(f"Category prewarm skipped: {e}")
+
         dpla_ids = load_ids(ids_file)
+        progress.start(partner, "upload", len(dpla_ids), tracker)
 
         try:
             if workers > 1:
@@ -3285,10 +3332,17 @@ def main(
                 for dpla_id in tqdm(
                     dpla_ids, desc="Uploading Items", unit="Item", ncols=100
                 ):
-                    with slot_budget.acquire():
+                    with (
+                        slot_budget.acquire(),
+                        tracker.measure(Histogram.ITEM_SECONDS),
+                        events.item(dpla_id),
+                    ):
                         uploader.process_item(
                             dpla_id, providers_json, partner, verbose, dry_run
                         )
+                    events.maybe_emit_tracker(tracker)
+                    progress.tick()
+            progress_status = "complete"
         except CsrfRecoveryFailed as ex:
             # Session's auth is broken and unrecoverable. Abort — do NOT
             # continue to remaining items (every one would hit the same
@@ -3306,6 +3360,9 @@ def main(
 
     finally:
         elapsed = time.time() - start_time
+        events.emit_phase_end(tracker, timings)
+        progress.finish(progress_status)
+        logging.info("\n" + str(timings))
         logging.info("\n" + str(tracker))
         logging.info(f"{elapsed} seconds.")
         local_fs.cleanup_temp_dir()
@@ -3567,7 +3624,10 @@ def _post_upload_touch_new_institutions(
     with slot_budget.acquire():
         for inst_qid in sorted(newly_created):
             try:
-                n = touch_institution_files(commons_site, inst_qid)
+                # Purge-first: stragglers for a large institution clear in a
+                # handful of batched purges; only files still stuck in the
+                # unknown-institution category cost a null edit.
+                n = touch_institution_files(commons_site, inst_qid, purge=True)
             except CsrfRecoveryFailed:
                 # Session-level fatal from a wrapped .touch() inside
                 # touch_institution_files — propagate so main() ends